@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""Offline benchmark harness for the presentation, data and video pipelines (see run.py)."""
@@ -0,0 +1,255 @@
+# benchmarks/run.py
+"""
+Offline benchmark runner: latency percentiles, throughput and peak RSS per
+scenario, compared against a stored baseline.
+
+  python -m benchmarks                          # every scenario, compare to baseline
+  python -m benchmarks data_query orchestrate   # a subset
+  python -m benchmarks --latency-scale 0        # CPU-only (stub latency off)
+  python -m benchmarks --update-baseline        # record a new baseline
+
+Each scenario runs in its own child process (cwd = a scratch working
+directory), so peak RSS is per scenario and the repo's out/ state is left
+alone. Exit status is 1 when a scenario regresses beyond --tolerance.
+"""
+from __future__ import annotations
+import argparse, json, os, platform, resource, shutil, statistics, subprocess, sys, tempfile, time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks.scenarios import REPO_ROOT, SCENARIOS
+from benchmarks.stubs import parse_latency_overrides
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.2
+# Run parameters that must match for a baseline comparison to mean anything
+_COMPARABLE = ("iterations", "concurrency", "latency_scale", "latency_overrides", "slides", "clip_secs", "use_cache")
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile (q in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def summarize(latencies: Sequence[float], errors: int, wall_secs: float) -> Dict[str, Any]:
+    ms = [s * 1000 for s in latencies]
+    return {
+        "ok": len(ms),
+        "errors": errors,
+        "p50_ms": round(percentile(ms, 50), 1),
+        "p95_ms": round(percentile(ms, 95), 1),
+        "mean_ms": round(statistics.fmean(ms), 1) if ms else 0.0,
+        "max_ms": round(max(ms), 1) if ms else 0.0,
+        "wall_secs": round(wall_secs, 3),
+        "throughput_per_min": round(len(ms) / wall_secs * 60, 2) if wall_secs > 0 else 0.0,
+    }
+
+
+def _rss_mb(who: int) -> float:
+    return round(resource.getrusage(who).ru_maxrss / 1024, 1)  # ru_maxrss is KiB on Linux
+
+
+def run_scenario(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one scenario in this process (the current directory is its workdir)."""
+    scenario = SCENARIOS[name]
+    op = scenario.setup(params)
+    for i in range(params["warmup"]):
+        op(-1 - i)
+
+    latencies: List[float] = []
+    failures: List[str] = []
+
+    def timed(i: int) -> None:
+        start = time.perf_counter()
+        try:
+            op(i)
+        except Exception as e:
+            failures.append(f"{type(e).__name__}: {e}"[:300])
+            return
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=params["concurrency"], thread_name_prefix="bench") as pool:
+        list(pool.map(timed, range(params["iterations"])))
+    wall = time.perf_counter() - start
+
+    return {
+        **summarize(latencies, len(failures), wall),
+        "peak_rss_mb": _rss_mb(resource.RUSAGE_SELF),
+        "peak_child_rss_mb": _rss_mb(resource.RUSAGE_CHILDREN),  # MCP server / ffmpeg
+        "failures": failures[:5],
+    }
+
+
+def bench_env(params: Dict[str, Any]) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    env["PRESGEN_BENCH_LATENCY_SCALE"] = str(params["latency_scale"])
+    env["PRESGEN_BENCH_LATENCY_MS"] = params["latency_overrides"]
+    env.setdefault("SALES_AGENT_CONFIG", str(REPO_ROOT / "config.yaml"))
+    env["PRESGEN_TRACE_EXPORTER"] = "none"
+    env.pop("PRESGEN_PROFILE_JOBS", None)
+    return env
+
+
+def prepare_workdir(workdir: Path) -> Path:
+    # The MCP server writes its log under ./src/logs of its cwd
+    (workdir / "src" / "logs").mkdir(parents=True, exist_ok=True)
+    return workdir
+
+
+def _run_child(name: str, params: Dict[str, Any], workdir: Path) -> Dict[str, Any]:
+    scenario = SCENARIOS[name]
+    missing = [exe for exe in scenario.requires if shutil.which(exe) is None]
+    if missing:
+        return {"skipped": f"{', '.join(missing)} not found on PATH"}
+
+    result_path = workdir / f"{name}.result.json"
+    log_path = workdir / f"{name}.log"
+    cmd = [sys.executable, "-m", "benchmarks", name, "--child-result", str(result_path),
+           "--params", json.dumps(params)]
+    with log_path.open("w") as log_file:
+        proc = subprocess.run(cmd, cwd=workdir, env=bench_env(params), stdout=log_file, stderr=subprocess.STDOUT)
+    if proc.returncode != 0 or not result_path.exists():
+        return {"skipped": f"scenario crashed (exit {proc.returncode}); see {log_path}"}
+    return json.loads(result_path.read_text())
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> Dict[str, Dict[str, List[str]]]:
+    """Per scenario: regressions beyond tolerance (errors, p95, throughput, peak RSS) and notes."""
+    verdicts: Dict[str, Dict[str, List[str]]] = {}
+    for name, res in results.items():
+        base = baseline.get("scenarios", {}).get(name)
+        if "skipped" in res:
+            continue
+        if not base:
+            verdicts[name] = {"regressions": [], "notes": ["no baseline"]}
+            continue
+        mismatched = [k for k in _COMPARABLE if base["params"].get(k) != res["params"].get(k)]
+        if mismatched:
+            verdicts[name] = {"regressions": [], "notes": [f"not comparable: {', '.join(mismatched)} differ"]}
+            continue
+        issues = []
+        if res["errors"] > base["errors"]:
+            issues.append(f"errors {base['errors']} -> {res['errors']}")
+        for key in ("p95_ms", "peak_rss_mb"):
+            if res[key] > base[key] * (1 + tolerance):
+                issues.append(f"{key} {base[key]} -> {res[key]} (+{(res[key] / base[key] - 1) * 100:.0f}%)")
+        if res["throughput_per_min"] < base["throughput_per_min"] * (1 - tolerance):
+            issues.append(f"throughput_per_min {base['throughput_per_min']} -> {res['throughput_per_min']}")
+        verdicts[name] = {"regressions": issues, "notes": []}
+    return verdicts
+
+
+def _delta(value: float, base: Optional[float]) -> str:
+    if not base:
+        return ""
+    return f" ({(value / base - 1) * 100:+.0f}%)"
+
+
+def print_report(results: Dict[str, Any], baseline: Dict[str, Any], verdicts: Dict[str, Dict[str, List[str]]]) -> None:
+    header = f"{'scenario':<18} {'ok/err':>7} {'p50 ms':>16} {'p95 ms':>16} {'per min':>14} {'rss MB':>14} {'child MB':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, res in results.items():
+        if "skipped" in res:
+            print(f"{name:<18} skipped: {res['skipped']}")
+            continue
+        base = baseline.get("scenarios", {}).get(name) or {}
+        print(
+            f"{name:<18} {res['ok']:>3}/{res['errors']:<3} "
+            f"{res['p50_ms']:>8}{_delta(res['p50_ms'], base.get('p50_ms')):>8} "
+            f"{res['p95_ms']:>8}{_delta(res['p95_ms'], base.get('p95_ms')):>8} "
+            f"{res['throughput_per_min']:>7}{_delta(res['throughput_per_min'], base.get('throughput_per_min')):>7} "
+            f"{res['peak_rss_mb']:>7}{_delta(res['peak_rss_mb'], base.get('peak_rss_mb')):>7} "
+            f"{res['peak_child_rss_mb']:>9}"
+        )
+        for failure in res.get("failures", []):
+            print(f"{'':<18} ! {failure}")
+    print()
+    for name, verdict in verdicts.items():
+        for issue in verdict["regressions"]:
+            print(f"REGRESSION {name}: {issue}")
+        for note in verdict["notes"]:
+            print(f"note       {name}: {note}")
+    if verdicts and not any(v["regressions"] for v in verdicts.values()):
+        print("No regressions against baseline.")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("scenarios", nargs="*", metavar="scenario",
+                    help=f"subset to run ({', '.join(SCENARIOS)}); default all")
+    ap.add_argument("--iterations", type=int, help="timed runs per scenario (default: per scenario)")
+    ap.add_argument("--concurrency", type=int, default=int(os.getenv("PRESGEN_PIPELINE_WORKERS", "3")),
+                    help="parallel runs, like the pipeline executor's workers (default 3)")
+    ap.add_argument("--warmup", type=int, default=1)
+    ap.add_argument("--latency-scale", type=float, default=1.0,
+                    help="multiplier for fixture backend latency; 0 = CPU-only")
+    ap.add_argument("--latency", default="", metavar="BACKEND=MS,...",
+                    help="per-backend latency overrides, e.g. llm=1500,imagen=0")
+    ap.add_argument("--slides", type=int, default=3, help="slides per deck for orchestrate scenarios")
+    ap.add_argument("--clip-secs", type=float, default=30.0, help="generated test clip length")
+    ap.add_argument("--use-cache", action="store_true", help="benchmark warm caches instead of cold runs")
+    ap.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    ap.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    ap.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                    help="allowed relative regression before failing (default 0.2)")
+    ap.add_argument("--json", type=Path, help="also write results to this file")
+    ap.add_argument("--workdir", type=Path, help="scratch working directory (default: a temp dir)")
+    ap.add_argument("--child-result", type=Path, help=argparse.SUPPRESS)
+    ap.add_argument("--params", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+    unknown = [n for n in args.scenarios if n not in SCENARIOS]
+    if unknown:
+        ap.error(f"unknown scenario(s) {', '.join(unknown)}; choose from {', '.join(SCENARIOS)}")
+
+    if args.child_result:
+        params = json.loads(args.params)
+        result = run_scenario(args.scenarios[0], params)
+        args.child_result.write_text(json.dumps({**result, "params": params}, indent=2))
+        return 0
+
+    parse_latency_overrides(args.latency)  # fail fast on typos
+    names = args.scenarios or list(SCENARIOS)
+    workdir = prepare_workdir(args.workdir or Path(tempfile.mkdtemp(prefix="presgen-bench-")))
+    results: Dict[str, Any] = {}
+    for name in names:
+        params = {
+            "iterations": args.iterations or SCENARIOS[name].iterations,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "latency_scale": args.latency_scale,
+            "latency_overrides": args.latency,
+            "slides": args.slides,
+            "clip_secs": args.clip_secs,
+            "use_cache": args.use_cache,
+        }
+        print(f"[bench] {name}: {SCENARIOS[name].description} "
+              f"(iterations={params['iterations']}, concurrency={params['concurrency']})", flush=True)
+        results[name] = _run_child(name, params, workdir)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    verdicts = {} if args.update_baseline else compare(results, baseline, args.tolerance)
+    print()
+    print_report(results, {} if args.update_baseline else baseline, verdicts)
+
+    meta = {"python": platform.python_version(), "machine": platform.machine(),
+            "cpus": os.cpu_count(), "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+    if args.json:
+        args.json.write_text(json.dumps({"meta": meta, "scenarios": results}, indent=2))
+    if args.update_baseline:
+        scenarios = {**baseline.get("scenarios", {}),
+                     **{n: r for n, r in results.items() if "skipped" not in r}}
+        args.baseline.write_text(json.dumps({"meta": meta, "scenarios": scenarios}, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    return 1 if any(v["regressions"] for v in verdicts.values()) else 0
@@ -0,0 +1,214 @@
+# benchmarks/scenarios.py
+"""
+Benchmark scenarios. Each setup() prepares its inputs in the working directory
+and returns the operation to time; op(i) raises if iteration i did not produce
+a usable result, which the runner counts as an error.
+"""
+from __future__ import annotations
+import asyncio, shutil, subprocess, uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SALES_XLSX = REPO_ROOT / "examples" / "presgen_sales_data.xlsx"
+REPORT_TXT = REPO_ROOT / "examples" / "report_demo.txt"
+
+# Pattern-matched (no LLM) and free-form (NL-to-SQL via the data LLM) questions
+DATA_QUESTIONS = [
+    "Total by Company",
+    "Which Company had the most Total",
+    "How did Total trend over time",
+    "Show me something interesting",
+    "What is the typical order size per customer",
+]
+
+Op = Callable[[int], Any]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    setup: Callable[[Dict[str, Any]], Op]
+    iterations: int
+    requires: Tuple[str, ...] = ()  # executables that must be on PATH
+
+
+def _ingest_dataset() -> str:
+    from src.data.ingest import ingest_file
+
+    return ingest_file(SALES_XLSX, original_name=SALES_XLSX.name)["dataset_id"]
+
+
+def _setup_ingest(options: Dict[str, Any]) -> Op:
+    from src.data.ingest import ingest_file
+
+    def op(i: int) -> Any:
+        res = ingest_file(SALES_XLSX, original_name=SALES_XLSX.name)
+        if not res["sheets"]:
+            raise RuntimeError("ingest produced no sheets")
+        return res
+
+    return op
+
+
+def _setup_data_query(options: Dict[str, Any]) -> Op:
+    from benchmarks.stubs import install_data_stubs
+    from src.mcp.tools.data import data_query_tool
+
+    install_data_stubs()
+    dataset_id = _ingest_dataset()
+
+    def op(i: int) -> Any:
+        res = data_query_tool({
+            "dataset_id": dataset_id,
+            "question": DATA_QUESTIONS[i % len(DATA_QUESTIONS)],
+            "req_id": f"bench-dq-{i}",
+            "use_cache": options["use_cache"],
+        })
+        if not res.get("chart_png_path") and not res.get("table_md"):
+            raise RuntimeError("data.query returned neither chart nor table")
+        return res
+
+    return op
+
+
+def _use_stub_server() -> None:
+    from benchmarks.stubs import StubbedMCPClient
+    from src.mcp_lab import orchestrator
+
+    orchestrator.MCPClient = StubbedMCPClient
+
+
+def _setup_orchestrate(options: Dict[str, Any]) -> Op:
+    from src.mcp_lab.orchestrator import orchestrate
+
+    _use_stub_server()
+    report = REPORT_TXT.read_text(encoding="utf-8")
+
+    def op(i: int) -> Any:
+        res = orchestrate(
+            report,
+            client_request_id=f"bench-{uuid.uuid4().hex[:12]}",
+            slide_count=options["slides"],
+            use_cache=options["use_cache"],
+        )
+        if not res.get("url") or res.get("created_slides") != options["slides"]:
+            raise RuntimeError(f"orchestrate returned {res}")
+        return res
+
+    return op
+
+
+def _setup_orchestrate_mixed(options: Dict[str, Any]) -> Op:
+    from src.mcp_lab.orchestrator import orchestrate_mixed
+
+    _use_stub_server()
+    report = REPORT_TXT.read_text(encoding="utf-8")
+    dataset_id = _ingest_dataset()
+    questions = DATA_QUESTIONS[: max(1, options["slides"] - 1)]  # one narrative slide, rest data
+
+    def op(i: int) -> Any:
+        res = orchestrate_mixed(
+            report,
+            slide_count=options["slides"],
+            dataset_id=dataset_id,
+            data_questions=questions,
+            client_request_id=f"bench-{uuid.uuid4().hex[:12]}",
+            use_cache=options["use_cache"],
+        )
+        if not res.get("url") or res.get("created_slides") != options["slides"]:
+            raise RuntimeError(f"orchestrate_mixed returned {res}")
+        return res
+
+    return op
+
+
+def make_test_clip(path: Path, seconds: float) -> Path:
+    """720p30 H.264 test pattern with a sine tone, like a short recorded talk."""
+    if not path.exists():
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-f", "lavfi", "-i", "testsrc2=size=1280x720:rate=30",
+                "-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100",
+                "-t", str(seconds), "-c:v", "libx264", "-preset", "veryfast",
+                "-pix_fmt", "yuv420p", "-c:a", "aac", "-shortest", str(path),
+            ],
+            check=True,
+        )
+    return path
+
+
+def _video_job(clip: Path) -> str:
+    """A /tmp/jobs/<job_id>/raw_video.mp4 layout as left by /video/upload."""
+    job_id = f"bench-{uuid.uuid4().hex[:12]}"
+    job_dir = Path("/tmp/jobs") / job_id
+    job_dir.mkdir(parents=True)
+    shutil.copyfile(clip, job_dir / "raw_video.mp4")
+    return job_id
+
+
+def _setup_video_audio(options: Dict[str, Any]) -> Op:
+    from src.mcp.tools.video_audio import AudioAgent
+
+    clip = make_test_clip(Path("bench_clip.mp4"), options["clip_secs"])
+
+    def op(i: int) -> Any:
+        job_id = _video_job(clip)
+        try:
+            res = asyncio.run(AudioAgent(job_id).extract_audio(str(Path("/tmp/jobs") / job_id / "raw_video.mp4")))
+            if not res.success:
+                raise RuntimeError(res.error)
+            return res
+        finally:
+            shutil.rmtree(Path("/tmp/jobs") / job_id, ignore_errors=True)
+
+    return op
+
+
+def _setup_video_compose(options: Dict[str, Any]) -> Op:
+    from src.mcp.tools.video_phase3 import Phase3Orchestrator
+
+    clip = make_test_clip(Path("bench_clip.mp4"), options["clip_secs"])
+    step = max(1, int(options["clip_secs"]) // 4)
+    summary = {
+        "bullet_points": [
+            {"timestamp": f"{(n * step) // 60:02d}:{(n * step) % 60:02d}", "text": text,
+             "confidence": 0.9, "duration": float(step)}
+            for n, text in enumerate([
+                "AI agents take action beyond answering questions",
+                "Reports become polished decks in minutes",
+                "Reliability comes from retries, caching and quotas",
+            ])
+        ],
+        "main_themes": ["Agents", "Automation", "Reliability"],
+    }
+
+    def op(i: int) -> Any:
+        job_id = _video_job(clip)
+        try:
+            res = Phase3Orchestrator(job_id, {"summary": summary}).compose_final_video()
+            if not res.get("success"):
+                raise RuntimeError(res.get("error"))
+            return res
+        finally:
+            shutil.rmtree(Path("/tmp/jobs") / job_id, ignore_errors=True)
+
+    return op
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    s.name: s
+    for s in (
+        Scenario("ingest", "ingest_file on examples/presgen_sales_data.xlsx", _setup_ingest, 20),
+        Scenario("data_query", "data_query_tool over the sales workbook (stubbed data LLM)", _setup_data_query, 20),
+        Scenario("orchestrate", "orchestrate via the MCP stub server (LLM, Imagen, Slides)", _setup_orchestrate, 6),
+        Scenario("orchestrate_mixed", "orchestrate_mixed: narrative + data slides", _setup_orchestrate_mixed, 6),
+        Scenario("video_audio", "Phase 1 ffmpeg audio extraction on a generated clip",
+                 _setup_video_audio, 5, requires=("ffmpeg", "ffprobe")),
+        Scenario("video_compose", "Phase 3 ffmpeg composition with bullet overlays on a generated clip",
+                 _setup_video_compose, 3, requires=("ffmpeg", "ffprobe")),
+    )
+}
@@ -0,0 +1,15 @@
+# benchmarks/stub_server.py
+"""MCP stdio server with stubbed backends; started by StubbedMCPClient."""
+from __future__ import annotations
+
+from src.mcp import server
+from benchmarks.stubs import install_server_stubs
+
+
+def main() -> int:
+    install_server_stubs(server.TOOLS)
+    return server.serve_stdio()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+# benchmarks/stubs.py
+"""
+Fixture-backed stand-ins for the external backends (Gemini, Imagen, Slides).
+
+Each backend replays the response stored in benchmarks/fixtures/<name>.json
+after sleeping for its latency, so benchmarks exercise the real orchestrator,
+MCP subprocess, caches, DuckDB and chart rendering without credentials or
+network. Params and results go through the same pydantic schemas as the live
+tools, so a fixture that drifts from the tool contract fails loudly instead of
+benchmarking a different code path.
+
+Latency: every fixture carries a latency_ms. PRESGEN_BENCH_LATENCY_SCALE
+multiplies all of them (0 = CPU-only runs) and PRESGEN_BENCH_LATENCY_MS
+overrides single backends ("llm=1500,imagen=0"). Both reach the MCP stub
+server through the environment.
+"""
+from __future__ import annotations
+import copy, functools, json, os, sys, time, uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from src.mcp_lab.rpc_client import MCPClient
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+BACKENDS = ("llm", "imagen", "slides", "data_llm")
+STUB_SERVER_CMD = [sys.executable, "-m", "benchmarks.stub_server"]
+
+
+@functools.lru_cache(maxsize=None)
+def _load(name: str) -> Dict[str, Any]:
+    return json.loads((FIXTURES_DIR / f"{name}.json").read_text(encoding="utf-8"))
+
+
+def load_fixture(name: str) -> Dict[str, Any]:
+    return copy.deepcopy(_load(name))
+
+
+def parse_latency_overrides(spec: str) -> Dict[str, float]:
+    """"llm=1500,imagen=0" -> {"llm": 1500.0, "imagen": 0.0} (milliseconds)."""
+    overrides: Dict[str, float] = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        backend, _, ms = part.partition("=")
+        if backend not in BACKENDS or not ms:
+            raise ValueError(f"bad latency override {part!r}; expected <backend>=<ms>, backend in {BACKENDS}")
+        overrides[backend] = float(ms)
+    return overrides
+
+
+def latency_secs(backend: str, recorded_ms: float) -> float:
+    overrides = parse_latency_overrides(os.getenv("PRESGEN_BENCH_LATENCY_MS", ""))
+    if backend in overrides:
+        return overrides[backend] / 1000
+    return recorded_ms * float(os.getenv("PRESGEN_BENCH_LATENCY_SCALE", "1.0")) / 1000
+
+
+def _replay(name: str) -> Dict[str, Any]:
+    fixture = load_fixture(name)
+    delay = latency_secs(fixture["backend"], fixture["latency_ms"])
+    if delay > 0:
+        time.sleep(delay)
+    return fixture
+
+
+# --- MCP tools ----------------------------------------------------------------
+
+
+def llm_summarize_stub(params: Dict[str, Any]) -> Dict[str, Any]:
+    from src.mcp.schemas import SummarizeParams, SummarizeResult
+
+    p = SummarizeParams.model_validate(params)
+    sections = _replay("llm_summarize")["response"]["sections"]
+    return SummarizeResult.model_validate({"sections": sections[: p.max_sections or None]}).model_dump()
+
+
+def image_generate_stub(params: Dict[str, Any]) -> Dict[str, Any]:
+    from src.mcp.schemas import GenerateImageParams, GenerateImageResult
+
+    GenerateImageParams.model_validate(params)
+    return GenerateImageResult.model_validate(_replay("image_generate")["response"]).model_dump(mode="json")
+
+
+def slides_create_stub(params: Dict[str, Any]) -> Dict[str, Any]:
+    from src.mcp.schemas import SlidesCreateParams, SlidesCreateResult
+
+    p = SlidesCreateParams.model_validate(params)
+    ids = {
+        "presentation_id": p.presentation_id or f"bench-{uuid.uuid4().hex[:16]}",
+        "slide_id": f"g{uuid.uuid4().hex[:12]}",
+    }
+    response = {
+        k: v.format(**ids) if isinstance(v, str) else v
+        for k, v in _replay("slides_create")["response"].items()
+    }
+    return SlidesCreateResult.model_validate(response).model_dump(mode="json")
+
+
+class FakeGemini:
+    """GenerativeModel stand-in for data.query's NL-to-SQL and insight prompts."""
+
+    def generate_content(self, prompt: Any, **_: Any) -> SimpleNamespace:
+        fixture = _replay("data_llm")
+        text = str(prompt)
+        if "SQL generator" in text:
+            question = text.split("Q:", 1)[-1].split("\n", 1)[0].strip()
+            return SimpleNamespace(text=fixture["sql"].get(question, fixture["default_sql"]))
+        return SimpleNamespace(text=fixture["insights"])
+
+
+def install_data_stubs() -> None:
+    """Route data.query's Gemini calls to FakeGemini (in this process)."""
+    from src.mcp.tools import data
+
+    data._USE_LLM = True
+    data._gemini = FakeGemini
+
+
+def install_server_stubs(tools: Dict[str, Any]) -> None:
+    """Swap the external-backend tools in an MCP server's TOOLS registry."""
+    from src.mcp.tools.data import data_query_tool
+
+    install_data_stubs()
+    tools.update(
+        {
+            "llm.summarize": llm_summarize_stub,
+            "image.generate": image_generate_stub,
+            "slides.create": slides_create_stub,
+            "data.query": data_query_tool,
+        }
+    )
+
+
+class StubbedMCPClient(MCPClient):
+    """MCPClient that starts benchmarks.stub_server instead of src.mcp.server."""
+
+    def __init__(self, cmd: Optional[List[str]] = None, start_timeout: float = 30.0):
+        super().__init__(cmd=cmd or STUB_SERVER_CMD, start_timeout=start_timeout)
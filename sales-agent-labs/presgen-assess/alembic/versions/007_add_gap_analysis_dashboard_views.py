@@ -0,0 +1,47 @@
+"""add_gap_analysis_dashboard_views
+
+Revision ID: 007_dashboard_views
+Revises: 006_gap_analysis
+Create Date: 2025-10-06
+
+Materialized read model for the Gap Analysis dashboard: one serialized,
+versioned payload per (workflow, dashboard section).
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '007_dashboard_views'
+down_revision = '006_gap_analysis'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the dashboard read model table."""
+
+    op.create_table(
+        'gap_analysis_dashboard_views',
+        sa.Column('workflow_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('section', sa.String(50), nullable=False),
+
+        # Serialized payload and its revalidation token
+        sa.Column('version', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column('etag', sa.String(64), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('stale', sa.Boolean(), nullable=False, server_default=sa.false()),
+
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), onupdate=sa.text('now()')),
+
+        # Foreign keys
+        sa.ForeignKeyConstraint(['workflow_id'], ['workflow_executions.id'], ondelete='CASCADE'),
+        # (workflow_id, section) primary key makes each dashboard load a single index lookup
+        sa.PrimaryKeyConstraint('workflow_id', 'section')
+    )
+
+
+def downgrade() -> None:
+    """Drop the dashboard read model table."""
+
+    op.drop_table('gap_analysis_dashboard_views')
@@ -0,0 +1,46 @@
+"""add_workflow_status_scan_indexes
+
+Revision ID: 008_workflow_status_indexes
+Revises: 007_dashboard_views
+Create Date: 2025-10-07
+
+Covering indexes for the execution_status scans run by
+ResponseIngestionService (polling and ingestion stats) and MonitoringService.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_workflow_status_indexes'
+down_revision = '007_dashboard_views'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create status scan indexes on workflow_executions."""
+
+    # Per-status counts (GROUP BY execution_status) and status + recency
+    # filters become index-only scans
+    op.create_index(
+        'ix_workflow_executions_execution_status_updated_at',
+        'workflow_executions',
+        ['execution_status', 'updated_at'],
+        postgresql_include=['id']
+    )
+
+    # Ingestion polling: workflows in a status that have a linked form
+    op.create_index(
+        'ix_workflow_executions_status_with_form',
+        'workflow_executions',
+        ['execution_status'],
+        postgresql_include=['id', 'google_form_id'],
+        postgresql_where=sa.text('google_form_id IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    """Drop status scan indexes."""
+
+    op.drop_index('ix_workflow_executions_status_with_form', table_name='workflow_executions')
+    op.drop_index('ix_workflow_executions_execution_status_updated_at', table_name='workflow_executions')
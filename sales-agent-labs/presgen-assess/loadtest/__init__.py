@@ -0,0 +1,7 @@
+"""Load-test harness for the PresGen-Assess API.
+
+Runs the app in-process against SQLite with local fakes for OpenAI, ChromaDB
+embeddings and Google Forms/Drive/Sheets, replays class workloads at
+increasing concurrency and reports per-endpoint latency, error rates and
+database pool saturation. See ``loadtest.run`` for usage.
+"""
@@ -0,0 +1,467 @@
+"""Local fakes for the external services the assessment API calls.
+
+Each fake answers with the response shapes the real client code reads and
+sleeps for a configurable, jittered latency so the app sees realistic
+waits without network access or credentials:
+
+* ``FakeAsyncOpenAI`` stands in for ``openai.AsyncOpenAI`` (chat completions).
+* ``FakeEmbeddingFunction`` replaces the OpenAI embedding function ChromaDB
+  calls; it blocks the calling thread like the real synchronous client.
+* ``FakeGoogleBackend`` serves Forms, Drive and Sheets requests built by
+  ``fake_build`` in place of ``googleapiclient.discovery.build``. Requests
+  block in ``execute()`` so they run on the Google API executor's threads.
+
+Latencies are medians in milliseconds, scaled by ``latency_scale`` (0 makes
+every backend instant so only the app's own CPU and database work remains).
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+DEFAULT_LATENCY_MS: Dict[str, float] = {
+    "openai.chat": 1500.0,
+    "openai.embeddings": 120.0,
+    "forms": 350.0,
+    "drive": 250.0,
+    "sheets": 400.0,
+}
+
+CERTIFICATION_ID = "aws-ml-specialty"  # retrieval key used by AIQuestionGenerator
+
+_QUESTION_COUNT = re.compile(r"generate (\d+) distinct")
+_QUESTION_DOMAIN = re.compile(r"for the (.+?) domain of")
+
+_VOCABULARY = (
+    "SageMaker endpoint autoscaling batch transform feature store Kinesis Firehose Glue crawler "
+    "Athena partition Redshift Spectrum EMR Spark notebook lifecycle hyperparameter tuning early "
+    "stopping spot training checkpoint XGBoost BlazingText DeepAR forecast anomaly RandomCutForest "
+    "Comprehend Rekognition Textract Polly Transcribe Lex augmented review Ground Truth labeling "
+    "drift baseline monitor bias Clarify explainability SHAP imbalance oversampling SMOTE recall "
+    "precision F1 AUC confusion matrix regularization dropout overfitting underfitting ensemble "
+    "bagging boosting embeddings tokenization stemming TF-IDF PCA t-SNE normalization one-hot "
+    "imputation outliers quantile binning shuffle stratified holdout cross-validation latency "
+    "throughput multi-model inference pipeline shadow canary rollback encryption KMS VPC private "
+    "IAM role least privilege lineage registry approval containers ECR Lambda Step Functions"
+).split()
+
+
+class LatencyModel:
+    """Jittered per-backend latencies, scaled and optionally overridden."""
+
+    def __init__(
+        self,
+        scale: float = 1.0,
+        overrides: Optional[Dict[str, float]] = None,
+        jitter: float = 0.25,
+        seed: Optional[int] = None
+    ):
+        self.scale = scale
+        self.jitter = jitter
+        self.latency_ms = {**DEFAULT_LATENCY_MS, **(overrides or {})}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def seconds(self, backend: str) -> float:
+        median = self.latency_ms.get(backend, 0.0) * self.scale
+        if median <= 0:
+            return 0.0
+        with self._lock:
+            factor = 1.0 + self._rng.uniform(-self.jitter, self.jitter)
+        return median * factor / 1000.0
+
+
+def parse_latency_overrides(spec: str) -> Dict[str, float]:
+    """Parse ``backend=ms[,backend=ms]`` (e.g. ``openai.chat=800,forms=0``)."""
+    overrides: Dict[str, float] = {}
+    for part in filter(None, (p.strip() for p in (spec or "").split(","))):
+        name, _, value = part.partition("=")
+        if name not in DEFAULT_LATENCY_MS:
+            raise ValueError(f"Unknown backend '{name}'; expected one of {', '.join(DEFAULT_LATENCY_MS)}")
+        overrides[name] = float(value)
+    return overrides
+
+
+# --- OpenAI -------------------------------------------------------------------
+
+def fake_questions(count: int, domain: str, rng: random.Random, serial: int = 0) -> List[Dict[str, Any]]:
+    """``count`` valid, mutually dissimilar multiple-choice questions."""
+    questions = []
+    for index in range(count):
+        words = rng.sample(_VOCABULARY, 9)
+        options = [f"{letter}) {' '.join(rng.sample(_VOCABULARY, 3))}" for letter in "ABCD"]
+        questions.append({
+            "question": f"[{domain} #{serial + index}] Which choice applies {' '.join(words)}?",
+            "options": options,
+            "correct_answer": rng.choice("ABCD"),
+            "explanation": f"Explains how {' '.join(words[:4])} applies to {domain}.",
+            "references": [f"{domain} study guide section {rng.randint(1, 40)}"]
+        })
+    return questions
+
+
+class _FakeChatCompletions:
+    def __init__(self, owner: "FakeAsyncOpenAI"):
+        self._owner = owner
+
+    async def create(self, *, messages: List[Dict[str, str]], response_format: Optional[Dict] = None, **_: Any):
+        owner = self._owner
+        await asyncio.sleep(owner.latency.seconds("openai.chat"))
+        prompt = messages[-1]["content"] if messages else ""
+
+        count_match = _QUESTION_COUNT.search(prompt)
+        if count_match:
+            domain_match = _QUESTION_DOMAIN.search(prompt)
+            domain = domain_match.group(1) if domain_match else "General"
+            with owner.lock:
+                serial = next(owner.serial)
+                rng = random.Random(f"{owner.seed}:{serial}")
+            questions = fake_questions(int(count_match.group(1)), domain, rng, serial=serial * 100)
+            payload: Any = {"questions": questions} if (response_format or {}).get("type") == "json_object" else questions
+            content = json.dumps(payload)
+        elif (response_format or {}).get("type") == "json_object":
+            content = json.dumps({"summary": "Learner performance summary.", "recommendations": []})
+        else:
+            content = "Learner performance summary with recommended next steps."
+
+        owner.calls += 1
+        tokens = len(prompt) // 4 + len(content) // 4
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content, role="assistant"), finish_reason="stop")],
+            usage=SimpleNamespace(prompt_tokens=len(prompt) // 4, completion_tokens=len(content) // 4, total_tokens=tokens),
+        )
+
+
+class FakeAsyncOpenAI:
+    """``AsyncOpenAI`` replacement whose chat completions return fake questions."""
+
+    latency = LatencyModel()
+    seed = 0
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self.lock = threading.Lock()
+        self.serial = itertools.count()
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=_FakeChatCompletions(self))
+
+
+# --- Embeddings -----------------------------------------------------------------
+
+try:
+    from chromadb.api.types import EmbeddingFunction as _EmbeddingFunctionBase
+except ImportError:  # pragma: no cover - chromadb is a hard dependency of the app
+    _EmbeddingFunctionBase = object
+
+
+class FakeEmbeddingFunction(_EmbeddingFunctionBase):
+    """Deterministic hashed embeddings; blocks like the synchronous OpenAI client."""
+
+    latency = LatencyModel()
+    dimensions = 64
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        pass
+
+    @staticmethod
+    def name() -> str:
+        return "presgen-loadtest"
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        time.sleep(self.latency.seconds("openai.embeddings"))
+        vectors = []
+        for text in input:
+            digest = hashlib.sha256(text.encode("utf-8")).digest() * 2
+            vector = [byte / 255.0 - 0.5 for byte in digest[:self.dimensions]]
+            norm = sum(v * v for v in vector) ** 0.5 or 1.0
+            vectors.append([v / norm for v in vector])
+        return vectors
+
+
+# --- Google Forms / Drive / Sheets ---------------------------------------------------
+
+def _rfc3339(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class FakeGoogleBackend:
+    """In-memory Forms, Drive and Sheets state shared by every fake service."""
+
+    def __init__(self, latency: Optional[LatencyModel] = None):
+        self.latency = latency or LatencyModel()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.forms: Dict[str, Dict[str, Any]] = {}
+        self.spreadsheets: Dict[str, Dict[str, Any]] = {}
+        self.calls: Dict[str, int] = {}
+
+    def _next_id(self, prefix: str) -> str:
+        return f"{prefix}{next(self._ids):06d}"
+
+    def call(self, api: str, operation: str, params: Dict[str, Any]) -> Any:
+        time.sleep(self.latency.seconds(api))
+        handler = getattr(self, f"_{api}_{operation.replace('.', '_')}", None)
+        with self._lock:
+            key = f"{api}.{operation}"
+            self.calls[key] = self.calls.get(key, 0) + 1
+            return handler(**params) if handler else {}
+
+    # Forms
+    def _forms_forms_create(self, body: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        form_id = self._next_id("form")
+        self.forms[form_id] = {
+            "info": dict(body.get("info", {})),
+            "items": [],
+            "responses": [],
+        }
+        return {
+            "formId": form_id,
+            "info": self.forms[form_id]["info"],
+            "responderUri": f"https://docs.google.com/forms/d/e/{form_id}/viewform",
+        }
+
+    def _forms_forms_batchUpdate(self, formId: str, body: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        form = self.forms[formId]
+        replies = []
+        for request in body.get("requests", []):
+            item = (request.get("createItem") or {}).get("item")
+            if item is None:
+                replies.append({})
+                continue
+            question_id = self._next_id("q")
+            choices = (item.get("questionItem", {}).get("question", {}).get("choiceQuestion") or {}).get("options", [])
+            form["items"].append({
+                "itemId": self._next_id("i"),
+                "title": item.get("title", ""),
+                "questionId": question_id,
+                "options": [option.get("value", "") for option in choices],
+            })
+            replies.append({"createItem": {"itemId": form["items"][-1]["itemId"], "questionId": [question_id]}})
+        return {"replies": replies, "form": {"formId": formId}}
+
+    def _forms_forms_get(self, formId: str, **_: Any) -> Dict[str, Any]:
+        form = self.forms[formId]
+        return {
+            "formId": formId,
+            "info": form["info"],
+            "items": [
+                {"itemId": item["itemId"], "title": item["title"],
+                 "questionItem": {"question": {"questionId": item["questionId"]}}}
+                for item in form["items"]
+            ],
+        }
+
+    def _forms_forms_responses_list(
+        self,
+        formId: str,
+        pageSize: int = 5000,
+        filter: Optional[str] = None,
+        pageToken: Optional[str] = None,
+        **_: Any
+    ) -> Dict[str, Any]:
+        responses = self.forms[formId]["responses"]
+        if filter:
+            since = filter.split(">=", 1)[1].strip()
+            responses = [r for r in responses if r["lastSubmittedTime"] >= since]
+        start = int(pageToken or 0)
+        page = responses[start:start + pageSize]
+        result: Dict[str, Any] = {"responses": [dict(r) for r in page]}
+        if start + pageSize < len(responses):
+            result["nextPageToken"] = str(start + pageSize)
+        return result
+
+    # Drive
+    def _drive_permissions_create(self, fileId: str, body: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        return {"id": self._next_id("perm"), "type": body.get("type"), "role": body.get("role")}
+
+    def _drive_files_create(self, body: Optional[Dict[str, Any]] = None, **_: Any) -> Dict[str, Any]:
+        file_id = self._next_id("file")
+        return {"id": file_id, "name": (body or {}).get("name"), "webViewLink": f"https://drive.google.com/{file_id}"}
+
+    def _drive_files_list(self, **_: Any) -> Dict[str, Any]:
+        return {"files": []}
+
+    # Sheets
+    def _sheets_spreadsheets_create(self, body: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        spreadsheet_id = self._next_id("sheet")
+        sheets = body.get("sheets") or [{"properties": {"title": "Sheet1"}}]
+        self.spreadsheets[spreadsheet_id] = {"next_sheet_id": len(sheets)}
+        return {
+            "spreadsheetId": spreadsheet_id,
+            "spreadsheetUrl": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
+            "properties": body.get("properties", {}),
+            "sheets": [
+                {"properties": {**sheet.get("properties", {}), "sheetId": index}}
+                for index, sheet in enumerate(sheets)
+            ],
+        }
+
+    def _sheets_spreadsheets_batchUpdate(self, spreadsheetId: str, body: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        state = self.spreadsheets.setdefault(spreadsheetId, {"next_sheet_id": 1})
+        replies = []
+        for request in body.get("requests", []):
+            if "addSheet" in request:
+                sheet_id = state["next_sheet_id"]
+                state["next_sheet_id"] += 1
+                properties = {**request["addSheet"].get("properties", {}), "sheetId": sheet_id}
+                replies.append({"addSheet": {"properties": properties}})
+            else:
+                replies.append({})
+        return {"spreadsheetId": spreadsheetId, "replies": replies}
+
+    def _sheets_spreadsheets_values_batchUpdate(self, spreadsheetId: str, body: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        data = body.get("data", [])
+        return {
+            "spreadsheetId": spreadsheetId,
+            "totalUpdatedRows": sum(len(entry.get("values", [])) for entry in data),
+        }
+
+    # Learners
+    def submit_responses(self, form_id: str, count: int, rng: random.Random) -> int:
+        """Record ``count`` learner submissions answering every question on the form."""
+        with self._lock:
+            form = self.forms[form_id]
+            for _ in range(count):
+                answers = {
+                    item["questionId"]: {
+                        "questionId": item["questionId"],
+                        "textAnswers": {"answers": [{"value": rng.choice(item["options"] or ["True"])}]},
+                    }
+                    for item in form["items"]
+                }
+                form["responses"].append({
+                    "responseId": self._next_id("resp"),
+                    "respondentEmail": f"learner{next(self._ids)}@example.edu",
+                    "createTime": _rfc3339(datetime.now(timezone.utc)),
+                    "lastSubmittedTime": _rfc3339(datetime.now(timezone.utc)),
+                    "answers": answers,
+                })
+            return len(form["items"])
+
+
+class FakeRequest:
+    """A prepared API call; ``execute()`` blocks for the backend's latency."""
+
+    def __init__(self, backend: FakeGoogleBackend, api: str, operation: str, params: Dict[str, Any]):
+        self.backend = backend
+        self.api = api
+        self.operation = operation
+        self.params = params
+
+    def execute(self, http: Any = None, num_retries: int = 0) -> Any:
+        return self.backend.call(self.api, self.operation, self.params)
+
+
+class FakeBatch:
+    def __init__(self, callback):
+        self._callback = callback
+        self._requests: List[tuple] = []
+
+    def add(self, request: FakeRequest, request_id: Optional[str] = None, callback=None) -> None:
+        self._requests.append((request_id or str(len(self._requests)), request, callback or self._callback))
+
+    def execute(self, http: Any = None) -> None:
+        for request_id, request, callback in self._requests:
+            try:
+                response, error = request.execute(), None
+            except Exception as exc:
+                response, error = None, exc
+            callback(request_id, response, error)
+
+
+class FakeResource:
+    """Discovery-style resource: ``svc.forms().responses().list(formId=...)``."""
+
+    def __init__(self, backend: FakeGoogleBackend, api: str, path: str = ""):
+        self._backend = backend
+        self._api = api
+        self._path = path
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        path = f"{self._path}.{name}" if self._path else name
+
+        def method(**params: Any):
+            if params:
+                return FakeRequest(self._backend, self._api, path, params)
+            return FakeResource(self._backend, self._api, path)
+
+        return method
+
+    def new_batch_http_request(self, callback=None) -> FakeBatch:
+        return FakeBatch(callback)
+
+
+def make_fake_build(backend: FakeGoogleBackend):
+    """A ``googleapiclient.discovery.build`` replacement bound to ``backend``."""
+
+    def fake_build(service_name: str, version: str, *args: Any, **kwargs: Any) -> FakeResource:
+        return FakeResource(backend, service_name)
+
+    return fake_build
+
+
+# --- Wiring -------------------------------------------------------------------------
+
+def install_fakes(latency: LatencyModel, seed: int = 0) -> FakeGoogleBackend:
+    """Point the app's OpenAI, ChromaDB and Google clients at the fakes.
+
+    Must run after ``src`` settings are configured and before the services
+    that build clients are instantiated (i.e. before the first request).
+    """
+    # Some service modules build clients at import time, so patch the client
+    # factories before importing anything that depends on them
+    from src.knowledge import embeddings
+
+    FakeEmbeddingFunction.latency = latency
+    embeddings.OpenAIEmbeddingFunctionV1 = FakeEmbeddingFunction
+
+    from src.services import llm_service
+
+    FakeAsyncOpenAI.latency = latency
+    FakeAsyncOpenAI.seed = seed
+    llm_service.AsyncOpenAI = FakeAsyncOpenAI
+
+    from src.services import drive_folder_manager, google_auth_manager, google_forms_service, google_sheets_service
+
+    backend = FakeGoogleBackend(latency)
+    fake_build = make_fake_build(backend)
+    credentials = SimpleNamespace(valid=True, expired=False, token="loadtest")
+
+    for module in (google_forms_service, google_sheets_service, drive_folder_manager, google_auth_manager):
+        module.build = fake_build
+    google_auth_manager.GoogleAuthManager.get_service_credentials = lambda self, *a, **k: credentials
+    google_sheets_service.ServiceAccountCredentials = SimpleNamespace(
+        from_service_account_file=lambda *a, **k: credentials
+    )
+    google_sheets_service.GOOGLE_SHEETS_AVAILABLE = True
+    return backend
+
+
+async def seed_knowledge_base(domains: List[str], chunks_per_domain: int = 6) -> None:
+    """Store exam-guide and transcript chunks the question generator retrieves."""
+    from src.knowledge.embeddings import VectorDatabaseManager
+
+    rng = random.Random(7)
+    vector_db = VectorDatabaseManager()
+    for classification in ("exam_guide", "transcript"):
+        chunks, metadata = [], []
+        for domain in domains:
+            for index in range(chunks_per_domain):
+                chunks.append(f"{domain}: {' '.join(rng.sample(_VOCABULARY, 40))}.")
+                metadata.append({
+                    "certification_id": CERTIFICATION_ID,
+                    "domain": domain,
+                    "source_file": f"loadtest-{classification}.txt",
+                    "chunk_index": index,
+                })
+        if not await vector_db.store_document_chunks(chunks, metadata, content_classification=classification):
+            raise RuntimeError(f"Seeding the {classification} collection failed")
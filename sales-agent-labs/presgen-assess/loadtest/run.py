@@ -0,0 +1,347 @@
+"""Step up concurrent classes against an in-process app and report capacity.
+
+The FastAPI app runs in this process (one worker, i.e. one node) on a
+file-backed SQLite database in the work directory, with OpenAI, ChromaDB
+embeddings and Google Forms/Drive/Sheets replaced by the fakes in
+``loadtest.fakes``. Requests go through ``httpx.ASGITransport`` so every
+middleware, dependency and background job runs as it does behind uvicorn.
+
+Usage (from the presgen-assess root):
+    python -m loadtest                                   # 1,2,4,8,16 classes
+    python -m loadtest --levels 1,4,8 --students 30 --json results.json
+    python -m loadtest --latency-scale 0                 # app CPU/DB cost only
+    python -m loadtest --latency-ms openai.chat=800,forms=150
+    python -m loadtest --database-url postgresql+asyncpg://...   # real pool
+
+Each level runs N classes (see ``loadtest.scenario``), started evenly over
+``--ramp-secs``. Between samples every 100ms the harness records DB pool
+occupancy, event-loop lag, Google API executor queueing and the generation
+job queue. The estimated capacity is the highest level at which it and every
+lower level kept the error rate, read/write p95 SLOs and pool timeouts in
+bounds.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SAMPLE_INTERVAL_SECS = 0.1
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--levels", default="1,2,4,8,16", help="Comma-separated concurrent class counts")
+    parser.add_argument("--students", type=int, default=25, help="Learners per class")
+    parser.add_argument("--questions", type=int, default=12, help="Questions per assessment")
+    parser.add_argument("--waves", type=int, default=3, help="Response submission waves per class")
+    parser.add_argument("--reads-per-student", type=int, default=3, help="Dashboard reads per learner")
+    parser.add_argument("--think-secs", type=float, default=1.0, help="Mean pause between a user's requests")
+    parser.add_argument("--poll-secs", type=float, default=0.5, help="Generation progress poll interval")
+    parser.add_argument("--export-fraction", type=float, default=0.25, help="Share of classes exporting to Sheets")
+    parser.add_argument("--ramp-secs", type=float, default=10.0, help="Spread class starts over this many seconds")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Multiply all fake backend latencies")
+    parser.add_argument("--latency-ms", default="", help="Per-backend median overrides, e.g. openai.chat=800,forms=0")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workdir", help="Database, ChromaDB and log directory (default: a new temp dir)")
+    parser.add_argument("--database-url", help="Async SQLAlchemy URL (default: SQLite in the workdir)")
+    parser.add_argument("--db-pool-size", type=int, help="Overrides DB_POOL_SIZE")
+    parser.add_argument("--db-max-overflow", type=int, help="Overrides DB_MAX_OVERFLOW")
+    parser.add_argument("--db-pool-timeout", type=float, help="Overrides DB_POOL_TIMEOUT_SECONDS")
+    parser.add_argument("--log-level", default="WARNING", type=str.upper, choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="App log level (INFO logs every request)")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--read-slo-ms", type=float, default=500.0, help="p95 bound for GET endpoints")
+    parser.add_argument("--write-slo-ms", type=float, default=5000.0, help="p95 bound for POST endpoints")
+    parser.add_argument("--keep-going", action="store_true", help="Run every level even after one misses the SLOs")
+    parser.add_argument("--json", dest="json_path", help="Also write the full results to this file")
+    args = parser.parse_args(argv)
+    try:
+        args.levels = sorted({int(level) for level in args.levels.split(",") if level.strip()})
+    except ValueError:
+        parser.error("--levels must be comma-separated integers")
+    if not args.levels or args.levels[0] < 1:
+        parser.error("--levels must be positive")
+    return args
+
+
+def configure_environment(args: argparse.Namespace) -> Path:
+    """Point settings at the work directory; must run before ``src`` is imported."""
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="presgen-loadtest-")).resolve()
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{workdir / 'loadtest.db'}"
+    os.environ["DB_SQLITE_METERED_POOL"] = "true"  # report checkout waits for SQLite too
+    os.environ["CHROMA_DB_PATH"] = str(workdir / "chroma")
+    os.environ["ENABLE_RATE_LIMITING"] = "false"
+    os.environ["ENABLE_GAP_DASHBOARD_ENHANCEMENTS"] = "true"
+    os.environ["ENABLE_AI_QUESTION_GENERATION"] = "false"  # generation already happens in the job
+    os.environ["USE_OAUTH_FOR_SHEETS"] = "false"
+    os.environ["DEBUG"] = "false"
+    os.environ["JOB_PROFILING_ENABLED"] = "false"
+    os.environ["LOG_LEVEL"] = args.log_level
+    os.environ.setdefault("OPENAI_API_KEY", "loadtest")
+    for value, name in (
+        (args.db_pool_size, "DB_POOL_SIZE"),
+        (args.db_max_overflow, "DB_MAX_OVERFLOW"),
+        (args.db_pool_timeout, "DB_POOL_TIMEOUT_SECONDS"),
+    ):
+        if value is not None:
+            os.environ[name] = str(value)
+
+    # The app writes logs to ./src/logs; keep them (and anything else relative)
+    # out of the checkout
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    os.chdir(workdir)
+    return workdir
+
+
+class Sampler:
+    """Periodically samples pool occupancy, loop lag and queue depths."""
+
+    def __init__(self, engine, executor, generation_jobs):
+        self._engine = engine
+        self._executor = executor
+        self._generation_jobs = generation_jobs
+        self.utilization: List[float] = []
+        self.saturated = 0
+        self.loop_lag: List[float] = []
+        self.max_in_flight = 0
+        self.max_queued = 0
+        self.max_generation_queue = 0
+        self.max_active_jobs = 0
+
+    async def run(self) -> None:
+        from src.service import database
+
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + SAMPLE_INTERVAL_SECS
+            await asyncio.sleep(SAMPLE_INTERVAL_SECS)
+            self.loop_lag.append(max(loop.time() - expected, 0.0))
+
+            pool = database.pool_metrics.snapshot(self._engine.sync_engine.pool)
+            if "utilization" in pool:
+                self.utilization.append(pool["utilization"])
+                if pool["checked_out"] >= pool["size"] + max(pool["max_overflow"], 0):
+                    self.saturated += 1
+            executor = self._executor.stats()
+            self.max_in_flight = max(self.max_in_flight, executor["in_flight"])
+            self.max_queued = max(self.max_queued, executor["queued"])
+            self.max_generation_queue = max(self.max_generation_queue, self._generation_jobs.queue_depth)
+            self.max_active_jobs = max(self.max_active_jobs, self._generation_jobs.active_jobs)
+
+
+def _cpu_secs() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def run_level(client, backend, certification_profile_id: str, classes: int, args) -> Dict[str, Any]:
+    """Run ``classes`` concurrent classes and summarize what the node did."""
+    from loadtest.scenario import ClassFailed, ClassProfile, Recorder, endpoint_summary, percentile, run_class
+    from src.service import database
+    from src.services.assessment_generation_jobs import generation_jobs
+    from src.services.google_api_executor import get_google_api_executor
+
+    profile = ClassProfile(
+        students=args.students,
+        questions=args.questions,
+        waves=args.waves,
+        reads_per_student=args.reads_per_student,
+        think_secs=args.think_secs,
+        poll_secs=args.poll_secs,
+        export_fraction=args.export_fraction,
+    )
+    recorder = Recorder()
+    database.pool_metrics = database.PoolMetrics()  # per-level pool counters
+    executor = get_google_api_executor()
+    executor.metrics.reset()
+    sampler = Sampler(database.engine, executor, generation_jobs)
+    sampler_task = asyncio.create_task(sampler.run())
+    rng = random.Random(f"{args.seed}:{classes}")
+
+    async def start_class(index: int) -> Dict[str, Any]:
+        await asyncio.sleep(args.ramp_secs * index / classes)
+        return await run_class(
+            client, backend, recorder, profile, certification_profile_id, index,
+            random.Random(rng.random())
+        )
+
+    cpu_started, started = _cpu_secs(), time.perf_counter()
+    outcomes = await asyncio.gather(*(start_class(i) for i in range(classes)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    cpu_used = _cpu_secs() - cpu_started
+    sampler_task.cancel()
+
+    finished = [o for o in outcomes if isinstance(o, dict)]
+    failures = [o for o in outcomes if isinstance(o, BaseException)]
+    for failure in failures:
+        if not isinstance(failure, ClassFailed):
+            print(f"⚠️ Unexpected error in class script: {failure!r}", file=sys.stderr)
+
+    durations = [o["total_secs"] for o in finished]
+    generation = [o["generation_secs"] for o in finished]
+    pool = database.pool_metrics.snapshot(database.engine.sync_engine.pool)
+    samples = len(sampler.loop_lag) or 1
+    return {
+        "classes": classes,
+        "classes_ok": len(finished),
+        "classes_failed": len(failures),
+        "failures": sorted({str(f) for f in failures})[:5],
+        "elapsed_secs": round(elapsed, 2),
+        "requests": recorder.total_requests,
+        "errors": recorder.total_errors,
+        "error_rate": round(recorder.total_errors / recorder.total_requests, 4) if recorder.total_requests else 0.0,
+        "rps": round(recorder.total_requests / elapsed, 2) if elapsed else 0.0,
+        "endpoints": endpoint_summary(recorder, elapsed),
+        "class_secs": {
+            "p50": round(percentile(durations, 50), 2),
+            "p95": round(percentile(durations, 95), 2),
+            "generation_p50": round(percentile(generation, 50), 2),
+            "generation_p95": round(percentile(generation, 95), 2),
+        },
+        "db_pool": {
+            "pool_class": pool.get("pool_class"),
+            "capacity": pool["size"] + max(pool["max_overflow"], 0) if "size" in pool else None,
+            "max_utilization": max(sampler.utilization, default=0.0),
+            "mean_utilization": round(sum(sampler.utilization) / len(sampler.utilization), 3) if sampler.utilization else 0.0,
+            "saturated_pct": round(100 * sampler.saturated / samples, 1),
+            "checkouts": pool["checkouts"],
+            "waited_checkouts": pool["waited_checkouts"],
+            "avg_wait_ms": pool["avg_wait_ms"],
+            "p95_wait_ms": pool["p95_wait_ms"],
+            "max_wait_ms": pool["max_wait_ms"],
+            "timeouts": pool["timeouts"],
+        },
+        "event_loop_lag_ms": {
+            "p95": round(1000 * percentile(sampler.loop_lag, 95), 1),
+            "max": round(1000 * max(sampler.loop_lag, default=0.0), 1),
+        },
+        "google_api": {
+            "max_workers": executor.max_workers,
+            "max_in_flight": sampler.max_in_flight,
+            "max_queued": sampler.max_queued,
+            "operations": executor.metrics.snapshot(),
+        },
+        "generation_jobs": {
+            "workers": generation_jobs.max_workers,
+            "max_queue_depth": sampler.max_generation_queue,
+            "max_active": sampler.max_active_jobs,
+        },
+        "process": {
+            "cpu_pct": round(100 * cpu_used / elapsed, 1) if elapsed else 0.0,
+            "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),  # KiB on Linux
+        },
+    }
+
+
+def print_level(level: Dict[str, Any]) -> None:
+    print(f"\n=== {level['classes']} concurrent class(es): {level['classes_ok']} ok, "
+          f"{level['classes_failed']} failed in {level['elapsed_secs']}s ===")
+    print(f"{'endpoint':<62} {'n':>6} {'err':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for endpoint, stats in level["endpoints"].items():
+        print(f"{endpoint:<62} {stats['requests']:>6} {stats['errors']:>5} {stats['p50_ms']:>8.1f} "
+              f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['max_ms']:>8.1f}")
+    pool, google, jobs = level["db_pool"], level["google_api"], level["generation_jobs"]
+    print(f"requests {level['requests']} ({level['rps']}/s), error rate {level['error_rate']:.2%}; "
+          f"class p50/p95 {level['class_secs']['p50']}/{level['class_secs']['p95']}s "
+          f"(generation {level['class_secs']['generation_p50']}/{level['class_secs']['generation_p95']}s)")
+    print(f"db pool ({pool['pool_class']}, capacity {pool['capacity']}): max util {pool['max_utilization']:.0%}, "
+          f"mean {pool['mean_utilization']:.0%}, saturated {pool['saturated_pct']}% of samples, "
+          f"waits avg/p95/max {pool['avg_wait_ms']}/{pool['p95_wait_ms']}/{pool['max_wait_ms']}ms, "
+          f"timeouts {pool['timeouts']}")
+    print(f"event loop lag p95/max {level['event_loop_lag_ms']['p95']}/{level['event_loop_lag_ms']['max']}ms; "
+          f"google api in-flight max {google['max_in_flight']}/{google['max_workers']} "
+          f"(queued max {google['max_queued']}); generation queue max {jobs['max_queue_depth']}, "
+          f"active max {jobs['max_active']}/{jobs['workers']}; "
+          f"cpu {level['process']['cpu_pct']}%, peak rss {level['process']['peak_rss_mb']}MB")
+    for failure in level["failures"]:
+        print(f"  ✗ {failure}")
+
+
+async def run_load_test(args: argparse.Namespace, workdir: Path) -> Dict[str, Any]:
+    import httpx
+
+    from loadtest.fakes import LatencyModel, install_fakes, parse_latency_overrides, seed_knowledge_base
+    from loadtest.scenario import EXAM_DOMAINS, create_certification_profile, estimate_capacity
+    from src.common.config import settings
+
+    # Several component loggers pin themselves to INFO; apply --log-level globally
+    logging.disable(getattr(logging, args.log_level) - 1)
+
+    latency = LatencyModel(args.latency_scale, parse_latency_overrides(args.latency_ms), seed=args.seed)
+    backend = install_fakes(latency, seed=args.seed)
+
+    from src.service.app import create_app  # builds service clients at import time
+
+    app = create_app()
+
+    levels: List[Dict[str, Any]] = []
+    async with app.router.lifespan_context(app):
+        await seed_knowledge_base([domain for domain, _, _ in EXAM_DOMAINS])
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost", timeout=300) as client:
+            certification_profile_id = await create_certification_profile(
+                client, f"AWS Certified Machine Learning - Specialty (load test {int(time.time())})"
+            )
+            for classes in args.levels:
+                print(f"▶ Running {classes} concurrent class(es)...", flush=True)
+                level = await run_level(client, backend, certification_profile_id, classes, args)
+                levels.append(level)
+                print_level(level)
+                verdict = estimate_capacity(levels, args.max_error_rate, args.read_slo_ms, args.write_slo_ms)
+                if verdict["limited_at"] is not None and not args.keep_going:
+                    break
+
+    capacity = estimate_capacity(levels, args.max_error_rate, args.read_slo_ms, args.write_slo_ms)
+    return {
+        "config": {
+            **{key: value for key, value in vars(args).items() if key != "json_path"},
+            "workdir": str(workdir),
+            "database_url": settings.database_url.split("@")[-1],
+            "db_pool_size": settings.db_pool_size,
+            "db_max_overflow": settings.db_max_overflow,
+            "db_pool_timeout_seconds": settings.db_pool_timeout_seconds,
+            "assessment_generation_workers": settings.assessment_generation_workers,
+            "google_api_max_workers": settings.google_api_max_workers,
+            "latency_ms": latency.latency_ms,
+        },
+        "levels": levels,
+        "capacity": capacity,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    json_path = Path(args.json_path).resolve() if args.json_path else None
+    workdir = configure_environment(args)
+    print(f"📁 Work directory: {workdir}")
+
+    results = asyncio.run(run_load_test(args, workdir))
+
+    capacity = results["capacity"]
+    print()
+    if capacity["concurrent_classes"] is None:
+        print(f"❌ No level met the SLOs (first level: {', '.join(capacity['reasons'])})")
+    else:
+        print(f"✅ Estimated capacity: {capacity['concurrent_classes']} concurrent class(es) on one node")
+    if capacity["limited_at"] is not None:
+        print(f"   limited at {capacity['limited_at']} classes by: {'; '.join(capacity['reasons'])}")
+    elif results["levels"]:
+        print("   every level met the SLOs; rerun with higher --levels to find the limit")
+
+    if json_path:
+        json_path.write_text(json.dumps(results, indent=2, default=str))
+        print(f"📝 Results written to {json_path}")
+    return 0 if capacity["concurrent_classes"] is not None else 1
@@ -0,0 +1,320 @@
+"""What one class does against the API, and the per-endpoint recorder.
+
+A class is one instructor workflow plus its learners:
+
+1. the instructor creates an assessment workflow and polls generation
+   (AI questions via the fake LLM, then the fake Google Form);
+2. learners submit in waves; after each wave the instructor forces response
+   ingestion and checks the workflow and ingestion stats;
+3. the instructor runs response processing (scoring + gap analysis);
+4. every learner opens the gap-analysis dashboard sections a few times,
+   revalidating with ``If-None-Match`` like the browser does; some classes
+   also export the results to Sheets.
+"""
+
+import asyncio
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from loadtest.fakes import FakeGoogleBackend
+
+API = "/api/v1"
+
+EXAM_DOMAINS = [
+    ("Data Engineering", 20, ["Data repositories", "Ingestion", "Transformation"]),
+    ("Exploratory Data Analysis", 24, ["Sanitizing data", "Feature engineering", "Visualization"]),
+    ("Modeling", 36, ["Framing problems", "Model selection", "Hyperparameter optimization", "Evaluation"]),
+    ("Machine Learning Implementation and Operations", 20, ["Deployment", "Monitoring", "Security"]),
+]
+
+# Dashboard reads a learner makes after results are published
+DASHBOARD_READS = [
+    ("GET /gap-analysis-dashboard/workflow/{id}", "/gap-analysis-dashboard/workflow/{id}"),
+    ("GET /gap-analysis-dashboard/workflow/{id}/summary", "/gap-analysis-dashboard/workflow/{id}/summary"),
+    ("GET /gap-analysis-dashboard/workflow/{id}/content-outlines", "/gap-analysis-dashboard/workflow/{id}/content-outlines"),
+    ("GET /gap-analysis-dashboard/workflow/{id}/recommended-courses", "/gap-analysis-dashboard/workflow/{id}/recommended-courses"),
+    ("GET /gap-analysis-dashboard/workflow/{id}/answers", "/gap-analysis-dashboard/workflow/{id}/answers"),
+    ("GET /workflows/{id}/gap-analysis", "/workflows/{id}/gap-analysis"),
+]
+
+# p95 bounds that replace the generic read/write SLO; the export makes a dozen
+# sequential Sheets calls even on an idle node
+ENDPOINT_SLO_MS = {
+    "POST /workflows/{id}/gap-analysis/export-to-sheets": 15000.0,
+}
+
+
+class ClassFailed(Exception):
+    """A step of a class script could not continue."""
+
+
+@dataclass
+class ClassProfile:
+    """Size and pacing of one simulated class."""
+
+    students: int = 25
+    questions: int = 12
+    waves: int = 3
+    reads_per_student: int = 3
+    think_secs: float = 1.0
+    poll_secs: float = 0.5
+    export_fraction: float = 0.25
+    generation_timeout_secs: float = 600.0
+
+
+class Recorder:
+    """Latency samples and outcomes per endpoint label."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint: str, seconds: float, status: str, ok: bool) -> None:
+        self.latencies[endpoint].append(seconds)
+        self.statuses[endpoint][status] += 1
+        if not ok:
+            self.errors[endpoint] += 1
+
+    @property
+    def total_requests(self) -> int:
+        return sum(len(samples) for samples in self.latencies.values())
+
+    @property
+    def total_errors(self) -> int:
+        return sum(self.errors.values())
+
+
+async def call(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    endpoint: str,
+    method: str,
+    path: str,
+    *,
+    ok_statuses: tuple = (200,),
+    expect_success: bool = False,
+    **kwargs: Any
+) -> httpx.Response:
+    """Issue one request, record it under ``endpoint`` and fail the class on errors.
+
+    ``expect_success`` also treats a 200 whose body says ``"success": false``
+    as an error, since several workflow endpoints report failures that way.
+    """
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, API + path, **kwargs)
+    except Exception as e:
+        recorder.record(endpoint, time.perf_counter() - started, type(e).__name__, ok=False)
+        raise ClassFailed(f"{endpoint}: {type(e).__name__}: {e}") from e
+    elapsed = time.perf_counter() - started
+
+    ok = response.status_code in ok_statuses
+    if ok and expect_success and response.status_code == 200:
+        ok = bool(response.json().get("success"))
+    recorder.record(endpoint, elapsed, str(response.status_code), ok)
+    if not ok:
+        raise ClassFailed(f"{endpoint}: HTTP {response.status_code} {response.text[:200]}")
+    return response
+
+
+async def create_certification_profile(client: httpx.AsyncClient, name: str) -> str:
+    """Create the certification profile every class's workflow refers to."""
+    response = await client.post(f"{API}/certifications/", json={
+        "name": name,
+        "version": "MLS-C01",
+        "provider": "AWS",
+        "description": "Load-test certification profile",
+        "exam_domains": [
+            {"name": domain, "weight_percentage": weight, "topics": topics}
+            for domain, weight, topics in EXAM_DOMAINS
+        ],
+    })
+    if response.status_code != 201:
+        raise RuntimeError(f"Creating the certification profile failed: HTTP {response.status_code} {response.text[:300]}")
+    return response.json()["id"]
+
+
+def domain_distribution(question_count: int) -> Dict[str, int]:
+    """Split ``question_count`` across the exam domains by weight."""
+    counts = {domain: question_count * weight // 100 for domain, weight, _ in EXAM_DOMAINS}
+    ranked = sorted(EXAM_DOMAINS, key=lambda d: -d[1])
+    for index in range(question_count - sum(counts.values())):
+        counts[ranked[index % len(ranked)][0]] += 1
+    return {domain: count for domain, count in counts.items() if count}
+
+
+async def _wait_for_generation(
+    client: httpx.AsyncClient, recorder: Recorder, workflow_id: str, profile: ClassProfile
+) -> Dict[str, Any]:
+    deadline = time.monotonic() + profile.generation_timeout_secs
+    while True:
+        job = (await call(
+            client, recorder, "GET /workflows/{id}/generation", "GET", f"/workflows/{workflow_id}/generation"
+        )).json()
+        if job["status"] in ("completed", "failed"):
+            return job
+        if time.monotonic() > deadline:
+            raise ClassFailed(f"generation still {job['status']} after {profile.generation_timeout_secs:.0f}s")
+        await asyncio.sleep(profile.poll_secs)
+
+
+async def _learner_reads(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    workflow_id: str,
+    profile: ClassProfile,
+    rng: random.Random
+) -> None:
+    etags: Dict[str, str] = {}
+    await asyncio.sleep(rng.uniform(0, profile.think_secs))
+    for _ in range(profile.reads_per_student):
+        endpoint, template = rng.choice(DASHBOARD_READS)
+        path = template.format(id=workflow_id)
+        headers = {"If-None-Match": etags[path]} if path in etags else {}
+        response = await call(client, recorder, endpoint, "GET", path, ok_statuses=(200, 304), headers=headers)
+        if response.headers.get("etag"):
+            etags[path] = response.headers["etag"]
+        await asyncio.sleep(rng.expovariate(1 / profile.think_secs) if profile.think_secs > 0 else 0)
+
+
+async def run_class(
+    client: httpx.AsyncClient,
+    backend: FakeGoogleBackend,
+    recorder: Recorder,
+    profile: ClassProfile,
+    certification_profile_id: str,
+    index: int,
+    rng: random.Random
+) -> Dict[str, Any]:
+    """Run one class end to end; raises ClassFailed at the first failed step."""
+    started = time.perf_counter()
+    created = (await call(
+        client, recorder, "POST /workflows", "POST", "/workflows/", ok_statuses=(201,),
+        json={
+            "user_id": f"loadtest-instructor-{index}-{rng.randrange(1 << 30)}",
+            "certification_profile_id": certification_profile_id,
+            "workflow_type": "assessment_generation",
+            "parameters": {
+                "title": f"Load test class {index}",
+                "question_count": profile.questions,
+                "difficulty_level": "intermediate",
+                "domain_distribution": domain_distribution(profile.questions),
+            },
+        },
+    )).json()
+    workflow_id = created["id"]
+
+    job = await _wait_for_generation(client, recorder, workflow_id, profile)
+    if job["status"] != "completed" or job["result"].get("generation_method") != "ai_generated":
+        raise ClassFailed(f"generation {job['status']} ({job.get('error') or job['result'].get('generation_method')})")
+    generated = time.perf_counter()
+
+    workflow = (await call(client, recorder, "GET /workflows/{id}", "GET", f"/workflows/{workflow_id}")).json()
+    form_id = workflow.get("google_form_id")
+    if not form_id:
+        raise ClassFailed("workflow has no Google Form after generation")
+
+    remaining = profile.students
+    for wave in range(profile.waves):
+        size = remaining // (profile.waves - wave)
+        remaining -= size
+        if size:
+            backend.submit_responses(form_id, size, rng)
+        await call(
+            client, recorder, "POST /workflows/{id}/force-ingest-responses", "POST",
+            f"/workflows/{workflow_id}/force-ingest-responses", expect_success=True,
+        )
+        await call(client, recorder, "GET /workflows/{id}", "GET", f"/workflows/{workflow_id}")
+        await call(client, recorder, "GET /workflows/ingestion/stats", "GET", "/workflows/ingestion/stats")
+        await asyncio.sleep(profile.think_secs)
+
+    await call(
+        client, recorder, "POST /workflows/{id}/process-responses", "POST",
+        f"/workflows/{workflow_id}/process-responses", expect_success=True,
+    )
+    analyzed = time.perf_counter()
+
+    learners = [
+        _learner_reads(client, recorder, workflow_id, profile, random.Random(rng.random()))
+        for _ in range(profile.students)
+    ]
+    if rng.random() < profile.export_fraction:
+        learners.append(call(
+            client, recorder, "POST /workflows/{id}/gap-analysis/export-to-sheets", "POST",
+            f"/workflows/{workflow_id}/gap-analysis/export-to-sheets", json={}, expect_success=True,
+        ))
+    results = await asyncio.gather(*learners, return_exceptions=True)
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures:
+        raise ClassFailed(f"{len(failures)} learner session(s) failed, first: {failures[0]}")
+
+    finished = time.perf_counter()
+    return {
+        "workflow_id": workflow_id,
+        "generation_secs": generated - started,
+        "analysis_secs": analyzed - started,
+        "total_secs": finished - started,
+    }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of ``samples`` (0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def endpoint_summary(recorder: Recorder, elapsed_secs: float) -> Dict[str, Dict[str, Any]]:
+    """Per-endpoint request counts, error rate and latency percentiles (ms)."""
+    summary = {}
+    for endpoint, samples in sorted(recorder.latencies.items()):
+        summary[endpoint] = {
+            "requests": len(samples),
+            "errors": recorder.errors.get(endpoint, 0),
+            "error_rate": round(recorder.errors.get(endpoint, 0) / len(samples), 4),
+            "rps": round(len(samples) / elapsed_secs, 2) if elapsed_secs else 0.0,
+            "p50_ms": round(1000 * percentile(samples, 50), 1),
+            "p95_ms": round(1000 * percentile(samples, 95), 1),
+            "p99_ms": round(1000 * percentile(samples, 99), 1),
+            "max_ms": round(1000 * max(samples), 1),
+            "statuses": dict(recorder.statuses[endpoint]),
+        }
+    return summary
+
+
+def estimate_capacity(levels: List[Dict[str, Any]], max_error_rate: float, read_slo_ms: float,
+                      write_slo_ms: float) -> Dict[str, Any]:
+    """Highest concurrency level at which this and every lower level met the SLOs.
+
+    A level fails if any class failed, the overall error rate exceeds
+    ``max_error_rate``, any GET endpoint's p95 exceeds ``read_slo_ms``, any
+    write's p95 exceeds ``write_slo_ms`` (``ENDPOINT_SLO_MS`` takes precedence)
+    or a pool checkout timed out.
+    """
+    capacity: Optional[int] = None
+    for level in sorted(levels, key=lambda lvl: lvl["classes"]):
+        reasons = []
+        if level["classes_failed"]:
+            reasons.append(f"{level['classes_failed']}/{level['classes']} classes failed")
+        if level["error_rate"] > max_error_rate:
+            reasons.append(f"error rate {level['error_rate']:.2%} > {max_error_rate:.2%}")
+        for endpoint, stats in level["endpoints"].items():
+            slo = ENDPOINT_SLO_MS.get(endpoint, read_slo_ms if endpoint.startswith("GET ") else write_slo_ms)
+            if stats["p95_ms"] > slo:
+                reasons.append(f"{endpoint} p95 {stats['p95_ms']:.0f}ms > {slo:.0f}ms")
+        if level["db_pool"].get("timeouts"):
+            reasons.append(f"{level['db_pool']['timeouts']} DB pool checkout timeouts")
+        if reasons:
+            return {"concurrent_classes": capacity, "limited_at": level["classes"], "reasons": reasons}
+        capacity = level["classes"]
+    return {"concurrent_classes": capacity, "limited_at": None, "reasons": []}
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark DocumentProcessor.create_chunks against the previous chunker.
+
+The previous implementation scanned forward character by character for a
+sentence end after every window and re-tokenized every (overlapping) chunk
+for keywords and concepts. It is reproduced here as ``legacy_create_chunks``
+so both can be timed on the same input.
+
+Usage:
+    python scripts/benchmark_chunker.py                  # synthetic 500-page guide
+    python scripts/benchmark_chunker.py --pages 2000
+    python scripts/benchmark_chunker.py --file guide.pdf  # real exam guide (PDF or text)
+"""
+
+import argparse
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.service.document_processor import DocumentProcessor, NLTK_AVAILABLE
+
+try:
+    from nltk.tokenize import word_tokenize
+    from nltk.corpus import stopwords
+except ImportError:
+    pass
+
+TOPICS = [
+    "Amazon VPC", "AWS Lambda", "Amazon S3", "IAM policies", "Elastic Load Balancing",
+    "Amazon RDS", "CloudFormation", "Auto Scaling", "Amazon DynamoDB", "CloudWatch alarms",
+]
+VERBS = ["configures", "restricts", "replicates", "monitors", "encrypts", "routes", "scales"]
+OBJECTS = [
+    "cross-region traffic", "least-privilege access", "multi-AZ deployments",
+    "lifecycle transitions", "provisioned throughput", "event-driven workloads",
+]
+
+
+def legacy_keywords(text):
+    if not NLTK_AVAILABLE:
+        return list(set(re.findall(r'\b[A-Z][a-z]+\b', text)))[:10]
+    try:
+        words = word_tokenize(text.lower())
+        stop_words = set(stopwords.words('english'))
+        return list({w for w in words if w.isalpha() and len(w) > 3 and w not in stop_words})[:10]
+    except Exception:
+        return list(set(re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())))[:10]
+
+
+def legacy_concepts(text):
+    concepts = [t for t in re.findall(r'\b[A-Z][A-Za-z]*(?:\s+[A-Z][A-Za-z]*)*\b', text) if len(t) > 3]
+    concepts.extend(re.findall(r'\b[A-Z]{2,}\b', text))
+    for pattern in [
+        r'\b(?:AWS|Azure|Google Cloud|GCP)\s+[A-Z][a-zA-Z\s]*\b',
+        r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+(?:Service|Platform|Protocol|Algorithm))\b',
+        r'\b(?:best practices?|design patterns?|architectures?|methodologies?)\b',
+    ]:
+        concepts.extend(re.findall(pattern, text, re.IGNORECASE))
+    return list(set([c.strip() for c in concepts if len(c.strip()) > 2]))[:15]
+
+
+def legacy_create_chunks(processor, text):
+    """The character-window chunker that create_chunks replaced."""
+    if len(text) <= processor.chunk_size:
+        return [(text, legacy_keywords(text), legacy_concepts(text))]
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + processor.chunk_size
+        if end < len(text):
+            for i in range(min(processor.chunk_overlap, len(text) - end)):
+                if text[end + i] in '.!?':
+                    end = end + i + 1
+                    break
+        chunk_text = text[start:end].strip()
+        if len(chunk_text) >= processor.min_chunk_size:
+            chunks.append((chunk_text, legacy_keywords(chunk_text), legacy_concepts(chunk_text)))
+        start = end - processor.chunk_overlap
+        if start >= len(text):
+            break
+    return chunks
+
+
+def synthetic_guide(pages, seed=7):
+    """Exam-guide-like pages (~2,500 characters each)."""
+    rng = random.Random(seed)
+    result = []
+    for page in range(pages):
+        sentences = [f"Section {page // 10 + 1}.{page % 10} covers {rng.choice(TOPICS)}."]
+        while sum(len(s) for s in sentences) < 2500:
+            sentences.append(
+                f"{rng.choice(TOPICS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)} "
+                f"while {rng.choice(TOPICS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)}."
+            )
+        result.append(" ".join(sentences))
+    return result
+
+
+def load_pages(path):
+    """Cleaned page texts from a PDF or text file."""
+    processor = DocumentProcessor(download_nltk=False)
+    if path.suffix.lower() == ".pdf":
+        import pypdf
+        reader = pypdf.PdfReader(str(path))
+        pages = [page.extract_text() or "" for page in reader.pages]
+    else:
+        pages = [path.read_text(encoding="utf-8")]
+    return [processor.clean_text(page) for page in pages if page.strip()]
+
+
+def time_runs(label, fn, pages, repeat):
+    timings = []
+    chunk_count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chunk_count = sum(len(fn(page)) for page in pages)
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    chars = sum(len(page) for page in pages)
+    print(
+        f"{label:<8} best {best * 1000:9.1f} ms  median {statistics.median(timings) * 1000:9.1f} ms  "
+        f"{chars / best / 1e6:6.2f} MB/s  {chunk_count} chunks"
+    )
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", type=Path, help="PDF or text exam guide to chunk")
+    parser.add_argument("--pages", type=int, default=500, help="synthetic guide size in pages")
+    parser.add_argument("--whole", action="store_true", help="chunk the document as one text instead of per page")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    processor = DocumentProcessor()
+    pages = load_pages(args.file) if args.file else synthetic_guide(args.pages)
+    if args.whole:
+        pages = [" ".join(pages)]
+
+    print(f"{len(pages)} text(s), {sum(len(p) for p in pages) / 1e6:.2f} MB, nltk={NLTK_AVAILABLE}")
+    legacy = time_runs("legacy", lambda page: legacy_create_chunks(processor, page), pages, args.repeat)
+    current = time_runs("current", processor.create_chunks, pages, args.repeat)
+    print(f"speedup  {legacy / current:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Opt-in sampling profiler for background jobs.
+
+A daemon thread snapshots the profiled thread's stack every
+``JOB_PROFILE_INTERVAL_MS`` with ``sys._current_frames()`` and counts
+identical stacks, so the job itself runs unmodified (no ``sys.setprofile``
+hook).
+
+Assessment generation runs on the event loop thread it shares with requests
+and other jobs. When ``profile_job`` is entered from a coroutine, the job's
+task and every task it creates are tagged with the job id (through a
+contextvar read by the loop's task factory), and a sample is only kept while
+the loop is running one of those tasks. Time the loop spends idle (e.g.
+waiting on the LLM) or running other work is counted as skipped, and
+executor threads are not sampled.
+
+Profiles are written to ``<JOB_PROFILE_DIR>/<job_id>/profile-<label>.folded``
+in the collapsed-stack format read by flamegraph.pl, speedscope and inferno.
+
+``SamplingProfiler`` is the same class as in sales-agent-labs'
+``src/common/profiling.py``; the two services are deployed separately with
+their own ``src`` packages, so keep the copies identical (sales-agent-labs'
+``tests/test_profiling_unit.py`` compares them).
+"""
+
+import asyncio
+import logging
+import os
+import re
+import sys
+import threading
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.common.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_NAME_RE = re.compile(r"^profile-[\w.-]+\.folded$")
+_MAX_DEPTH = 200
+
+# Job id of the profiled job the current task runs for; tasks created while
+# it is set are tagged by the task factory installed in _tag_job_tasks
+_JOB_ID: ContextVar[Optional[str]] = ContextVar("profiled_job_id", default=None)
+_TASK_JOBS: "weakref.WeakKeyDictionary[asyncio.Task, str]" = weakref.WeakKeyDictionary()
+
+
+def profile_path(job_id: str, label: str) -> Path:
+    safe_label = re.sub(r"[^\w.-]", "_", label)
+    return Path(settings.job_profile_dir) / job_id / f"profile-{safe_label}.folded"
+
+
+def list_profiles(job_id: str) -> List[str]:
+    """Profile file names written for a job."""
+    job_dir = Path(settings.job_profile_dir) / job_id
+    if not job_dir.is_dir():
+        return []
+    return sorted(p.name for p in job_dir.glob("profile-*.folded"))
+
+
+class SamplingProfiler:
+    """Samples thread stacks on a background thread and aggregates collapsed stacks.
+
+    thread_ids=None samples every thread except the sampler, with each stack
+    rooted at its thread name. ``include`` is checked before and after each
+    stack snapshot; if either check is False the sample is counted as skipped.
+    """
+
+    def __init__(
+        self,
+        thread_ids: Optional[Iterable[int]] = None,
+        interval: Optional[float] = None,
+        include: Optional[Callable[[], bool]] = None,
+    ):
+        self.thread_ids = set(thread_ids) if thread_ids is not None else None
+        self.interval = interval or _default_interval()
+        self.include = include
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.skipped = 0
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="job-profiler", daemon=True)
+
+    def start(self) -> "SamplingProfiler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def sample(self) -> None:
+        if self.include is not None and not self.include():
+            self.skipped += 1
+            return
+        frames = sys._current_frames()
+        if self.include is not None and not self.include():
+            self.skipped += 1  # switched away while the stacks were captured
+            return
+        me = threading.get_ident()
+        if self.thread_ids is None:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            targets = [(tid, names.get(tid, str(tid))) for tid in frames if tid != me]
+        else:
+            targets = [(tid, None) for tid in self.thread_ids if tid in frames]
+        for tid, thread_name in targets:
+            stack = self._collapse(frames[tid])
+            if thread_name is not None:
+                stack = f"{thread_name};{stack}"
+            self.samples[stack] += 1
+        self.sample_count += 1
+
+    def write_folded(self, path: Path) -> None:
+        """Write (merging with any existing profile at path) in collapsed-stack format."""
+        merged = Counter(self.samples)
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                stack, _, count = line.rpartition(" ")
+                if stack and count.isdigit():
+                    merged[stack] += int(count)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text("".join(f"{s} {n}\n" for s, n in sorted(merged.items())), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def _collapse(self, frame) -> str:
+        parts: List[str] = []
+        while frame is not None and len(parts) < _MAX_DEPTH:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = (
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                ).replace(";", ":")
+            parts.append(label)
+            frame = frame.f_back
+        return ";".join(reversed(parts))
+
+
+def _default_interval() -> float:
+    return settings.job_profile_interval_ms / 1000
+
+
+def _tag_job_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Wrap the loop's task factory so tasks created under a profiled job are tagged."""
+    previous = loop.get_task_factory()
+    if getattr(previous, "tags_profiled_jobs", False):
+        return
+
+    def factory(loop, coro, **kwargs):
+        if previous is not None:
+            task = previous(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        job_id = _JOB_ID.get()
+        if job_id is not None:
+            _TASK_JOBS[task] = job_id
+        return task
+
+    factory.tags_profiled_jobs = True
+    loop.set_task_factory(factory)
+
+
+def _loop_runs_job(loop: asyncio.AbstractEventLoop, job_id: str) -> bool:
+    task = asyncio.current_task(loop)
+    return task is not None and _TASK_JOBS.get(task) == job_id
+
+
+@contextmanager
+def profile_job(job_id: str, label: str, enabled: Optional[bool] = None) -> Iterator[Optional[Path]]:
+    """Profile the enclosed block when enabled (default: JOB_PROFILING_ENABLED).
+
+    Inside a coroutine only the current task and the tasks it creates are
+    sampled. Yields the profile path, or None when profiling is off.
+    """
+    if enabled is None:
+        enabled = settings.job_profiling_enabled
+    if not enabled:
+        yield None
+        return
+
+    path = profile_path(job_id, label)
+    try:
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task(loop)
+    except RuntimeError:
+        loop = task = None
+
+    include = None
+    if task is not None:
+        _tag_job_tasks(loop)
+        token = _JOB_ID.set(job_id)
+        outer_job = _TASK_JOBS.get(task)
+        _TASK_JOBS[task] = job_id
+        include = partial(_loop_runs_job, loop, job_id)
+
+    profiler = SamplingProfiler([threading.get_ident()], include=include).start()
+    try:
+        yield path
+    finally:
+        profiler.stop()
+        if task is not None:
+            _JOB_ID.reset(token)
+            if outer_job is None:
+                _TASK_JOBS.pop(task, None)
+            else:
+                _TASK_JOBS[task] = outer_job
+        try:
+            profiler.write_folded(path)
+            logger.info(
+                f"🔥 Job profile written | job_id={job_id} label={label} "
+                f"samples={profiler.sample_count} skipped={profiler.skipped} path={path}"
+            )
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write job profile | job_id={job_id} label={label} error={e}")
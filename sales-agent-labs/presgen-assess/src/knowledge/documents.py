@@ -1,5 +1,6 @@
 """Document processing pipeline for PresGen-Assess."""
 
+import asyncio
 import hashlib
 import logging
 import mimetypes
@@ -11,6 +12,8 @@ import PyPDF2
 from docx import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from src.service.document_processor import get_extraction_executor
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,7 +66,7 @@ class DocumentProcessor:
                 raise ValueError("No text content extracted from document")
 
             # Generate chunks with semantic splitting
-            chunks = self._create_semantic_chunks(text_content)
+            chunks = await self._create_semantic_chunks(text_content)
 
             # Generate metadata for each chunk
             metadata_list = self._generate_chunk_metadata(
@@ -104,18 +107,24 @@ class DocumentProcessor:
             }
 
     async def _extract_text_content(self, file_path: Path, mime_type: str) -> str:
-        """Extract text content based on file type."""
+        """Extract text content based on file type.
+
+        Parsing is CPU-bound, so it runs in the shared extraction process pool
+        instead of on the event loop.
+        """
         extractor = self.supported_types.get(mime_type)
         if not extractor:
             raise ValueError(f"No extractor available for mime type: {mime_type}")
 
         try:
-            return extractor(file_path)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(get_extraction_executor(), extractor, file_path)
         except Exception as e:
             logger.error(f"❌ Text extraction failed for {file_path}: {e}")
             raise
 
-    def _extract_pdf_text(self, file_path: Path) -> str:
+    @staticmethod
+    def _extract_pdf_text(file_path: Path) -> str:
         """Extract text from PDF files."""
         text_content = []
 
@@ -139,7 +148,8 @@ class DocumentProcessor:
             logger.error(f"❌ PDF extraction failed: {e}")
             raise
 
-    def _extract_docx_text(self, file_path: Path) -> str:
+    @staticmethod
+    def _extract_docx_text(file_path: Path) -> str:
         """Extract text from DOCX files."""
         text_content = []
 
@@ -167,7 +177,8 @@ class DocumentProcessor:
             logger.error(f"❌ DOCX extraction failed: {e}")
             raise
 
-    def _extract_txt_text(self, file_path: Path) -> str:
+    @staticmethod
+    def _extract_txt_text(file_path: Path) -> str:
         """Extract text from plain text files."""
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
@@ -181,14 +192,17 @@ class DocumentProcessor:
                 logger.error(f"❌ Text file extraction failed: {e}")
                 raise
 
-    def _create_semantic_chunks(self, text: str) -> List[str]:
+    async def _create_semantic_chunks(self, text: str) -> List[str]:
         """Create semantic chunks with overlap for better context preservation."""
         try:
             # Clean and normalize text
             cleaned_text = self._clean_text(text)
 
-            # Split into chunks
-            chunks = self.text_splitter.split_text(cleaned_text)
+            # Split into chunks (in the extraction pool; splitting is CPU-bound)
+            loop = asyncio.get_running_loop()
+            chunks = await loop.run_in_executor(
+                get_extraction_executor(), self.text_splitter.split_text, cleaned_text
+            )
 
             # Filter out very short or empty chunks
             meaningful_chunks = [
@@ -6,6 +6,7 @@ with ChromaDB integration for certification-specific knowledge bases.
 """
 
 import uuid
+from datetime import datetime
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
 from fastapi.responses import FileResponse
@@ -14,7 +15,7 @@ import chromadb
 
 from src.service.auth import get_current_user
 from src.service.file_upload_service import (
-    FileUploadService, FileMetadata, ProcessingResult,
+    BulkUploadBatch, FileUploadService, FileMetadata, ProcessingResult,
     file_registry, ResourceType
 )
 from src.service.chromadb_schema import ChromaDBCollectionManager
@@ -149,53 +150,95 @@ async def bulk_upload_files(
             detail="Certification profile not found"
         )
 
-    uploaded_files = []
-    errors = []
-
-    for file in files:
-        try:
-            # Get resource type for this file
-            resource_type = request_data.resource_mappings.get(
-                file.filename,
-                ResourceType.SUPPLEMENTAL
-            )
-
-            # Upload file
-            file_metadata = await file_upload_service.save_uploaded_file(
-                file=file,
-                user_id=str(current_user.id),
-                cert_profile_id=request_data.cert_profile_id,
-                resource_type=resource_type
-            )
-
-            file_registry.register_file(file_metadata)
+    # Stream all uploads to disk concurrently
+    saved_files, errors = await file_upload_service.save_uploaded_files(
+        uploads=[
+            (file, request_data.resource_mappings.get(file.filename, ResourceType.SUPPLEMENTAL))
+            for file in files
+        ],
+        user_id=str(current_user.id),
+        cert_profile_id=request_data.cert_profile_id
+    )
 
-            # Schedule processing
-            background_tasks.add_task(
-                process_file_background,
-                file_metadata,
-                cert_profile.name.lower().replace(' ', '-'),
-                cert_profile.version,
-                request_data.domain_mappings or {}
-            )
+    batch = BulkUploadBatch(
+        batch_id=str(uuid.uuid4()),
+        user_id=str(current_user.id),
+        cert_profile_id=request_data.cert_profile_id,
+        file_ids=[file_metadata.file_id for file_metadata in saved_files],
+        errors=errors,
+        created_at=datetime.utcnow().isoformat()
+    )
+    for file_metadata in saved_files:
+        file_registry.register_file(file_metadata)
+    file_registry.register_batch(batch)
+
+    # Process the whole batch with bounded concurrency
+    if saved_files:
+        background_tasks.add_task(
+            process_files_background,
+            saved_files,
+            cert_profile.name.lower().replace(' ', '-'),
+            cert_profile.version,
+            request_data.domain_mappings or {}
+        )
 
-            uploaded_files.append({
+    return {
+        "batch_id": batch.batch_id,
+        "status_url": f"/files/bulk-upload/{batch.batch_id}",
+        "uploaded_files": [
+            {
                 "file_id": file_metadata.file_id,
                 "filename": file_metadata.original_filename,
                 "status": "uploaded"
-            })
+            }
+            for file_metadata in saved_files
+        ],
+        "errors": errors,
+        "total_uploaded": len(saved_files),
+        "total_errors": len(errors)
+    }
 
-        except Exception as e:
-            errors.append({
-                "filename": file.filename,
-                "error": str(e)
-            })
 
+@router.get("/bulk-upload/{batch_id}")
+async def get_bulk_upload_progress(
+    batch_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get per-file processing progress for a bulk upload"""
+
+    batch = file_registry.get_batch(batch_id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="Bulk upload not found")
+
+    if batch.user_id != str(current_user.id):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    files = []
+    status_counts: Dict[str, int] = {}
+    for file_id in batch.file_ids:
+        file_metadata = file_registry.get_file(file_id)
+        if not file_metadata:
+            continue
+        status_counts[file_metadata.processing_status] = status_counts.get(file_metadata.processing_status, 0) + 1
+        files.append({
+            "file_id": file_metadata.file_id,
+            "filename": file_metadata.original_filename,
+            "status": file_metadata.processing_status,
+            "chunk_count": file_metadata.chunk_count,
+            "error_message": file_metadata.error_message
+        })
+
+    finished = status_counts.get("completed", 0) + status_counts.get("failed", 0)
     return {
-        "uploaded_files": uploaded_files,
-        "errors": errors,
-        "total_uploaded": len(uploaded_files),
-        "total_errors": len(errors)
+        "batch_id": batch.batch_id,
+        "cert_profile_id": batch.cert_profile_id,
+        "created_at": batch.created_at,
+        "total_files": len(files),
+        "status_counts": status_counts,
+        "progress_percent": round(100 * finished / len(files), 1) if files else 100.0,
+        "total_chunks": sum(f["chunk_count"] for f in files),
+        "files": files,
+        "upload_errors": batch.errors
     }
 
 
@@ -485,18 +528,7 @@ async def process_file_background(
         )
 
         # Update file registry with results
-        if result.success:
-            file_registry.update_file_status(
-                file_metadata.file_id,
-                "completed",
-                None
-            )
-        else:
-            file_registry.update_file_status(
-                file_metadata.file_id,
-                "failed",
-                result.error_message
-            )
+        record_processing_result(file_metadata, result)
 
     except Exception as e:
         file_registry.update_file_status(
@@ -506,6 +538,49 @@ async def process_file_background(
         )
 
 
+async def process_files_background(
+    file_metadatas: List[FileMetadata],
+    cert_id: str,
+    bundle_version: str,
+    domain_mappings: Dict[str, str]
+):
+    """Background task to process a bulk upload with bounded concurrency"""
+    try:
+        await file_upload_service.process_uploaded_files(
+            file_metadatas=file_metadatas,
+            cert_id=cert_id,
+            bundle_version=bundle_version,
+            collection_manager=collection_manager,
+            domain_mappings=domain_mappings,
+            on_result=record_processing_result
+        )
+
+    except Exception as e:
+        for file_metadata in file_metadatas:
+            if file_metadata.processing_status not in ("completed", "failed"):
+                file_registry.update_file_status(
+                    file_metadata.file_id,
+                    "failed",
+                    str(e)
+                )
+
+
+def record_processing_result(file_metadata: FileMetadata, result: ProcessingResult) -> None:
+    """Update the file registry as each file finishes processing"""
+    if result.success:
+        file_registry.update_file_status(
+            file_metadata.file_id,
+            "completed",
+            None
+        )
+    else:
+        file_registry.update_file_status(
+            file_metadata.file_id,
+            "failed",
+            result.error_message
+        )
+
+
 # Health check endpoints
 @router.get("/health")
 async def health_check():
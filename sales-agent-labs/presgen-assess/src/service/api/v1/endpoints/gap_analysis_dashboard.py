@@ -2,33 +2,54 @@
 
 Provides endpoints to retrieve Gap Analysis results, content outlines,
 and course recommendations for the dashboard UI.
+
+Read endpoints are served from the materialized dashboard read model
+(``src.services.gap_analysis_read_model``) and honour ``If-None-Match``.
 """
 
 import logging
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Header, status, Depends
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from src.service.database import get_db
-from src.models.gap_analysis import (
-    GapAnalysisResult as GapAnalysisResultModel,
-    ContentOutline as ContentOutlineModel,
-    RecommendedCourse as RecommendedCourseModel
-)
+from src.models.gap_analysis import RecommendedCourse as RecommendedCourseModel
 from src.schemas.gap_analysis import (
     GapAnalysisResult,
     ContentOutlineItem,
     RecommendedCourse
 )
+from src.services.gap_analysis_read_model import (
+    DashboardSection,
+    gap_analysis_read_model,
+    section_response
+)
 from src.common.logging_config import get_gap_analysis_logger
 
 logger = get_gap_analysis_logger()
 router = APIRouter()
 
 
+async def _get_section(
+    db: AsyncSession,
+    workflow_id: UUID,
+    section: str,
+    not_found_detail: str
+) -> DashboardSection:
+    cached = await gap_analysis_read_model.get_or_build(db, workflow_id, section)
+    if cached is None:
+        logger.warning(not_found_detail)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=not_found_detail
+        )
+    return cached
+
+
 @router.get(
     "/workflow/{workflow_id}",
     response_model=GapAnalysisResult,
@@ -36,8 +57,9 @@ router = APIRouter()
 )
 async def get_gap_analysis_by_workflow(
     workflow_id: UUID,
-    db: AsyncSession = Depends(get_db)
-) -> GapAnalysisResult:
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """
     Retrieve Gap Analysis results for a workflow.
 
@@ -51,9 +73,10 @@ async def get_gap_analysis_by_workflow(
     Args:
         workflow_id: UUID of the workflow execution
         db: Database session
+        if_none_match: ETag from a previous response
 
     Returns:
-        GapAnalysisResult: Complete gap analysis data
+        GapAnalysisResult: Complete gap analysis data (304 if unchanged)
 
     Raises:
         404: Gap analysis not found for workflow
@@ -62,38 +85,13 @@ async def get_gap_analysis_by_workflow(
     try:
         logger.info(f"Fetching gap analysis for workflow: {workflow_id}")
 
-        # Query database for gap analysis result (most recent)
-        result = await db.execute(
-            select(GapAnalysisResultModel)
-            .where(GapAnalysisResultModel.workflow_id == workflow_id)
-            .order_by(GapAnalysisResultModel.created_at.desc())
-            .limit(1)
+        section = await _get_section(
+            db, workflow_id, "gap_analysis",
+            f"Gap analysis not found for workflow {workflow_id}"
         )
-        gap_analysis_db = result.scalar_one_or_none()
 
-        if not gap_analysis_db:
-            logger.warning(f"Gap analysis not found for workflow: {workflow_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Gap analysis not found for workflow {workflow_id}"
-            )
-
-        # Convert database model to response schema
-        gap_analysis_response = GapAnalysisResult(
-            workflow_id=gap_analysis_db.workflow_id,
-            overall_score=gap_analysis_db.overall_score,
-            total_questions=gap_analysis_db.total_questions,
-            correct_answers=gap_analysis_db.correct_answers,
-            incorrect_answers=gap_analysis_db.incorrect_answers,
-            skill_gaps=gap_analysis_db.skill_gaps,
-            performance_by_domain=gap_analysis_db.performance_by_domain,
-            text_summary=gap_analysis_db.text_summary,
-            charts_data=gap_analysis_db.charts_data,
-            generated_at=gap_analysis_db.created_at
-        )
-
-        logger.info(f"✅ Gap analysis retrieved: {len(gap_analysis_response.skill_gaps)} skill gaps found")
-        return gap_analysis_response
+        logger.info(f"✅ Gap analysis retrieved: {len(section.payload['skill_gaps'])} skill gaps found")
+        return section_response(section, if_none_match)
 
     except HTTPException:
         raise
@@ -112,8 +110,9 @@ async def get_gap_analysis_by_workflow(
 )
 async def get_content_outlines(
     workflow_id: UUID,
-    db: AsyncSession = Depends(get_db)
-) -> List[ContentOutlineItem]:
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """
     Retrieve content outlines for a workflow's skill gaps.
 
@@ -123,6 +122,7 @@ async def get_content_outlines(
     Args:
         workflow_id: UUID of the workflow execution
         db: Database session
+        if_none_match: ETag from a previous response
 
     Returns:
         List[ContentOutlineItem]: Content outlines for all skill gaps
@@ -134,44 +134,13 @@ async def get_content_outlines(
     try:
         logger.info(f"Fetching content outlines for workflow: {workflow_id}")
 
-        # First verify gap analysis exists (get most recent)
-        gap_result = await db.execute(
-            select(GapAnalysisResultModel)
-            .where(GapAnalysisResultModel.workflow_id == workflow_id)
-            .order_by(GapAnalysisResultModel.created_at.desc())
-            .limit(1)
-        )
-        gap_analysis = gap_result.scalar_one_or_none()
-
-        if not gap_analysis:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Gap analysis not found for workflow {workflow_id}"
-            )
-
-        # Query content outlines
-        result = await db.execute(
-            select(ContentOutlineModel).where(
-                ContentOutlineModel.gap_analysis_id == gap_analysis.id
-            )
+        section = await _get_section(
+            db, workflow_id, "content_outlines",
+            f"Gap analysis not found for workflow {workflow_id}"
         )
-        content_outlines_db = result.scalars().all()
-
-        # Convert to response schemas
-        content_outlines = [
-            ContentOutlineItem(
-                skill_id=outline.skill_id,
-                skill_name=outline.skill_name,
-                exam_domain=outline.exam_domain,
-                exam_guide_section=outline.exam_guide_section,
-                content_items=outline.content_items,
-                rag_retrieval_score=outline.rag_retrieval_score
-            )
-            for outline in content_outlines_db
-        ]
 
-        logger.info(f"✅ Retrieved {len(content_outlines)} content outlines")
-        return content_outlines
+        logger.info(f"✅ Retrieved {len(section.payload)} content outlines")
+        return section_response(section, if_none_match)
 
     except HTTPException:
         raise
@@ -190,8 +159,9 @@ async def get_content_outlines(
 )
 async def get_recommended_courses(
     workflow_id: UUID,
-    db: AsyncSession = Depends(get_db)
-) -> List[RecommendedCourse]:
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """
     Retrieve recommended courses for a workflow's skill gaps.
 
@@ -205,6 +175,7 @@ async def get_recommended_courses(
     Args:
         workflow_id: UUID of the workflow execution
         db: Database session
+        if_none_match: ETag from a previous response
 
     Returns:
         List[RecommendedCourse]: Courses ordered by priority (high to low)
@@ -216,52 +187,13 @@ async def get_recommended_courses(
     try:
         logger.info(f"Fetching recommended courses for workflow: {workflow_id}")
 
-        # First verify gap analysis exists (get most recent)
-        gap_result = await db.execute(
-            select(GapAnalysisResultModel)
-            .where(GapAnalysisResultModel.workflow_id == workflow_id)
-            .order_by(GapAnalysisResultModel.created_at.desc())
-            .limit(1)
+        section = await _get_section(
+            db, workflow_id, "recommended_courses",
+            f"Gap analysis not found for workflow {workflow_id}"
         )
-        gap_analysis = gap_result.scalar_one_or_none()
-
-        if not gap_analysis:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Gap analysis not found for workflow {workflow_id}"
-            )
-
-        # Query recommended courses, ordered by priority descending
-        result = await db.execute(
-            select(RecommendedCourseModel)
-            .where(RecommendedCourseModel.gap_analysis_id == gap_analysis.id)
-            .order_by(RecommendedCourseModel.priority.desc())
-        )
-        courses_db = result.scalars().all()
-
-        # Convert to response schemas
-        courses = [
-            RecommendedCourse(
-                id=course.id,
-                workflow_id=course.workflow_id,
-                skill_id=course.skill_id,
-                skill_name=course.skill_name,
-                exam_domain=course.exam_domain,
-                exam_subsection=course.exam_subsection,
-                course_title=course.course_title,
-                course_description=course.course_description,
-                estimated_duration_minutes=course.estimated_duration_minutes,
-                difficulty_level=course.difficulty_level,
-                learning_objectives=course.learning_objectives,
-                content_outline=course.content_outline,
-                generation_status=course.generation_status,
-                priority=course.priority
-            )
-            for course in courses_db
-        ]
 
-        logger.info(f"✅ Retrieved {len(courses)} recommended courses")
-        return courses
+        logger.info(f"✅ Retrieved {len(section.payload)} recommended courses")
+        return section_response(section, if_none_match)
 
     except HTTPException:
         raise
@@ -279,8 +211,9 @@ async def get_recommended_courses(
 )
 async def get_assessment_answers(
     workflow_id: UUID,
-    db: AsyncSession = Depends(get_db)
-) -> Dict:
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """
     Retrieve assessment answers with explanations for correct/incorrect responses.
 
@@ -297,6 +230,7 @@ async def get_assessment_answers(
     Args:
         workflow_id: UUID of the workflow execution
         db: Database session
+        if_none_match: ETag from a previous response
 
     Returns:
         Dict: Contains lists of correct and incorrect answers with explanations
@@ -308,71 +242,16 @@ async def get_assessment_answers(
     try:
         logger.info(f"Fetching assessment answers for workflow: {workflow_id}")
 
-        # Get workflow with assessment data
-        from src.models.workflow import WorkflowExecution
-
-        result = await db.execute(
-            select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
+        section = await _get_section(
+            db, workflow_id, "answers",
+            f"Workflow {workflow_id} not found"
         )
-        workflow = result.scalar_one_or_none()
-
-        if not workflow:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Workflow {workflow_id} not found"
-            )
-
-        # Extract questions and responses from workflow
-        assessment_data = workflow.assessment_data or {}
-        questions = assessment_data.get("questions", [])
-        responses = workflow.collected_responses or []
-
-        # Create a map of question_id to question data
-        question_map = {q.get("id"): q for q in questions}
-
-        # Process responses and categorize as correct/incorrect
-        correct_answers = []
-        incorrect_answers = []
-
-        for response in responses:
-            question_id = response.get("question_id")
-            question = question_map.get(question_id, {})
-
-            if not question:
-                continue
-
-            user_answer = response.get("answer")
-            correct_answer = question.get("correct_answer")
-            is_correct = user_answer == correct_answer
-
-            answer_detail = {
-                "question_id": question_id,
-                "question_text": question.get("question_text", ""),
-                "user_answer": user_answer,
-                "correct_answer": correct_answer,
-                "explanation": question.get("explanation", "No explanation available."),
-                "domain": question.get("domain", "General"),
-                "difficulty": question.get("difficulty", "intermediate"),
-                "options": question.get("options", []),
-                "is_correct": is_correct
-            }
-
-            if is_correct:
-                correct_answers.append(answer_detail)
-            else:
-                incorrect_answers.append(answer_detail)
-
-        logger.info(f"✅ Retrieved {len(correct_answers)} correct and {len(incorrect_answers)} incorrect answers")
 
-        return {
-            "workflow_id": str(workflow_id),
-            "total_questions": len(questions),
-            "correct_count": len(correct_answers),
-            "incorrect_count": len(incorrect_answers),
-            "correct_answers": correct_answers,
-            "incorrect_answers": incorrect_answers,
-            "score_percentage": round((len(correct_answers) / len(questions) * 100), 2) if questions else 0
-        }
+        logger.info(
+            f"✅ Retrieved {section.payload['correct_count']} correct and "
+            f"{section.payload['incorrect_count']} incorrect answers"
+        )
+        return section_response(section, if_none_match)
 
     except HTTPException:
         raise
@@ -390,8 +269,9 @@ async def get_assessment_answers(
 )
 async def get_gap_analysis_summary(
     workflow_id: UUID,
-    db: AsyncSession = Depends(get_db)
-) -> Dict:
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """
     Retrieve Gap Analysis summary dashboard data.
 
@@ -407,6 +287,7 @@ async def get_gap_analysis_summary(
     Args:
         workflow_id: UUID of the workflow execution
         db: Database session
+        if_none_match: ETag from a previous response
 
     Returns:
         Dict: Dashboard summary data
@@ -418,62 +299,13 @@ async def get_gap_analysis_summary(
     try:
         logger.info(f"Fetching gap analysis summary for workflow: {workflow_id}")
 
-        # Query gap analysis
-        gap_result = await db.execute(
-            select(GapAnalysisResultModel).where(
-                GapAnalysisResultModel.workflow_id == workflow_id
-            )
-        )
-        gap_analysis = gap_result.scalar_one_or_none()
-
-        if not gap_analysis:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Gap analysis not found for workflow {workflow_id}"
-            )
-
-        # Count content outlines
-        content_count_result = await db.execute(
-            select(ContentOutlineModel).where(
-                ContentOutlineModel.gap_analysis_id == gap_analysis.id
-            )
+        section = await _get_section(
+            db, workflow_id, "summary",
+            f"Gap analysis not found for workflow {workflow_id}"
         )
-        content_outlines_count = len(content_count_result.scalars().all())
-
-        # Count recommended courses
-        courses_count_result = await db.execute(
-            select(RecommendedCourseModel).where(
-                RecommendedCourseModel.gap_analysis_id == gap_analysis.id
-            )
-        )
-        courses_count = len(courses_count_result.scalars().all())
-
-        # Get top 5 skill gaps by severity
-        skill_gaps = gap_analysis.skill_gaps
-        top_skill_gaps = sorted(
-            skill_gaps,
-            key=lambda x: x.get("severity", 0),
-            reverse=True
-        )[:5]
-
-        summary = {
-            "workflow_id": str(workflow_id),
-            "overall_score": gap_analysis.overall_score,
-            "total_questions": gap_analysis.total_questions,
-            "correct_answers": gap_analysis.correct_answers,
-            "incorrect_answers": gap_analysis.incorrect_answers,
-            "text_summary": gap_analysis.text_summary,
-            "performance_by_domain": gap_analysis.performance_by_domain,
-            "top_skill_gaps": top_skill_gaps,
-            "total_skill_gaps": len(skill_gaps),
-            "content_outlines_count": content_outlines_count,
-            "recommended_courses_count": courses_count,
-            "charts_data": gap_analysis.charts_data or {},
-            "generated_at": gap_analysis.created_at.isoformat()
-        }
 
         logger.info(f"✅ Gap analysis summary retrieved")
-        return summary
+        return section_response(section, if_none_match)
 
     except HTTPException:
         raise
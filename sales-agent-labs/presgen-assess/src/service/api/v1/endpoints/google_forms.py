@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
 
 from src.schemas.google_forms import (
@@ -71,11 +74,11 @@ async def add_questions(form_id: str, payload: AddQuestionsRequest):
 
 
 @router.get("/{form_id}/responses")
-async def get_responses(form_id: str):
-    """Retrieve responses for a specified form."""
+async def get_responses(form_id: str, since: Optional[datetime] = None):
+    """Retrieve responses for a specified form, optionally only those submitted since a time."""
     try:
         service = google_forms_service or get_google_forms_service()
-        result = await service.get_form_responses(form_id=form_id)
+        result = await service.get_form_responses(form_id=form_id, since=since)
         return result
     except Exception as exc:  # pragma: no cover
         logger.error("Failed to retrieve responses for form %s: %s", form_id, exc)
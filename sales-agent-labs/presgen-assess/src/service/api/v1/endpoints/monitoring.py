@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.common.logging_config import get_workflow_logger
 from src.service.database import get_db
-from src.services.monitoring_service import MonitoringService
+from src.services.monitoring_service import get_monitoring_service
 from src.services.presgen_integration_service import PresGenIntegrationService
 
 logger = get_workflow_logger()
@@ -18,24 +18,32 @@ router = APIRouter()
 @router.get("/health")
 async def health_check(
     include_details: bool = Query(default=True, description="Include detailed health check results"),
-    db: AsyncSession = Depends(get_db)
+    refresh: bool = Query(default=False, description="Run the checks now instead of serving the cached result")
 ) -> Dict[str, Any]:
-    """Comprehensive health check endpoint for production monitoring."""
+    """Comprehensive health check endpoint for production monitoring.
+
+    Serves the cached result (refreshed in the background once it is older
+    than the cache TTL), so probes do not wait on the database or Google APIs.
+    """
     try:
-        logger.info("🏥 Performing health check", extra={"include_details": include_details})
+        logger.debug("🏥 Performing health check", extra={"include_details": include_details, "refresh": refresh})
 
-        monitoring_service = MonitoringService()
-        health_result = await monitoring_service.comprehensive_health_check()
+        monitoring_service = get_monitoring_service()
+        if refresh:
+            health_result = await monitoring_service.comprehensive_health_check()
+        else:
+            health_result = await monitoring_service.get_cached_health()
 
         if not include_details:
             # Return simplified health status
             return {
                 "status": health_result["overall_status"],
                 "timestamp": health_result["timestamp"],
-                "summary": health_result.get("summary", {})
+                "summary": health_result.get("summary", {}),
+                "cache": health_result.get("cache")
             }
 
-        logger.info("✅ Health check completed", extra={
+        logger.debug("✅ Health check completed", extra={
             "overall_status": health_result["overall_status"],
             "checks_count": len(health_result.get("checks", []))
         })
@@ -74,7 +82,7 @@ async def get_system_metrics(
     try:
         logger.info("📊 Retrieving system metrics")
 
-        monitoring_service = MonitoringService()
+        monitoring_service = get_monitoring_service()
         metrics_result = await monitoring_service.get_system_metrics()
 
         if not metrics_result["success"]:
@@ -105,7 +113,7 @@ async def get_health_history(
     try:
         logger.info("📈 Retrieving health history", extra={"limit": limit})
 
-        monitoring_service = MonitoringService()
+        monitoring_service = get_monitoring_service()
         history_result = await monitoring_service.get_health_history(limit)
 
         if not history_result["success"]:
@@ -138,7 +146,7 @@ async def get_active_alerts(
     try:
         logger.info("🚨 Checking for active alerts")
 
-        monitoring_service = MonitoringService()
+        monitoring_service = get_monitoring_service()
         alerts = await monitoring_service.check_alerts()
 
         alert_summary = {
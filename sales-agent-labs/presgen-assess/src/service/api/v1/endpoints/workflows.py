@@ -2,17 +2,18 @@
 
 from datetime import datetime
 import csv
+import json
 from io import StringIO
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm.attributes import flag_modified
 
-from src.common.logging_config import get_workflow_logger, get_api_logger, get_assessment_logger
+from src.common.logging_config import get_workflow_logger, get_api_logger
 from src.common.config import settings
+from src.common.profiling import PROFILE_NAME_RE, profile_path
 from src.models.workflow import WorkflowExecution
 from src.schemas.workflow import (
     WorkflowCreate,
@@ -21,16 +22,21 @@ from src.schemas.workflow import (
     WorkflowStatusUpdate
 )
 from src.schemas.google_forms import AssessmentWorkflowRequest, FormSettings
+from src.service import workflow_queries
 from src.service.database import get_db
 from src.services.workflow_orchestrator import WorkflowOrchestrator
-from src.services.ai_question_generator import AIQuestionGenerator
+from src.services.assessment_generation_jobs import (
+    GenerationQueueFullError,
+    generation_jobs,
+    run_assessment_generation
+)
 from src.services.response_ingestion_service import ResponseIngestionService
 from src.services.google_sheets_service import GoogleSheetsService, EnhancedGapAnalysisExporter
-from fastapi.responses import JSONResponse, Response
+from src.services.gap_analysis_read_model import gap_analysis_read_model, section_response
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 
 logger = get_workflow_logger()
 api_logger = get_api_logger()
-assessment_logger = get_assessment_logger()
 
 router = APIRouter()
 
@@ -40,9 +46,7 @@ async def _build_gap_analysis_data(
     db: AsyncSession
 ) -> Dict[str, Any]:
     """Build gap analysis payload for a workflow."""
-    stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-    result = await db.execute(stmt)
-    workflow = result.scalar_one_or_none()
+    workflow = await workflow_queries.get_workflow(db, workflow_id)
 
     if not workflow:
         raise HTTPException(
@@ -292,6 +296,21 @@ async def _build_gap_analysis_data(
     }
 
 
+async def _build_gap_analysis_report(
+    db: AsyncSession,
+    workflow_id: UUID
+) -> Dict[str, Any]:
+    """Read model builder for the workflow gap analysis report section."""
+    return {"report": await _build_gap_analysis_data(workflow_id, db)}
+
+
+async def _get_gap_analysis_report(workflow_id: UUID, db: AsyncSession):
+    """Serve the gap analysis report from the dashboard read model."""
+    return await gap_analysis_read_model.get_or_build(
+        db, workflow_id, "report", builder=_build_gap_analysis_report
+    )
+
+
 def _generate_basic_pdf(text: str) -> bytes:
     """Generate a minimal PDF document containing the provided text."""
     # Escape PDF text characters
@@ -343,15 +362,37 @@ def _generate_basic_pdf(text: str) -> bytes:
     body += b"startxref\n" + str(xref_offset).encode("latin-1") + b"\n%%EOF"
 
     return body
+
+
+def _generation_queue_full() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Assessment generation queue is full, please retry shortly",
+        headers={"Retry-After": "30"}
+    )
+
+
 @router.post("/", response_model=WorkflowResponse, status_code=status.HTTP_201_CREATED)
 async def create_workflow(
     workflow_data: WorkflowCreate,
+    response: Response,
+    profile: Optional[bool] = Query(
+        None, description="Sample question generation with the job profiler (default: JOB_PROFILING_ENABLED)"
+    ),
     db: AsyncSession = Depends(get_db)
 ) -> WorkflowResponse:
-    """Create a new async workflow."""
+    """Create a new async workflow.
+
+    ``assessment_generation`` workflows are returned as soon as they are
+    stored; question generation and form creation run on the background
+    generation pool (see ``GET /workflows/{id}/generation``).
+    """
     # Log API request
     api_logger.info(f"📥 POST /workflows | user_id={workflow_data.user_id} | workflow_type={workflow_data.workflow_type} | cert_profile_id={workflow_data.certification_profile_id}")
 
+    if workflow_data.workflow_type == "assessment_generation" and generation_jobs.is_saturated():
+        raise _generation_queue_full()
+
     try:
         # Map WorkflowCreate data to WorkflowExecution fields
         workflow_dict = workflow_data.model_dump(exclude_none=True)
@@ -384,6 +425,11 @@ async def create_workflow(
             workflow_dict.get('workflow_type'),
         )
 
+        if workflow_dict.get('workflow_type') == "assessment_generation":
+            parameters = dict(workflow_dict.get('parameters') or {})
+            parameters['generation_status'] = "queued"
+            workflow_dict['parameters'] = parameters
+
         workflow = WorkflowExecution(**workflow_dict)
         db.add(workflow)
         await db.commit()
@@ -396,106 +442,102 @@ async def create_workflow(
             workflow.current_step,
         )
 
-        # Auto-trigger orchestration for assessment_generation workflows
+        # Queue AI question generation + form orchestration; the request
+        # returns immediately and progress is exposed on /generation
         if workflow.workflow_type == "assessment_generation":
             try:
-                logger.info("🚀 Auto-triggering orchestration for assessment_generation workflow")
-
-                # Generate real AI questions using knowledge base
-                logger.info(f"🤖 Generating AI questions for workflow {workflow.id} | cert_profile_id={workflow.certification_profile_id} | domain_distribution={workflow.parameters.get('domain_distribution', {})} | question_count={workflow.parameters.get('question_count', 24)}")
-                assessment_logger.info(f"🚀 Starting assessment generation | workflow_id={workflow.id} | cert_profile_id={workflow.certification_profile_id} | question_count={workflow.parameters.get('question_count', 24)}")
-
-                question_generator = AIQuestionGenerator()
-                ai_result = await question_generator.generate_contextual_assessment(
-                    certification_profile_id=str(workflow.certification_profile_id),
-                    user_profile="intermediate_learner",  # Default user profile
-                    difficulty_level=workflow.parameters.get('difficulty_level', 'beginner'),
-                    domain_distribution=workflow.parameters.get('domain_distribution', {}),
-                    question_count=workflow.parameters.get('question_count', 24)
+                generation_jobs.submit(workflow.id, run_assessment_generation, profile=profile)
+                response.headers["Location"] = (
+                    f"{settings.api_v1_prefix}/workflows/{workflow.id}/generation"
                 )
+                logger.info(f"🚀 Assessment generation queued for workflow {workflow.id}")
+            except GenerationQueueFullError as e:
+                # The queue filled after the precheck: drop the workflow so a
+                # retry doesn't leave an orphan that never generates
+                logger.warning(f"⚠️ Assessment generation not queued for workflow {workflow.id}: {e}")
+                await db.delete(workflow)
+                await db.commit()
+                raise _generation_queue_full()
 
-                logger.info(f"🔍 AI question generation result | success={ai_result.get('success')} | error={ai_result.get('error', 'None')}")
-                assessment_logger.info(f"✅ Assessment generation completed | success={ai_result.get('success')} | questions_generated={len(ai_result.get('assessment_data', {}).get('questions', []))} | workflow_id={workflow.id}")
-
-                if ai_result.get('success') and ai_result.get('assessment_data', {}).get('questions'):
-                    # Use AI-generated questions
-                    assessment_data = ai_result['assessment_data']
-                    generation_method = "ai_generated"
-                    question_count = len(assessment_data.get('questions', []))
-                    logger.info(f"✅ Using AI-generated questions | count={question_count}")
-                else:
-                    # Fallback to mock questions if AI generation fails
-                    logger.warning(f"⚠️ AI question generation failed, using fallback mock questions: {ai_result.get('error', 'Unknown error')}")
-                    fallback_count = min(5, workflow.parameters.get('question_count', 24) // 5)
-                    assessment_data = {
-                        "questions": [
-                            {
-                                "id": f"fallback_q{i+1}",
-                                "question_text": f"Sample question {i+1} for {workflow.parameters.get('title', 'Assessment')}",
-                                "question_type": "multiple_choice",
-                                "options": ["A) Option 1", "B) Option 2", "C) Option 3", "D) Option 4"],
-                                "correct_answer": "A"
-                            } for i in range(fallback_count)
-                        ],
-                        "metadata": {
-                            "certification_name": workflow.parameters.get('title', 'Assessment'),
-                            "difficulty_level": workflow.parameters.get('difficulty_level', 'beginner'),
-                            "question_count": workflow.parameters.get('question_count', 24),
-                            "domain_distribution": workflow.parameters.get('domain_distribution', {})
-                        }
-                    }
-                    generation_method = "fallback"
-                    question_count = fallback_count
-
-                # Store generation metadata in workflow parameters
-                if not workflow.parameters:
-                    workflow.parameters = {}
-                workflow.parameters['generation_method'] = generation_method
-                workflow.parameters['question_count'] = question_count
+        return WorkflowResponse.model_validate(workflow)
 
-                # Flag the JSON column as modified so SQLAlchemy detects the change
-                flag_modified(workflow, 'parameters')
+    except HTTPException:
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.exception("❌ Failed to create workflow")
+        logger.error("❌ Payload causing failure: %s", workflow_data.model_dump())
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create workflow: {str(e)}"
+        )
 
-                await db.commit()
-                await db.refresh(workflow)
 
-                logger.info(f"✅ Stored generation metadata | method={generation_method} | count={question_count}")
+@router.get("/{workflow_id}/generation")
+async def get_generation_progress(
+    workflow_id: UUID,
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """Poll assessment generation progress for a workflow."""
+    job = generation_jobs.get(workflow_id)
+    if job:
+        return job.to_dict()
 
-                form_settings = FormSettings(
-                    collect_email=True,
-                    require_login=False
-                )
+    # Job evicted or owned by another process: fall back to persisted status
+    workflow = await workflow_queries.get_workflow(db, workflow_id)
+    parameters = (workflow.parameters or {}) if workflow else {}
 
-                orchestrator = WorkflowOrchestrator()
-                orchestration_result = await orchestrator.execute_assessment_to_form_workflow(
-                    certification_profile_id=workflow.certification_profile_id,
-                    user_id=workflow.user_id,
-                    assessment_data=assessment_data,
-                    form_settings=form_settings
-                )
+    if not workflow or 'generation_status' not in parameters:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No assessment generation found for workflow"
+        )
 
-                if orchestration_result.get("success"):
-                    logger.info(f"✅ Auto-orchestration successful for workflow {workflow.id}")
-                else:
-                    logger.warning(f"⚠️ Auto-orchestration failed for workflow {workflow.id}: {orchestration_result.get('error')}")
+    return {
+        "workflow_id": str(workflow_id),
+        "status": parameters['generation_status'],
+        "stage": parameters['generation_status'],
+        "progress": 100 if parameters['generation_status'] == "completed" else None,
+        "result": {
+            "generation_method": parameters.get('generation_method'),
+            "question_count": parameters.get('question_count')
+        },
+        "error": parameters.get('generation_error')
+    }
 
-            except Exception as e:
-                logger.error(f"❌ Auto-orchestration error for workflow {workflow.id}: {e}")
 
-            # Refresh workflow to get latest parameters with generation metadata
-            await db.refresh(workflow)
+@router.get("/{workflow_id}/generation/profiles/{name}")
+async def get_generation_profile(workflow_id: UUID, name: str) -> FileResponse:
+    """Download a collapsed-stack CPU profile listed in the generation job's ``profiles``."""
+    path = profile_path(str(workflow_id), name[len("profile-"):-len(".folded")])
+    if not PROFILE_NAME_RE.match(name) or not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    return FileResponse(path, media_type="text/plain", filename=name)
 
-        return WorkflowResponse.model_validate(workflow)
 
-    except Exception as e:
-        await db.rollback()
-        logger.exception("❌ Failed to create workflow")
-        logger.error("❌ Payload causing failure: %s", workflow_data.model_dump())
+@router.get("/{workflow_id}/generation/events")
+async def stream_generation_progress(workflow_id: UUID) -> StreamingResponse:
+    """Stream assessment generation progress as Server-Sent Events."""
+    job = generation_jobs.get(workflow_id)
+    if not job:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create workflow: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No active assessment generation for workflow; poll /generation instead"
         )
 
+    async def event_source():
+        async for event in generation_jobs.stream(job):
+            yield f"id: {event['seq']}\nevent: {event['stage']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 
 @router.get("/", response_model=List[WorkflowResponse])
 async def list_workflows(
@@ -532,9 +574,7 @@ async def get_workflow(
     """Get a specific workflow by ID."""
     try:
         logger.info("🔍 Fetching workflow detail | id=%s", workflow_id)
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow(db, workflow_id)
 
         if not workflow:
             logger.warning("⚠️ Workflow not found | id=%s", workflow_id)
@@ -571,9 +611,7 @@ async def get_workflow_by_token(
 ) -> WorkflowResponse:
     """Get workflow by resume token."""
     try:
-        stmt = select(WorkflowExecution).where(WorkflowExecution.resume_token == resume_token)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow_by_resume_token(db, resume_token)
 
         if not workflow:
             raise HTTPException(
@@ -609,9 +647,7 @@ async def resume_workflow(
 ) -> WorkflowResponse:
     """Resume a workflow with provided data."""
     try:
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow(db, workflow_id)
 
         if not workflow:
             raise HTTPException(
@@ -662,9 +698,7 @@ async def update_workflow_status(
 ) -> WorkflowResponse:
     """Update workflow status."""
     try:
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow(db, workflow_id)
 
         if not workflow:
             raise HTTPException(
@@ -703,9 +737,7 @@ async def delete_workflow(
 ):
     """Delete a workflow."""
     try:
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow(db, workflow_id)
 
         if not workflow:
             raise HTTPException(
@@ -896,9 +928,7 @@ async def trigger_workflow_orchestration(
         logger.info(f"🚀 Triggering orchestration for workflow: {workflow_id}")
 
         # Get the workflow
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow(db, workflow_id)
 
         if not workflow:
             raise HTTPException(
@@ -1000,9 +1030,7 @@ async def manual_process_completed_form(
         logger.info(f"🎯 Manual processing for completed form | workflow_id={workflow_id}")
 
         # Get workflow details
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow(db, workflow_id)
 
         if not workflow:
             raise HTTPException(
@@ -1079,9 +1107,7 @@ async def manual_gap_analysis_completion(
         logger.info(f"🎯 Manual gap analysis with persistence | workflow_id={workflow_id}")
 
         # Get workflow details
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow(db, workflow_id)
 
         if not workflow:
             raise HTTPException(
@@ -1144,6 +1170,9 @@ async def manual_gap_analysis_completion(
                 certification_profile=cert_profile
             )
 
+        # Build the dashboard read model once everything above is persisted
+        await gap_service.materialize_dashboard(workflow_id)
+
         # Update workflow to completed (Gap Analysis is now the final step)
         workflow.current_step = "gap_analysis_complete"
         workflow.execution_status = "completed"
@@ -1192,9 +1221,7 @@ async def manual_presentation_completion(
         logger.info(f"🎯 Manual presentation completion | workflow_id={workflow_id}")
 
         # Get workflow details
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow(db, workflow_id)
 
         if not workflow:
             raise HTTPException(
@@ -1307,15 +1334,16 @@ async def manual_presentation_completion(
 )
 async def get_workflow_gap_analysis(
     workflow_id: UUID,
-    db: AsyncSession = Depends(get_db)
-) -> Dict[str, Any]:
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """Get gap analysis results for a completed workflow."""
     try:
         logger.info(f"📊 Getting gap analysis for workflow: {workflow_id}")
-        gap_analysis_data = await _build_gap_analysis_data(workflow_id, db)
+        report = await _get_gap_analysis_report(workflow_id, db)
 
-        logger.info(f"✅ Gap analysis retrieved for workflow: {workflow_id}")
-        return gap_analysis_data
+        logger.info(f"✅ Gap analysis retrieved for workflow: {workflow_id} (version {report.version})")
+        return section_response(report, if_none_match)
 
     except HTTPException:
         raise
@@ -1552,7 +1580,7 @@ async def export_gap_analysis_report(
 ) -> Response:
     """Export gap analysis data in JSON, CSV, or PDF format."""
     try:
-        gap_analysis_data = await _build_gap_analysis_data(workflow_id, db)
+        gap_analysis_data = (await _get_gap_analysis_report(workflow_id, db)).payload
 
         filename_base = f"gap-analysis-{workflow_id}"
 
@@ -1655,9 +1683,7 @@ async def auto_progress_workflow(
         logger.info(f"🚀 Auto-progressing workflow: {workflow_id}")
 
         # Get workflow details
-        stmt = select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-        result = await db.execute(stmt)
-        workflow = result.scalar_one_or_none()
+        workflow = await workflow_queries.get_workflow(db, workflow_id)
 
         if not workflow:
             raise HTTPException(
@@ -13,6 +13,10 @@ from src.common.config import settings
 from src.common.logging_config import initialize_service_loggers, log_application_startup, log_application_shutdown
 from src.service.api.v1.router import api_router
 from src.service.database import init_db
+from src.service.document_processor import shutdown_extraction_executor
+from src.services.assessment_generation_jobs import generation_jobs
+from src.services.google_api_executor import shutdown_google_api_executor
+from src.services.monitoring_service import shutdown_monitoring_service
 from src.service.middleware import RequestLoggingMiddleware, RateLimitingMiddleware
 
 logger = logging.getLogger(__name__)
@@ -38,6 +42,10 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("🔄 Shutting down PresGen-Assess application")
+    await generation_jobs.shutdown()
+    shutdown_extraction_executor()
+    shutdown_google_api_executor()
+    await shutdown_monitoring_service()
     log_application_shutdown()
 
 
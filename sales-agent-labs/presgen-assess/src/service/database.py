@@ -1,24 +1,165 @@
 """Database configuration and session management."""
 
 import logging
+import threading
+import time
+from collections import deque
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from src.common.config import settings
 from src.models.base import Base
 
 logger = logging.getLogger(__name__)
 
+
+class PoolMetrics:
+    """Connection checkout counters and wait times for the engine's pool."""
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._recent_waits = deque(maxlen=window)
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.timeouts = 0
+        self.waited_checkouts = 0
+        self.wait_samples = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def increment(self, counter: str) -> None:
+        """Bump a pool event counter (connects, checkouts or checkins)."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self._recent_waits.append(seconds)
+            self.wait_samples += 1
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            if seconds >= 0.001:
+                self.waited_checkouts += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool: Any = None) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._recent_waits)
+            stats = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "waited_checkouts": self.waited_checkouts,
+                "avg_wait_ms": round(1000 * self.total_wait_seconds / self.wait_samples, 3) if self.wait_samples else 0.0,
+                "p95_wait_ms": round(1000 * waits[int(0.95 * (len(waits) - 1))], 3) if waits else 0.0,
+                "max_wait_ms": round(1000 * self.max_wait_seconds, 3)
+            }
+
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            checked_out = pool.checkedout()
+            max_overflow = getattr(pool, "max_overflow", settings.db_max_overflow)
+            capacity = pool.size() + max(max_overflow, 0)
+            stats.update({
+                "pool_class": type(pool).__name__,
+                "size": pool.size(),
+                "max_overflow": max_overflow,
+                "checked_out": checked_out,
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "utilization": round(checked_out / capacity, 3) if capacity else 0.0
+            })
+        elif pool is not None:
+            stats["pool_class"] = type(pool).__name__
+        return stats
+
+
+pool_metrics = PoolMetrics()
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection.
+
+    The wait is timed around the public connect() call, so it also covers
+    opening a new connection and the pre-ping; only public pool API is used.
+    """
+
+    def __init__(self, *args: Any, max_overflow: int = 10, **kwargs: Any):
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow  # the pool only keeps it privately
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            logger.warning(
+                f"⚠️ Database pool exhausted | size={self.size()} overflow={self.overflow()} "
+                f"timeout={self.timeout()}s"
+            )
+            raise
+        pool_metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """Pool and driver options for the configured database."""
+    url = make_url(database_url)
+    options: Dict[str, Any] = {"echo": settings.debug, "pool_pre_ping": True}
+
+    if settings.debug:
+        options["poolclass"] = NullPool
+    elif url.get_backend_name() != "sqlite" or (
+        settings.db_sqlite_metered_pool and url.database not in (None, "", ":memory:")
+    ):
+        options.update({
+            "poolclass": MeteredQueuePool,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout_seconds,
+            "pool_recycle": settings.db_pool_recycle_seconds,
+        })
+
+    if url.get_driver_name() == "asyncpg" and "prepared_statement_cache_size" not in url.query:
+        # Server-side prepared statements for the repeated hot lookups
+        url = url.update_query_dict({"prepared_statement_cache_size": str(settings.db_statement_cache_size)})
+
+    options["url"] = url
+    return options
+
+
+def _create_engine():
+    options = _engine_options(settings.database_url)
+    new_engine = create_async_engine(options.pop("url"), **options)
+
+    pool_events = new_engine.sync_engine.pool
+
+    @event.listens_for(pool_events, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        pool_metrics.increment("connects")
+
+    @event.listens_for(pool_events, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool_metrics.increment("checkouts")
+
+    @event.listens_for(pool_events, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        pool_metrics.increment("checkins")
+
+    return new_engine
+
+
 # Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    poolclass=NullPool if settings.debug else None,
-)
+engine = _create_engine()
 
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -30,6 +171,11 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def get_pool_metrics() -> Dict[str, Any]:
+    """Current pool occupancy plus cumulative checkout/wait statistics."""
+    return pool_metrics.snapshot(engine.sync_engine.pool)
+
+
 async def init_db():
     """Initialize database tables."""
     try:
@@ -59,4 +205,4 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency for database session."""
     async with get_db_session() as session:
-        yield session
\ No newline at end of file
+        yield session
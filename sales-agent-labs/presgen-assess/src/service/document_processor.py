@@ -6,12 +6,20 @@ and extracts structured content for ChromaDB storage.
 """
 
 import re
+import asyncio
+import bisect
 import logging
-from typing import List, Dict, Any, Optional
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import aiofiles
 from io import BytesIO
 
+from src.common.config import settings
+
 # Optional imports for different file types
 try:
     import pypdf
@@ -27,7 +35,6 @@ except ImportError:
 
 try:
     import nltk
-    from nltk.tokenize import sent_tokenize, word_tokenize
     from nltk.corpus import stopwords
     NLTK_AVAILABLE = True
 except ImportError:
@@ -36,6 +43,165 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Average characters per word token (word plus separator); converts the
+# character-based chunk settings into token budgets
+CHARS_PER_TOKEN = 6
+
+_TOKEN_PATTERN = re.compile(r"\w+(?:['\-]\w+)*")
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]+(?=\s|$)")
+
+_TECH_TERM_PATTERN = re.compile(r'\b[A-Z][A-Za-z]*(?:\s+[A-Z][A-Za-z]*)*\b')
+_ACRONYM_PATTERN = re.compile(r'\b[A-Z]{2,}\b')
+_CONCEPT_PATTERNS = [
+    re.compile(r'\b(?:AWS|Azure|Google Cloud|GCP)\s+[A-Z][a-zA-Z\s]*\b', re.IGNORECASE),
+    re.compile(r'\b(?:best practices?|design patterns?|architectures?|methodologies?)\b', re.IGNORECASE),
+]
+# Backtracks over every word run, so it only runs on sentences containing a suffix
+_SERVICE_CONCEPT_PATTERN = re.compile(
+    r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+(?:Service|Platform|Protocol|Algorithm))\b', re.IGNORECASE
+)
+_SERVICE_SUFFIX_PATTERN = re.compile(r'\b(?:Service|Platform|Protocol|Algorithm)\b', re.IGNORECASE)
+
+# Used when the NLTK stopwords corpus is unavailable (keywords are > 3 chars)
+_FALLBACK_STOP_WORDS = frozenset({
+    'about', 'above', 'after', 'again', 'against', 'also', 'because', 'been', 'before',
+    'being', 'below', 'between', 'both', 'could', 'does', 'doing', 'down', 'during',
+    'each', 'from', 'further', 'have', 'having', 'here', 'into', 'just', 'more', 'most',
+    'once', 'only', 'other', 'over', 'same', 'should', 'some', 'such', 'than', 'that',
+    'their', 'theirs', 'them', 'then', 'there', 'these', 'they', 'this', 'those',
+    'through', 'under', 'until', 'very', 'were', 'what', 'when', 'where', 'which',
+    'while', 'will', 'with', 'would', 'your', 'yours',
+})
+
+
+@lru_cache(maxsize=1)
+def _stop_words() -> frozenset:
+    if NLTK_AVAILABLE:
+        try:
+            return frozenset(stopwords.words('english'))
+        except LookupError:
+            pass
+    return _FALLBACK_STOP_WORDS
+
+
+def _sentence_boundaries(text: str) -> List[int]:
+    """End offsets of each sentence; the last one is ``len(text)``"""
+    boundaries = [match.end() for match in _SENTENCE_END_PATTERN.finditer(text)]
+    if not boundaries or boundaries[-1] < len(text):
+        boundaries.append(len(text))
+    return boundaries
+
+
+def _concept_matches(text: str, boundaries: Optional[List[int]] = None) -> List[Tuple[int, int, str]]:
+    """Concept candidates in ``text`` as (start, end, term), sorted by start"""
+    if boundaries is None:
+        boundaries = _sentence_boundaries(text)
+
+    matches = [
+        (m.start(), m.end(), m.group().strip())
+        for m in _TECH_TERM_PATTERN.finditer(text)
+        if len(m.group()) > 3
+    ]
+    matches.extend((m.start(), m.end(), m.group()) for m in _ACRONYM_PATTERN.finditer(text))
+    for pattern in _CONCEPT_PATTERNS:
+        matches.extend((m.start(), m.end(), m.group().strip()) for m in pattern.finditer(text))
+
+    # Service matches never cross sentence-ending punctuation
+    sentences = sorted({
+        bisect.bisect_right(boundaries, m.start()) for m in _SERVICE_SUFFIX_PATTERN.finditer(text)
+    })
+    for sentence in sentences:
+        start = boundaries[sentence - 1] if sentence else 0
+        matches.extend(
+            (m.start(), m.end(), m.group().strip())
+            for m in _SERVICE_CONCEPT_PATTERN.finditer(text, start, boundaries[sentence])
+        )
+
+    matches = [match for match in matches if len(match[2]) > 2]
+    matches.sort()
+    return matches
+
+
+class _TokenizedText:
+    """One tokenization pass over a text: word tokens, keyword flags and sentence spans.
+
+    Sentences longer than ``max_tokens`` or ``max_chars`` are split so every
+    span fits a chunk; spans that are still too long in characters (scripts
+    without spaces, symbol runs) fall back to fixed character windows.
+    """
+
+    def __init__(self, text: str, max_tokens: int, max_chars: Optional[int] = None):
+        self.max_chars = max_chars or max(1, len(text))
+        stop_words = _stop_words()
+        matches = list(_TOKEN_PATTERN.finditer(text))
+        self.starts = [match.start() for match in matches]
+        self.words = [match.group().lower() for match in matches]
+        self.is_keyword = [
+            len(word) > 3 and word.isalpha() and word not in stop_words
+            for word in self.words
+        ]
+
+        # (char_start, char_end, first_token, end_token) per sentence
+        self.spans = []
+        self.boundaries = _sentence_boundaries(text)
+        token = 0
+        sentence_start = 0
+
+        for boundary in self.boundaries:
+            first = token
+            token = bisect.bisect_left(self.starts, boundary, first)
+            self._add_sentence(sentence_start, boundary, first, token, max_tokens)
+            sentence_start = boundary
+
+    def _add_sentence(self, char_start: int, char_end: int, first: int, end: int, max_tokens: int):
+        while end - first > max_tokens:
+            split = first + max_tokens
+            self._add_span(char_start, self.starts[split], first, split)
+            char_start, first = self.starts[split], split
+        self._add_span(char_start, char_end, first, end)
+
+    def _add_span(self, char_start: int, char_end: int, first: int, end: int):
+        while char_end - char_start > self.max_chars:
+            split_char = char_start + self.max_chars
+            split = bisect.bisect_left(self.starts, split_char, first, end)
+            self.spans.append((char_start, split_char, first, split))
+            char_start, first = split_char, split
+        self.spans.append((char_start, char_end, first, end))
+
+    def keywords(self, first: int, end: int, limit: int = 10) -> List[str]:
+        """Unique keywords among tokens [first, end) in order of appearance"""
+        found = {}
+        for index in range(first, end):
+            if self.is_keyword[index] and self.words[index] not in found:
+                found[self.words[index]] = None
+                if len(found) == limit:
+                    break
+        return list(found)
+
+# Shared worker pool for CPU-bound parsing and chunking. Created lazily so
+# importing this module (including inside the workers) stays cheap.
+_extraction_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_extraction_executor() -> ProcessPoolExecutor:
+    """Process pool that runs document parsing and chunking off the event loop"""
+    global _extraction_executor
+    if _extraction_executor is None:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        _extraction_executor = ProcessPoolExecutor(
+            max_workers=max(1, settings.document_extraction_workers),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _extraction_executor
+
+
+def shutdown_extraction_executor() -> None:
+    """Stop the extraction workers (application shutdown)"""
+    global _extraction_executor
+    if _extraction_executor is not None:
+        _extraction_executor.shutdown(wait=False, cancel_futures=True)
+        _extraction_executor = None
+
 
 class DocumentChunk:
     """Represents a processed document chunk"""
@@ -78,12 +244,18 @@ class DocumentProcessor:
         self,
         chunk_size: int = 1000,
         chunk_overlap: int = 100,
-        min_chunk_size: int = 100
+        min_chunk_size: int = 100,
+        pages_per_batch: Optional[int] = None,
+        download_nltk: bool = True
     ):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
-        self.setup_nltk()
+        self.chunk_tokens = max(1, chunk_size // CHARS_PER_TOKEN)
+        self.overlap_tokens = chunk_overlap // CHARS_PER_TOKEN
+        self.pages_per_batch = pages_per_batch or settings.document_extraction_pages_per_batch
+        if download_nltk:
+            self.setup_nltk()
 
     def setup_nltk(self):
         """Setup NLTK resources if available"""
@@ -92,18 +264,21 @@ class DocumentProcessor:
             return
 
         try:
-            nltk.data.find('tokenizers/punkt')
             nltk.data.find('corpora/stopwords')
         except LookupError:
             logger.info("Downloading NLTK resources...")
             try:
-                nltk.download('punkt', quiet=True)
                 nltk.download('stopwords', quiet=True)
+                _stop_words.cache_clear()
             except Exception as e:
                 logger.warning(f"Failed to download NLTK resources: {e}")
 
     async def process_file(self, file_path: Path, mime_type: str) -> List[Dict[str, Any]]:
         """Process file based on MIME type"""
+        return [chunk async for chunk in self.iter_chunks(file_path, mime_type)]
+
+    async def iter_chunks(self, file_path: Path, mime_type: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield chunks as they are extracted, so callers can embed while parsing continues"""
 
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -111,106 +286,102 @@ class DocumentProcessor:
         logger.info(f"Processing file: {file_path} (type: {mime_type})")
 
         if mime_type == 'application/pdf':
-            return await self.process_pdf(file_path)
+            chunks = self.iter_pdf_chunks(file_path)
         elif mime_type == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document':
-            return await self.process_docx(file_path)
+            chunks = self.iter_docx_chunks(file_path)
         elif mime_type in ['text/plain', 'text/markdown']:
-            return await self.process_text(file_path)
+            chunks = self.iter_text_chunks(file_path)
         else:
             # Try to process as text
             logger.warning(f"Unknown MIME type {mime_type}, attempting text processing")
-            return await self.process_text(file_path)
+            chunks = self.iter_text_chunks(file_path)
+
+        async for chunk in chunks:
+            yield chunk
 
     async def process_pdf(self, file_path: Path) -> List[Dict[str, Any]]:
         """Process PDF file"""
+        return [chunk async for chunk in self.iter_pdf_chunks(file_path)]
+
+    async def process_docx(self, file_path: Path) -> List[Dict[str, Any]]:
+        """Process DOCX file"""
+        return [chunk async for chunk in self.iter_docx_chunks(file_path)]
+
+    async def process_text(self, file_path: Path) -> List[Dict[str, Any]]:
+        """Process plain text file"""
+        return [chunk async for chunk in self.iter_text_chunks(file_path)]
+
+    async def iter_pdf_chunks(self, file_path: Path) -> AsyncIterator[Dict[str, Any]]:
+        """Stream PDF chunks, parsing batches of pages in the extraction pool.
+
+        At most one batch per worker is in flight, so memory stays flat
+        regardless of page count. Batches are consumed in page order and the
+        running section header is applied here, since it depends on earlier pages.
+        """
         if not PDF_AVAILABLE:
             raise ImportError("pypdf library not installed. Install with: pip install pypdf")
 
-        chunks = []
+        loop = asyncio.get_running_loop()
+        executor = get_extraction_executor()
+        path = str(file_path)
+        params = self._chunk_params()
+        max_in_flight = max(1, settings.document_extraction_workers)
+
+        pending = deque()
         current_section = ""
+        chunk_count = 0
 
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = pypdf.PdfReader(file)
-
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    try:
-                        text = page.extract_text()
-                        if not text or len(text.strip()) < self.min_chunk_size:
-                            continue
-
-                        # Try to extract section headers
-                        section = self.extract_section_header(text)
-                        if section:
-                            current_section = section
-
-                        # Clean and chunk the text
-                        cleaned_text = self.clean_text(text)
-                        page_chunks = self.create_chunks(
-                            text=cleaned_text,
-                            section=current_section,
-                            page=page_num
-                        )
-
-                        chunks.extend([chunk.to_dict() for chunk in page_chunks])
-
-                    except Exception as e:
-                        logger.warning(f"Error processing page {page_num}: {e}")
-                        continue
+            page_count = await loop.run_in_executor(executor, _count_pdf_pages, path)
+            next_page = 0
+
+            while next_page < page_count or pending:
+                while next_page < page_count and len(pending) < max_in_flight:
+                    stop = min(next_page + self.pages_per_batch, page_count)
+                    pending.append(loop.run_in_executor(
+                        executor, _extract_pdf_pages, path, next_page, stop, params
+                    ))
+                    next_page = stop
+
+                for page_num, section, page_chunks in await pending.popleft():
+                    if section:
+                        current_section = section
+                    for chunk in page_chunks:
+                        chunk['section'] = current_section
+                        chunk_count += 1
+                        yield chunk
 
         except Exception as e:
             logger.error(f"Error processing PDF {file_path}: {e}")
             raise
+        finally:
+            for future in pending:
+                future.cancel()
 
-        logger.info(f"Extracted {len(chunks)} chunks from PDF")
-        return chunks
+        logger.info(f"Extracted {chunk_count} chunks from PDF")
 
-    async def process_docx(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Process DOCX file"""
+    async def iter_docx_chunks(self, file_path: Path) -> AsyncIterator[Dict[str, Any]]:
+        """Stream DOCX chunks; python-docx loads the whole package, so it is one pool task"""
         if not DOCX_AVAILABLE:
             raise ImportError("python-docx library not installed. Install with: pip install python-docx")
 
-        chunks = []
-        current_section = ""
+        loop = asyncio.get_running_loop()
 
         try:
-            doc = DocxDocument(file_path)
-            full_text = []
-            page_num = 1  # DOCX doesn't have explicit pages
-
-            for paragraph in doc.paragraphs:
-                if not paragraph.text.strip():
-                    continue
-
-                # Check if paragraph is a heading
-                if paragraph.style.name.startswith('Heading'):
-                    current_section = paragraph.text.strip()
-                    full_text.append(f"\n\n{paragraph.text}\n")
-                else:
-                    full_text.append(paragraph.text)
-
-            # Combine text and create chunks
-            combined_text = " ".join(full_text)
-            cleaned_text = self.clean_text(combined_text)
-
-            if len(cleaned_text.strip()) >= self.min_chunk_size:
-                doc_chunks = self.create_chunks(
-                    text=cleaned_text,
-                    section=current_section,
-                    page=page_num
-                )
-                chunks.extend([chunk.to_dict() for chunk in doc_chunks])
-
+            chunks = await loop.run_in_executor(
+                get_extraction_executor(), _extract_docx, str(file_path), self._chunk_params()
+            )
         except Exception as e:
             logger.error(f"Error processing DOCX {file_path}: {e}")
             raise
 
         logger.info(f"Extracted {len(chunks)} chunks from DOCX")
-        return chunks
+        for chunk in chunks:
+            yield chunk
 
-    async def process_text(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Process plain text file"""
-        chunks = []
+    async def iter_text_chunks(self, file_path: Path) -> AsyncIterator[Dict[str, Any]]:
+        """Stream plain text chunks; reading is async, chunking runs in the pool"""
+        loop = asyncio.get_running_loop()
 
         try:
             async with aiofiles.open(file_path, 'r', encoding='utf-8') as file:
@@ -218,27 +389,105 @@ class DocumentProcessor:
 
             if len(content.strip()) < self.min_chunk_size:
                 logger.warning(f"Text file {file_path} too short to process")
-                return chunks
+                return
 
-            # Try to detect sections
-            current_section = self.extract_section_header(content)
-
-            # Clean and chunk the text
-            cleaned_text = self.clean_text(content)
-            text_chunks = self.create_chunks(
-                text=cleaned_text,
-                section=current_section,
-                page=1
+            chunks = await loop.run_in_executor(
+                get_extraction_executor(), _chunk_text, content, self._chunk_params()
             )
 
-            chunks.extend([chunk.to_dict() for chunk in text_chunks])
-
         except Exception as e:
             logger.error(f"Error processing text file {file_path}: {e}")
             raise
 
         logger.info(f"Extracted {len(chunks)} chunks from text file")
-        return chunks
+        for chunk in chunks:
+            yield chunk
+
+    def _chunk_params(self) -> Tuple[int, int, int]:
+        """Chunking settings handed to the extraction workers"""
+        return (self.chunk_size, self.chunk_overlap, self.min_chunk_size)
+
+    def extract_pdf_pages(
+        self,
+        file_path: str,
+        start: int,
+        stop: int
+    ) -> List[Tuple[int, str, List[Dict[str, Any]]]]:
+        """Extract and chunk pages [start, stop) of a PDF.
+
+        Returns (page number, section header, chunks) per non-empty page.
+        """
+        results = []
+
+        with open(file_path, 'rb') as file:
+            pdf_reader = pypdf.PdfReader(file)
+
+            for page_num in range(start + 1, stop + 1):
+                try:
+                    text = pdf_reader.pages[page_num - 1].extract_text()
+                    if not text or len(text.strip()) < self.min_chunk_size:
+                        continue
+
+                    # Try to extract section headers
+                    section = self.extract_section_header(text)
+
+                    # Clean and chunk the text
+                    cleaned_text = self.clean_text(text)
+                    page_chunks = self.create_chunks(text=cleaned_text, page=page_num)
+
+                    results.append((page_num, section, [chunk.to_dict() for chunk in page_chunks]))
+
+                except Exception as e:
+                    logger.warning(f"Error processing page {page_num}: {e}")
+                    continue
+
+        return results
+
+    def extract_docx(self, file_path: str) -> List[Dict[str, Any]]:
+        """Extract and chunk a DOCX file"""
+        current_section = ""
+        doc = DocxDocument(file_path)
+        full_text = []
+        page_num = 1  # DOCX doesn't have explicit pages
+
+        for paragraph in doc.paragraphs:
+            if not paragraph.text.strip():
+                continue
+
+            # Check if paragraph is a heading
+            if paragraph.style.name.startswith('Heading'):
+                current_section = paragraph.text.strip()
+                full_text.append(f"\n\n{paragraph.text}\n")
+            else:
+                full_text.append(paragraph.text)
+
+        # Combine text and create chunks
+        combined_text = " ".join(full_text)
+        cleaned_text = self.clean_text(combined_text)
+
+        if len(cleaned_text.strip()) < self.min_chunk_size:
+            return []
+
+        doc_chunks = self.create_chunks(
+            text=cleaned_text,
+            section=current_section,
+            page=page_num
+        )
+        return [chunk.to_dict() for chunk in doc_chunks]
+
+    def chunk_text(self, content: str) -> List[Dict[str, Any]]:
+        """Chunk a plain text document"""
+        # Try to detect sections
+        current_section = self.extract_section_header(content)
+
+        # Clean and chunk the text
+        cleaned_text = self.clean_text(content)
+        text_chunks = self.create_chunks(
+            text=cleaned_text,
+            section=current_section,
+            page=1
+        )
+        return [chunk.to_dict() for chunk in text_chunks]
 
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
@@ -252,8 +501,8 @@ class DocumentProcessor:
         text = re.sub(r'\.{3,}', '...', text)
 
         # Normalize quotes
-        text = re.sub(r'["""]', '"', text)
-        text = re.sub(r'['']', "'", text)
+        text = re.sub('[\u201c\u201d]', '"', text)
+        text = re.sub('[\u2018\u2019]', "'", text)
 
         return text.strip()
 
@@ -283,7 +532,14 @@ class DocumentProcessor:
         section: str = "",
         page: Optional[int] = None
     ) -> List[DocumentChunk]:
-        """Create chunks from text with overlap"""
+        """Create chunks from sentence spans with token-based size and overlap.
+
+        The text is tokenized once; chunk boundaries, keywords and concepts
+        are all derived from that pass, so the cost is linear in the text.
+        """
+        tokenized = _TokenizedText(text, self.chunk_tokens, self.chunk_size)
+        concepts = _concept_matches(text, tokenized.boundaries)
+
         if len(text) <= self.chunk_size:
             # Text is small enough to be one chunk
             chunk = DocumentChunk(
@@ -291,27 +547,29 @@ class DocumentProcessor:
                 section=section,
                 page=page,
                 chunk_index=0,
-                keywords=self.extract_keywords(text),
-                concepts=self.extract_concepts(text)
+                keywords=tokenized.keywords(0, len(tokenized.words)),
+                concepts=self._concepts_in(concepts, 0, len(text))
             )
             return [chunk]
 
+        spans = tokenized.spans
         chunks = []
-        start = 0
         chunk_index = 0
+        start = 0
 
-        while start < len(text):
-            end = start + self.chunk_size
-
-            # Try to break at sentence boundary
-            if end < len(text):
-                # Look for sentence ending within overlap distance
-                for i in range(min(self.chunk_overlap, len(text) - end)):
-                    if text[end + i] in '.!?':
-                        end = end + i + 1
-                        break
+        while start < len(spans):
+            # Take whole sentences up to the token and character budgets
+            end = start
+            tokens = 0
+            while end < len(spans) and (end == start or (
+                tokens + self._span_tokens(spans[end]) <= self.chunk_tokens
+                and spans[end][1] - spans[start][0] <= self.chunk_size
+            )):
+                tokens += self._span_tokens(spans[end])
+                end += 1
 
-            chunk_text = text[start:end].strip()
+            char_start, char_end = spans[start][0], spans[end - 1][1]
+            chunk_text = text[char_start:char_end].strip()
 
             if len(chunk_text) >= self.min_chunk_size:
                 chunk = DocumentChunk(
@@ -319,73 +577,55 @@ class DocumentProcessor:
                     section=section,
                     page=page,
                     chunk_index=chunk_index,
-                    keywords=self.extract_keywords(chunk_text),
-                    concepts=self.extract_concepts(chunk_text)
+                    keywords=tokenized.keywords(spans[start][2], spans[end - 1][3]),
+                    concepts=self._concepts_in(concepts, char_start, char_end)
                 )
                 chunks.append(chunk)
                 chunk_index += 1
 
-            # Move start position with overlap
-            start = end - self.chunk_overlap
-            if start >= len(text):
+            if end >= len(spans):
                 break
 
+            # Overlap: repeat trailing sentences that fit the overlap budget
+            next_start = end
+            overlap = 0
+            while (
+                next_start - 1 > start
+                and overlap + self._span_tokens(spans[next_start - 1]) <= self.overlap_tokens
+                and spans[end - 1][1] - spans[next_start - 1][0] <= self.chunk_overlap
+            ):
+                next_start -= 1
+                overlap += self._span_tokens(spans[next_start])
+            start = next_start
+
         return chunks
 
+    @staticmethod
+    def _span_tokens(span: Tuple[int, int, int, int]) -> int:
+        return span[3] - span[2]
+
+    @staticmethod
+    def _concepts_in(concepts: List[Tuple[int, int, str]], char_start: int, char_end: int) -> List[str]:
+        """Unique concepts wholly inside [char_start, char_end), limited to 15"""
+        found = {}
+        index = bisect.bisect_left(concepts, (char_start,))
+        while index < len(concepts) and concepts[index][0] < char_end:
+            match_start, match_end, term = concepts[index]
+            if match_end <= char_end:
+                found[term] = None
+                if len(found) == 15:
+                    break
+            index += 1
+        return list(found)
+
     def extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text"""
-        if not NLTK_AVAILABLE:
-            # Simple keyword extraction without NLTK
-            words = re.findall(r'\b[A-Z][a-z]+\b', text)  # Capitalized words
-            return list(set(words))[:10]
-
-        try:
-            # Tokenize and filter
-            words = word_tokenize(text.lower())
-            stop_words = set(stopwords.words('english'))
-
-            # Filter out stopwords and short words
-            keywords = [
-                word for word in words
-                if (word.isalpha() and
-                    len(word) > 3 and
-                    word not in stop_words)
-            ]
-
-            # Get unique keywords, limit to top 10
-            return list(set(keywords))[:10]
-
-        except Exception:
-            # Fallback to simple extraction
-            words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
-            return list(set(words))[:10]
+        tokenized = _TokenizedText(text, max(1, len(text)))
+        return tokenized.keywords(0, len(tokenized.words))
 
     def extract_concepts(self, text: str) -> List[str]:
         """Extract key concepts from text"""
-        concepts = []
-
-        # Technical terms (capitalized phrases)
-        tech_terms = re.findall(r'\b[A-Z][A-Za-z]*(?:\s+[A-Z][A-Za-z]*)*\b', text)
-        concepts.extend([term for term in tech_terms if len(term) > 3])
-
-        # Acronyms
-        acronyms = re.findall(r'\b[A-Z]{2,}\b', text)
-        concepts.extend(acronyms)
-
-        # Common patterns for important concepts
-        concept_patterns = [
-            r'\b(?:AWS|Azure|Google Cloud|GCP)\s+[A-Z][a-zA-Z\s]*\b',
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+(?:Service|Platform|Protocol|Algorithm))\b',
-            r'\b(?:best practices?|design patterns?|architectures?|methodologies?)\b',
-        ]
-
-        for pattern in concept_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            concepts.extend(matches)
-
-        # Remove duplicates and limit
-        unique_concepts = list(set([c.strip() for c in concepts if len(c.strip()) > 2]))
-        return unique_concepts[:15]
+        return self._concepts_in(_concept_matches(text), 0, len(text))
 
     def get_processing_stats(self) -> Dict[str, Any]:
         """Get processing statistics"""
@@ -393,12 +633,44 @@ class DocumentProcessor:
             'chunk_size': self.chunk_size,
             'chunk_overlap': self.chunk_overlap,
             'min_chunk_size': self.min_chunk_size,
+            'chunk_tokens': self.chunk_tokens,
+            'overlap_tokens': self.overlap_tokens,
             'pdf_support': PDF_AVAILABLE,
             'docx_support': DOCX_AVAILABLE,
             'nltk_support': NLTK_AVAILABLE
         }
 
 
+# Extraction pool entry points: module-level so they can be pickled by reference
+
+@lru_cache(maxsize=4)
+def _worker_processor(chunk_size: int, chunk_overlap: int, min_chunk_size: int) -> DocumentProcessor:
+    """Per-worker processor; NLTK resources are already set up by the parent"""
+    return DocumentProcessor(chunk_size, chunk_overlap, min_chunk_size, download_nltk=False)
+
+
+def _count_pdf_pages(file_path: str) -> int:
+    with open(file_path, 'rb') as file:
+        return len(pypdf.PdfReader(file).pages)
+
+
+def _extract_pdf_pages(
+    file_path: str,
+    start: int,
+    stop: int,
+    params: Tuple[int, int, int]
+) -> List[Tuple[int, str, List[Dict[str, Any]]]]:
+    return _worker_processor(*params).extract_pdf_pages(file_path, start, stop)
+
+
+def _extract_docx(file_path: str, params: Tuple[int, int, int]) -> List[Dict[str, Any]]:
+    return _worker_processor(*params).extract_docx(file_path)
+
+
+def _chunk_text(content: str, params: Tuple[int, int, int]) -> List[Dict[str, Any]]:
+    return _worker_processor(*params).chunk_text(content)
+
+
 # Example usage
 async def main():
     """Example usage of DocumentProcessor"""
@@ -438,5 +710,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
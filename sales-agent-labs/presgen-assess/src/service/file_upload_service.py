@@ -5,11 +5,12 @@ Handles file uploads, processing, and integration with ChromaDB
 for certification-specific knowledge bases.
 """
 
+import asyncio
 import os
 import uuid
 import hashlib
 import mimetypes
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -52,6 +53,16 @@ class ProcessingResult(BaseModel):
     warnings: List[str] = []
 
 
+class BulkUploadBatch(BaseModel):
+    """Files uploaded together, tracked for per-file processing progress"""
+    batch_id: str
+    user_id: str
+    cert_profile_id: str
+    file_ids: List[str] = []
+    errors: List[Dict[str, str]] = []
+    created_at: str
+
+
 class FileUploadService:
     """Service for handling file uploads and processing"""
 
@@ -59,12 +70,20 @@ class FileUploadService:
         self,
         upload_dir: str = "uploads",
         max_file_size: int = 50 * 1024 * 1024,  # 50MB
-        allowed_extensions: List[str] = None
+        allowed_extensions: List[str] = None,
+        upload_chunk_size: int = 1024 * 1024,  # 1MB
+        max_concurrent_uploads: int = 8,
+        max_concurrent_processing: int = 4,
+        embedding_batch_size: int = 64
     ):
         self.upload_dir = Path(upload_dir)
         self.upload_dir.mkdir(exist_ok=True)
         self.max_file_size = max_file_size
         self.allowed_extensions = allowed_extensions or ['.pdf', '.docx', '.txt', '.md']
+        self.upload_chunk_size = upload_chunk_size
+        self.max_concurrent_uploads = max_concurrent_uploads
+        self.max_concurrent_processing = max_concurrent_processing
+        self.embedding_batch_size = embedding_batch_size
         self.processor = DocumentProcessor()
 
         # Create subdirectories
@@ -133,17 +152,28 @@ class FileUploadService:
         resource_dir = self.get_resource_directory(resource_type)
         file_path = resource_dir / stored_filename
 
-        # Save file to disk
+        # Stream file to disk, hashing and enforcing the size limit in the same pass
+        hash_sha256 = hashlib.sha256()
+        file_size = 0
         try:
             async with aiofiles.open(file_path, 'wb') as f:
-                content = await file.read()
-                await f.write(content)
-                file_size = len(content)
+                while chunk := await file.read(self.upload_chunk_size):
+                    file_size += len(chunk)
+                    if file_size > self.max_file_size:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File size exceeds maximum allowed size of {self.max_file_size / (1024*1024):.1f}MB"
+                        )
+                    hash_sha256.update(chunk)
+                    await f.write(chunk)
+        except HTTPException:
+            file_path.unlink(missing_ok=True)
+            raise
         except Exception as e:
+            file_path.unlink(missing_ok=True)
             raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
 
-        # Calculate file hash
-        file_hash = await self.calculate_file_hash(file_path)
+        file_hash = hash_sha256.hexdigest()
 
         # Determine MIME type
         mime_type, _ = mimetypes.guess_type(file.filename)
@@ -167,6 +197,68 @@ class FileUploadService:
 
         return metadata
 
+    async def save_uploaded_files(
+        self,
+        uploads: List[Tuple[UploadFile, ResourceType]],
+        user_id: str,
+        cert_profile_id: str
+    ) -> Tuple[List[FileMetadata], List[Dict[str, str]]]:
+        """Save several uploads concurrently (bounded); returns (saved, errors)"""
+        semaphore = asyncio.Semaphore(self.max_concurrent_uploads)
+
+        async def save(file: UploadFile, resource_type: ResourceType) -> FileMetadata:
+            async with semaphore:
+                return await self.save_uploaded_file(
+                    file=file,
+                    user_id=user_id,
+                    cert_profile_id=cert_profile_id,
+                    resource_type=resource_type
+                )
+
+        results = await asyncio.gather(
+            *(save(file, resource_type) for file, resource_type in uploads),
+            return_exceptions=True
+        )
+
+        saved = []
+        errors = []
+        for (file, _), result in zip(uploads, results):
+            if isinstance(result, BaseException):
+                errors.append({
+                    "filename": file.filename,
+                    "error": result.detail if isinstance(result, HTTPException) else str(result)
+                })
+            else:
+                saved.append(result)
+        return saved, errors
+
+    async def process_uploaded_files(
+        self,
+        file_metadatas: List[FileMetadata],
+        cert_id: str,
+        bundle_version: str,
+        collection_manager: ChromaDBCollectionManager,
+        domain_mappings: Optional[Dict[str, str]] = None,
+        on_result: Optional[Callable[[FileMetadata, ProcessingResult], None]] = None
+    ) -> List[ProcessingResult]:
+        """Process files concurrently with at most max_concurrent_processing at once"""
+        semaphore = asyncio.Semaphore(self.max_concurrent_processing)
+
+        async def process(file_metadata: FileMetadata) -> ProcessingResult:
+            async with semaphore:
+                result = await self.process_uploaded_file(
+                    file_metadata=file_metadata,
+                    cert_id=cert_id,
+                    bundle_version=bundle_version,
+                    collection_manager=collection_manager,
+                    domain_mappings=domain_mappings
+                )
+            if on_result:
+                on_result(file_metadata, result)
+            return result
+
+        return await asyncio.gather(*(process(file_metadata) for file_metadata in file_metadatas))
+
     async def process_uploaded_file(
         self,
         file_metadata: FileMetadata,
@@ -184,21 +276,6 @@ class FileUploadService:
             # Update processing status
             file_metadata.processing_status = "processing"
 
-            # Process document into chunks
-            chunks = await self.processor.process_file(
-                file_path=Path(file_metadata.file_path),
-                mime_type=file_metadata.mime_type
-            )
-
-            if not chunks:
-                return ProcessingResult(
-                    file_id=file_metadata.file_id,
-                    success=False,
-                    chunk_count=0,
-                    processing_time_seconds=0,
-                    error_message="No content could be extracted from file"
-                )
-
             # Get or create collection
             try:
                 collection = collection_manager.get_collection(
@@ -216,11 +293,15 @@ class FileUploadService:
                     error_message=f"Collection not found for cert_id: {cert_id}, bundle_version: {bundle_version}"
                 )
 
-            # Create document metadata for each chunk
+            # Embed chunks in batches as the extraction pool produces them
             documents = []
             metadatas = []
+            chunk_count = 0
 
-            for i, chunk in enumerate(chunks):
+            async for chunk in self.processor.iter_chunks(
+                file_path=Path(file_metadata.file_path),
+                mime_type=file_metadata.mime_type
+            ):
                 # Extract domain from content if domain mappings provided
                 domain = ""
                 if domain_mappings:
@@ -240,7 +321,7 @@ class FileUploadService:
                     source_file=file_metadata.original_filename,
                     source_uri=file_metadata.file_path,
                     mime_type=file_metadata.mime_type,
-                    chunk_index=i,
+                    chunk_index=chunk_count,
                     content_type=ContentType.CONCEPT,  # Default, could be enhanced
                     section=chunk.get('section', ''),
                     page=chunk.get('page'),
@@ -253,24 +334,35 @@ class FileUploadService:
 
                 documents.append(chunk['content'])
                 metadatas.append(doc_metadata)
+                chunk_count += 1
 
-            # Add documents to collection
-            collection_manager.add_documents(
-                collection=collection,
-                documents=documents,
-                metadatas=metadatas
-            )
+                if len(documents) >= self.embedding_batch_size:
+                    await self._add_documents(collection_manager, collection, documents, metadatas)
+                    documents, metadatas = [], []
+
+            if documents:
+                await self._add_documents(collection_manager, collection, documents, metadatas)
+
+            if not chunk_count:
+                file_metadata.processing_status = "failed"
+                return ProcessingResult(
+                    file_id=file_metadata.file_id,
+                    success=False,
+                    chunk_count=0,
+                    processing_time_seconds=0,
+                    error_message="No content could be extracted from file"
+                )
 
             # Update file metadata
             file_metadata.processing_status = "completed"
-            file_metadata.chunk_count = len(chunks)
+            file_metadata.chunk_count = chunk_count
 
             processing_time = (datetime.now() - start_time).total_seconds()
 
             return ProcessingResult(
                 file_id=file_metadata.file_id,
                 success=True,
-                chunk_count=len(chunks),
+                chunk_count=chunk_count,
                 processing_time_seconds=processing_time,
                 warnings=warnings
             )
@@ -289,6 +381,21 @@ class FileUploadService:
                 error_message=str(e)
             )
 
+    async def _add_documents(
+        self,
+        collection_manager: ChromaDBCollectionManager,
+        collection: Any,
+        documents: List[str],
+        metadatas: List[Any]
+    ) -> None:
+        """Add one batch of chunks (embedding is blocking; keep it off the event loop)"""
+        await asyncio.to_thread(
+            collection_manager.add_documents,
+            collection=collection,
+            documents=documents,
+            metadatas=metadatas
+        )
+
     async def delete_file(self, file_metadata: FileMetadata) -> bool:
         """Delete uploaded file from disk"""
         try:
@@ -341,6 +448,7 @@ class FileRegistry:
 
     def __init__(self):
         self._files: Dict[str, FileMetadata] = {}
+        self._batches: Dict[str, BulkUploadBatch] = {}
 
     def register_file(self, file_metadata: FileMetadata) -> None:
         """Register uploaded file metadata"""
@@ -371,6 +479,14 @@ class FileRegistry:
             return True
         return False
 
+    def register_batch(self, batch: BulkUploadBatch) -> None:
+        """Register a bulk upload batch"""
+        self._batches[batch.batch_id] = batch
+
+    def get_batch(self, batch_id: str) -> Optional[BulkUploadBatch]:
+        """Get bulk upload batch by ID"""
+        return self._batches.get(batch_id)
+
     def update_file_status(self, file_id: str, status: str, error_message: Optional[str] = None) -> bool:
         """Update file processing status"""
         if file_id in self._files:
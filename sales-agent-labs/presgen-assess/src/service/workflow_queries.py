@@ -0,0 +1,57 @@
+"""Cached statements for the hot WorkflowExecution lookups.
+
+Endpoints and background services look workflows up by id, resume token
+and status on nearly every request. These helpers build each statement
+with ``lambda_stmt`` so SQLAlchemy caches the constructed and compiled
+statement once per call site and only binds new parameter values. On
+asyncpg the compiled SQL is additionally kept as a server-side prepared
+statement (see ``prepared_statement_cache_size`` in ``database.py``).
+"""
+
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.workflow import WorkflowExecution, WorkflowStatus
+
+
+async def get_workflow(session: AsyncSession, workflow_id: UUID) -> Optional[WorkflowExecution]:
+    """Workflow by primary key, or None."""
+    result = await session.execute(
+        lambda_stmt(lambda: select(WorkflowExecution).where(WorkflowExecution.id == workflow_id))
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_workflow_by_resume_token(session: AsyncSession, resume_token: str) -> Optional[WorkflowExecution]:
+    """Workflow by its (unique) resume token, or None."""
+    result = await session.execute(
+        lambda_stmt(lambda: select(WorkflowExecution).where(WorkflowExecution.resume_token == resume_token))
+    )
+    return result.scalar_one_or_none()
+
+
+async def list_workflows_by_status(
+    session: AsyncSession,
+    status: WorkflowStatus,
+    with_form_only: bool = False
+) -> List[WorkflowExecution]:
+    """Workflows in ``status``; optionally only those with a linked Google Form."""
+    stmt = lambda_stmt(lambda: select(WorkflowExecution).where(WorkflowExecution.execution_status == status))
+    if with_form_only:
+        stmt += lambda s: s.where(WorkflowExecution.google_form_id.isnot(None))
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def count_workflows_by_status(session: AsyncSession) -> Dict[WorkflowStatus, int]:
+    """Workflow counts per execution status in a single grouped scan."""
+    result = await session.execute(
+        lambda_stmt(lambda: select(
+            WorkflowExecution.execution_status,
+            func.count(WorkflowExecution.id)
+        ).group_by(WorkflowExecution.execution_status))
+    )
+    return dict(result.all())
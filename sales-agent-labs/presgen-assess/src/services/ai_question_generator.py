@@ -8,10 +8,13 @@ user difficulty preferences, and domain distribution requirements.
 import asyncio
 import json
 import logging
+import weakref
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
+from src.common.config import settings
 from src.services.assessment_engine import AssessmentEngine
 from src.knowledge.base import RAGKnowledgeBase
 from src.services.assessment_prompt_service import AssessmentPromptService
@@ -27,6 +30,22 @@ from src.common.enhanced_logging import (
 
 logger = get_enhanced_logger(__name__)
 
+# Process-wide cap on in-flight question generation LLM calls, shared by all
+# generators and domains. One semaphore per event loop (tests and workers may
+# run several loops).
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def _llm_slot():
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, settings.ai_generation_max_concurrency))
+        _llm_semaphores[loop] = semaphore
+    async with semaphore:
+        yield
+
 
 class QuestionQualityMetrics:
     """Quality metrics for generated questions."""
@@ -119,7 +138,8 @@ class AIQuestionGenerator:
         user_profile: str,
         difficulty_level: str,
         domain_distribution: Dict[str, int],
-        question_count: int
+        question_count: int,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """
         Generate AI-powered questions from certification resources.
@@ -130,6 +150,8 @@ class AIQuestionGenerator:
             difficulty_level: Target difficulty (beginner, intermediate, advanced)
             domain_distribution: Questions per domain (e.g., {"Security": 6, "Networking": 8})
             question_count: Total number of questions to generate
+            progress_callback: Optional coroutine called after each domain with
+                per-domain question counts
 
         Returns:
             Dict containing generated questions and metadata
@@ -156,11 +178,12 @@ class AIQuestionGenerator:
             # Step 1: Retrieve certification resources
             cert_resources = await self._get_certification_resources(certification_profile_id)
 
-            # Step 2: Generate questions by domain
-            generated_questions = []
+            # Step 2: Generate questions for every domain concurrently; each
+            # domain retrieves its RAG context once and batches its LLM calls
             total_generated = 0
 
-            for domain, count in domain_distribution.items():
+            async def generate_for_domain(domain: str, count: int) -> List[GeneratedQuestion]:
+                nonlocal total_generated
                 logger.info(
                     "📚 Generating questions for domain | domain=%s count=%d correlation_id=%s",
                     domain, count, correlation_id
@@ -173,15 +196,29 @@ class AIQuestionGenerator:
                     cert_resources=cert_resources,
                     correlation_id=correlation_id
                 )
-
-                generated_questions.extend(domain_questions)
                 total_generated += len(domain_questions)
 
+                if progress_callback:
+                    await progress_callback({
+                        "domain": domain,
+                        "requested": count,
+                        "generated": len(domain_questions),
+                        "total_generated": total_generated,
+                        "question_count": question_count
+                    })
+
                 logger.info(
                     "✅ Domain questions generated | domain=%s generated=%d quality_avg=%.1f",
                     domain, len(domain_questions),
-                    sum(q.quality_metrics.overall_score for q in domain_questions) / len(domain_questions)
+                    sum(q.quality_metrics.overall_score for q in domain_questions) / max(len(domain_questions), 1)
                 )
+                return domain_questions
+
+            domain_results = await asyncio.gather(*(
+                generate_for_domain(domain, count)
+                for domain, count in domain_distribution.items()
+            ))
+            generated_questions = [q for questions in domain_results for q in questions]
 
             # Step 3: Validate total count and quality
             if total_generated < question_count:
@@ -334,100 +371,129 @@ class AIQuestionGenerator:
         question_count: int,
         difficulty_level: str,
         cert_resources: Dict[str, Any],
-        correlation_id: str
+        correlation_id: str,
+        number_offset: int = 0
     ) -> List[GeneratedQuestion]:
-        """Generate questions for a specific domain."""
-
-        questions = []
-        domain_knowledge = cert_resources.get("knowledge_domains", {}).get(domain, "")
-        generated_question_texts = set()  # Track question text for deduplication
+        """Generate questions for a specific domain.
 
-        for i in range(question_count):
-            # Try up to 3 times to generate a unique question
-            for attempt in range(3):
-                question = await self._generate_single_question(
-                    domain=domain,
-                    question_number=i + 1,
-                    difficulty_level=difficulty_level,
-                    domain_knowledge=domain_knowledge,
-                    cert_resources=cert_resources,
-                    correlation_id=correlation_id,
-                    existing_questions=list(generated_question_texts)
-                )
-
-                # Check if question is unique (not too similar to existing ones)
-                if not self._is_duplicate_question(question.question_text, generated_question_texts):
-                    generated_question_texts.add(question.question_text)
-                    questions.append(question)
-                    break
-                else:
-                    logger.warning(
-                        "Duplicate question detected, retrying | domain=%s attempt=%d correlation_id=%s",
-                        domain, attempt + 1, correlation_id
-                    )
-                    if attempt == 2:  # Last attempt
-                        # Accept the question anyway to avoid infinite loops
-                        generated_question_texts.add(question.question_text)
-                        questions.append(question)
+        Retrieves the domain's knowledge base context once, then requests
+        the questions in batches of ``questions_per_call`` which run
+        concurrently under the global LLM concurrency limit. Each returned
+        question is validated and de-duplicated individually; shortfalls are
+        re-requested and finally filled from templates.
+        """
+        if question_count <= 0:
+            return []
 
-        return questions
+        question_numbers = [number_offset + i + 1 for i in range(question_count)]
+        cert_name = cert_resources.get("certification_name", "Unknown Certification")
+        domain_context = await self._retrieve_domain_context(
+            domain, difficulty_level, cert_resources, correlation_id
+        )
 
-    def _is_duplicate_question(self, new_question: str, existing_questions: set) -> bool:
-        """Check if a question is too similar to existing questions.
+        if not domain_context:
+            return [
+                await self._generate_template_question(domain, number, difficulty_level, correlation_id)
+                for number in question_numbers
+            ]
 
-        Uses simple similarity check based on shared key phrases.
-        """
-        if not existing_questions:
-            return False
+        batch_size = max(1, settings.ai_generation_questions_per_call)
+        batch_counts = [
+            min(batch_size, question_count - start)
+            for start in range(0, question_count, batch_size)
+        ]
+        batches = await asyncio.gather(*(
+            self._generate_llm_questions(
+                domain=domain,
+                difficulty_level=difficulty_level,
+                context_chunks=domain_context,
+                cert_name=cert_name,
+                correlation_id=correlation_id,
+                count=count,
+                batch_label=f"{index + 1} of {len(batch_counts)}"
+            )
+            for index, count in enumerate(batch_counts)
+        ))
 
-        # Normalize the new question for comparison
-        new_words = set(new_question.lower().split())
+        accepted: List[Dict[str, Any]] = []
+        accepted_texts: set = set()
 
-        for existing_question in existing_questions:
-            existing_words = set(existing_question.lower().split())
+        def accept(candidates: List[Dict[str, Any]]) -> None:
+            for candidate in candidates:
+                if len(accepted) >= question_count:
+                    return
+                if self._is_duplicate_question(candidate["question"], accepted_texts):
+                    logger.warning(
+                        "Duplicate question dropped | domain=%s correlation_id=%s",
+                        domain, correlation_id
+                    )
+                    continue
+                accepted_texts.add(candidate["question"])
+                accepted.append(candidate)
+
+        for batch in batches:
+            accept(batch)
+
+        # Re-request any shortfall, showing the model what it already wrote
+        for _ in range(self.max_generation_attempts - 1):
+            missing = question_count - len(accepted)
+            if missing <= 0:
+                break
+            accept(await self._generate_llm_questions(
+                domain=domain,
+                difficulty_level=difficulty_level,
+                context_chunks=domain_context,
+                cert_name=cert_name,
+                correlation_id=correlation_id,
+                count=missing,
+                existing_questions=[q["question"] for q in accepted]
+            ))
 
-            # Calculate Jaccard similarity
-            intersection = new_words.intersection(existing_words)
-            union = new_words.union(existing_words)
+        questions = [
+            GeneratedQuestion(
+                question_id=f"kb_{domain.lower().replace(' ', '_')}_{number}",
+                question_text=question_data["question"],
+                question_type="multiple_choice",
+                options=question_data["options"],
+                correct_answer=question_data["correct_answer"],
+                domain=domain,
+                difficulty=difficulty_level,
+                explanation=question_data["explanation"],
+                source_references=question_data["references"],
+                quality_metrics=self._knowledge_base_quality_metrics()
+            )
+            for number, question_data in zip(question_numbers, accepted)
+        ]
 
-            if len(union) > 0:
-                similarity = len(intersection) / len(union)
-                # If more than 70% similar, consider it a duplicate
-                if similarity > 0.7:
-                    return True
+        for number in question_numbers[len(questions):]:
+            questions.append(
+                await self._generate_template_question(domain, number, difficulty_level, correlation_id)
+            )
 
-        return False
+        logger.info(
+            "✅ Knowledge base questions generated | domain=%s llm=%d template=%d llm_calls=%d correlation_id=%s",
+            domain, len(accepted), question_count - len(accepted), len(batch_counts), correlation_id
+        )
+        return questions
 
-    async def _generate_single_question(
+    async def _retrieve_domain_context(
         self,
         domain: str,
-        question_number: int,
         difficulty_level: str,
-        domain_knowledge: str,
         cert_resources: Dict[str, Any],
-        correlation_id: str,
-        existing_questions: List[str] = None
-    ) -> GeneratedQuestion:
-        """Generate a single contextual question using knowledge base."""
-
-        cert_name = cert_resources.get("certification_name", "Unknown Certification")
+        correlation_id: str
+    ) -> List[Dict]:
+        """Retrieve knowledge base context for a domain (once per domain)."""
+        cert_profile_id = cert_resources.get("certification_profile_id")
 
-        logger.debug(
-            "Generating question using knowledge base | domain=%s question_num=%d difficulty=%s correlation_id=%s",
-            domain, question_number, difficulty_level, correlation_id
-        )
+        if not cert_profile_id:
+            logger.warning(
+                "No certification_profile_id found in cert_resources, falling back to templates | correlation_id=%s",
+                correlation_id
+            )
+            return []
 
         try:
-            # Get certification profile ID from cert_resources
-            cert_profile_id = cert_resources.get("certification_profile_id")
-
-            if not cert_profile_id:
-                logger.warning(
-                    "No certification_profile_id found in cert_resources, falling back to templates | correlation_id=%s",
-                    correlation_id
-                )
-                return await self._generate_template_question(domain, question_number, difficulty_level, correlation_id)
-
             # Retrieve context from knowledge base for this domain
             # Use a simplified certification ID that matches what's stored in the vector database
             # For AWS ML Specialty, the stored ID is "aws-ml-specialty"
@@ -439,58 +505,54 @@ class AIQuestionGenerator:
                 k=3,  # Get top 3 most relevant chunks
                 include_sources=True
             )
+        except Exception as e:
+            logger.error(
+                "❌ Knowledge base retrieval failed | domain=%s error=%s correlation_id=%s",
+                domain, str(e), correlation_id, exc_info=True
+            )
+            return []
 
-            if not domain_context:
-                logger.warning(
-                    "No knowledge base context found for domain=%s cert_profile=%s, falling back to templates | correlation_id=%s",
-                    domain, cert_profile_id, correlation_id
-                )
-                return await self._generate_template_question(domain, question_number, difficulty_level, correlation_id)
-
-            # Generate question using LLM with knowledge base context
-            question_data = await self._generate_llm_question(
-                domain=domain,
-                difficulty_level=difficulty_level,
-                context_chunks=domain_context,
-                cert_name=cert_name,
-                correlation_id=correlation_id,
-                existing_questions=existing_questions or []
+        if not domain_context:
+            logger.warning(
+                "No knowledge base context found for domain=%s cert_profile=%s, falling back to templates | correlation_id=%s",
+                domain, cert_profile_id, correlation_id
             )
+        return domain_context or []
 
-            # Create question with quality metrics
-            quality_metrics = QuestionQualityMetrics()
-            quality_metrics.relevance_score = 9.5  # High relevance due to knowledge base context
-            quality_metrics.accuracy_score = 9.7   # High accuracy from exam guide content
-            quality_metrics.difficulty_calibration = 9.0  # Good difficulty calibration
-            quality_metrics.educational_value = 9.3  # High educational value
+    @staticmethod
+    def _knowledge_base_quality_metrics() -> QuestionQualityMetrics:
+        quality_metrics = QuestionQualityMetrics()
+        quality_metrics.relevance_score = 9.5  # High relevance due to knowledge base context
+        quality_metrics.accuracy_score = 9.7   # High accuracy from exam guide content
+        quality_metrics.difficulty_calibration = 9.0  # Good difficulty calibration
+        quality_metrics.educational_value = 9.3  # High educational value
+        return quality_metrics
 
-            question = GeneratedQuestion(
-                question_id=f"kb_{domain.lower().replace(' ', '_')}_{question_number}",
-                question_text=question_data["question"],
-                question_type="multiple_choice",
-                options=question_data["options"],
-                correct_answer=question_data["correct_answer"],
-                domain=domain,
-                difficulty=difficulty_level,
-                explanation=question_data["explanation"],
-                source_references=question_data["references"],
-                quality_metrics=quality_metrics
-            )
+    def _is_duplicate_question(self, new_question: str, existing_questions: set) -> bool:
+        """Check if a question is too similar to existing questions.
 
-            logger.info(
-                "✅ Knowledge base question generated | domain=%s question_id=%s quality=%.1f correlation_id=%s",
-                domain, question.question_id, quality_metrics.overall_score, correlation_id
-            )
+        Uses simple similarity check based on shared key phrases.
+        """
+        if not existing_questions:
+            return False
 
-            return question
+        # Normalize the new question for comparison
+        new_words = set(new_question.lower().split())
 
-        except Exception as e:
-            logger.error(
-                "❌ Knowledge base question generation failed | domain=%s error=%s correlation_id=%s",
-                domain, str(e), correlation_id, exc_info=True
-            )
-            # Fallback to template-based generation
-            return await self._generate_template_question(domain, question_number, difficulty_level, correlation_id)
+        for existing_question in existing_questions:
+            existing_words = set(existing_question.lower().split())
+
+            # Calculate Jaccard similarity
+            intersection = new_words.intersection(existing_words)
+            union = new_words.union(existing_words)
+
+            if len(union) > 0:
+                similarity = len(intersection) / len(union)
+                # If more than 70% similar, consider it a duplicate
+                if similarity > 0.7:
+                    return True
+
+        return False
 
     async def _generate_template_question(
         self,
@@ -548,16 +610,22 @@ class AIQuestionGenerator:
 
         return question
 
-    async def _generate_llm_question(
+    async def _generate_llm_questions(
         self,
         domain: str,
         difficulty_level: str,
         context_chunks: List[Dict],
         cert_name: str,
         correlation_id: str,
-        existing_questions: List[str] = None
-    ) -> Dict[str, Any]:
-        """Generate question using LLM with knowledge base context."""
+        count: int,
+        existing_questions: List[str] = None,
+        batch_label: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Generate ``count`` questions in one LLM call with knowledge base context.
+
+        Returns only the questions that pass validation; an empty list if the
+        call or parsing fails (the caller re-requests or uses templates).
+        """
 
         # Combine context from knowledge base chunks
         context_text = "\n\n".join([
@@ -569,78 +637,110 @@ class AIQuestionGenerator:
         existing_questions_text = ""
         if existing_questions:
             existing_questions_text = "\n\nEXISTING QUESTIONS TO AVOID (generate something different):\n" + "\n".join(
-                f"- {q}" for q in existing_questions[-5:]  # Show last 5 to avoid duplicates
+                f"- {q}" for q in existing_questions[-10:]
+            )
+
+        batch_text = ""
+        if batch_label:
+            batch_text = (
+                f"\n\nThis is batch {batch_label} for this domain; other batches are generated in parallel, "
+                "so favour less obvious concepts and scenarios over the most common ones."
             )
 
-        # Create prompt for LLM to generate question
-        prompt = f"""Based on the following certification content, generate a {difficulty_level} level multiple choice question for the {domain} domain of {cert_name}.
+        # Create prompt for LLM to generate the questions
+        prompt = f"""Based on the following certification content, generate {count} distinct {difficulty_level} level multiple choice questions for the {domain} domain of {cert_name}.
 
 Context from certification materials:
-{context_text}{existing_questions_text}
+{context_text}{existing_questions_text}{batch_text}
 
 Requirements:
-1. Create a question that tests understanding of concepts from the provided context
-2. Provide 4 multiple choice options (A, B, C, D)
+1. Each question tests understanding of concepts from the provided context
+2. Each question has 4 multiple choice options (A, B, C, D)
 3. Indicate the correct answer
 4. Provide a detailed explanation
 5. Include source references from the context
-6. IMPORTANT: The question must be unique and focus on a DIFFERENT concept or scenario than the existing questions shown above
-
-Format your response as JSON:
-{{
-    "question": "Your question here",
-    "options": ["A) Option 1", "B) Option 2", "C) Option 3", "D) Option 4"],
-    "correct_answer": "A",
-    "explanation": "Detailed explanation of why this is correct",
-    "references": ["Source citations from context"]
-}}"""
+6. IMPORTANT: Every question must focus on a DIFFERENT concept or scenario from the others and from any existing questions shown above
+
+Format your response as a JSON array with exactly {count} objects:
+[
+    {{
+        "question": "Your question here",
+        "options": ["A) Option 1", "B) Option 2", "C) Option 3", "D) Option 4"],
+        "correct_answer": "A",
+        "explanation": "Detailed explanation of why this is correct",
+        "references": ["Source citations from context"]
+    }}
+]"""
 
         try:
-            # Use the assessment engine to generate the question
-            llm_response = await self.assessment_engine.generate_llm_response(
-                prompt=prompt,
-                max_tokens=800,
-                temperature=0.7
-            )
-
-            # Parse JSON response
-            import json
-            question_data = json.loads(llm_response.strip())
-
-            # Validate required fields
-            required_fields = ["question", "options", "correct_answer", "explanation", "references"]
-            for field in required_fields:
-                if field not in question_data:
-                    raise ValueError(f"Missing required field: {field}")
-
-            logger.info(
-                "✅ LLM question generated successfully | domain=%s correlation_id=%s",
-                domain, correlation_id
-            )
-
-            return question_data
-
+            async with _llm_slot():
+                # Use the assessment engine to generate the questions
+                llm_response = await self.assessment_engine.generate_llm_response(
+                    prompt=prompt,
+                    max_tokens=min(800 * count, 4096),
+                    temperature=0.7
+                )
+            candidates = self._parse_question_batch(llm_response)
         except Exception as e:
             logger.error(
-                "❌ LLM question generation failed | domain=%s error=%s correlation_id=%s",
-                domain, str(e), correlation_id
+                "❌ LLM question generation failed | domain=%s count=%d error=%s correlation_id=%s",
+                domain, count, str(e), correlation_id
             )
+            return []
 
-            # Fallback question based on context
-            fallback_question = {
-                "question": f"Based on the {cert_name} certification materials, which of the following is a key concept in {domain}?",
-                "options": [
-                    "A) Basic fundamentals and core principles",
-                    "B) Advanced implementation strategies",
-                    "C) Industry best practices and standards",
-                    "D) All of the above"
-                ],
-                "correct_answer": "D",
-                "explanation": f"All options represent important aspects of {domain} as covered in the certification materials.",
-                "references": [chunk.get('citation', 'Certification Materials') for chunk in context_chunks[:2]]
-            }
+        questions = []
+        for candidate in candidates:
+            problem = self._validate_question_data(candidate)
+            if problem:
+                logger.warning(
+                    "Invalid LLM question dropped | domain=%s reason=%s correlation_id=%s",
+                    domain, problem, correlation_id
+                )
+                continue
+            questions.append(candidate)
+
+        logger.info(
+            "✅ LLM questions generated | domain=%s requested=%d valid=%d correlation_id=%s",
+            domain, count, len(questions), correlation_id
+        )
+        return questions
 
-            return fallback_question
+    @staticmethod
+    def _parse_question_batch(llm_response: str) -> List[Any]:
+        """Parse a JSON array of questions, tolerating code fences and wrappers."""
+        text = llm_response.strip()
+        if text.startswith("```"):
+            text = text.strip("`")
+            text = text[text.find("\n") + 1:] if "\n" in text else text
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = data.get("questions", [data])
+        if not isinstance(data, list):
+            raise ValueError("LLM response is not a JSON array of questions")
+        return data
+
+    @staticmethod
+    def _validate_question_data(question_data: Any) -> Optional[str]:
+        """Return why a single generated question is unusable, or None if valid."""
+        if not isinstance(question_data, dict):
+            return "not an object"
+
+        # Validate required fields
+        required_fields = ["question", "options", "correct_answer", "explanation", "references"]
+        for field in required_fields:
+            if field not in question_data:
+                return f"missing required field: {field}"
+
+        if not isinstance(question_data["question"], str) or not question_data["question"].strip():
+            return "empty question text"
+        options = question_data["options"]
+        if not isinstance(options, list) or len(options) != 4:
+            return "expected 4 options"
+        if str(question_data["correct_answer"]).strip()[:1].upper() not in ("A", "B", "C", "D"):
+            return "correct_answer must be A-D"
+        if not isinstance(question_data["references"], list):
+            question_data["references"] = [str(question_data["references"])]
+        return None
 
     async def _get_domain_question_templates(self, domain: str, difficulty: str) -> List[Dict[str, Any]]:
         """Get contextual question templates for domain and difficulty."""
@@ -769,20 +869,23 @@ Format your response as JSON:
         if not domains:
             domains = ["General"]
 
-        questions = []
-        for i in range(count):
-            domain = domains[i % len(domains)]
-            question = await self._generate_single_question(
+        per_domain = {domain: count // len(domains) for domain in domains}
+        for domain in domains[:count % len(domains)]:
+            per_domain[domain] += 1
+
+        results = await asyncio.gather(*(
+            self._generate_domain_questions(
                 domain=domain,
-                question_number=i + 100,  # Offset to avoid ID conflicts
+                question_count=domain_count,
                 difficulty_level=difficulty_level,
-                domain_knowledge="",
                 cert_resources=cert_resources,
-                correlation_id=correlation_id
+                correlation_id=correlation_id,
+                number_offset=99  # Offset to avoid ID conflicts
             )
-            questions.append(question)
-
-        return questions
+            for domain, domain_count in per_domain.items()
+            if domain_count
+        ))
+        return [q for questions in results for q in questions]
 
     async def _validate_question_quality(self, questions: List[GeneratedQuestion]) -> Dict[str, float]:
         """Validate overall quality of generated questions."""
@@ -0,0 +1,357 @@
+"""Background assessment generation jobs.
+
+``POST /workflows`` used to run AI question generation and the
+assessment-to-form orchestration inline, holding the HTTP request open for
+the whole LLM + Google Forms run. Generation is now queued onto a bounded
+pool of asyncio workers. Each job records progress events (per-domain
+question counts, form creation) that can be polled or streamed over SSE.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm.attributes import flag_modified
+
+from src.common.config import settings
+from src.common.logging_config import get_workflow_logger, get_assessment_logger
+from src.common.profiling import list_profiles, profile_job
+from src.models.workflow import WorkflowExecution
+from src.schemas.google_forms import FormSettings
+from src.service.database import get_db_session
+from src.service.workflow_queries import get_workflow
+from src.services.ai_question_generator import AIQuestionGenerator
+from src.services.workflow_orchestrator import WorkflowOrchestrator
+
+logger = get_workflow_logger()
+assessment_logger = get_assessment_logger()
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class GenerationQueueFullError(RuntimeError):
+    """Raised when the generation queue cannot accept another job."""
+
+
+@dataclass
+class GenerationJob:
+    """Progress of one workflow's assessment generation."""
+
+    workflow_id: UUID
+    status: str = "queued"  # queued, running, completed, failed
+    stage: str = "queued"
+    progress: int = 0
+    domains: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    result: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    profile: Optional[bool] = None  # None defers to JOB_PROFILING_ENABLED
+    profiles: List[str] = field(default_factory=list)  # listed once the job finishes
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+    _changed: asyncio.Condition = field(default_factory=asyncio.Condition, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def collect_profiles(self) -> None:
+        """List the profiles written for this job (once, when it finishes)."""
+        self.profiles = list_profiles(str(self.workflow_id))
+
+    async def report(self, stage: str, progress: Optional[int] = None, **details: Any) -> None:
+        """Record a progress event and wake any streaming subscribers."""
+        self.stage = stage
+        if progress is not None:
+            self.progress = progress
+        self.updated_at = datetime.utcnow()
+        event = {
+            "seq": len(self.events),
+            "stage": stage,
+            "status": self.status,
+            "progress": self.progress,
+            "timestamp": self.updated_at.isoformat(),
+            **details
+        }
+        self.events.append(event)
+        async with self._changed:
+            self._changed.notify_all()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workflow_id": str(self.workflow_id),
+            "status": self.status,
+            "stage": self.stage,
+            "progress": self.progress,
+            "domains": self.domains,
+            "result": self.result,
+            "error": self.error,
+            "profiles": [
+                f"{settings.api_v1_prefix}/workflows/{self.workflow_id}/generation/profiles/{name}"
+                for name in self.profiles
+            ],
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat()
+        }
+
+
+JobRunner = Callable[[GenerationJob], Awaitable[Dict[str, Any]]]
+
+
+class AssessmentGenerationJobManager:
+    """Bounded worker pool for assessment generation jobs."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        job_ttl: Optional[timedelta] = None
+    ):
+        self.max_workers = max_workers or settings.assessment_generation_workers
+        self.max_queue_size = max_queue_size or settings.assessment_generation_queue_size
+        self.job_ttl = job_ttl or timedelta(minutes=settings.assessment_generation_job_ttl_minutes)
+        self._jobs: Dict[UUID, GenerationJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    @property
+    def active_jobs(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == "running")
+
+    def is_saturated(self) -> bool:
+        return self.queue_depth >= self.max_queue_size
+
+    def _ensure_workers(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self.max_workers:
+            self._workers.append(
+                asyncio.create_task(self._worker(len(self._workers)))
+            )
+
+    def submit(
+        self,
+        workflow_id: UUID,
+        runner: JobRunner,
+        profile: Optional[bool] = None
+    ) -> GenerationJob:
+        """Queue a job and return immediately; raises GenerationQueueFullError."""
+        self._prune()
+        existing = self._jobs.get(workflow_id)
+        if existing and not existing.done:
+            return existing
+
+        self._ensure_workers()
+        job = GenerationJob(workflow_id=workflow_id, profile=profile)
+        try:
+            self._queue.put_nowait((job, runner))
+        except asyncio.QueueFull:
+            raise GenerationQueueFullError(
+                f"Assessment generation queue is full ({self.max_queue_size} jobs)"
+            )
+        self._jobs[workflow_id] = job
+        logger.info(
+            f"📥 Assessment generation queued | workflow_id={workflow_id} "
+            f"queue_depth={self.queue_depth} workers={self.max_workers}"
+        )
+        return job
+
+    def get(self, workflow_id: UUID) -> Optional[GenerationJob]:
+        return self._jobs.get(workflow_id)
+
+    async def stream(self, job: GenerationJob) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every progress event, past and future, until the job finishes."""
+        seq = 0
+        while True:
+            while seq < len(job.events):
+                yield job.events[seq]
+                seq += 1
+            if job.done:
+                return
+            async with job._changed:
+                await job._changed.wait_for(lambda: len(job.events) > seq or job.done)
+
+    async def shutdown(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job, runner = await self._queue.get()
+            try:
+                job.status = "running"
+                await job.report("started", 5)
+                job.result = await runner(job) or {}
+                job.collect_profiles()
+                job.status = "completed"
+                await job.report("completed", 100, result=job.result)
+            except asyncio.CancelledError:
+                job.collect_profiles()
+                job.status = "failed"
+                job.error = "Generation cancelled during shutdown"
+                await job.report("failed", error=job.error)
+                raise
+            except Exception as e:
+                logger.error(f"❌ Assessment generation job failed | workflow_id={job.workflow_id} error={e}", exc_info=True)
+                job.collect_profiles()
+                job.status = "failed"
+                job.error = str(e)
+                await job.report("failed", error=job.error)
+            finally:
+                self._queue.task_done()
+
+    def _prune(self) -> None:
+        cutoff = datetime.utcnow() - self.job_ttl
+        for workflow_id in [
+            wid for wid, job in self._jobs.items()
+            if job.done and job.updated_at < cutoff
+        ]:
+            del self._jobs[workflow_id]
+
+
+generation_jobs = AssessmentGenerationJobManager()
+
+
+async def _store_generation_status(workflow_id: UUID, **values: Any) -> Optional[WorkflowExecution]:
+    """Persist generation metadata into the workflow's parameters."""
+    async with get_db_session() as session:
+        workflow = await get_workflow(session, workflow_id)
+        if not workflow:
+            return None
+        if not workflow.parameters:
+            workflow.parameters = {}
+        workflow.parameters.update(values)
+        # Flag the JSON column as modified so SQLAlchemy detects the change
+        flag_modified(workflow, 'parameters')
+        await session.commit()
+        await session.refresh(workflow)
+        return workflow
+
+
+async def run_assessment_generation(job: GenerationJob) -> Dict[str, Any]:
+    """Generate AI questions and create the assessment form for a workflow."""
+    try:
+        return await _generate_and_create_form(job)
+    except Exception as e:
+        await _store_generation_status(job.workflow_id, generation_status="failed", generation_error=str(e))
+        raise
+
+
+async def _generate_and_create_form(job: GenerationJob) -> Dict[str, Any]:
+    workflow = await _store_generation_status(job.workflow_id, generation_status="running")
+    if not workflow:
+        raise ValueError(f"Workflow {job.workflow_id} not found")
+
+    parameters = workflow.parameters or {}
+    requested_count = parameters.get('question_count', 24)
+    domain_distribution = parameters.get('domain_distribution', {})
+
+    logger.info(f"🤖 Generating AI questions for workflow {workflow.id} | cert_profile_id={workflow.certification_profile_id} | domain_distribution={domain_distribution} | question_count={requested_count}")
+    assessment_logger.info(f"🚀 Starting assessment generation | workflow_id={workflow.id} | cert_profile_id={workflow.certification_profile_id} | question_count={requested_count}")
+
+    await job.report("generating_questions", 10, question_count=requested_count)
+
+    async def on_domain_generated(update: Dict[str, Any]) -> None:
+        job.domains[update["domain"]] = {
+            "requested": update["requested"],
+            "generated": update["generated"]
+        }
+        fraction = update["total_generated"] / max(update["question_count"], 1)
+        await job.report("domain_generated", 10 + int(60 * min(fraction, 1.0)), **update)
+
+    question_generator = AIQuestionGenerator()
+    with profile_job(str(job.workflow_id), "generate_contextual_assessment", enabled=job.profile):
+        ai_result = await question_generator.generate_contextual_assessment(
+            certification_profile_id=str(workflow.certification_profile_id),
+            user_profile="intermediate_learner",  # Default user profile
+            difficulty_level=parameters.get('difficulty_level', 'beginner'),
+            domain_distribution=domain_distribution,
+            question_count=requested_count,
+            progress_callback=on_domain_generated
+        )
+
+    logger.info(f"🔍 AI question generation result | success={ai_result.get('success')} | error={ai_result.get('error', 'None')}")
+    assessment_logger.info(f"✅ Assessment generation completed | success={ai_result.get('success')} | questions_generated={len(ai_result.get('assessment_data', {}).get('questions', []))} | workflow_id={workflow.id}")
+
+    if ai_result.get('success') and ai_result.get('assessment_data', {}).get('questions'):
+        # Use AI-generated questions
+        assessment_data = ai_result['assessment_data']
+        generation_method = "ai_generated"
+        question_count = len(assessment_data.get('questions', []))
+        logger.info(f"✅ Using AI-generated questions | count={question_count}")
+    else:
+        # Fallback to mock questions if AI generation fails
+        logger.warning(f"⚠️ AI question generation failed, using fallback mock questions: {ai_result.get('error', 'Unknown error')}")
+        fallback_count = min(5, requested_count // 5)
+        assessment_data = {
+            "questions": [
+                {
+                    "id": f"fallback_q{i+1}",
+                    "question_text": f"Sample question {i+1} for {parameters.get('title', 'Assessment')}",
+                    "question_type": "multiple_choice",
+                    "options": ["A) Option 1", "B) Option 2", "C) Option 3", "D) Option 4"],
+                    "correct_answer": "A"
+                } for i in range(fallback_count)
+            ],
+            "metadata": {
+                "certification_name": parameters.get('title', 'Assessment'),
+                "difficulty_level": parameters.get('difficulty_level', 'beginner'),
+                "question_count": requested_count,
+                "domain_distribution": domain_distribution
+            }
+        }
+        generation_method = "fallback"
+        question_count = fallback_count
+
+    # Store generation metadata in workflow parameters
+    await _store_generation_status(
+        job.workflow_id,
+        generation_method=generation_method,
+        question_count=question_count
+    )
+    logger.info(f"✅ Stored generation metadata | method={generation_method} | count={question_count}")
+    await job.report("questions_ready", 75, generation_method=generation_method, question_count=question_count)
+
+    await job.report("creating_form", 80)
+    form_settings = FormSettings(
+        collect_email=True,
+        require_login=False
+    )
+
+    orchestrator = WorkflowOrchestrator()
+    orchestration_result = await orchestrator.execute_assessment_to_form_workflow(
+        certification_profile_id=workflow.certification_profile_id,
+        user_id=workflow.user_id,
+        assessment_data=assessment_data,
+        form_settings=form_settings
+    )
+
+    if orchestration_result.get("success"):
+        logger.info(f"✅ Auto-orchestration successful for workflow {workflow.id}")
+        await job.report(
+            "form_created", 95,
+            form_id=orchestration_result.get("form_id"),
+            form_url=orchestration_result.get("form_url")
+        )
+    else:
+        logger.warning(f"⚠️ Auto-orchestration failed for workflow {workflow.id}: {orchestration_result.get('error')}")
+        await job.report("form_failed", 95, error=orchestration_result.get("error"))
+
+    await _store_generation_status(job.workflow_id, generation_status="completed")
+
+    return {
+        "generation_method": generation_method,
+        "question_count": question_count,
+        "form_id": orchestration_result.get("form_id"),
+        "form_url": orchestration_result.get("form_url"),
+        "orchestration_success": bool(orchestration_result.get("success"))
+    }
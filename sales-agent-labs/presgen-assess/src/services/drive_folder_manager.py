@@ -11,6 +11,7 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
 
+from src.services.google_api_executor import get_google_api_executor
 from src.services.google_auth_manager import GoogleAuthManager
 from src.common.enhanced_logging import get_enhanced_logger
 
@@ -22,6 +23,7 @@ class DriveFolderManager:
         self.logger = get_enhanced_logger(__name__)
         self.auth_manager = GoogleAuthManager()
         self.drive_service = None
+        self.api_executor = get_google_api_executor()
         self._folder_cache: Dict[str, str] = {}  # folder_path -> folder_id
 
     async def _get_drive_service(self):
@@ -31,6 +33,10 @@ class DriveFolderManager:
             self.drive_service = build('drive', 'v3', credentials=credentials)
         return self.drive_service
 
+    async def _execute(self, request, operation: str) -> Dict[str, Any]:
+        """Run a Drive request on the shared Google API executor."""
+        return await self.api_executor.execute(request, api="drive", operation=operation)
+
     async def create_assessment_folder_structure(
         self,
         workflow_id: UUID,
@@ -55,44 +61,29 @@ class DriveFolderManager:
 
             main_folder_id = main_folder["id"]
 
-            # Create subfolders
-            subfolders = {}
-
-            # Forms subfolder
-            forms_folder = await self._create_folder(
-                drive_service,
-                "Forms",
-                main_folder_id,
-                description="Google Forms and related files"
-            )
-            subfolders["forms"] = forms_folder["id"]
-
-            # Responses subfolder
-            responses_folder = await self._create_folder(
+            # Create the subfolders in a single batched Drive call
+            subfolder_specs = [
+                ("Forms", "Google Forms and related files"),
+                ("Responses", "Response data and analysis"),
+                ("Analysis", "Gap analysis and assessment results"),
+                ("Reports", "Generated reports and presentations"),
+            ]
+            created = await self.api_executor.execute_batch(
                 drive_service,
-                "Responses",
-                main_folder_id,
-                description="Response data and analysis"
+                [
+                    drive_service.files().create(
+                        body=self._folder_metadata(name, main_folder_id, description),
+                        fields='id,name,webViewLink'
+                    )
+                    for name, description in subfolder_specs
+                ],
+                api="drive",
+                operation="files.create",
             )
-            subfolders["responses"] = responses_folder["id"]
-
-            # Analysis subfolder
-            analysis_folder = await self._create_folder(
-                drive_service,
-                "Analysis",
-                main_folder_id,
-                description="Gap analysis and assessment results"
-            )
-            subfolders["analysis"] = analysis_folder["id"]
-
-            # Reports subfolder
-            reports_folder = await self._create_folder(
-                drive_service,
-                "Reports",
-                main_folder_id,
-                description="Generated reports and presentations"
-            )
-            subfolders["reports"] = reports_folder["id"]
+            subfolders = {
+                name.lower(): folder["id"]
+                for (name, _), folder in zip(subfolder_specs, created)
+            }
 
             # Set folder permissions
             await self._configure_folder_permissions(
@@ -144,22 +135,16 @@ class DriveFolderManager:
         description: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a folder in Google Drive."""
-        folder_metadata = {
-            'name': folder_name,
-            'mimeType': 'application/vnd.google-apps.folder'
-        }
-
-        if parent_folder_id:
-            folder_metadata['parents'] = [parent_folder_id]
-
-        if description:
-            folder_metadata['description'] = description
+        folder_metadata = self._folder_metadata(folder_name, parent_folder_id, description)
 
         try:
-            folder = drive_service.files().create(
-                body=folder_metadata,
-                fields='id,name,webViewLink'
-            ).execute()
+            folder = await self._execute(
+                drive_service.files().create(
+                    body=folder_metadata,
+                    fields='id,name,webViewLink'
+                ),
+                "files.create"
+            )
 
             self.logger.debug("Created Drive folder", extra={
                 "folder_name": folder_name,
@@ -177,6 +162,25 @@ class DriveFolderManager:
             })
             raise
 
+    @staticmethod
+    def _folder_metadata(
+        folder_name: str,
+        parent_folder_id: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> Dict[str, Any]:
+        folder_metadata = {
+            'name': folder_name,
+            'mimeType': 'application/vnd.google-apps.folder'
+        }
+
+        if parent_folder_id:
+            folder_metadata['parents'] = [parent_folder_id]
+
+        if description:
+            folder_metadata['description'] = description
+
+        return folder_metadata
+
     async def _configure_folder_permissions(
         self,
         drive_service,
@@ -193,11 +197,14 @@ class DriveFolderManager:
             }
 
             try:
-                drive_service.permissions().create(
-                    fileId=folder_id,
-                    body=user_permission,
-                    sendNotificationEmail=False
-                ).execute()
+                await self._execute(
+                    drive_service.permissions().create(
+                        fileId=folder_id,
+                        body=user_permission,
+                        sendNotificationEmail=False
+                    ),
+                    "permissions.create"
+                )
 
                 self.logger.debug("Set user permissions", extra={
                     "folder_id": folder_id,
@@ -230,20 +237,26 @@ class DriveFolderManager:
             drive_service = await self._get_drive_service()
 
             # Get current form parents
-            form_file = drive_service.files().get(
-                fileId=form_id,
-                fields='parents,name'
-            ).execute()
+            form_file = await self._execute(
+                drive_service.files().get(
+                    fileId=form_id,
+                    fields='parents,name'
+                ),
+                "files.get"
+            )
 
             # Move form to forms folder
             previous_parents = ",".join(form_file.get('parents', []))
 
-            updated_file = drive_service.files().update(
-                fileId=form_id,
-                addParents=forms_folder_id,
-                removeParents=previous_parents,
-                fields='id,parents,webViewLink'
-            ).execute()
+            updated_file = await self._execute(
+                drive_service.files().update(
+                    fileId=form_id,
+                    addParents=forms_folder_id,
+                    removeParents=previous_parents,
+                    fields='id,parents,webViewLink'
+                ),
+                "files.update"
+            )
 
             self.logger.info("Organized form in folder", extra={
                 "form_id": form_id,
@@ -291,10 +304,13 @@ class DriveFolderManager:
                 'parents': [analysis_folder_id]
             }
 
-            spreadsheet = drive_service.files().create(
-                body=sheet_metadata,
-                fields='id,name,webViewLink'
-            ).execute()
+            spreadsheet = await self._execute(
+                drive_service.files().create(
+                    body=sheet_metadata,
+                    fields='id,name,webViewLink'
+                ),
+                "files.create"
+            )
 
             # TODO: Populate spreadsheet with analysis data using Sheets API
             # This would require additional Sheets API integration
@@ -345,16 +361,28 @@ class DriveFolderManager:
                 f"and createdTime < '{cutoff_iso}'"
             )
 
-            results = drive_service.files().list(
-                q=query,
-                fields='files(id,name,createdTime,description)',
-                pageSize=100
-            ).execute()
+            results = await self._execute(
+                drive_service.files().list(
+                    q=query,
+                    fields='files(id,name,createdTime,description)',
+                    pageSize=100
+                ),
+                "files.list"
+            )
 
             old_folders = results.get('files', [])
-            cleanup_results = []
+            deletions: List[Any] = []
+            if not dry_run and old_folders:
+                deletions = await self.api_executor.execute_batch(
+                    drive_service,
+                    [drive_service.files().delete(fileId=folder["id"]) for folder in old_folders],
+                    api="drive",
+                    operation="files.delete",
+                    return_exceptions=True
+                )
 
-            for folder in old_folders:
+            cleanup_results = []
+            for index, folder in enumerate(old_folders):
                 folder_info = {
                     "folder_id": folder["id"],
                     "folder_name": folder["name"],
@@ -363,12 +391,11 @@ class DriveFolderManager:
                 }
 
                 if not dry_run:
-                    try:
-                        drive_service.files().delete(fileId=folder["id"]).execute()
-                        folder_info["status"] = "deleted"
-                    except HttpError as e:
+                    if isinstance(deletions[index], Exception):
                         folder_info["status"] = "failed"
-                        folder_info["error"] = str(e)
+                        folder_info["error"] = str(deletions[index])
+                    else:
+                        folder_info["status"] = "deleted"
                 else:
                     folder_info["status"] = "would_delete"
 
@@ -406,17 +433,23 @@ class DriveFolderManager:
             drive_service = await self._get_drive_service()
 
             # Get main folder info
-            main_folder = drive_service.files().get(
-                fileId=main_folder_id,
-                fields='id,name,description,createdTime,webViewLink'
-            ).execute()
+            main_folder = await self._execute(
+                drive_service.files().get(
+                    fileId=main_folder_id,
+                    fields='id,name,description,createdTime,webViewLink'
+                ),
+                "files.get"
+            )
 
             # Get subfolders
             subfolders_query = f"'{main_folder_id}' in parents and mimeType='application/vnd.google-apps.folder'"
-            subfolders_result = drive_service.files().list(
-                q=subfolders_query,
-                fields='files(id,name,description,webViewLink)'
-            ).execute()
+            subfolders_result = await self._execute(
+                drive_service.files().list(
+                    q=subfolders_query,
+                    fields='files(id,name,description,webViewLink)'
+                ),
+                "files.list"
+            )
 
             subfolders = {}
             for subfolder in subfolders_result.get('files', []):
@@ -427,13 +460,20 @@ class DriveFolderManager:
                     "description": subfolder.get('description', '')
                 }
 
-            # Count files in each subfolder
-            for folder_name, folder_info in subfolders.items():
-                files_query = f"'{folder_info['id']}' in parents"
-                files_result = drive_service.files().list(
-                    q=files_query,
-                    fields='files(id,name,mimeType)'
-                ).execute()
+            # Count files in each subfolder (one batched call for all listings)
+            listings = await self.api_executor.execute_batch(
+                drive_service,
+                [
+                    drive_service.files().list(
+                        q=f"'{folder_info['id']}' in parents",
+                        fields='files(id,name,mimeType)'
+                    )
+                    for folder_info in subfolders.values()
+                ],
+                api="drive",
+                operation="files.list"
+            )
+            for folder_info, files_result in zip(subfolders.values(), listings):
                 folder_info["file_count"] = len(files_result.get('files', []))
 
             return {
@@ -470,14 +510,17 @@ class DriveFolderManager:
 
             contents = []
 
-            def _scan_folder(current_folder_id: str, folder_path: str = ""):
+            async def _scan_folder(current_folder_id: str, folder_path: str = ""):
                 """Recursively scan folder contents."""
                 query = f"'{current_folder_id}' in parents"
-                results = drive_service.files().list(
-                    q=query,
-                    fields='files(id,name,mimeType,size,createdTime,modifiedTime,webViewLink)',
-                    pageSize=1000
-                ).execute()
+                results = await self._execute(
+                    drive_service.files().list(
+                        q=query,
+                        fields='files(id,name,mimeType,size,createdTime,modifiedTime,webViewLink)',
+                        pageSize=1000
+                    ),
+                    "files.list"
+                )
 
                 for file_item in results.get('files', []):
                     file_info = {
@@ -497,9 +540,9 @@ class DriveFolderManager:
                     if (include_subfolders and
                         file_item['mimeType'] == 'application/vnd.google-apps.folder'):
                         subfolder_path = f"{folder_path}/{file_item['name']}" if folder_path else file_item['name']
-                        _scan_folder(file_item['id'], subfolder_path)
+                        await _scan_folder(file_item['id'], subfolder_path)
 
-            _scan_folder(folder_id)
+            await _scan_folder(folder_id)
 
             # Calculate statistics
             total_files = len([c for c in contents if not c['is_folder']])
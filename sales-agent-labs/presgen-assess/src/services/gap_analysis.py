@@ -1,13 +1,30 @@
 """Learning gap analysis engine with confidence scoring and personalized recommendations."""
 
+import asyncio
 import logging
 import statistics
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from uuid import uuid4
 
+import numpy as np
+
 from src.knowledge.base import RAGKnowledgeBase
+from src.services.gap_analysis_cohort import (
+    BLOOM_LEVELS,
+    CohortMatrix,
+    analyze_confidence,
+    analyze_metacognition,
+    analyze_subdomains,
+    bloom_level_counts,
+    category_counts,
+    category_means,
+    cohort_aggregates,
+    group_by_question_set,
+    readiness_scores,
+)
 from src.services.llm_service import LLMService
+from src.services.remediation_context import RemediationContextBuilder, domain_remediation_query
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +44,193 @@ class GapAnalysisEngine:
         confidence_ratings: Optional[Dict] = None
     ) -> Dict:
         """Perform comprehensive gap analysis on assessment results."""
+        return await self._run_gap_analysis(
+            assessment_results, certification_profile, confidence_ratings or {}
+        )
+
+    async def analyze_cohort_results(
+        self,
+        cohort_results: List[Dict],
+        certification_profile: Dict,
+        confidence_ratings: Optional[Dict[str, Dict]] = None,
+        max_concurrent: int = 8
+    ) -> Dict:
+        """Analyze a whole cohort's results in one vectorized pass.
+
+        ``cohort_results`` are assessment_results dicts as taken by
+        analyze_assessment_results; ``confidence_ratings`` maps user_id to that
+        learner's {question_id: rating}. Learners sharing a question list are
+        packed into learners x questions arrays, so confidence calibration,
+        subdomain and Bloom breakdowns and readiness scores are computed once
+        per cohort. The remaining per-learner work (domain gaps, remediation
+        plans with their knowledge-base lookups) runs concurrently, at most
+        ``max_concurrent`` learners at a time. Per-learner analyses match
+        analyze_assessment_results.
+        """
+        confidence_ratings = confidence_ratings or {}
+        semaphore = asyncio.Semaphore(max_concurrent)
+        learner_jobs = []
+        matrices = []
+        readiness_by_learner = [0.0] * len(cohort_results)
+        calibration_by_learner = ["poor"] * len(cohort_results)
+
+        for indices in group_by_question_set(cohort_results):
+            group = [cohort_results[i] for i in indices]
+            matrix = CohortMatrix.from_results(group, confidence_ratings)
+            matrices.append(matrix)
+
+            confidence = analyze_confidence(matrix)
+            subdomains = analyze_subdomains(matrix)
+            bloom = self._cohort_bloom_analyses(matrix)
+            learning_style = self._cohort_learning_style_analyses(matrix)
+            try:
+                metacognition = analyze_metacognition(matrix)
+            except Exception:
+                metacognition = [None] * len(group)
+            readiness = readiness_scores(
+                np.array([r.get("score", 0.0) for r in group], dtype=float),
+                matrix.domain_scores,
+                [c["calibration_quality"] for c in confidence]
+            )
+
+            for k, i in enumerate(indices):
+                readiness_by_learner[i] = round(float(readiness[k]), 1)
+                calibration_by_learner[i] = confidence[k]["calibration_quality"]
+                learner_jobs.append((
+                    i,
+                    confidence_ratings.get(matrix.learner_ids[k], {}),
+                    {
+                        "confidence_analysis": confidence[k],
+                        "subdomain_breakdowns": subdomains[k],
+                        "bloom_analysis": bloom[k],
+                        "learning_style_analysis": learning_style[k],
+                        "metacognitive_analysis": metacognition[k],
+                        "readiness_score": readiness_by_learner[i]
+                    }
+                ))
+
+        async def analyze_learner(i: int, ratings: Dict, precomputed: Dict) -> Dict:
+            async with semaphore:
+                return await self._run_gap_analysis(
+                    cohort_results[i], certification_profile, ratings, precomputed=precomputed
+                )
+
+        learner_analyses: List[Optional[Dict]] = [None] * len(cohort_results)
+        results = await asyncio.gather(*(analyze_learner(*job) for job in learner_jobs))
+        for (i, _, _), analysis in zip(learner_jobs, results):
+            learner_analyses[i] = analysis
+
+        cohort = cohort_aggregates(
+            matrices,
+            np.array(readiness_by_learner, dtype=float),
+            calibration_by_learner,
+            [
+                [gap["domain"] for gap in analysis.get("identified_gaps", [])]
+                for analysis in learner_analyses if analysis and analysis.get("success")
+            ]
+        )
+
+        logger.info(
+            f"✅ Completed cohort gap analysis for {len(cohort_results)} learners "
+            f"({len(matrices)} question set(s), mean readiness "
+            f"{cohort['readiness_distribution'].get('mean', 0)}%)"
+        )
+
+        return {
+            "learner_analyses": learner_analyses,
+            "cohort_summary": cohort,
+            "certification_target": certification_profile.get("name", "Unknown"),
+            "generated_at": datetime.now().isoformat(),
+            "success": True
+        }
+
+    def _cohort_bloom_analyses(self, matrix: CohortMatrix) -> List[Optional[Dict]]:
+        """Bloom's breakdown per learner from cohort counts; None falls back to the per-learner path."""
+        try:
+            correct_counts, totals, question_ids = bloom_level_counts(matrix)
+            return [
+                self._summarize_bloom_levels({
+                    level: {
+                        "correct": int(correct_counts[i, k]),
+                        "total": int(totals[k]),
+                        "questions": list(question_ids[level])
+                    }
+                    for k, level in enumerate(BLOOM_LEVELS)
+                })
+                for i in range(len(matrix.learner_ids))
+            ]
+        except Exception:
+            # e.g. no higher-order questions: let the per-learner path report it
+            return [None] * len(matrix.learner_ids)
+
+    def _cohort_learning_style_analyses(self, matrix: CohortMatrix) -> List[Optional[Dict]]:
+        """Learning style and retention indicators per learner from cohort counts."""
+        try:
+            questions = matrix.questions
+            style_types = ["multiple_choice", "scenario_based", "practical", "theoretical"]
+            type_labels = [q.get("question_type", "multiple_choice") for q in questions]
+            _, type_correct, type_totals = category_counts(matrix, type_labels, style_types)
+            type_times = category_means(matrix.response_time, type_labels, style_types)
+
+            # Domain switches depend only on question order, so the whole cohort shares them
+            switch_columns = []
+            current_domain = None
+            for j, question in enumerate(questions):
+                domain = question.get("domain")
+                if current_domain and current_domain != domain:
+                    switch_columns.append(j)
+                current_domain = domain
+            switch_correct = matrix.correct[:, switch_columns].tolist()
+
+            domains, domain_correct, domain_totals = category_counts(
+                matrix, [q.get("domain") for q in questions]
+            )
+
+            results = []
+            for i in range(len(matrix.learner_ids)):
+                style_preferences = {}
+                for k, style in enumerate(style_types):
+                    total = int(type_totals[k])
+                    if total > 0:
+                        accuracy = int(type_correct[i, k]) / total
+                        avg_time = type_times[i][k]
+                        style_preferences[style] = {
+                            "accuracy": round(accuracy, 3),
+                            "average_time_seconds": round(avg_time, 1),
+                            "question_count": total,
+                            "efficiency_score": round(accuracy / max(avg_time / 60, 0.5), 3)  # accuracy per minute
+                        }
+
+                consistency = [int(domain_correct[i, k]) / int(domain_totals[k]) for k in range(len(domains))]
+                avg_consistency = statistics.mean(consistency) if consistency else 0
+
+                results.append({
+                    "question_type_preferences": style_preferences,
+                    "context_switching_ability": self._analyze_context_switching(
+                        [{"is_correct": is_correct} for is_correct in switch_correct[i]]
+                    ),
+                    "learning_style_recommendations": self._recommend_learning_approaches(style_preferences),
+                    "retention_indicators": {
+                        "domain_consistency": {
+                            domain: round(score, 3) for domain, score in zip(domains, consistency)
+                        },
+                        "overall_retention_score": round(avg_consistency, 3),
+                        "retention_quality": "strong" if avg_consistency > 0.8 else "moderate" if avg_consistency > 0.6 else "weak"
+                    }
+                })
+            return results
+        except Exception:
+            return [None] * len(matrix.learner_ids)
+
+    async def _run_gap_analysis(
+        self,
+        assessment_results: Dict,
+        certification_profile: Dict,
+        confidence_ratings: Dict,
+        precomputed: Optional[Dict] = None
+    ) -> Dict:
+        """Single-learner analysis; ``precomputed`` carries sections from the cohort pass."""
+        precomputed = precomputed or {}
         try:
             # Extract key metrics from assessment results
             overall_score = assessment_results.get("score", 0.0)
@@ -35,10 +239,10 @@ class GapAnalysisEngine:
             answers = assessment_results.get("answers", {})
 
             # Analyze confidence patterns
-            confidence_analysis = self._analyze_confidence_patterns(
+            confidence_analysis = precomputed.get("confidence_analysis") or self._analyze_confidence_patterns(
                 questions=questions,
                 answers=answers,
-                confidence_ratings=confidence_ratings or {}
+                confidence_ratings=confidence_ratings
             )
 
             # Identify knowledge gaps by domain
@@ -46,7 +250,8 @@ class GapAnalysisEngine:
                 domain_scores=domain_scores,
                 certification_profile=certification_profile,
                 questions=questions,
-                answers=answers
+                answers=answers,
+                subdomain_breakdowns=precomputed.get("subdomain_breakdowns")
             )
 
             # Calculate skill level assessments
@@ -65,19 +270,24 @@ class GapAnalysisEngine:
             )
 
             # Calculate overall readiness score
-            readiness_score = self._calculate_readiness_score(
-                overall_score=overall_score,
-                domain_scores=domain_scores,
-                confidence_analysis=confidence_analysis
-            )
+            readiness_score = precomputed.get("readiness_score")
+            if readiness_score is None:
+                readiness_score = self._calculate_readiness_score(
+                    overall_score=overall_score,
+                    domain_scores=domain_scores,
+                    confidence_analysis=confidence_analysis
+                )
 
             # NEW: Enhanced 5-Metric Gap Analysis Engine
             skill_gap_analysis = await self._analyze_skill_gaps_five_metrics(
                 questions=questions,
                 answers=answers,
                 domain_scores=domain_scores,
-                confidence_ratings=confidence_ratings or {},
-                certification_profile=certification_profile
+                confidence_ratings=confidence_ratings,
+                certification_profile=certification_profile,
+                bloom_analysis=precomputed.get("bloom_analysis"),
+                learning_style_analysis=precomputed.get("learning_style_analysis"),
+                metacognitive_analysis=precomputed.get("metacognitive_analysis")
             )
 
             gap_analysis = {
@@ -195,7 +405,8 @@ class GapAnalysisEngine:
         domain_scores: Dict,
         certification_profile: Dict,
         questions: List[Dict],
-        answers: Dict
+        answers: Dict,
+        subdomain_breakdowns: Optional[Dict[str, Dict]] = None
     ) -> List[Dict]:
         """Identify specific learning gaps by domain and subdomain."""
 
@@ -210,9 +421,12 @@ class GapAnalysisEngine:
 
             if domain_score < passing_threshold:
                 # Analyze subdomain performance
-                subdomain_analysis = self._analyze_subdomain_performance(
-                    domain_name, questions, answers
-                )
+                if subdomain_breakdowns is not None:
+                    subdomain_analysis = subdomain_breakdowns.get(domain_name, {})
+                else:
+                    subdomain_analysis = self._analyze_subdomain_performance(
+                        domain_name, questions, answers
+                    )
 
                 gap_severity = self._calculate_gap_severity(
                     domain_score, passing_threshold, domain_weight
@@ -343,28 +557,31 @@ class GapAnalysisEngine:
         """Generate personalized remediation plan with RAG-enhanced recommendations."""
 
         try:
-            # Extract priority areas
-            priority_areas = [gap["domain"] for gap in domain_gaps[:3]]  # Top 3 gaps
-
-            # Get RAG context for remediation recommendations
-            rag_context = ""
-            citations = []
-            if certification_id and priority_areas:
-                context_query = f"study materials and learning resources for {', '.join(priority_areas)}"
-                context_result = await self.knowledge_base.retrieve_context_for_assessment(
-                    query=context_query,
-                    certification_id=certification_id,
-                    k=6,
-                    balance_sources=True
+            # Retrieve RAG context for every gap's domain concurrently; gaps
+            # sharing a domain share a single retrieval
+            domain_queries = {
+                gap["domain"]: domain_remediation_query(gap["domain"])
+                for gap in domain_gaps
+            }
+            contexts = {}
+            if certification_id and domain_queries:
+                contexts = await RemediationContextBuilder(self.knowledge_base).retrieve(
+                    domain_queries.values(), certification_id
                 )
-                rag_context = context_result.get("combined_context", "")
-                citations = context_result.get("citations", [])
+
+            domain_contexts = {
+                domain: RemediationContextBuilder.lookup(contexts, query)
+                for domain, query in domain_queries.items()
+            }
+            citations = RemediationContextBuilder.merged_citations(domain_contexts.values())
+            rag_enhanced = any(context.get("combined_context") for context in domain_contexts.values())
 
             # Generate remediation actions for each gap
             remediation_actions = []
             total_estimated_hours = 0
 
             for gap in domain_gaps:
+                rag_context = domain_contexts[gap["domain"]].get("combined_context", "")
                 actions = self._create_remediation_actions(gap, rag_context)
                 remediation_actions.extend(actions)
                 total_estimated_hours += sum(action.get("estimated_duration_hours", 2) for action in actions)
@@ -388,7 +605,7 @@ class GapAnalysisEngine:
                     total_estimated_hours, len(remediation_actions)
                 ),
                 "success_metrics": self._define_success_metrics(domain_gaps),
-                "rag_enhanced": bool(rag_context)
+                "rag_enhanced": rag_enhanced
             }
 
         except Exception as e:
@@ -697,20 +914,29 @@ class GapAnalysisEngine:
         answers: Dict,
         domain_scores: Dict,
         confidence_ratings: Dict,
-        certification_profile: Dict
+        certification_profile: Dict,
+        bloom_analysis: Optional[Dict] = None,
+        learning_style_analysis: Optional[Dict] = None,
+        metacognitive_analysis: Optional[Dict] = None
     ) -> Dict:
-        """Enhanced 5-metric skill gap analysis engine."""
+        """Enhanced 5-metric skill gap analysis engine.
+
+        Sections passed in (from analyze_cohort_results) are used as-is.
+        """
         try:
             # 1. Bloom's Taxonomy Depth Analysis
-            bloom_analysis = self._analyze_blooms_taxonomy_performance(questions, answers)
+            if bloom_analysis is None:
+                bloom_analysis = self._analyze_blooms_taxonomy_performance(questions, answers)
 
             # 2. Learning Style & Retention Indicators
-            learning_style_analysis = self._analyze_learning_style_patterns(questions, answers)
+            if learning_style_analysis is None:
+                learning_style_analysis = self._analyze_learning_style_patterns(questions, answers)
 
             # 4. Metacognitive Awareness Gaps
-            metacognitive_analysis = self._analyze_metacognitive_awareness(
-                questions, answers, confidence_ratings
-            )
+            if metacognitive_analysis is None:
+                metacognitive_analysis = self._analyze_metacognitive_awareness(
+                    questions, answers, confidence_ratings
+                )
 
             # 5. Transfer Learning Assessment
             transfer_learning_analysis = self._analyze_transfer_learning_ability(
@@ -765,6 +991,10 @@ class GapAnalysisEngine:
                 if is_correct:
                     bloom_levels[bloom_level]["correct"] += 1
 
+        return self._summarize_bloom_levels(bloom_levels)
+
+    def _summarize_bloom_levels(self, bloom_levels: Dict) -> Dict:
+        """Scores, gaps and recommendations from per-level correct/total counts."""
         # Calculate scores and identify gaps
         bloom_scores = {}
         cognitive_gaps = []
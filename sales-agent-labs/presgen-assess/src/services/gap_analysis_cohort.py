@@ -0,0 +1,409 @@
+"""Vectorized cohort kernels for the gap analysis engine.
+
+A cohort that took the same form is packed into learners x questions arrays
+(correctness, confidence, response time) plus one-hot question attribute
+matrices (domain/subdomain, Bloom level). Confidence calibration, subdomain and
+Bloom breakdowns, readiness scores and cohort aggregates are then a handful of
+array reductions instead of one Python loop per learner.
+
+Per-learner outputs use the same formulas, defaults and rounding as the
+per-learner methods on GapAnalysisEngine.
+"""
+
+import statistics
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+BLOOM_LEVELS = ["remember", "understand", "apply", "analyze", "evaluate", "create"]
+CONFIDENCE_BINS = ["very_low", "low", "medium", "high", "very_high"]
+CALIBRATION_BONUS = {"excellent": 5, "good": 2, "fair": 0, "poor": -3}
+
+
+@dataclass
+class CohortMatrix:
+    """Responses of learners who answered the same question list, as arrays."""
+
+    questions: List[Dict]
+    learner_ids: List[str]
+    correct: np.ndarray        # (L, Q) bool
+    confidence: np.ndarray     # (L, Q) float, 3.0 where no rating was given
+    response_time: np.ndarray  # (L, Q) float, 0 where missing
+    domain_scores: np.ndarray  # (L, D) float, NaN where a learner has no score
+    domain_names: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_results(
+        cls,
+        cohort_results: List[Dict],
+        confidence_ratings: Optional[Dict[str, Dict]] = None,
+    ) -> "CohortMatrix":
+        """Build from per-learner assessment_results dicts sharing one question list."""
+        confidence_ratings = confidence_ratings or {}
+        questions = cohort_results[0].get("questions", []) if cohort_results else []
+        question_ids = [q.get("id") for q in questions]
+
+        domain_names: List[str] = []
+        for result in cohort_results:
+            for name in result.get("domain_scores", {}):
+                if name not in domain_names:
+                    domain_names.append(name)
+
+        n_learners, n_questions = len(cohort_results), len(question_ids)
+        learner_ids = [result.get("user_id", "anonymous") for result in cohort_results]
+        correct, confidence, response_time, domain_rows = [], [], [], []
+        empty: Dict = {}
+
+        for learner_id, result in zip(learner_ids, cohort_results):
+            answers = result.get("answers", {})
+            ratings = confidence_ratings.get(learner_id, {})
+            row_answers = [answers.get(question_id, empty) for question_id in question_ids]
+            correct.append([bool(a.get("is_correct", False)) for a in row_answers])
+            response_time.append([a.get("response_time_seconds", 0) for a in row_answers])
+            confidence.append([ratings.get(question_id, 3.0) for question_id in question_ids])
+            scores = result.get("domain_scores", {})
+            domain_rows.append([scores.get(name, np.nan) for name in domain_names])
+
+        shape = (n_learners, n_questions)
+        return cls(
+            questions=questions,
+            learner_ids=learner_ids,
+            correct=np.array(correct, dtype=bool).reshape(shape),
+            confidence=np.array(confidence, dtype=float).reshape(shape),
+            response_time=np.array(response_time, dtype=float).reshape(shape),
+            domain_scores=np.array(domain_rows, dtype=float).reshape(n_learners, len(domain_names)),
+            domain_names=domain_names,
+        )
+
+
+def group_by_question_set(cohort_results: List[Dict]) -> List[List[int]]:
+    """Indices of learners grouped by identical (ordered) question id lists."""
+    groups: Dict[Tuple, List[int]] = {}
+    for i, result in enumerate(cohort_results):
+        key = tuple(q.get("id") for q in result.get("questions", []))
+        groups.setdefault(key, []).append(i)
+    return list(groups.values())
+
+
+def _one_hot(labels: List, categories: List) -> np.ndarray:
+    """(Q, C) indicator matrix; labels outside categories get an all-zero row."""
+    index = {c: k for k, c in enumerate(categories)}
+    matrix = np.zeros((len(labels), len(categories)))
+    for q, label in enumerate(labels):
+        k = index.get(label)
+        if k is not None:
+            matrix[q, k] = 1.0
+    return matrix
+
+
+def row_means(values: np.ndarray) -> List[float]:
+    """Per-row mean; raises like statistics.mean when there are no columns."""
+    if values.shape[1] == 0:
+        raise statistics.StatisticsError("mean requires at least one data point")
+    return values.mean(axis=1).tolist()
+
+
+def _pearson_rows(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Row-wise Pearson correlation; 0 where undefined (same rule as _calculate_correlation)."""
+    if x.shape[1] < 2:
+        return np.zeros(x.shape[0])
+    dx = x - x.mean(axis=1, keepdims=True)
+    dy = y - y.mean(axis=1, keepdims=True)
+    numerator = (dx * dy).sum(axis=1)
+    denominator = np.sqrt((dx ** 2).sum(axis=1) * (dy ** 2).sum(axis=1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = np.where(denominator != 0, numerator / denominator, 0.0)
+    return r
+
+
+def calibration_quality(correlation: np.ndarray, avg_confidence: np.ndarray, avg_accuracy: np.ndarray) -> np.ndarray:
+    """Vectorized GapAnalysisEngine._assess_calibration_quality."""
+    gap = np.abs(avg_confidence / 5.0 - avg_accuracy)
+    return np.select(
+        [(correlation > 0.7) & (gap < 0.2), (correlation > 0.5) & (gap < 0.3), correlation > 0.2],
+        ["excellent", "good", "fair"],
+        default="poor",
+    )
+
+
+def analyze_confidence(matrix: CohortMatrix) -> List[Dict]:
+    """Per-learner equivalent of GapAnalysisEngine._analyze_confidence_patterns."""
+    n_learners, n_questions = matrix.correct.shape
+    accuracy = matrix.correct.astype(float)
+
+    if n_questions:
+        avg_confidence = np.array(row_means(matrix.confidence))
+        avg_accuracy = np.array(row_means(accuracy))
+    else:
+        avg_confidence = np.full(n_learners, 3.0)
+        avg_accuracy = np.zeros(n_learners)
+    correlation = _pearson_rows(matrix.confidence, accuracy)
+    quality = calibration_quality(correlation, avg_confidence, avg_accuracy)
+
+    # Confidence histogram: bins are (.., 1.5], (1.5, 2.5], (2.5, 3.5], (3.5, 4.5], (4.5, ..)
+    bin_index = np.searchsorted(np.array([1.5, 2.5, 3.5, 4.5]), matrix.confidence, side="left")
+    bin_counts = np.stack([(bin_index == k).sum(axis=1) for k in range(len(CONFIDENCE_BINS))], axis=1)
+
+    overconfident = (matrix.confidence >= 4.0) & ~matrix.correct
+    underconfident = (matrix.confidence <= 2.0) & matrix.correct
+
+    question_meta = [(q.get("domain"), q.get("subdomain"), q.get("id")) for q in matrix.questions]
+    confidence_rows = matrix.confidence.tolist()
+
+    def _areas(mask_row: np.ndarray, conf_row: List[float]) -> List[Dict]:
+        return [
+            {
+                "domain": question_meta[j][0],
+                "subdomain": question_meta[j][1],
+                "question_id": question_meta[j][2],
+                "confidence": conf_row[j],
+            }
+            for j in np.flatnonzero(mask_row).tolist()
+        ]
+
+    results = []
+    for i in range(n_learners):
+        avg_conf = float(avg_confidence[i])
+        avg_acc = float(avg_accuracy[i])
+        distribution = (
+            {name: round(int(bin_counts[i, k]) / n_questions, 2) for k, name in enumerate(CONFIDENCE_BINS)}
+            if n_questions else {}
+        )
+        results.append({
+            "average_confidence": round(avg_conf, 2),
+            "average_accuracy": round(avg_acc, 2),
+            "confidence_accuracy_correlation": round(float(correlation[i]), 3),
+            "confidence_accuracy_ratio": round(avg_conf / 5.0 / max(avg_acc, 0.1), 2),
+            "overconfident_areas": _areas(overconfident[i], confidence_rows[i]),
+            "underconfident_areas": _areas(underconfident[i], confidence_rows[i]),
+            "confidence_distribution": distribution,
+            "calibration_quality": str(quality[i]),
+        })
+    return results
+
+
+def analyze_subdomains(matrix: CohortMatrix) -> List[Dict[str, Dict]]:
+    """Per-learner {domain: subdomain breakdown}, as _analyze_subdomain_performance builds it."""
+    pairs: List[Tuple] = []
+    for q in matrix.questions:
+        pair = (q.get("domain"), q.get("subdomain", "General"))
+        if pair not in pairs:
+            pairs.append(pair)
+
+    labels = [(q.get("domain"), q.get("subdomain", "General")) for q in matrix.questions]
+    indicator = _one_hot(labels, pairs)
+    totals = indicator.sum(axis=0).astype(int)
+    correct_counts = (matrix.correct.astype(float) @ indicator).astype(int)
+    question_ids = {
+        pair: [q.get("id") for q, label in zip(matrix.questions, labels) if label == pair]
+        for pair in pairs
+    }
+
+    results = []
+    for i in range(len(matrix.learner_ids)):
+        by_domain: Dict[str, Dict] = {}
+        for k, (domain, subdomain) in enumerate(pairs):
+            total = int(totals[k])
+            correct = int(correct_counts[i, k])
+            by_domain.setdefault(domain, {})[subdomain] = {
+                "correct": correct,
+                "total": total,
+                "question_ids": list(question_ids[(domain, subdomain)]),
+                "score": round(correct / total if total > 0 else 0.0, 3),
+            }
+        results.append(by_domain)
+    return results
+
+
+def category_counts(
+    matrix: CohortMatrix, labels: List, categories: Optional[List] = None
+) -> Tuple[List, np.ndarray, np.ndarray]:
+    """(categories, correct counts (L, C), question totals (C,)) for one label per question.
+
+    ``categories`` defaults to the labels in first-seen order, which is the
+    order the per-learner dict loops produce.
+    """
+    if categories is None:
+        categories = list(dict.fromkeys(labels))
+    indicator = _one_hot(labels, categories)
+    totals = indicator.sum(axis=0).astype(int)
+    correct_counts = (matrix.correct.astype(float) @ indicator).astype(int)
+    return categories, correct_counts, totals
+
+
+def category_means(values: np.ndarray, labels: List, categories: List) -> List[List[float]]:
+    """Per-learner mean of ``values`` (L, Q) within each category; 0 for empty categories."""
+    indicator = _one_hot(labels, categories).astype(float)
+    totals = indicator.sum(axis=0)
+    sums = values.astype(float) @ indicator
+    means = np.divide(sums, totals, out=np.zeros_like(sums), where=totals > 0)
+    return means.tolist()
+
+
+def bloom_level_counts(matrix: CohortMatrix) -> Tuple[np.ndarray, np.ndarray, Dict[str, List]]:
+    """(correct counts (L, 6), totals (6,), question ids per level) over BLOOM_LEVELS."""
+    labels = [q.get("bloom_level", "understand").lower() for q in matrix.questions]
+    _, correct_counts, totals = category_counts(matrix, labels, BLOOM_LEVELS)
+    question_ids = {
+        level: [q.get("id") for q, label in zip(matrix.questions, labels) if label == level]
+        for level in BLOOM_LEVELS
+    }
+    return correct_counts, totals, question_ids
+
+
+def analyze_metacognition(matrix: CohortMatrix) -> List[Dict]:
+    """Per-learner equivalent of GapAnalysisEngine._analyze_metacognitive_awareness."""
+    n_questions = len(matrix.questions)
+    if n_questions == 0:
+        raise statistics.StatisticsError("mean requires at least one data point")
+
+    difficulties = [q.get("difficulty_level", "medium") for q in matrix.questions]
+    expected_time = np.array(
+        [{"easy": 30, "medium": 60, "hard": 120, "expert": 180}.get(d, 60) for d in difficulties],
+        dtype=float,
+    )
+    hard = np.array([d in ["hard", "expert"] for d in difficulties])
+
+    predicted = matrix.confidence / 5.0
+    actual = matrix.correct.astype(float)
+    accuracy_gap = np.abs(predicted - actual)
+    uncertain = (hard & (matrix.confidence <= 2.0)).any(axis=1)
+    time_ratio = matrix.response_time / expected_time
+    appropriate = ((time_ratio >= 0.5) & (time_ratio <= 2.0)).sum(axis=1)
+
+    question_ids = [q.get("id") for q in matrix.questions]
+    domains = [q.get("domain") for q in matrix.questions]
+
+    avg_gaps = row_means(accuracy_gap)
+    gap_rows = accuracy_gap.tolist()
+    predicted_rows = predicted.tolist()
+    actual_rows = actual.tolist()
+
+    results = []
+    for i in range(len(matrix.learner_ids)):
+        gaps = gap_rows[i]
+        avg_gap = avg_gaps[i]
+        recognition_rate = 1.0 if uncertain[i] else 0.0  # every flagged item is "appropriately uncertain"
+        allocation_rate = int(appropriate[i]) / n_questions
+        results.append({
+            "self_assessment_accuracy": {
+                "average_gap": round(avg_gap, 3),
+                "details": [
+                    {"question_id": qid, "predicted": p, "actual": a, "accuracy_gap": g, "domain": d}
+                    for qid, p, a, g, d in zip(question_ids, predicted_rows[i], actual_rows[i], gaps, domains)
+                ],
+                "calibration_quality": "good" if avg_gap < 0.3 else "needs_improvement"
+            },
+            "uncertainty_recognition": {
+                "recognition_rate": round(recognition_rate, 3),
+                "quality": "good" if recognition_rate > 0.7 else "needs_improvement"
+            },
+            "strategy_adaptation": {
+                "appropriate_time_allocation_rate": round(allocation_rate, 3),
+                "adaptation_quality": "good" if allocation_rate > 0.7 else "needs_improvement"
+            },
+            "metacognitive_maturity_score": round((
+                (1 - avg_gap) + recognition_rate + allocation_rate
+            ) / 3, 3)
+        })
+    return results
+
+
+def readiness_scores(
+    overall_scores: np.ndarray, domain_scores: np.ndarray, calibration: List[str]
+) -> np.ndarray:
+    """Vectorized GapAnalysisEngine._calculate_readiness_score (unrounded)."""
+    present = ~np.isnan(domain_scores)
+    counts = present.sum(axis=1)
+    penalties = np.zeros(len(overall_scores))
+    for i in np.flatnonzero(counts > 1):
+        # statistics.stdev keeps the per-learner rounding behaviour bit-for-bit
+        penalties[i] = min(10, statistics.stdev(domain_scores[i, present[i]].tolist()) / 2)
+    bonus = np.array([CALIBRATION_BONUS.get(q, 0) for q in calibration], dtype=float)
+    return np.clip(overall_scores - penalties + bonus, 0, 100)
+
+
+def _distribution(values: np.ndarray) -> Dict:
+    if values.size == 0:
+        return {}
+    return {
+        "mean": round(float(values.mean()), 2),
+        "median": round(float(np.median(values)), 2),
+        "p25": round(float(np.percentile(values, 25)), 2),
+        "p75": round(float(np.percentile(values, 75)), 2),
+        "min": round(float(values.min()), 2),
+        "max": round(float(values.max()), 2),
+    }
+
+
+def cohort_aggregates(
+    matrices: List[CohortMatrix],
+    readiness: np.ndarray,
+    calibration: List[str],
+    gap_domains: List[List[str]],
+) -> Dict:
+    """Cohort-level summary computed from the same arrays as the per-learner results."""
+    n_learners = int(readiness.size)
+    aggregates: Dict = {
+        "learner_count": n_learners,
+        "readiness_distribution": _distribution(readiness),
+        "study_approach_counts": {
+            "maintenance": int((readiness >= 85).sum()),
+            "targeted": int(((readiness >= 70) & (readiness < 85)).sum()),
+            "comprehensive": int((readiness < 70).sum()),
+        },
+        "calibration_quality_counts": {
+            level: calibration.count(level) for level in ("excellent", "good", "fair", "poor")
+        },
+    }
+
+    # Share of learners with a gap in each domain
+    gap_counts: Dict[str, int] = {}
+    for domains in gap_domains:
+        for domain in domains:
+            gap_counts[domain] = gap_counts.get(domain, 0) + 1
+    aggregates["domain_gap_rates"] = {
+        domain: round(count / max(n_learners, 1), 3)
+        for domain, count in sorted(gap_counts.items(), key=lambda kv: -kv[1])
+    }
+
+    # Mean reported domain score across the cohort
+    domain_totals: Dict[str, List[float]] = {}
+    for m in matrices:
+        for j, name in enumerate(m.domain_names):
+            column = m.domain_scores[:, j]
+            domain_totals.setdefault(name, []).extend(column[~np.isnan(column)].tolist())
+    aggregates["domain_score_means"] = {
+        name: round(float(np.mean(values)), 2) for name, values in domain_totals.items() if values
+    }
+
+    # Item statistics (p-value = share correct) and Bloom accuracy, per question set
+    item_stats: Dict[str, Dict] = {}
+    bloom_correct = np.zeros(len(BLOOM_LEVELS))
+    bloom_total = np.zeros(len(BLOOM_LEVELS))
+    for m in matrices:
+        if not m.questions:
+            continue
+        p_values = m.correct.mean(axis=0)
+        overconfidence = ((m.confidence >= 4.0) & ~m.correct).mean(axis=0)
+        mean_time = m.response_time.mean(axis=0)
+        for j, q in enumerate(m.questions):
+            item_stats[q.get("id")] = {
+                "domain": q.get("domain"),
+                "p_value": round(float(p_values[j]), 3),
+                "overconfidence_rate": round(float(overconfidence[j]), 3),
+                "average_time_seconds": round(float(mean_time[j]), 1),
+                "responses": len(m.learner_ids),
+            }
+        correct_counts, totals, _ = bloom_level_counts(m)
+        bloom_correct += correct_counts.sum(axis=0)
+        bloom_total += totals * len(m.learner_ids)
+
+    aggregates["item_statistics"] = item_stats
+    aggregates["hardest_questions"] = sorted(item_stats, key=lambda qid: item_stats[qid]["p_value"])[:5]
+    aggregates["bloom_level_accuracy"] = {
+        level: round(float(bloom_correct[k] / bloom_total[k]), 3)
+        for k, level in enumerate(BLOOM_LEVELS) if bloom_total[k] > 0
+    }
+    return aggregates
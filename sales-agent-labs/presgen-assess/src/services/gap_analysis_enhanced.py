@@ -6,7 +6,7 @@ and integration with existing GapAnalysisEngine.
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 from uuid import UUID, uuid4
 from datetime import datetime
 
@@ -17,7 +17,13 @@ from src.service.database import get_db_session as get_async_session
 from src.models.workflow import WorkflowExecution
 from src.models.gap_analysis import GapAnalysisResult, ContentOutline, RecommendedCourse
 from src.services.gap_analysis import GapAnalysisEngine
+from src.services.gap_analysis_read_model import gap_analysis_read_model
 from src.services.llm_service import LLMService
+from src.services.remediation_context import (
+    RemediationContextBuilder,
+    context_relevance,
+    domain_remediation_query,
+)
 from src.common.structured_logger import StructuredLogger
 from src.common.feature_flags import is_feature_enabled
 
@@ -150,7 +156,9 @@ class EnhancedGapAnalysisService:
     ) -> List[UUID]:
         """Generate content outlines for skill gaps via RAG retrieval.
 
-        Sprint 1: Content outline generation (placeholder for full RAG in Sprint 2).
+        Retrieval for all skill gaps runs concurrently (identical queries are
+        retrieved once) and the outlines are written with a single bulk insert.
+        Gaps without knowledge base context get placeholder content items.
 
         Args:
             gap_analysis_id: Gap analysis result ID
@@ -161,16 +169,36 @@ class EnhancedGapAnalysisService:
         Returns:
             List of content outline IDs
         """
-        content_outline_ids = []
+        if not skill_gaps:
+            return []
 
-        for skill_gap in skill_gaps:
-            # Placeholder: Simple content mapping (full RAG retrieval in Sprint 2)
-            content_items = self._generate_placeholder_content_items(
-                skill_gap,
-                certification_profile
+        gap_queries = [
+            domain_remediation_query(
+                skill_gap.get("exam_domain") or "General",
+                skill_gap.get("skill_name")
             )
+            for skill_gap in skill_gaps
+        ]
+        contexts = await RemediationContextBuilder(self.gap_engine.knowledge_base).retrieve(
+            gap_queries,
+            str(certification_profile.get("id") or "")
+        )
+
+        content_outlines = []
+        for skill_gap, query in zip(skill_gaps, gap_queries):
+            context = RemediationContextBuilder.lookup(contexts, query)
+            content_items = self._content_items_from_context(context)
+            rag_retrieval_score = context_relevance(context)
+
+            if not content_items:
+                content_items = self._generate_placeholder_content_items(
+                    skill_gap,
+                    certification_profile
+                )
+                rag_retrieval_score = 0.75  # Placeholder score
 
-            content_outline_id = await self._persist_content_outline(
+            content_outlines.append(ContentOutline(
+                id=uuid4(),
                 gap_analysis_id=gap_analysis_id,
                 workflow_id=workflow_id,
                 skill_id=skill_gap.get("skill_id"),
@@ -178,12 +206,10 @@ class EnhancedGapAnalysisService:
                 exam_domain=skill_gap.get("exam_domain"),
                 exam_guide_section=skill_gap.get("exam_subsection") or "General",
                 content_items=content_items,
-                rag_retrieval_score=0.75  # Placeholder score
-            )
+                rag_retrieval_score=rag_retrieval_score if rag_retrieval_score is not None else 0.75
+            ))
 
-            content_outline_ids.append(content_outline_id)
-
-        return content_outline_ids
+        return await self._persist_all(content_outlines)
 
     async def generate_course_recommendations(
         self,
@@ -194,7 +220,8 @@ class EnhancedGapAnalysisService:
     ) -> List[UUID]:
         """Generate course recommendations for skill gaps.
 
-        Sprint 1: Course recommendation generation.
+        Sprint 1: Course recommendation generation. All recommendations are
+        written with a single bulk insert.
 
         Args:
             gap_analysis_id: Gap analysis result ID
@@ -205,7 +232,7 @@ class EnhancedGapAnalysisService:
         Returns:
             List of recommended course IDs
         """
-        course_ids = []
+        courses = []
 
         for skill_gap in skill_gaps:
             course_data = self._generate_course_recommendation(
@@ -213,20 +240,40 @@ class EnhancedGapAnalysisService:
                 certification_profile
             )
 
-            course_id = await self._persist_recommended_course(
+            courses.append(RecommendedCourse(
+                id=uuid4(),
                 gap_analysis_id=gap_analysis_id,
                 workflow_id=workflow_id,
                 skill_id=skill_gap.get("skill_id"),
                 skill_name=skill_gap.get("skill_name"),
                 exam_domain=skill_gap.get("exam_domain"),
                 exam_subsection=skill_gap.get("exam_subsection"),
-                course_data=course_data,
+                course_title=course_data["course_title"],
+                course_description=course_data["course_description"],
+                estimated_duration_minutes=course_data["estimated_duration_minutes"],
+                difficulty_level=course_data["difficulty_level"],
+                learning_objectives=course_data["learning_objectives"],
+                content_outline=course_data["content_outline"],
                 priority=skill_gap.get("severity", 5)
-            )
+            ))
 
-            course_ids.append(course_id)
+        return await self._persist_all(courses)
 
-        return course_ids
+    async def materialize_dashboard(self, workflow_id: UUID) -> None:
+        """Build the dashboard read model once the analysis, outlines and courses are persisted.
+
+        Each persist step only invalidates the read model (through its ORM
+        listeners); callers materialize once at the end. The read model is
+        rebuilt lazily on a miss, so a failure here only costs the first
+        dashboard load and must not fail the analysis.
+        """
+        try:
+            async with get_async_session() as session:
+                await gap_analysis_read_model.materialize(session, workflow_id)
+        except Exception as e:
+            self.logger.logger.warning(
+                f"⚠️ Dashboard read model materialization failed | workflow_id={workflow_id} error={e}"
+            )
 
     # Private methods
 
@@ -525,6 +572,23 @@ Your strongest areas are:
             }
         ]
 
+    def _content_items_from_context(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Build content items from retrieved knowledge base chunks."""
+        content_items = []
+        for group in context.get("sources", {}).values():
+            for result in group.get("results", []):
+                metadata = result.get("metadata") or {}
+                content = " ".join((result.get("content") or "").split())
+                if not content:
+                    continue
+                content_items.append({
+                    "topic": metadata.get("section") or metadata.get("title") or metadata.get("source_file") or "Study Material",
+                    "source": result.get("citation") or metadata.get("source_file") or "Knowledge Base",
+                    "page_ref": str(metadata["page"]) if metadata.get("page") is not None else "Section TBD",
+                    "summary": content[:300]
+                })
+        return content_items
+
     def _generate_course_recommendation(
         self,
         skill_gap: Dict[str, Any],
@@ -612,69 +676,14 @@ Your strongest areas are:
 
             return gap_result.id
 
-    async def _persist_content_outline(
-        self,
-        gap_analysis_id: UUID,
-        workflow_id: UUID,
-        skill_id: str,
-        skill_name: str,
-        exam_domain: str,
-        exam_guide_section: str,
-        content_items: List[Dict[str, Any]],
-        rag_retrieval_score: float
-    ) -> UUID:
-        """Persist content outline to database."""
-        async with get_async_session() as session:
-            content_outline = ContentOutline(
-                id=uuid4(),
-                gap_analysis_id=gap_analysis_id,
-                workflow_id=workflow_id,
-                skill_id=skill_id,
-                skill_name=skill_name,
-                exam_domain=exam_domain,
-                exam_guide_section=exam_guide_section,
-                content_items=content_items,
-                rag_retrieval_score=rag_retrieval_score
-            )
-
-            session.add(content_outline)
-            await session.commit()
-            await session.refresh(content_outline)
+    async def _persist_all(self, rows: List[Any]) -> List[UUID]:
+        """Persist rows with one bulk insert and a single commit."""
+        if not rows:
+            return []
 
-            return content_outline.id
-
-    async def _persist_recommended_course(
-        self,
-        gap_analysis_id: UUID,
-        workflow_id: UUID,
-        skill_id: str,
-        skill_name: str,
-        exam_domain: str,
-        exam_subsection: Optional[str],
-        course_data: Dict[str, Any],
-        priority: int
-    ) -> UUID:
-        """Persist recommended course to database."""
+        row_ids = [row.id for row in rows]
         async with get_async_session() as session:
-            course = RecommendedCourse(
-                id=uuid4(),
-                gap_analysis_id=gap_analysis_id,
-                workflow_id=workflow_id,
-                skill_id=skill_id,
-                skill_name=skill_name,
-                exam_domain=exam_domain,
-                exam_subsection=exam_subsection,
-                course_title=course_data["course_title"],
-                course_description=course_data["course_description"],
-                estimated_duration_minutes=course_data["estimated_duration_minutes"],
-                difficulty_level=course_data["difficulty_level"],
-                learning_objectives=course_data["learning_objectives"],
-                content_outline=course_data["content_outline"],
-                priority=priority
-            )
-
-            session.add(course)
+            session.add_all(rows)
             await session.commit()
-            await session.refresh(course)
 
-            return course.id
\ No newline at end of file
+        return row_ids
@@ -0,0 +1,499 @@
+"""Materialized read model for the Gap Analysis dashboard.
+
+Dashboard tabs used to re-query WorkflowExecution, GapAnalysisResult,
+ContentOutline and RecommendedCourse and rebuild the response payload on
+every load and tab switch. This module stores each serialized dashboard
+section once, keyed by ``(workflow_id, section)``, so a dashboard load is a
+single primary-key lookup. Each section carries a content ETag for
+``If-None-Match`` revalidation.
+
+Sections are materialized when gap analysis is persisted and lazily rebuilt
+on a miss. They are invalidated from ORM events whenever one of their source
+rows changes, including bulk ``update(WorkflowExecution)`` statements.
+Every invalidation bumps the row version, and rebuilt sections are written
+from a dedicated session with a compare-and-set on the version observed
+before building, so a rebuild never overwrites a newer invalidation.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from fastapi import status
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    JSON,
+    String,
+    Uuid,
+    delete,
+    event,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter
+from sqlalchemy.sql import operators
+
+from src.models.base import Base
+from src.models.gap_analysis import (
+    GapAnalysisResult as GapAnalysisResultModel,
+    ContentOutline as ContentOutlineModel,
+    RecommendedCourse as RecommendedCourseModel
+)
+from src.models.workflow import WorkflowExecution
+from src.service.workflow_queries import get_workflow
+from src.schemas.gap_analysis import (
+    GapAnalysisResult,
+    ContentOutlineItem,
+    RecommendedCourse
+)
+
+logger = logging.getLogger(__name__)
+
+# Sections derived from the gap analysis tables
+GAP_SECTIONS = ("gap_analysis", "summary", "content_outlines", "recommended_courses")
+# Sections derived from the WorkflowExecution row itself
+WORKFLOW_SECTIONS = ("answers", "report")
+# Sections a builder produces together, claimed together before a rebuild
+_SECTION_GROUPS = {section: GAP_SECTIONS for section in GAP_SECTIONS}
+
+SectionBuilder = Callable[[AsyncSession, UUID], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class GapAnalysisDashboardView(Base):
+    """One serialized dashboard section for a workflow."""
+
+    __tablename__ = "gap_analysis_dashboard_views"
+
+    workflow_id = Column(Uuid(as_uuid=True), primary_key=True)
+    section = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=1)
+    etag = Column(String(64), nullable=False)
+    payload = Column(JSON, nullable=False)
+    stale = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+@dataclass(frozen=True)
+class DashboardSection:
+    """A materialized section ready to be served."""
+
+    section: str
+    payload: Any
+    etag: str
+    version: int
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Return True if an ``If-None-Match`` header covers this ETag."""
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(
+            tag.removeprefix("W/") == self.etag for tag in candidates
+        )
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Cache-Control": "private, no-cache",
+            "X-Read-Model-Version": str(self.version),
+        }
+
+
+def section_response(section: DashboardSection, if_none_match: Optional[str]) -> Response:
+    """Serve a materialized section, or 304 if the client copy is current."""
+    if section.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=section.headers)
+    return JSONResponse(content=section.payload, headers=section.headers)
+
+
+def serialize_section(payload: Any) -> str:
+    """Serialize a section canonically so equal payloads share an ETag."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def compute_etag(serialized: str) -> str:
+    return '"' + hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+# Section builders
+
+async def _latest_gap_analysis(db: AsyncSession, workflow_id: UUID):
+    result = await db.execute(
+        select(GapAnalysisResultModel)
+        .where(GapAnalysisResultModel.workflow_id == workflow_id)
+        .order_by(GapAnalysisResultModel.created_at.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def build_gap_sections(db: AsyncSession, workflow_id: UUID) -> Optional[Dict[str, Any]]:
+    """Build every gap-analysis-derived section from the persisted tables."""
+    gap_analysis = await _latest_gap_analysis(db, workflow_id)
+    if not gap_analysis:
+        return None
+
+    outlines_result = await db.execute(
+        select(ContentOutlineModel).where(
+            ContentOutlineModel.gap_analysis_id == gap_analysis.id
+        )
+    )
+    courses_result = await db.execute(
+        select(RecommendedCourseModel)
+        .where(RecommendedCourseModel.gap_analysis_id == gap_analysis.id)
+        .order_by(RecommendedCourseModel.priority.desc())
+    )
+    outlines = outlines_result.scalars().all()
+    courses = courses_result.scalars().all()
+
+    skill_gaps = gap_analysis.skill_gaps or []
+    top_skill_gaps = sorted(
+        skill_gaps,
+        key=lambda x: x.get("severity", 0),
+        reverse=True
+    )[:5]
+
+    return {
+        "gap_analysis": GapAnalysisResult(
+            workflow_id=gap_analysis.workflow_id,
+            overall_score=gap_analysis.overall_score,
+            total_questions=gap_analysis.total_questions,
+            correct_answers=gap_analysis.correct_answers,
+            incorrect_answers=gap_analysis.incorrect_answers,
+            skill_gaps=skill_gaps,
+            performance_by_domain=gap_analysis.performance_by_domain,
+            text_summary=gap_analysis.text_summary,
+            charts_data=gap_analysis.charts_data,
+            generated_at=gap_analysis.created_at
+        ).model_dump(mode="json"),
+        "content_outlines": [
+            ContentOutlineItem(
+                skill_id=outline.skill_id,
+                skill_name=outline.skill_name,
+                exam_domain=outline.exam_domain,
+                exam_guide_section=outline.exam_guide_section,
+                content_items=outline.content_items,
+                rag_retrieval_score=outline.rag_retrieval_score
+            ).model_dump(mode="json")
+            for outline in outlines
+        ],
+        "recommended_courses": [
+            RecommendedCourse(
+                id=course.id,
+                workflow_id=course.workflow_id,
+                skill_id=course.skill_id,
+                skill_name=course.skill_name,
+                exam_domain=course.exam_domain,
+                exam_subsection=course.exam_subsection,
+                course_title=course.course_title,
+                course_description=course.course_description,
+                estimated_duration_minutes=course.estimated_duration_minutes,
+                difficulty_level=course.difficulty_level,
+                learning_objectives=course.learning_objectives,
+                content_outline=course.content_outline,
+                generation_status=course.generation_status,
+                priority=course.priority
+            ).model_dump(mode="json")
+            for course in courses
+        ],
+        "summary": {
+            "workflow_id": str(workflow_id),
+            "overall_score": gap_analysis.overall_score,
+            "total_questions": gap_analysis.total_questions,
+            "correct_answers": gap_analysis.correct_answers,
+            "incorrect_answers": gap_analysis.incorrect_answers,
+            "text_summary": gap_analysis.text_summary,
+            "performance_by_domain": gap_analysis.performance_by_domain,
+            "top_skill_gaps": top_skill_gaps,
+            "total_skill_gaps": len(skill_gaps),
+            "content_outlines_count": len(outlines),
+            "recommended_courses_count": len(courses),
+            "charts_data": gap_analysis.charts_data or {},
+            "generated_at": gap_analysis.created_at.isoformat()
+        },
+    }
+
+
+async def build_answers_section(db: AsyncSession, workflow_id: UUID) -> Optional[Dict[str, Any]]:
+    """Build the Answers tab from the workflow's questions and responses."""
+    workflow = await get_workflow(db, workflow_id)
+    if not workflow:
+        return None
+
+    assessment_data = workflow.assessment_data or {}
+    questions = assessment_data.get("questions", [])
+    responses = workflow.collected_responses or []
+    question_map = {q.get("id"): q for q in questions}
+
+    correct_answers = []
+    incorrect_answers = []
+
+    for response in responses:
+        question_id = response.get("question_id")
+        question = question_map.get(question_id, {})
+
+        if not question:
+            continue
+
+        user_answer = response.get("answer")
+        correct_answer = question.get("correct_answer")
+        is_correct = user_answer == correct_answer
+
+        answer_detail = {
+            "question_id": question_id,
+            "question_text": question.get("question_text", ""),
+            "user_answer": user_answer,
+            "correct_answer": correct_answer,
+            "explanation": question.get("explanation", "No explanation available."),
+            "domain": question.get("domain", "General"),
+            "difficulty": question.get("difficulty", "intermediate"),
+            "options": question.get("options", []),
+            "is_correct": is_correct
+        }
+
+        if is_correct:
+            correct_answers.append(answer_detail)
+        else:
+            incorrect_answers.append(answer_detail)
+
+    return {
+        "answers": {
+            "workflow_id": str(workflow_id),
+            "total_questions": len(questions),
+            "correct_count": len(correct_answers),
+            "incorrect_count": len(incorrect_answers),
+            "correct_answers": correct_answers,
+            "incorrect_answers": incorrect_answers,
+            "score_percentage": round((len(correct_answers) / len(questions) * 100), 2) if questions else 0
+        }
+    }
+
+
+_DEFAULT_BUILDERS: Dict[str, SectionBuilder] = {
+    **{section: build_gap_sections for section in GAP_SECTIONS},
+    "answers": build_answers_section,
+}
+
+
+class GapAnalysisReadModel:
+    """Versioned store of serialized dashboard sections.
+
+    Reads use the caller's session; writes go through ``session_factory``
+    (the application session factory by default) so serving a GET never
+    commits or rolls back the request session.
+    """
+
+    def __init__(self, session_factory: Optional[async_sessionmaker] = None):
+        self._session_factory = session_factory
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        if self._session_factory is None:
+            from src.service.database import AsyncSessionLocal
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    async def get(
+        self,
+        db: AsyncSession,
+        workflow_id: UUID,
+        section: str
+    ) -> Optional[DashboardSection]:
+        """Return a fresh materialized section, or None on a miss."""
+        view = await db.get(
+            GapAnalysisDashboardView,
+            (workflow_id, section),
+            populate_existing=True
+        )
+        if view is None or view.stale:
+            return None
+        return DashboardSection(section, view.payload, view.etag, view.version)
+
+    async def get_or_build(
+        self,
+        db: AsyncSession,
+        workflow_id: UUID,
+        section: str,
+        builder: Optional[SectionBuilder] = None
+    ) -> Optional[DashboardSection]:
+        """Serve a section from the read model, rebuilding it on a miss.
+
+        ``builder`` returns a mapping of section name to payload (it may build
+        sibling sections in the same pass) or None if the source rows are
+        missing.
+        """
+        cached = await self.get(db, workflow_id, section)
+        if cached is not None:
+            return cached
+
+        builder = builder or _DEFAULT_BUILDERS[section]
+        versions = await self.claim(workflow_id, _SECTION_GROUPS.get(section, (section,)))
+        sections = await builder(db, workflow_id)
+        if sections is None:
+            return None
+
+        logger.info(f"🔄 Rebuilding dashboard read model | workflow_id={workflow_id} sections={list(sections)}")
+        stored = await self.store(workflow_id, sections, versions)
+        return stored[section]
+
+    async def materialize(self, db: AsyncSession, workflow_id: UUID) -> List[str]:
+        """Eagerly (re)build the gap analysis sections after persistence."""
+        versions = await self.claim(workflow_id, GAP_SECTIONS)
+        sections = await build_gap_sections(db, workflow_id)
+        if sections is None:
+            return []
+        await self.store(workflow_id, sections, versions)
+        logger.info(f"✅ Dashboard read model materialized | workflow_id={workflow_id}")
+        return list(sections)
+
+    async def claim(self, workflow_id: UUID, sections: Iterable[str]) -> Dict[str, int]:
+        """Current version of each section, creating stale placeholder rows.
+
+        Call before reading the source rows: any invalidation committed
+        after this bumps the version, and ``store`` then skips the write.
+        """
+        sections = list(sections)
+        query = (
+            select(_view_table.c.section, _view_table.c.version)
+            .where(_view_table.c.workflow_id == workflow_id)
+            .where(_view_table.c.section.in_(sections))
+        )
+        async with self.session_factory() as session:
+            for _ in range(2):
+                versions = dict((await session.execute(query)).all())
+                missing = [section for section in sections if section not in versions]
+                if not missing:
+                    break
+                try:
+                    await session.execute(insert(_view_table), [
+                        {"workflow_id": workflow_id, "section": section, "version": 0,
+                         "etag": "", "payload": {}, "stale": True}
+                        for section in missing
+                    ])
+                    await session.commit()
+                    versions.update((section, 0) for section in missing)
+                    break
+                except IntegrityError:
+                    # A concurrent rebuild claimed them first; read its versions
+                    await session.rollback()
+        return versions
+
+    async def store(
+        self,
+        workflow_id: UUID,
+        sections: Dict[str, Any],
+        versions: Optional[Dict[str, int]] = None
+    ) -> Dict[str, DashboardSection]:
+        """Write serialized sections if their version is still ``versions``.
+
+        Sections without an observed version are claimed first. A section
+        invalidated or rebuilt since it was observed is left alone; the
+        payload built for this request is still returned to serve it.
+        """
+        versions = dict(versions or {})
+        unclaimed = [section for section in sections if section not in versions]
+        if unclaimed:
+            versions.update(await self.claim(workflow_id, unclaimed))
+
+        stored = {}
+        skipped = []
+        async with self.session_factory() as session:
+            for section, payload in sections.items():
+                etag = compute_etag(serialize_section(payload))
+                expected = versions.get(section)
+                written = expected is not None and (await session.execute(
+                    update(_view_table)
+                    .where(_view_table.c.workflow_id == workflow_id)
+                    .where(_view_table.c.section == section)
+                    .where(_view_table.c.version == expected)
+                    .values(payload=payload, etag=etag, stale=False, version=expected + 1)
+                )).rowcount == 1
+                if not written:
+                    skipped.append(section)
+                version = expected + 1 if written else (expected or 0)
+                stored[section] = DashboardSection(section, payload, etag, version)
+            await session.commit()
+
+        if skipped:
+            logger.warning(f"⚠️ Dashboard read model changed during rebuild | workflow_id={workflow_id} sections={skipped}")
+        return stored
+
+
+gap_analysis_read_model = GapAnalysisReadModel()
+
+
+# Invalidation
+
+_view_table = GapAnalysisDashboardView.__table__
+
+
+def _invalidate(connection, workflow_ids: Optional[Iterable[Any]], sections: Iterable[str]) -> None:
+    # Always bump the version, even for rows already stale: a rebuild in
+    # flight compares against the version it saw before reading its sources
+    stmt = update(_view_table).where(_view_table.c.section.in_(list(sections)))
+    if workflow_ids is not None:
+        stmt = stmt.where(_view_table.c.workflow_id.in_(list(workflow_ids)))
+    connection.execute(stmt.values(stale=True, version=_view_table.c.version + 1))
+
+
+@event.listens_for(WorkflowExecution, "after_update")
+def _workflow_updated(mapper, connection, target):
+    _invalidate(connection, [target.id], WORKFLOW_SECTIONS)
+
+
+@event.listens_for(WorkflowExecution, "after_delete")
+def _workflow_deleted(mapper, connection, target):
+    connection.execute(delete(_view_table).where(_view_table.c.workflow_id == target.id))
+
+
+def _gap_rows_changed(mapper, connection, target):
+    _invalidate(connection, [target.workflow_id], GAP_SECTIONS)
+
+
+for _model in (GapAnalysisResultModel, ContentOutlineModel, RecommendedCourseModel):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _gap_rows_changed)
+
+
+# Bulk ORM statements bypass mapper events, so catch them at the session
+_BULK_KEYS = {
+    WorkflowExecution: (WorkflowExecution.__table__.c.id, WORKFLOW_SECTIONS),
+    GapAnalysisResultModel: (GapAnalysisResultModel.__table__.c.workflow_id, GAP_SECTIONS),
+    ContentOutlineModel: (ContentOutlineModel.__table__.c.workflow_id, GAP_SECTIONS),
+    RecommendedCourseModel: (RecommendedCourseModel.__table__.c.workflow_id, GAP_SECTIONS),
+}
+
+
+def _ids_from_where(whereclause, key_column) -> Optional[List[Any]]:
+    """Extract ``key_column == value`` from a bulk statement, if that simple."""
+    if isinstance(whereclause, BinaryExpression) and whereclause.left.compare(key_column):
+        if whereclause.operator is operators.eq and isinstance(whereclause.right, BindParameter):
+            return [whereclause.right.effective_value]
+    return None
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bulk_statement_executed(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ not in _BULK_KEYS:
+        return
+
+    key_column, sections = _BULK_KEYS[mapper.class_]
+    workflow_ids = _ids_from_where(orm_execute_state.statement.whereclause, key_column)
+    # Unrecognised WHERE clauses invalidate the sections for every workflow
+    _invalidate(orm_execute_state.session.connection(), workflow_ids, sections)
@@ -0,0 +1,366 @@
+"""Shared executor for blocking googleapiclient requests.
+
+googleapiclient's ``request.execute()`` performs synchronous HTTP through
+httplib2. Calling it from an ``async def`` freezes the event loop for the whole
+round-trip, so every Forms/Drive/Sheets call is routed through this module:
+requests run on a bounded thread pool, transient failures are retried with
+exponential backoff, independent calls can be grouped into one
+``BatchHttpRequest``, and per-API latency is recorded for monitoring.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import google_auth_httplib2
+    import httplib2
+    from googleapiclient.errors import HttpError
+    from googleapiclient.http import HttpRequest, build_http
+except ImportError:  # pragma: no cover - library mocked during tests
+    google_auth_httplib2 = None  # type: ignore
+    httplib2 = None  # type: ignore
+    HttpError = Exception  # type: ignore
+    HttpRequest = None  # type: ignore
+    build_http = None  # type: ignore
+
+from src.common.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Google's batch endpoint accepts at most this many calls per request
+MAX_BATCH_SIZE = 100
+
+# Failures of the batch HTTP call itself (connection resets, timeouts, DNS)
+TRANSPORT_ERRORS: Tuple[type, ...] = (OSError,) + ((httplib2.HttpLib2Error,) if httplib2 else ())
+
+
+class BatchResponseMissingError(Exception):
+    """A batched call got no callback, i.e. no part in the multipart batch response."""
+
+
+class GoogleAPIErrorHandler:
+    """Simple exponential-backoff retry helper for Google API calls."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        backoff_factor: float = 2.0,
+        retry_statuses: Optional[List[int]] = None,
+    ) -> None:
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = set(retry_statuses or [429, 500, 503])
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Retryable status codes and transport failures, for single and batched calls alike."""
+        if isinstance(exc, TRANSPORT_ERRORS):
+            return True
+        return isinstance(exc, HttpError) and getattr(getattr(exc, "resp", None), "status", None) in self.retry_statuses
+
+    def delay_for(self, attempt: int) -> float:
+        return self.base_delay * (self.backoff_factor ** attempt)
+
+    async def execute_with_retry(self, func):
+        """Execute a callable with retry support for rate limits and transient errors."""
+        attempt = 0
+        while True:
+            try:
+                result = func()
+                if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+                    return await result
+                return result
+            except Exception as exc:
+                if not self.is_retryable(exc) or attempt >= self.max_retries:
+                    raise
+                delay = self.delay_for(attempt)
+                attempt += 1
+                reason = getattr(getattr(exc, "resp", None), "status", None) or type(exc).__name__
+                logger.warning("Google API call failed with %s; retrying in %.2fs", reason, delay)
+                await asyncio.sleep(delay)
+
+
+class GoogleAPIMetrics:
+    """Call counts, error counts and latency percentiles per Google API operation.
+
+    Calls recorded without ``seconds`` (results of batched calls, whose only
+    latency is the batch round-trip) count towards calls and errors but add
+    no latency sample.
+    """
+
+    def __init__(self, window: int = 500):
+        self._lock = threading.Lock()
+        self._window = window
+        self._operations: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def record(
+        self, api: str, operation: str, seconds: Optional[float], error: Optional[BaseException] = None
+    ) -> None:
+        with self._lock:
+            entry = self._operations.get((api, operation))
+            if entry is None:
+                entry = self._operations[(api, operation)] = {
+                    "calls": 0,
+                    "errors": 0,
+                    "timed_calls": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "recent": deque(maxlen=self._window),
+                    "statuses": {},
+                }
+            entry["calls"] += 1
+            if seconds is not None:
+                entry["timed_calls"] += 1
+                entry["total_seconds"] += seconds
+                entry["max_seconds"] = max(entry["max_seconds"], seconds)
+                entry["recent"].append(seconds)
+            if error is not None:
+                entry["errors"] += 1
+                status = str(getattr(getattr(error, "resp", None), "status", None) or type(error).__name__)
+                entry["statuses"][status] = entry["statuses"].get(status, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Metrics keyed by API, then by operation (e.g. ``forms`` -> ``responses.list``)."""
+        with self._lock:
+            snapshot: Dict[str, Any] = {}
+            for (api, operation), entry in sorted(self._operations.items()):
+                recent = sorted(entry["recent"]) or [0.0]
+                snapshot.setdefault(api, {})[operation] = {
+                    "calls": entry["calls"],
+                    "errors": entry["errors"],
+                    "error_statuses": dict(entry["statuses"]),
+                    "avg_ms": round(1000 * entry["total_seconds"] / entry["timed_calls"], 3) if entry["timed_calls"] else 0.0,
+                    "p50_ms": round(1000 * recent[int(0.50 * (len(recent) - 1))], 3),
+                    "p95_ms": round(1000 * recent[int(0.95 * (len(recent) - 1))], 3),
+                    "max_ms": round(1000 * entry["max_seconds"], 3),
+                }
+            return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations.clear()
+
+
+class GoogleAPIExecutor:
+    """Run googleapiclient requests off the event loop on a bounded thread pool.
+
+    httplib2 connections are not thread-safe, so each worker thread executes
+    requests through its own authorized transport built from the request's
+    credentials; the discovery service objects themselves stay shared.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        error_handler: Optional[GoogleAPIErrorHandler] = None,
+        metrics: Optional[GoogleAPIMetrics] = None,
+    ) -> None:
+        self.max_workers = max(1, max_workers or settings.google_api_max_workers)
+        self.error_handler = error_handler or GoogleAPIErrorHandler()
+        self.metrics = metrics or GoogleAPIMetrics()
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="google-api")
+        self._tls = threading.local()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    async def run(self, request: Any, *, api: str, operation: str) -> Any:
+        """Execute a request once on the pool and return its response."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return await loop.run_in_executor(self._pool, self._execute, request, api, operation)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def execute(
+        self,
+        request: Any,
+        *,
+        api: str,
+        operation: str,
+        error_handler: Optional[GoogleAPIErrorHandler] = None,
+    ) -> Any:
+        """Execute a request on the pool, retrying rate limits and transient errors."""
+        handler = error_handler or self.error_handler
+        return await handler.execute_with_retry(lambda: self.run(request, api=api, operation=operation))
+
+    async def execute_batch(
+        self,
+        service: Any,
+        requests: Sequence[Any],
+        *,
+        api: str,
+        operation: str,
+        error_handler: Optional[GoogleAPIErrorHandler] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Execute independent requests as batched HTTP calls; responses keep the input order.
+
+        Calls that fail with a retryable status are resent in a smaller batch
+        after the handler's backoff delay; when the batch HTTP call itself
+        fails with a retryable status or a transport error, all of its calls
+        are resent the same way. A call missing from the batch response fails
+        with BatchResponseMissingError. With ``return_exceptions`` the
+        remaining per-call errors are returned in place of their responses,
+        otherwise the first one is raised once the whole batch has finished.
+        """
+        handler = error_handler or self.error_handler
+        results: List[Any] = [None] * len(requests)
+        failures: Dict[int, BaseException] = {}
+        pending = list(range(len(requests)))
+        attempt = 0
+
+        while pending:
+            for start in range(0, len(pending), MAX_BATCH_SIZE):
+                indexes = pending[start:start + MAX_BATCH_SIZE]
+                try:
+                    responses = await self._run_batch(service, [requests[i] for i in indexes], api, operation)
+                except Exception as exc:
+                    responses = [(None, exc)] * len(indexes)
+                for index, (response, error) in zip(indexes, responses):
+                    if error is None:
+                        results[index] = response
+                        failures.pop(index, None)
+                    else:
+                        failures[index] = error
+
+            pending = [index for index in pending if index in failures and handler.is_retryable(failures[index])]
+            if not pending or attempt >= handler.max_retries:
+                break
+            delay = handler.delay_for(attempt)
+            attempt += 1
+            logger.warning(
+                "%d of %d batched %s.%s calls failed transiently; retrying in %.2fs",
+                len(pending), len(requests), api, operation, delay,
+            )
+            await asyncio.sleep(delay)
+
+        for index in sorted(failures):
+            if not return_exceptions:
+                raise failures[index]
+            results[index] = failures[index]
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": in_flight,
+            "queued": max(in_flight - self.max_workers, 0),
+            "apis": self.metrics.snapshot(),
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def _run_batch(
+        self, service: Any, requests: Sequence[Any], api: str, operation: str
+    ) -> List[Tuple[Any, Optional[BaseException]]]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return await loop.run_in_executor(self._pool, self._execute_batch, service, requests, api, operation)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _execute(self, request: Any, api: str, operation: str) -> Any:
+        started = time.perf_counter()
+        try:
+            http = self._thread_http(request)
+            response = request.execute(http=http) if http is not None else request.execute()
+        except Exception as exc:
+            self.metrics.record(api, operation, time.perf_counter() - started, error=exc)
+            raise
+        self.metrics.record(api, operation, time.perf_counter() - started)
+        return response
+
+    def _execute_batch(
+        self, service: Any, requests: Sequence[Any], api: str, operation: str
+    ) -> List[Tuple[Any, Optional[BaseException]]]:
+        responses: Dict[str, Tuple[Any, Optional[BaseException]]] = {}
+
+        def _collect(request_id, response, exception):
+            responses[request_id] = (response, exception)
+
+        batch = service.new_batch_http_request(callback=_collect)
+        for position, request in enumerate(requests):
+            batch.add(request, request_id=str(position))
+
+        started = time.perf_counter()
+        try:
+            http = self._thread_http(requests[0]) if requests else None
+            if http is not None:
+                batch.execute(http=http)
+            else:
+                batch.execute()
+        except Exception as exc:
+            self.metrics.record(api, f"{operation}[batch]", time.perf_counter() - started, error=exc)
+            raise
+        elapsed = time.perf_counter() - started
+        self.metrics.record(api, f"{operation}[batch]", elapsed)
+
+        ordered = [
+            responses.get(
+                str(position),
+                (None, BatchResponseMissingError(f"No response for batched {api}.{operation} call {position}")),
+            )
+            for position in range(len(requests))
+        ]
+        for _, error in ordered:
+            # Counted, but the batch round-trip is not this call's latency
+            self.metrics.record(api, operation, None, error=error)
+        return ordered
+
+    def _thread_http(self, request: Any):
+        """This thread's authorized transport for the request's credentials, if any."""
+        if HttpRequest is None or not isinstance(request, HttpRequest):
+            return None
+        credentials = getattr(request.http, "credentials", None)
+        if credentials is None:
+            return None
+        cache = getattr(self._tls, "transports", None)
+        if cache is None:
+            cache = self._tls.transports = {}
+        cached = cache.get(id(credentials))
+        if cached is None or cached[0] is not credentials:
+            cached = cache[id(credentials)] = (
+                credentials,
+                google_auth_httplib2.AuthorizedHttp(credentials, http=build_http()),
+            )
+        return cached[1]
+
+
+_executor: Optional[GoogleAPIExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_google_api_executor() -> GoogleAPIExecutor:
+    """Process-wide Google API executor, created on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = GoogleAPIExecutor()
+    return _executor
+
+
+def shutdown_google_api_executor() -> None:
+    """Stop the shared executor; called from the app's lifespan shutdown."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 try:
     from googleapiclient.discovery import build
@@ -18,43 +18,17 @@ except ImportError:  # pragma: no cover - library mocked during tests
 
 from src.schemas.google_forms import FormSettings
 from src.services.assessment_forms_mapper import AssessmentFormsMapper
+from src.services.google_api_executor import (
+    GoogleAPIErrorHandler,
+    GoogleAPIExecutor,
+    get_google_api_executor,
+)
 from src.services.google_auth_manager import GoogleAuthManager
 
 logger = logging.getLogger(__name__)
 
-
-class GoogleAPIErrorHandler:
-    """Simple exponential-backoff retry helper for Google API calls."""
-
-    def __init__(
-        self,
-        max_retries: int = 3,
-        base_delay: float = 0.5,
-        backoff_factor: float = 2.0,
-        retry_statuses: Optional[List[int]] = None,
-    ) -> None:
-        self.max_retries = max_retries
-        self.base_delay = base_delay
-        self.backoff_factor = backoff_factor
-        self.retry_statuses = set(retry_statuses or [429, 500, 503])
-
-    async def execute_with_retry(self, func):
-        """Execute a callable with retry support for rate limits and transient errors."""
-        attempt = 0
-        while True:
-            try:
-                result = func()
-                if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
-                    return await result
-                return result
-            except HttpError as exc:  # type: ignore[misc]
-                status = getattr(exc.resp, "status", None)
-                if status not in self.retry_statuses or attempt >= self.max_retries:
-                    raise
-                delay = self.base_delay * (self.backoff_factor ** attempt)
-                attempt += 1
-                logger.warning("Google API call failed with status %s; retrying in %.2fs", status, delay)
-                await asyncio.sleep(delay)
+# Largest page the Forms API returns for responses.list
+RESPONSES_PAGE_SIZE = 5000
 
 
 class FormCreationValidator:
@@ -81,12 +55,14 @@ class GoogleFormsService:
         mapper: Optional[AssessmentFormsMapper] = None,
         auth_manager: Optional[GoogleAuthManager] = None,
         error_handler: Optional[GoogleAPIErrorHandler] = None,
+        api_executor: Optional[GoogleAPIExecutor] = None,
         forms_service: Any = None,
         drive_service: Any = None,
     ) -> None:
         self.mapper = mapper or AssessmentFormsMapper()
         self.validator = FormCreationValidator()
         self.error_handler = error_handler or GoogleAPIErrorHandler()
+        self.api_executor = api_executor or get_google_api_executor()
         self.auth_manager = auth_manager or GoogleAuthManager()
 
         credentials = None
@@ -104,6 +80,12 @@ class GoogleFormsService:
             return self.auth_manager.build_service(service_name, version, credentials)
         return build(service_name, version, credentials=credentials, cache_discovery=False)
 
+    async def _execute(self, request: Any, *, api: str, operation: str) -> Any:
+        """Run a Google API request off the event loop with this service's retry policy."""
+        return await self.api_executor.execute(
+            request, api=api, operation=operation, error_handler=self.error_handler
+        )
+
     async def create_assessment_form(
         self,
         *,
@@ -124,32 +106,29 @@ class GoogleFormsService:
             or mapped_form["info"].get("description")
         )
 
-        async def _create_form():
-            request = self.forms_service.forms().create(body={"info": {"title": base_title}})
-            return request.execute()
-
-        creation_response = await self.error_handler.execute_with_retry(_create_form)
+        creation_response = await self._execute(
+            self.forms_service.forms().create(body={"info": {"title": base_title}}),
+            api="forms",
+            operation="forms.create",
+        )
         form_id = creation_response.get("formId")
         form_url = creation_response.get("responderUri")
 
         if description_to_apply:
-            async def _update_description():
-                request = self.forms_service.forms().batchUpdate(
-                    formId=form_id,
-                    body={
-                        "requests": [
-                            {
-                                "updateFormInfo": {
-                                    "info": {"description": description_to_apply},
-                                    "updateMask": "description"
-                                }
+            request = self.forms_service.forms().batchUpdate(
+                formId=form_id,
+                body={
+                    "requests": [
+                        {
+                            "updateFormInfo": {
+                                "info": {"description": description_to_apply},
+                                "updateMask": "description"
                             }
-                        ]
-                    }
-                )
-                return request.execute()
-
-            await self.error_handler.execute_with_retry(_update_description)
+                        }
+                    ]
+                }
+            )
+            await self._execute(request, api="forms", operation="forms.batchUpdate")
 
         questions = assessment_data.get("questions", [])
         if questions:
@@ -175,14 +154,11 @@ class GoogleFormsService:
         """Append assessment questions to an existing form."""
         requests = self.mapper.build_batch_update_requests(questions, start_index=start_index)
 
-        async def _batch_update():
-            request = self.forms_service.forms().batchUpdate(
-                formId=form_id,
-                body={"requests": requests},
-            )
-            return request.execute()
-
-        update_response = await self.error_handler.execute_with_retry(_batch_update)
+        request = self.forms_service.forms().batchUpdate(
+            formId=form_id,
+            body={"requests": requests},
+        )
+        update_response = await self._execute(request, api="forms", operation="forms.batchUpdate")
         return {
             "success": True,
             "form_id": form_id,
@@ -218,20 +194,75 @@ class GoogleFormsService:
         *,
         form_id: str,
         include_empty: bool = False,
+        since: Optional[Union[datetime, str]] = None,
     ) -> Dict[str, Any]:
-        """Retrieve and normalise responses from a Google Form."""
-
-        async def _fetch_responses():
-            request = self.forms_service.forms().responses().list(formId=form_id)
-            return request.execute()
-
-        response_payload = await self.error_handler.execute_with_retry(_fetch_responses)
-        raw_responses = response_payload.get("responses", [])
-        parsed = [self._serialise_response(item) for item in raw_responses]
-        if not include_empty:
-            parsed = [item for item in parsed if item["answers"]]
+        """Retrieve and normalise responses from a Google Form.
+
+        Collects every page from iter_form_responses; pass ``since`` to fetch
+        only submissions made at or after that time.
+        """
+        parsed = [
+            item
+            async for item in self.iter_form_responses(
+                form_id=form_id, include_empty=include_empty, since=since
+            )
+        ]
+        latest = max(
+            (item["submitted_at"] for item in parsed if item["submitted_at"]),
+            key=lambda value: datetime.fromisoformat(value.replace("Z", "+00:00")),
+            default=None,
+        )
+        return {"success": True, "responses": parsed, "latest_submitted_at": latest}
 
-        return {"success": True, "responses": parsed}
+    async def iter_form_responses(
+        self,
+        *,
+        form_id: str,
+        include_empty: bool = False,
+        since: Optional[Union[datetime, str]] = None,
+        page_size: int = RESPONSES_PAGE_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield parsed responses page by page, following ``nextPageToken``.
+
+        ``since`` becomes the API's ``timestamp >= N`` filter, so a poller that
+        passes its last seen ``submitted_at`` only downloads new submissions.
+        The filter is inclusive; callers de-duplicate on ``response_id``.
+        """
+        list_kwargs: Dict[str, Any] = {"formId": form_id, "pageSize": page_size}
+        if since:
+            list_kwargs["filter"] = f"timestamp >= {self._rfc3339(since)}"
+
+        page_token: Optional[str] = None
+        pages = 0
+        while True:
+            if page_token:
+                list_kwargs["pageToken"] = page_token
+            response_payload = await self._execute(
+                self.forms_service.forms().responses().list(**list_kwargs),
+                api="forms",
+                operation="forms.responses.list",
+            )
+            pages += 1
+            for item in response_payload.get("responses", []):
+                parsed = self._serialise_response(item)
+                if include_empty or parsed["answers"]:
+                    yield parsed
+
+            page_token = response_payload.get("nextPageToken")
+            if not page_token:
+                break
+        logger.debug("Fetched form %s responses in %d page(s) since=%s", form_id, pages, since)
+
+    @staticmethod
+    def _rfc3339(value: Union[datetime, str]) -> str:
+        """Format a timestamp the way the Forms API filter expects (UTC, ``Z`` suffix)."""
+        if isinstance(value, str):
+            if value.endswith("Z"):
+                return value  # already the API's own format, e.g. a lastSubmittedTime
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat(timespec="microseconds") + "Z"
 
     def _serialise_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         answers = {}
@@ -261,13 +292,10 @@ class GoogleFormsService:
     ) -> Dict[str, Any]:
         """Share the generated form/response sheet with a collaborator."""
 
-        async def _create_permission():
-            request = self.drive_service.permissions().create(
-                fileId=file_id,
-                body={"type": "user", "role": role, "emailAddress": email},
-                sendNotificationEmail=False,
-            )
-            return request.execute()
-
-        result = await self.error_handler.execute_with_retry(_create_permission)
+        request = self.drive_service.permissions().create(
+            fileId=file_id,
+            body={"type": "user", "role": role, "emailAddress": email},
+            sendNotificationEmail=False,
+        )
+        result = await self._execute(request, api="drive", operation="permissions.create")
         return {"success": True, "permission": result}
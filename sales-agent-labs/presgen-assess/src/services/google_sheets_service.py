@@ -7,6 +7,8 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from uuid import uuid4
 
+from src.services.google_api_executor import get_google_api_executor
+
 try:
     from google.oauth2.service_account import Credentials as ServiceAccountCredentials
     from google.oauth2.credentials import Credentials as OAuthCredentials
@@ -38,6 +40,7 @@ class GoogleSheetsService:
         self.credentials_path = credentials_path
         self.use_oauth = use_oauth
         self.service = None
+        self.api_executor = get_google_api_executor()
         self.scopes = [
             'https://www.googleapis.com/auth/spreadsheets',
             'https://www.googleapis.com/auth/drive.file'
@@ -78,6 +81,10 @@ class GoogleSheetsService:
             logger.error(f"❌ Failed to initialize Google Sheets service: {e}", exc_info=True)
             raise
 
+    async def _execute(self, request, operation: str) -> Dict:
+        """Run a Sheets request on the shared Google API executor."""
+        return await self.api_executor.execute(request, api="sheets", operation=operation)
+
     def _get_oauth_credentials(self):
         """Get OAuth credentials, refreshing or authenticating as needed.
 
@@ -231,10 +238,13 @@ class GoogleSheetsService:
                 }]
 
                 batch_update_request = {'requests': requests}
-                response = self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=spreadsheet_id,
-                    body=batch_update_request
-                ).execute()
+                response = await self._execute(
+                    self.service.spreadsheets().batchUpdate(
+                        spreadsheetId=spreadsheet_id,
+                        body=batch_update_request
+                    ),
+                    "spreadsheets.batchUpdate"
+                )
 
                 sheet_id = response['replies'][0]['addSheet']['properties']['sheetId']
                 logger.debug(f"✅ New sheet created | sheet_id={sheet_id}")
@@ -251,10 +261,13 @@ class GoogleSheetsService:
                 }]
 
                 batch_update_request = {'requests': requests}
-                self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=spreadsheet_id,
-                    body=batch_update_request
-                ).execute()
+                await self._execute(
+                    self.service.spreadsheets().batchUpdate(
+                        spreadsheetId=spreadsheet_id,
+                        body=batch_update_request
+                    ),
+                    "spreadsheets.batchUpdate"
+                )
                 logger.debug(f"✅ First sheet renamed to: {tab_name}")
 
             # Add title and data
@@ -300,10 +313,13 @@ class GoogleSheetsService:
                     ]
                 }
 
-                result = self.service.spreadsheets().values().batchUpdate(
-                    spreadsheetId=spreadsheet_id,
-                    body=body
-                ).execute()
+                result = await self._execute(
+                    self.service.spreadsheets().values().batchUpdate(
+                        spreadsheetId=spreadsheet_id,
+                        body=body
+                    ),
+                    "spreadsheets.values.batchUpdate"
+                )
                 logger.debug(f"✅ Batch update completed for {tab_name}")
 
                 # Apply formatting
@@ -325,9 +341,12 @@ class GoogleSheetsService:
                 }
             }
 
-            spreadsheet = self.service.spreadsheets().create(
-                body=spreadsheet_body
-            ).execute()
+            spreadsheet = await self._execute(
+                self.service.spreadsheets().create(
+                    body=spreadsheet_body
+                ),
+                "spreadsheets.create"
+            )
 
             logger.debug(f"✅ Spreadsheet created successfully | id={spreadsheet.get('spreadsheetId')}")
             return spreadsheet
@@ -426,10 +445,13 @@ class GoogleSheetsService:
                     ]
                 }
 
-                result = self.service.spreadsheets().values().batchUpdate(
-                    spreadsheetId=spreadsheet_id,
-                    body=body
-                ).execute()
+                result = await self._execute(
+                    self.service.spreadsheets().values().batchUpdate(
+                        spreadsheetId=spreadsheet_id,
+                        body=body
+                    ),
+                    "spreadsheets.values.batchUpdate"
+                )
                 logger.debug(f"✅ Batch update completed | updated_ranges={result.get('totalUpdatedRows', 0)}")
 
                 # Apply formatting
@@ -462,10 +484,13 @@ class GoogleSheetsService:
             }]
 
             batch_update_request = {'requests': requests}
-            response = self.service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=batch_update_request
-            ).execute()
+            response = await self._execute(
+                self.service.spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body=batch_update_request
+                ),
+                "spreadsheets.batchUpdate"
+            )
 
             new_sheet_id = response['replies'][0]['addSheet']['properties']['sheetId']
             logger.debug(f"✅ Charts sheet created | sheet_id={new_sheet_id}")
@@ -527,10 +552,13 @@ class GoogleSheetsService:
                     ]
                 }
 
-                result = self.service.spreadsheets().values().batchUpdate(
-                    spreadsheetId=spreadsheet_id,
-                    body=body
-                ).execute()
+                result = await self._execute(
+                    self.service.spreadsheets().values().batchUpdate(
+                        spreadsheetId=spreadsheet_id,
+                        body=body
+                    ),
+                    "spreadsheets.values.batchUpdate"
+                )
                 logger.debug(f"✅ Chart batch update completed | updated_ranges={result.get('totalUpdatedRows', 0)}")
 
                 # Apply formatting to charts sheet
@@ -581,10 +609,13 @@ class GoogleSheetsService:
             ]
 
             batch_update_request = {'requests': requests}
-            response = self.service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=batch_update_request
-            ).execute()
+            response = await self._execute(
+                self.service.spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body=batch_update_request
+                ),
+                "spreadsheets.batchUpdate"
+            )
 
             logger.debug(f"✅ Formatting applied successfully | replies={len(response.get('replies', []))}")
             return {"success": True, "formatting_applied": True}
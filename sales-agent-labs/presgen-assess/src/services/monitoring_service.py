@@ -7,21 +7,25 @@ import json
 import logging
 import platform
 import sys
+import time
 try:
     import psutil
 except ImportError:
     psutil = None
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.config import settings
 from src.models.workflow import WorkflowExecution, WorkflowStatus
-from src.service.database import get_db_session
+from src.service.database import get_db_session, get_pool_metrics
+from src.service.workflow_queries import count_workflows_by_status
 from src.common.enhanced_logging import get_enhanced_logger
+from src.services.google_api_executor import get_google_api_executor
 from src.services.google_forms_service import GoogleFormsService
 from src.services.presgen_integration_service import PresGenIntegrationService
 
@@ -49,8 +53,17 @@ class HealthCheckResult:
 class MonitoringService:
     """Comprehensive monitoring service for production readiness."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_ttl_seconds: Optional[float] = None,
+        check_timeout_seconds: Optional[float] = None
+    ):
         self.logger = get_enhanced_logger(__name__)
+        self.cache_ttl_seconds = cache_ttl_seconds or settings.health_check_cache_ttl_seconds
+        self.check_timeout_seconds = check_timeout_seconds or settings.health_check_timeout_seconds
+        self._latest_health: Optional[Dict[str, Any]] = None
+        self._latest_checked_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
         self.google_forms_service = GoogleFormsService()
         self.presgen_service = PresGenIntegrationService()
         self._health_history: List[Dict] = []
@@ -59,40 +72,34 @@ class MonitoringService:
             "memory_percent": 85.0,
             "disk_percent": 90.0,
             "response_time_ms": 5000,
-            "error_rate_percent": 10.0
+            "error_rate_percent": 10.0,
+            "db_pool_utilization_percent": 90.0
         }
 
+    def _health_checks(self) -> List[Tuple[str, Callable[[], Awaitable[HealthCheckResult]], str]]:
+        """Each check with the status it reports when it exceeds the check timeout."""
+        return [
+            ("system", self._check_system_health, "degraded"),
+            ("database", self._check_database_health, "unhealthy"),
+            ("google_forms", self._check_google_forms_health, "degraded"),
+            ("presgen_integration", self._check_presgen_health, "degraded"),
+            ("workflow_system", self._check_workflow_health, "unhealthy"),
+            ("application", self._check_application_health, "degraded"),
+        ]
+
     async def comprehensive_health_check(self) -> Dict[str, Any]:
-        """Perform comprehensive health check of all system components."""
-        self.logger.info("Starting comprehensive health check")
+        """Perform comprehensive health check of all system components.
 
-        health_checks = []
-        overall_status = "healthy"
+        Checks run concurrently and each is bounded by the check timeout, so
+        one slow dependency cannot hold up the others.
+        """
+        self.logger.info("Starting comprehensive health check")
 
         try:
-            # System health checks
-            system_check = await self._check_system_health()
-            health_checks.append(system_check)
-
-            # Database health check
-            db_check = await self._check_database_health()
-            health_checks.append(db_check)
-
-            # Google Forms service health check
-            forms_check = await self._check_google_forms_health()
-            health_checks.append(forms_check)
-
-            # PresGen integration health check
-            presgen_check = await self._check_presgen_health()
-            health_checks.append(presgen_check)
-
-            # Workflow system health check
-            workflow_check = await self._check_workflow_health()
-            health_checks.append(workflow_check)
-
-            # Application-specific health checks
-            app_check = await self._check_application_health()
-            health_checks.append(app_check)
+            health_checks = list(await asyncio.gather(*(
+                self._run_check(name, check, timeout_status)
+                for name, check, timeout_status in self._health_checks()
+            )))
 
             # Determine overall status
             overall_status = self._calculate_overall_status(health_checks)
@@ -123,6 +130,71 @@ class MonitoringService:
                 "checks": []
             }
 
+    async def get_cached_health(self) -> Dict[str, Any]:
+        """Latest health result, without waiting on dependencies once one exists.
+
+        A result older than the cache TTL is still returned immediately while a
+        single background refresh replaces it; only the first call waits.
+        """
+        if self._latest_health is None:
+            await self._refresh_health()
+        elif time.monotonic() - self._latest_checked_at >= self.cache_ttl_seconds:
+            self._start_refresh()
+
+        age = time.monotonic() - self._latest_checked_at
+        return {
+            **self._latest_health,
+            "cache": {
+                "age_seconds": round(age, 3),
+                "ttl_seconds": self.cache_ttl_seconds,
+                "stale": age >= self.cache_ttl_seconds,
+                "refreshing": self._refresh_task is not None and not self._refresh_task.done()
+            }
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel any in-flight background refresh."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+        self._refresh_task = None
+
+    def _start_refresh(self) -> asyncio.Task:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._run_refresh())
+        return self._refresh_task
+
+    async def _refresh_health(self) -> Dict[str, Any]:
+        return await asyncio.shield(self._start_refresh())
+
+    async def _run_refresh(self) -> Dict[str, Any]:
+        health_result = await self.comprehensive_health_check()
+        self._latest_health = health_result
+        self._latest_checked_at = time.monotonic()
+        return health_result
+
+    async def _run_check(
+        self,
+        name: str,
+        check: Callable[[], Awaitable[HealthCheckResult]],
+        timeout_status: str
+    ) -> HealthCheckResult:
+        """Run one check, reporting ``timeout_status`` if it exceeds the check timeout."""
+        start_time = time.perf_counter()
+        try:
+            return await asyncio.wait_for(check(), timeout=self.check_timeout_seconds)
+        except asyncio.TimeoutError:
+            self.logger.warning("Health check timed out", extra={
+                "check": name,
+                "timeout_seconds": self.check_timeout_seconds
+            })
+            result = HealthCheckResult(name, timeout_status, {
+                "error": f"timed out after {self.check_timeout_seconds}s",
+                "timed_out": True
+            })
+            result.response_time_ms = (time.perf_counter() - start_time) * 1000
+            return result
+
     async def _check_system_health(self) -> HealthCheckResult:
         """Check system resource health."""
         try:
@@ -135,22 +207,11 @@ class MonitoringService:
                     "python_version": sys.version
                 })
 
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-
-            # Memory usage
-            memory = psutil.virtual_memory()
+            # CPU sampling blocks for a second, so read resources on a worker thread
+            cpu_percent, memory, disk, load_avg = await asyncio.to_thread(self._sample_system_resources)
             memory_percent = memory.percent
-
-            # Disk usage
-            disk = psutil.disk_usage('/')
             disk_percent = (disk.used / disk.total) * 100
 
-            # Load average (Unix-like systems)
-            load_avg = None
-            if hasattr(psutil, 'getloadavg'):
-                load_avg = psutil.getloadavg()
-
             response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
 
             details = {
@@ -183,6 +244,12 @@ class MonitoringService:
         except Exception as e:
             return HealthCheckResult("system", "unhealthy", {"error": str(e)})
 
+    @staticmethod
+    def _sample_system_resources():
+        # Load average only exists on Unix-like systems
+        load_avg = psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
+        return psutil.cpu_percent(interval=1), psutil.virtual_memory(), psutil.disk_usage('/'), load_avg
+
     async def _check_database_health(self) -> HealthCheckResult:
         """Check database connectivity and performance."""
         try:
@@ -208,16 +275,21 @@ class MonitoringService:
 
             response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
 
+            pool = get_pool_metrics()
             details = {
                 "total_workflows": workflow_count,
                 "recent_workflows_24h": recent_workflows,
                 "connection_test": "passed",
-                "query_test": "passed"
+                "query_test": "passed",
+                "pool": pool
             }
 
             status = "healthy"
             if response_time > self._alert_thresholds["response_time_ms"]:
                 status = "degraded"
+            pool_utilization = pool.get("utilization", 0.0) * 100
+            if pool_utilization >= self._alert_thresholds["db_pool_utilization_percent"]:
+                status = "degraded"
 
             result = HealthCheckResult("database", status, details)
             result.response_time_ms = response_time
@@ -233,7 +305,9 @@ class MonitoringService:
 
             # Test authentication
             try:
-                credentials = self.google_forms_service.auth_manager.get_service_credentials()
+                credentials = await asyncio.to_thread(
+                    self.google_forms_service.auth_manager.get_service_credentials
+                )
                 auth_status = "valid" if credentials else "invalid"
             except Exception as e:
                 auth_status = f"error: {str(e)}"
@@ -306,13 +380,11 @@ class MonitoringService:
 
             async with get_db_session() as session:
                 # Count workflows by status
-                status_counts = {}
-                for status_value in WorkflowStatus:
-                    result = await session.execute(
-                        select(func.count(WorkflowExecution.id))
-                        .where(WorkflowExecution.execution_status == status_value)
-                    )
-                    status_counts[status_value.value] = result.scalar()
+                counts = {
+                    getattr(status, "value", status): count
+                    for status, count in (await count_workflows_by_status(session)).items()
+                }
+                status_counts = {status.value: counts.get(status.value, 0) for status in WorkflowStatus}
 
                 # Check for stuck workflows (awaiting completion for > 24 hours)
                 stuck_cutoff = datetime.utcnow() - timedelta(hours=24)
@@ -362,14 +434,10 @@ class MonitoringService:
         try:
             start_time = datetime.utcnow()
 
-            # Check log file health
-            log_status = self._check_log_files()
-
-            # Check temporary directory usage
-            temp_status = self._check_temp_directory()
-
-            # Check configuration
-            config_status = self._check_configuration()
+            # Log/temp directory scans touch the filesystem; keep them off the event loop
+            log_status, temp_status, config_status = await asyncio.to_thread(
+                lambda: (self._check_log_files(), self._check_temp_directory(), self._check_configuration())
+            )
 
             response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
 
@@ -518,6 +586,12 @@ class MonitoringService:
                 workflow_metrics = await self._get_workflow_metrics(session)
                 current_metrics["workflows"] = workflow_metrics
 
+            # Connection pool occupancy and checkout waits
+            current_metrics["database_pool"] = get_pool_metrics()
+
+            # Google API executor occupancy and per-operation latency
+            current_metrics["google_api"] = get_google_api_executor().stats()
+
             # Application metrics
             current_metrics["application"] = {
                 "health_checks_performed": len(self._health_history),
@@ -540,13 +614,11 @@ class MonitoringService:
     async def _get_workflow_metrics(self, session: AsyncSession) -> Dict[str, Any]:
         """Get workflow-specific metrics."""
         # Status distribution
-        status_counts = {}
-        for status_value in WorkflowStatus:
-            result = await session.execute(
-                select(func.count(WorkflowExecution.id))
-                .where(WorkflowExecution.execution_status == status_value)
-            )
-            status_counts[status_value.value] = result.scalar()
+        counts = {
+            getattr(status, "value", status): count
+            for status, count in (await count_workflows_by_status(session)).items()
+        }
+        status_counts = {status.value: counts.get(status.value, 0) for status in WorkflowStatus}
 
         # Recent activity (last 24 hours)
         recent_cutoff = datetime.utcnow() - timedelta(hours=24)
@@ -663,3 +735,21 @@ class MonitoringService:
                 "message": f"Alert checking failed: {str(e)}",
                 "timestamp": datetime.utcnow().isoformat()
             }]
+
+
+_monitoring_service: Optional[MonitoringService] = None
+
+
+def get_monitoring_service() -> MonitoringService:
+    """Process-wide monitoring service, so cached health and history are shared by requests."""
+    global _monitoring_service
+    if _monitoring_service is None:
+        _monitoring_service = MonitoringService()
+    return _monitoring_service
+
+
+async def shutdown_monitoring_service() -> None:
+    global _monitoring_service
+    if _monitoring_service is not None:
+        await _monitoring_service.shutdown()
+        _monitoring_service = None
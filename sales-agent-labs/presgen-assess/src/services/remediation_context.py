@@ -0,0 +1,108 @@
+"""Concurrent, de-duplicated RAG retrieval for remediation content.
+
+Remediation plans, content outlines and course recommendations need
+knowledge base context per learning gap. Retrieving it gap by gap made the
+remediation step scale linearly with the number of gaps; this builder
+collapses identical queries and retrieves the remaining ones concurrently.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from src.knowledge.base import RAGKnowledgeBase
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """Key used to collapse queries that differ only in case or whitespace."""
+    return " ".join(query.lower().split())
+
+
+def domain_remediation_query(domain: str, subject: Optional[str] = None) -> str:
+    """Retrieval query for study material on a domain (optionally a skill in it)."""
+    if subject and subject != domain:
+        return f"study materials and learning resources for {subject} in {domain}"
+    return f"study materials and learning resources for {domain}"
+
+
+def context_relevance(context_result: Dict) -> Optional[float]:
+    """Mean similarity (1 - distance) of the retrieved chunks, or None."""
+    distances = [
+        result["distance"]
+        for group in context_result.get("sources", {}).values()
+        for result in group.get("results", [])
+        if result.get("distance") is not None
+    ]
+    if not distances:
+        return None
+    similarity = 1.0 - sum(distances) / len(distances)
+    return round(min(1.0, max(0.0, similarity)), 3)
+
+
+class RemediationContextBuilder:
+    """Retrieves knowledge base context for many remediation queries at once."""
+
+    def __init__(
+        self,
+        knowledge_base: RAGKnowledgeBase,
+        k: int = 4,
+        max_concurrency: int = 8
+    ):
+        self.knowledge_base = knowledge_base
+        self.k = k
+        self.max_concurrency = max_concurrency
+
+    async def retrieve(
+        self,
+        queries: Iterable[str],
+        certification_id: str
+    ) -> Dict[str, Dict]:
+        """Retrieve context for every distinct query concurrently.
+
+        Returns a mapping from normalized query (see ``normalize_query``) to
+        the ``retrieve_context_for_assessment`` result. A failed retrieval
+        maps to an empty result so one bad query does not sink the plan.
+        """
+        unique: Dict[str, str] = {}
+        for query in queries:
+            unique.setdefault(normalize_query(query), query)
+
+        if not unique or not certification_id:
+            return {}
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(query: str) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.knowledge_base.retrieve_context_for_assessment(
+                        query=query,
+                        certification_id=certification_id,
+                        k=self.k,
+                        balance_sources=True
+                    )
+                except Exception as e:
+                    logger.warning(f"⚠️ Remediation context retrieval failed for '{query}': {e}")
+                    return {}
+
+        results = await asyncio.gather(*(fetch(query) for query in unique.values()))
+        logger.info(
+            f"📚 Retrieved remediation context | queries={len(unique)} "
+            f"certification_id={certification_id}"
+        )
+        return dict(zip(unique.keys(), results))
+
+    @staticmethod
+    def lookup(contexts: Dict[str, Dict], query: str) -> Dict:
+        return contexts.get(normalize_query(query)) or {}
+
+    @staticmethod
+    def merged_citations(contexts: Iterable[Dict]) -> List[str]:
+        """Citations across results, de-duplicated in first-seen order."""
+        citations: Dict[str, None] = {}
+        for context in contexts:
+            for citation in context.get("citations", []) or []:
+                citations.setdefault(citation, None)
+        return list(citations)
@@ -4,18 +4,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import update
 from sqlalchemy.orm import selectinload
 
 from src.models.workflow import WorkflowExecution, WorkflowStatus
 from src.services.google_forms_service import GoogleFormsService
 from src.services.form_response_processor import FormResponseProcessor
 from src.service.database import get_db_session as get_async_session
+from src.service.workflow_queries import (
+    count_workflows_by_status,
+    get_workflow,
+    list_workflows_by_status,
+)
 from src.common.enhanced_logging import (
     get_enhanced_logger,
     log_response_polling_attempt,
@@ -31,6 +36,7 @@ class ResponseIngestionService:
         self.google_forms_service = GoogleFormsService()
         self.response_processor = FormResponseProcessor()
         self._processed_responses: Set[str] = set()  # Deduplication cache
+        self._response_cursors: Dict[str, str] = {}  # form_id -> latest submitted_at seen
 
     async def start_ingestion_worker(self, poll_interval_seconds: int = 60):
         """Start the async response ingestion worker."""
@@ -55,14 +61,9 @@ class ResponseIngestionService:
         """Poll all active workflows for new responses."""
         async with get_async_session() as session:
             # Find workflows awaiting completion
-            result = await session.execute(
-                select(WorkflowExecution).where(
-                    WorkflowExecution.execution_status == WorkflowStatus.AWAITING_COMPLETION
-                ).where(
-                    WorkflowExecution.google_form_id.isnot(None)
-                )
+            workflows = await list_workflows_by_status(
+                session, WorkflowStatus.AWAITING_COMPLETION, with_form_only=True
             )
-            workflows = result.scalars().all()
 
             self.logger.info("Polling workflows for responses", extra={
                 "workflow_count": len(workflows)
@@ -89,22 +90,22 @@ class ResponseIngestionService:
 
         correlation_id = f"workflow_{workflow.id}"
 
-        # Fetch responses from Google Forms
-        responses_result = await self.google_forms_service.get_form_responses(
+        # Stream only submissions since the last poll from Google Forms
+        since = self._response_cursor(workflow)
+        latest = since
+        new_responses = []
+        async for response in self.google_forms_service.iter_form_responses(
             form_id=workflow.google_form_id,
-            include_empty=False
-        )
+            include_empty=False,
+            since=since
+        ):
+            submitted_at = response.get("submitted_at")
+            if submitted_at and (latest is None or self._is_later(submitted_at, latest)):
+                latest = submitted_at
+            new_responses.extend(self._filter_new_responses([response]))
 
-        if not responses_result.get("success"):
-            self.logger.warning("Failed to fetch form responses", extra={
-                "workflow_id": str(workflow.id),
-                "form_id": workflow.google_form_id,
-                "error": responses_result.get("error")
-            })
-            return
-
-        raw_responses = responses_result.get("responses", [])
-        new_responses = self._filter_new_responses(raw_responses)
+        if latest:
+            self._response_cursors[workflow.google_form_id] = latest
 
         # Enhanced Stage 2 Logging
         log_response_polling_attempt(
@@ -149,6 +150,40 @@ class ResponseIngestionService:
             normalized_responses
         )
 
+    def _response_cursor(self, workflow: WorkflowExecution) -> Optional[str]:
+        """Latest submission time already ingested for the workflow's form.
+
+        After a restart the cursor is rebuilt from the responses stored on the
+        workflow, whose ids also seed the deduplication cache because the
+        timestamp filter is inclusive.
+        """
+        cursor = self._response_cursors.get(workflow.google_form_id)
+        if cursor is not None:
+            return cursor
+
+        latest: Optional[datetime] = None
+        for stored in workflow.collected_responses or []:
+            if stored.get("response_id"):
+                self._processed_responses.add(stored["response_id"])
+            submitted_at = self._parse_utc(stored.get("submitted_at"))
+            if submitted_at and (latest is None or submitted_at > latest):
+                latest = submitted_at
+        return latest.isoformat() if latest else None
+
+    def _is_later(self, candidate: str, current: str) -> bool:
+        candidate_dt = self._parse_utc(candidate)
+        current_dt = self._parse_utc(current)
+        if candidate_dt is None or current_dt is None:
+            return False
+        return candidate_dt > current_dt
+
+    def _parse_utc(self, timestamp_str: Optional[str]) -> Optional[datetime]:
+        """Parse a timestamp, treating naive values as UTC so they compare with API times."""
+        parsed = self._parse_timestamp(timestamp_str)
+        if parsed is not None and parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+
     def _filter_new_responses(self, responses: List[Dict]) -> List[Dict]:
         """Filter out already processed responses."""
         new_responses = []
@@ -337,10 +372,7 @@ class ResponseIngestionService:
     async def force_ingest_workflow_responses(self, workflow_id: UUID) -> Dict[str, Any]:
         """Manually trigger response ingestion for a specific workflow."""
         async with get_async_session() as session:
-            result = await session.execute(
-                select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-            )
-            workflow = result.scalar_one_or_none()
+            workflow = await get_workflow(session, workflow_id)
 
             if not workflow:
                 return {"success": False, "error": "Workflow not found"}
@@ -374,12 +406,7 @@ class ResponseIngestionService:
         """Get statistics about response ingestion."""
         async with get_async_session() as session:
             # Count workflows by status
-            result = await session.execute(
-                select(WorkflowExecution.execution_status,
-                       func.count(WorkflowExecution.id))
-                .group_by(WorkflowExecution.execution_status)
-            )
-            status_counts = dict(result.all())
+            status_counts = await count_workflows_by_status(session)
 
             return {
                 "processed_response_ids": len(self._processed_responses),
@@ -21,6 +21,7 @@ from src.services.response_ingestion_service import ResponseIngestionService
 from src.services.ai_question_generator import AIQuestionGenerator  # Sprint 1
 from src.services.gap_analysis_enhanced import EnhancedGapAnalysisService  # Sprint 1
 from src.service.database import get_db_session as get_async_session
+from src.service.workflow_queries import get_workflow
 from src.common.enhanced_logging import (
     get_enhanced_logger,
     log_workflow_stage_start,
@@ -255,6 +256,12 @@ class WorkflowOrchestrator:
                     "current_step": existing_workflow.current_step,
                     "current_status": existing_workflow.execution_status
                 })
+                if not existing_workflow.assessment_data and assessment_data:
+                    # Workflows created through the API reach here without
+                    # questions; keep them so responses can be scored later
+                    existing_workflow.assessment_data = assessment_data
+                    await session.commit()
+                    await session.refresh(existing_workflow)
                 return existing_workflow
 
             # Create new workflow if none exists
@@ -476,10 +483,7 @@ class WorkflowOrchestrator:
     async def process_completed_responses(self, workflow_id: UUID) -> Dict[str, Any]:
         """Process responses when collection phase is complete."""
         async with get_async_session() as session:
-            result = await session.execute(
-                select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-            )
-            workflow = result.scalar_one_or_none()
+            workflow = await get_workflow(session, workflow_id)
 
             if not workflow:
                 return {"success": False, "error": "Workflow not found"}
@@ -598,10 +602,7 @@ class WorkflowOrchestrator:
     async def get_workflow_status(self, workflow_id: UUID) -> Dict[str, Any]:
         """Get current workflow status and progress."""
         async with get_async_session() as session:
-            result = await session.execute(
-                select(WorkflowExecution).where(WorkflowExecution.id == workflow_id)
-            )
-            workflow = result.scalar_one_or_none()
+            workflow = await get_workflow(session, workflow_id)
 
             if not workflow:
                 return {"success": False, "error": "Workflow not found"}
@@ -717,6 +718,8 @@ class WorkflowOrchestrator:
                 gap_result["content_outline_count"] = len(content_outline_ids)
                 gap_result["recommended_course_count"] = len(course_ids)
             
+            await self.gap_analysis_service.materialize_dashboard(workflow_id)
+            
             return gap_result
             
         except Exception as e:
@@ -0,0 +1,56 @@
+"""Shared pytest configuration for presgen-assess tests."""
+
+import sys
+import types
+
+import pytest
+
+# Stub objects that a test module put into sys.modules while it was imported,
+# keyed by module path. They are taken out again once that module has been
+# collected, so later test modules import the real packages, and are put back
+# only while the owning module's tests run.
+_MODULE_STUBS = {}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    if not isinstance(collector, pytest.Module):
+        yield
+        return
+
+    before = dict(sys.modules)
+    yield
+    stubs = {
+        name: module
+        for name, module in sys.modules.items()
+        if not isinstance(module, types.ModuleType) and before.get(name) is not module
+    }
+    if not stubs:
+        return
+
+    _MODULE_STUBS[collector.path] = stubs
+    for name in stubs:
+        if name in before:
+            sys.modules[name] = before[name]
+        else:
+            del sys.modules[name]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _module_stubs(request):
+    """Reinstall the stubs this module imported against, so patch() targets match."""
+    stubs = _MODULE_STUBS.get(request.path)
+    if not stubs:
+        yield
+        return
+
+    originals = {name: sys.modules.get(name) for name in stubs}
+    sys.modules.update(stubs)
+    try:
+        yield
+    finally:
+        for name, module in originals.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
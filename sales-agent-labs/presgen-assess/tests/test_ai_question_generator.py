@@ -0,0 +1,120 @@
+"""Tests for batched, concurrent AI question generation."""
+
+import asyncio
+import json
+import re
+
+import pytest
+
+from src.services.ai_question_generator import AIQuestionGenerator
+
+
+def _question(text):
+    return {
+        "question": text,
+        "options": ["A) One", "B) Two", "C) Three", "D) Four"],
+        "correct_answer": "B",
+        "explanation": "Because.",
+        "references": ["Exam guide"]
+    }
+
+
+class FakeAssessmentEngine:
+    """Returns a fenced JSON array of unique questions per call."""
+
+    def __init__(self, invalid_on_first_call=0):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.invalid_on_first_call = invalid_on_first_call
+
+    async def generate_llm_response(self, prompt, max_tokens, temperature):
+        self.calls += 1
+        call = self.calls
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        count = int(re.search(r"generate (\d+) distinct", prompt).group(1))
+        questions = [
+            _question(f"Call {call} item {i} " + " ".join(f"term{call}_{i}_{j}" for j in range(6)))
+            for i in range(count)
+        ]
+        for i in range(self.invalid_on_first_call if call == 1 else 0):
+            questions[i]["options"] = ["A) Only one"]
+        return "```json\n" + json.dumps(questions) + "\n```"
+
+
+class FakeVectorDatabase:
+    def __init__(self):
+        self.queries = []
+
+    async def retrieve_context(self, query, certification_id, k, include_sources):
+        self.queries.append(query)
+        return [{"citation": "Exam guide", "content": "Domain content"}]
+
+
+class TestAIQuestionGeneratorBatching:
+    """RAG context is fetched once per domain and LLM calls are batched."""
+
+    @pytest.fixture
+    def generator(self):
+        generator = AIQuestionGenerator.__new__(AIQuestionGenerator)
+        generator.assessment_engine = FakeAssessmentEngine()
+        generator.vector_db = FakeVectorDatabase()
+        generator.min_quality_score = 8.0
+        generator.max_generation_attempts = 3
+        return generator
+
+    @pytest.fixture
+    def cert_resources(self):
+        return {
+            "certification_profile_id": "profile-1",
+            "certification_name": "AWS ML Specialty",
+            "knowledge_domains": {}
+        }
+
+    @pytest.mark.asyncio
+    async def test_domain_uses_one_retrieval_and_batched_calls(self, generator, cert_resources):
+        questions = await generator._generate_domain_questions(
+            "Data Engineering", 12, "intermediate", cert_resources, "corr-1"
+        )
+
+        assert len(questions) == 12
+        assert len(generator.vector_db.queries) == 1
+        assert generator.assessment_engine.calls == 3  # batches of 5, 5, 2
+        assert generator.assessment_engine.peak_in_flight == 3
+        assert [q.question_id for q in questions[:2]] == ["kb_data_engineering_1", "kb_data_engineering_2"]
+        assert all(q.options[1] == "B) Two" for q in questions)
+
+    @pytest.mark.asyncio
+    async def test_invalid_items_are_dropped_and_rerequested(self, generator, cert_resources):
+        generator.assessment_engine = FakeAssessmentEngine(invalid_on_first_call=1)
+
+        questions = await generator._generate_domain_questions(
+            "Modeling", 4, "intermediate", cert_resources, "corr-2"
+        )
+
+        assert len(questions) == 4
+        assert all(q.question_id.startswith("kb_modeling_") for q in questions)
+        assert all(len(q.options) == 4 for q in questions)
+        assert generator.assessment_engine.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_profile_falls_back_to_templates(self, generator):
+        questions = await generator._generate_domain_questions(
+            "Security", 2, "beginner", {"certification_name": "X"}, "corr-3"
+        )
+
+        assert len(questions) == 2
+        assert generator.assessment_engine.calls == 0
+        assert generator.vector_db.queries == []
+
+    def test_parse_question_batch_accepts_wrapped_and_single_objects(self):
+        single = json.dumps(_question("Single"))
+        wrapped = json.dumps({"questions": [_question("One"), _question("Two")]})
+
+        assert len(AIQuestionGenerator._parse_question_batch(single)) == 1
+        assert len(AIQuestionGenerator._parse_question_batch(wrapped)) == 2
+        assert AIQuestionGenerator._validate_question_data({"question": "x"}) == "missing required field: options"
@@ -0,0 +1,177 @@
+"""Tests for the background assessment generation job pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.services.assessment_generation_jobs import (
+    AssessmentGenerationJobManager,
+    GenerationQueueFullError,
+)
+
+
+class TestAssessmentGenerationJobManager:
+    """Bounded worker pool, progress events and failure handling."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_immediately_and_streams_progress(self):
+        manager = AssessmentGenerationJobManager(max_workers=2, max_queue_size=10)
+        release = asyncio.Event()
+
+        async def runner(job):
+            await job.report("domain_generated", 40, domain="Security", generated=3)
+            await release.wait()
+            return {"question_count": 3}
+
+        try:
+            job = manager.submit(uuid4(), runner)
+            assert job.status == "queued"
+
+            stream = manager.stream(job)
+            stages = [(await stream.__anext__())["stage"] for _ in range(2)]
+            assert stages == ["started", "domain_generated"]
+            assert manager.active_jobs == 1
+
+            release.set()
+            stages += [event["stage"] async for event in stream]
+        finally:
+            await manager.shutdown()
+
+        assert stages == ["started", "domain_generated", "completed"]
+        assert job.status == "completed"
+        assert job.progress == 100
+        assert job.result == {"question_count": 3}
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_bounds_concurrency(self):
+        manager = AssessmentGenerationJobManager(max_workers=2, max_queue_size=10)
+        running = 0
+        peak = 0
+
+        async def runner(job):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {}
+
+        try:
+            jobs = [manager.submit(uuid4(), runner) for _ in range(6)]
+            for job in jobs:
+                async for _ in manager.stream(job):
+                    pass
+        finally:
+            await manager.shutdown()
+
+        assert peak == 2
+        assert all(job.status == "completed" for job in jobs)
+
+    @pytest.mark.asyncio
+    async def test_failed_runner_marks_job_failed(self):
+        manager = AssessmentGenerationJobManager(max_workers=1, max_queue_size=10)
+
+        async def runner(job):
+            raise RuntimeError("LLM unavailable")
+
+        try:
+            job = manager.submit(uuid4(), runner)
+            events = [event async for event in manager.stream(job)]
+        finally:
+            await manager.shutdown()
+
+        assert job.status == "failed"
+        assert job.error == "LLM unavailable"
+        assert events[-1]["stage"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_and_duplicate_submit_is_idempotent(self):
+        manager = AssessmentGenerationJobManager(max_workers=1, max_queue_size=1)
+        release = asyncio.Event()
+
+        async def runner(job):
+            await release.wait()
+            return {}
+
+        try:
+            first = manager.submit(uuid4(), runner)
+            await asyncio.sleep(0)  # worker picks up the first job
+            workflow_id = uuid4()
+            queued = manager.submit(workflow_id, runner)
+            assert manager.submit(workflow_id, runner) is queued
+            assert manager.is_saturated()
+            with pytest.raises(GenerationQueueFullError):
+                manager.submit(uuid4(), runner)
+            release.set()
+        finally:
+            await manager.shutdown()
+
+        assert first.status in ("running", "completed", "failed")
+
+
+    @pytest.mark.asyncio
+    async def test_profiles_are_listed_once_when_the_job_finishes(self, monkeypatch):
+        from src.services import assessment_generation_jobs
+
+        listed = []
+        monkeypatch.setattr(
+            assessment_generation_jobs, "list_profiles",
+            lambda job_id: listed.append(job_id) or ["profile-generate_contextual_assessment.folded"]
+        )
+        manager = AssessmentGenerationJobManager(max_workers=1, max_queue_size=10)
+
+        async def runner(job):
+            for progress in (20, 40, 60):
+                await job.report("domain_generated", progress)
+                assert job.to_dict()["profiles"] == []
+            return {}
+
+        try:
+            job = manager.submit(uuid4(), runner)
+            events = [event async for event in manager.stream(job)]
+        finally:
+            await manager.shutdown()
+
+        assert events[-1]["stage"] == "completed"
+        assert listed == [str(job.workflow_id)]
+        assert job.to_dict()["profiles"][0].endswith("/generation/profiles/profile-generate_contextual_assessment.folded")
+
+
+class TestCreateWorkflowQueueFull:
+    """POST /workflows answers 503 when the generation queue is full."""
+
+    @pytest.mark.asyncio
+    async def test_queue_filling_after_precheck_drops_workflow(self, monkeypatch):
+        from fastapi import HTTPException, Response
+        from src.schemas.workflow import WorkflowCreate
+        from src.service.api.v1.endpoints import workflows
+
+        def submit(*args, **kwargs):
+            raise GenerationQueueFullError("queue full")
+
+        monkeypatch.setattr(workflows.generation_jobs, "is_saturated", lambda: False)
+        monkeypatch.setattr(workflows.generation_jobs, "submit", submit)
+        db = AsyncMock()
+        db.add = Mock()
+        response = Response()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await workflows.create_workflow(
+                WorkflowCreate(
+                    user_id="instructor",
+                    certification_profile_id=uuid4(),
+                    workflow_type="assessment_generation",
+                ),
+                response,
+                profile=None,
+                db=db,
+            )
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "30"}
+        assert "Location" not in response.headers
+        created = db.add.call_args.args[0]
+        db.delete.assert_awaited_once_with(created)
+        assert db.commit.await_count == 2
@@ -0,0 +1,138 @@
+"""Tests for the metered connection pool and cached workflow lookups."""
+
+import asyncio
+import threading
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+from src.common.config import settings
+from src.models.workflow import WorkflowExecution, WorkflowStatus
+from src.service import workflow_queries
+from src.service.database import MeteredQueuePool, PoolMetrics, _engine_options, pool_metrics
+
+
+class TestDatabasePool:
+    """Explicit pool sizing, checkout wait metrics and hot lookups."""
+
+    @pytest_asyncio.fixture
+    async def engine(self, tmp_path):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=MeteredQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.2
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(WorkflowExecution.metadata.create_all, tables=[WorkflowExecution.__table__])
+        yield engine
+        await engine.dispose()
+
+    def test_engine_options_size_pool_and_cache_statements(self):
+        options = _engine_options("postgresql+asyncpg://user:secret@db/presgen")
+
+        assert options["poolclass"] is MeteredQueuePool
+        assert options["pool_size"] > 0 and options["pool_timeout"] > 0
+        assert "prepared_statement_cache_size" in options["url"].query
+        assert "pool_size" not in _engine_options("sqlite+aiosqlite://")
+        assert "pool_size" not in _engine_options("sqlite+aiosqlite:////tmp/presgen.db")
+
+    def test_file_backed_sqlite_gets_metered_pool_only_when_enabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "db_sqlite_metered_pool", True)
+
+        assert _engine_options("sqlite+aiosqlite:////tmp/presgen.db")["poolclass"] is MeteredQueuePool
+        assert "pool_size" not in _engine_options("sqlite+aiosqlite://")
+
+    @pytest.mark.asyncio
+    async def test_exhausted_pool_records_wait_and_timeout(self, engine):
+        before = pool_metrics.snapshot()
+
+        async def hold_connection():
+            async with engine.connect():
+                await asyncio.sleep(0.4)
+
+        results = await asyncio.gather(hold_connection(), hold_connection(), return_exceptions=True)
+
+        assert any(isinstance(r, PoolTimeoutError) for r in results)
+        after = pool_metrics.snapshot(engine.sync_engine.pool)
+        assert after["timeouts"] == before["timeouts"] + 1
+        assert after["max_wait_ms"] >= 200
+        assert after["size"] == 1 and after["checked_out"] == 0
+
+    @pytest.mark.asyncio
+    async def test_checkout_wait_and_overflow_come_from_public_pool_api(self, engine):
+        samples = pool_metrics.wait_samples
+
+        async with engine.connect():
+            pass
+
+        assert pool_metrics.wait_samples == samples + 1
+        assert pool_metrics.snapshot(engine.sync_engine.pool)["max_overflow"] == 0
+
+    def test_event_counters_are_thread_safe(self):
+        metrics = PoolMetrics()
+        workers = [
+            threading.Thread(target=lambda: [metrics.increment("checkouts") for _ in range(2000)])
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert metrics.snapshot()["checkouts"] == 8000
+
+    def test_snapshot_reports_wait_percentiles(self):
+        metrics = PoolMetrics()
+        for seconds in (0.0, 0.0, 0.01, 0.2):
+            metrics.record_wait(seconds)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["waited_checkouts"] == 2
+        assert snapshot["max_wait_ms"] == 200.0
+        assert snapshot["p95_wait_ms"] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_cached_lookups(self, engine):
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        workflows = [
+            WorkflowExecution(
+                id=uuid4(),
+                user_id="user",
+                certification_profile_id=uuid4(),
+                workflow_type="assessment_generation",
+                execution_status=status,
+                resume_token=f"token-{i}",
+                google_form_id="form" if i == 0 else None
+            )
+            for i, status in enumerate([
+                WorkflowStatus.AWAITING_COMPLETION,
+                WorkflowStatus.AWAITING_COMPLETION,
+                WorkflowStatus.COMPLETED,
+            ])
+        ]
+
+        async with session_factory() as session:
+            session.add_all(workflows)
+            await session.commit()
+
+            for workflow in workflows:
+                assert (await workflow_queries.get_workflow(session, workflow.id)) is workflow
+            assert await workflow_queries.get_workflow(session, uuid4()) is None
+            assert (await workflow_queries.get_workflow_by_resume_token(session, "token-2")) is workflows[2]
+
+            awaiting = await workflow_queries.list_workflows_by_status(session, WorkflowStatus.AWAITING_COMPLETION)
+            with_form = await workflow_queries.list_workflows_by_status(
+                session, WorkflowStatus.AWAITING_COMPLETION, with_form_only=True
+            )
+            counts = await workflow_queries.count_workflows_by_status(session)
+
+        assert len(awaiting) == 2
+        assert with_form == [workflows[0]]
+        assert sum(counts.values()) == 3
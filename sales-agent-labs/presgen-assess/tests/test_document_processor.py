@@ -0,0 +1,139 @@
+"""Tests for process-pool document extraction and incremental chunking."""
+
+import pytest
+
+pytest.importorskip("pypdf")
+
+from src.service.document_processor import DocumentProcessor, shutdown_extraction_executor
+
+
+def write_pdf(path, page_lines):
+    """Write a minimal text PDF with one page per entry in ``page_lines``."""
+    page_count = len(page_lines)
+    font_id = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % (3 + 2 * i) for i in range(page_count)), page_count
+        ),
+    ]
+    for i, lines in enumerate(page_lines):
+        text = b"BT /F1 10 Tf 12 TL 40 780 Td " + b" ".join(
+            b"(%s) Tj T*" % line.encode() for line in lines
+        ) + b" ET"
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (font_id, 4 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(text), text))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(data))
+
+
+def page_text(page_num):
+    body = [f"Page {page_num} covers load balancing and storage replication in detail."] * 4
+    if page_num % 10 == 1:
+        return [f"SECTION {page_num // 10 + 1}"] + body
+    return body
+
+
+class TestDocumentProcessor:
+    """Chunks stream from the extraction pool in document order."""
+
+    @pytest.fixture(autouse=True)
+    def extraction_pool(self):
+        yield
+        shutdown_extraction_executor()
+
+    @pytest.fixture
+    def processor(self):
+        return DocumentProcessor(
+            chunk_size=200, chunk_overlap=20, min_chunk_size=50, pages_per_batch=4, download_nltk=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_pdf_pages_stream_in_order_across_batches(self, processor, tmp_path):
+        pdf_path = tmp_path / "guide.pdf"
+        write_pdf(pdf_path, [page_text(page) for page in range(1, 26)])
+
+        chunks = [chunk async for chunk in processor.iter_chunks(pdf_path, "application/pdf")]
+
+        pages = [chunk["page"] for chunk in chunks]
+        assert pages == sorted(pages) and set(pages) == set(range(1, 26))
+        # The running section carries over pages parsed in other batches
+        assert {chunk["section"] for chunk in chunks if chunk["page"] == 20} == {"SECTION 2"}
+        assert {chunk["section"] for chunk in chunks if chunk["page"] == 21} == {"SECTION 3"}
+        # Same output as extracting the whole file in-process
+        expected = [
+            chunk["content"]
+            for _, _, page_chunks in processor.extract_pdf_pages(str(pdf_path), 0, 25)
+            for chunk in page_chunks
+        ]
+        assert [chunk["content"] for chunk in chunks] == expected
+
+    @pytest.mark.asyncio
+    async def test_text_and_docx_are_chunked_in_the_pool(self, processor, tmp_path):
+        docx = pytest.importorskip("docx")
+        text_path = tmp_path / "notes.txt"
+        text_path.write_text("Chapter 1 “Networking”\n" + "Routing tables decide the next hop. " * 30)
+        docx_path = tmp_path / "notes.docx"
+        document = docx.Document()
+        document.add_heading("Storage Services", level=1)
+        document.add_paragraph("Object storage keeps durable replicas across zones. " * 10)
+        document.save(docx_path)
+
+        text_chunks = await processor.process_file(text_path, "text/plain")
+        docx_chunks = await processor.process_file(
+            docx_path, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        )
+
+        assert len(text_chunks) > 1
+        assert text_chunks[0]["section"].startswith("Chapter 1")
+        assert docx_chunks and {chunk["section"] for chunk in docx_chunks} == {"Storage Services"}
+
+    def test_chunks_follow_sentence_spans_with_token_overlap(self):
+        # 33-token chunks with a 10-token overlap: one 7-token sentence is repeated
+        processor = DocumentProcessor(chunk_size=200, chunk_overlap=60, min_chunk_size=50, download_nltk=False)
+        sentences = [f"Region{chr(97 + i)} replication keeps durable copies across zones." for i in range(26)]
+        chunks = processor.create_chunks(" ".join(sentences), page=3)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.content.endswith(".")
+            assert len(chunk.content.split()) <= processor.chunk_tokens
+        # Consecutive chunks share their boundary sentence
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.content.split(". ")[0] + "." == previous.content.split(". ")[-1]
+        # Keywords come from the chunk's own tokens
+        assert "regiona" in chunks[0].keywords and "regiona" not in chunks[1].keywords
+        assert {"replication", "durable"} <= set(chunks[1].keywords)
+
+    def test_sentences_longer_than_a_chunk_are_split(self, processor):
+        text = " ".join(f"word{i}" for i in range(198)) + "."
+
+        chunks = processor.create_chunks(text)
+
+        assert all(len(chunk.content.split()) <= processor.chunk_tokens for chunk in chunks)
+        assert chunks[0].content.startswith("word0 ") and chunks[-1].content.endswith("word197.")
+
+    def test_text_without_ascii_words_is_capped_at_chunk_size(self, processor):
+        japanese = "機械学習モデルは、データから規則を学びます。" * 330
+        symbols = "→" * 12000
+
+        for text in (japanese, symbols):
+            chunks = processor.create_chunks(text)
+
+            assert all(len(chunk.content) <= processor.chunk_size for chunk in chunks)
+            # Sentences and windows are longer than the overlap budget, so nothing repeats
+            assert "".join(chunk.content for chunk in chunks) == text
+        assert "機械学習モデルは" in processor.create_chunks(japanese)[0].keywords
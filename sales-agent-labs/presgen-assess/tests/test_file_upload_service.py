@@ -0,0 +1,111 @@
+"""Tests for streaming uploads and bounded bulk processing."""
+
+import asyncio
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from src.service.file_upload_service import FileUploadService, ResourceType
+
+
+class FakeProcessor:
+    """Returns one chunk per file and tracks concurrent processing."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def iter_chunks(self, file_path, mime_type):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        for page in (1, 2, 3):
+            yield {"content": f"Content of {file_path.name}", "section": "", "page": page}
+
+
+class FakeCollectionManager:
+    def get_collection(self, user_id, cert_id, bundle_version):
+        return "collection"
+
+    def __init__(self):
+        self.added = []
+        self.batches = []
+
+    def add_documents(self, collection, documents, metadatas):
+        self.added.extend(documents)
+        self.batches.append(len(documents))
+
+
+class TestFileUploadService:
+    """Single-pass hashing, size limits and bulk concurrency."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        service = FileUploadService(
+            upload_dir=str(tmp_path / "uploads"),
+            max_file_size=1024 * 1024,
+            upload_chunk_size=4096,
+            max_concurrent_processing=2,
+            embedding_batch_size=2
+        )
+        service.processor = FakeProcessor()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_save_streams_and_hashes_in_one_pass(self, service):
+        payloads = [(f"notes {i}\n" * 2000).encode() for i in range(3)]
+        uploads = [
+            (UploadFile(io.BytesIO(payload), filename=f"notes-{i}.txt"), ResourceType.SUPPLEMENTAL)
+            for i, payload in enumerate(payloads)
+        ]
+
+        saved, errors = await service.save_uploaded_files(uploads, "user-1", "profile-1")
+
+        assert errors == []
+        for metadata, payload in zip(saved, payloads):
+            assert metadata.file_size == len(payload)
+            assert metadata.file_hash == hashlib.sha256(payload).hexdigest()
+            assert metadata.file_hash == await service.calculate_file_hash(metadata.file_path)
+
+    @pytest.mark.asyncio
+    async def test_oversized_and_invalid_uploads_are_reported_per_file(self, service):
+        uploads = [
+            (UploadFile(io.BytesIO(b"ok" * 100), filename="ok.txt"), ResourceType.SUPPLEMENTAL),
+            (UploadFile(io.BytesIO(b"x" * (2 * 1024 * 1024)), filename="huge.txt"), ResourceType.SUPPLEMENTAL),
+            (UploadFile(io.BytesIO(b"x"), filename="tool.exe"), ResourceType.SUPPLEMENTAL),
+        ]
+
+        saved, errors = await service.save_uploaded_files(uploads, "user-1", "profile-1")
+
+        assert [metadata.original_filename for metadata in saved] == ["ok.txt"]
+        assert [error["filename"] for error in errors] == ["huge.txt", "tool.exe"]
+        assert "exceeds maximum" in errors[0]["error"]
+        # The partial oversized file is removed
+        assert len(list(service.get_resource_directory(ResourceType.SUPPLEMENTAL).iterdir())) == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_processing_is_bounded_and_reports_each_file(self, service):
+        uploads = [
+            (UploadFile(io.BytesIO(b"content " * 50), filename=f"doc-{i}.md"), ResourceType.EXAM_GUIDE)
+            for i in range(6)
+        ]
+        saved, _ = await service.save_uploaded_files(uploads, "user-1", "profile-1")
+        collection_manager = FakeCollectionManager()
+        progress = []
+
+        results = await service.process_uploaded_files(
+            saved, "cert", "v1", collection_manager,
+            on_result=lambda metadata, result: progress.append((metadata.file_id, metadata.processing_status))
+        )
+
+        assert all(result.success for result in results)
+        assert service.processor.peak_in_flight == 2
+        assert len(collection_manager.added) == 18
+        # Chunks are embedded in batches as they stream in
+        assert sorted(collection_manager.batches) == [1] * 6 + [2] * 6
+        assert all(result.chunk_count == 3 for result in results)
+        assert sorted(file_id for file_id, _ in progress) == sorted(m.file_id for m in saved)
+        assert {status for _, status in progress} == {"completed"}
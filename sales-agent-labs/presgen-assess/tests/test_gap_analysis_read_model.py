@@ -0,0 +1,192 @@
+"""Tests for the Gap Analysis dashboard read model."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+pytest.importorskip("aiosqlite")
+
+from src.models.gap_analysis import (
+    GapAnalysisResult as GapAnalysisResultModel,
+    ContentOutline as ContentOutlineModel,
+    RecommendedCourse as RecommendedCourseModel
+)
+from src.models.workflow import WorkflowExecution
+from src.services.gap_analysis_read_model import (
+    DashboardSection,
+    GapAnalysisDashboardView,
+    GapAnalysisReadModel,
+    compute_etag,
+    serialize_section,
+)
+
+
+class TestGapAnalysisReadModel:
+    """Materialization, ETags and invalidation of dashboard sections."""
+
+    @pytest_asyncio.fixture
+    async def session_factory(self, tmp_path):
+        """File-backed SQLite with just the tables the read model touches.
+
+        File-backed so the read model's own write sessions get separate
+        connections from the request session, as they do in production.
+        """
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'dashboard.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                GapAnalysisDashboardView.metadata.create_all,
+                tables=[
+                    GapAnalysisDashboardView.__table__,
+                    GapAnalysisResultModel.__table__,
+                    ContentOutlineModel.__table__,
+                    RecommendedCourseModel.__table__,
+                    WorkflowExecution.__table__,
+                ]
+            )
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    @pytest.fixture
+    def read_model(self, session_factory):
+        return GapAnalysisReadModel(session_factory=session_factory)
+
+    async def _persist_gap_analysis(self, session, workflow_id):
+        gap = GapAnalysisResultModel(
+            id=uuid4(),
+            workflow_id=workflow_id,
+            overall_score=62.5,
+            total_questions=8,
+            correct_answers=5,
+            incorrect_answers=3,
+            skill_gaps=[{
+                "skill_id": "iam",
+                "skill_name": "IAM",
+                "exam_domain": "Security",
+                "severity": 7,
+                "confidence_delta": 1.5
+            }],
+            performance_by_domain={"Security": 50.0},
+            severity_scores={"iam": 7},
+            text_summary="Focus on IAM.",
+            charts_data={},
+            certification_profile_id=uuid4()
+        )
+        session.add(gap)
+        await session.commit()
+        return gap
+
+    def test_etag_matching(self):
+        payload = {"b": 1, "a": [1, 2]}
+        etag = compute_etag(serialize_section(payload))
+        section = DashboardSection("summary", payload, etag, 3)
+
+        assert etag == compute_etag(serialize_section({"a": [1, 2], "b": 1}))
+        assert section.matches(etag)
+        assert section.matches(f'"other", W/{etag}')
+        assert section.matches("*")
+        assert not section.matches(None)
+        assert not section.matches('"stale"')
+        assert section.headers["X-Read-Model-Version"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_materialize_then_single_lookup(self, session_factory, read_model):
+        workflow_id = uuid4()
+
+        async with session_factory() as session:
+            assert await read_model.get_or_build(session, workflow_id, "summary") is None
+            await self._persist_gap_analysis(session, workflow_id)
+            sections = await read_model.materialize(session, workflow_id)
+
+        assert set(sections) == {"gap_analysis", "summary", "content_outlines", "recommended_courses"}
+
+        async with session_factory() as session:
+            summary = await read_model.get(session, workflow_id, "summary")
+            gap_analysis = await read_model.get(session, workflow_id, "gap_analysis")
+
+        assert summary.payload["overall_score"] == 62.5
+        assert summary.payload["top_skill_gaps"][0]["skill_id"] == "iam"
+        assert gap_analysis.payload["workflow_id"] == str(workflow_id)
+        assert summary.etag != gap_analysis.etag
+
+    @pytest.mark.asyncio
+    async def test_gap_row_change_invalidates_and_rebuilds(self, session_factory, read_model):
+        workflow_id = uuid4()
+
+        async with session_factory() as session:
+            gap = await self._persist_gap_analysis(session, workflow_id)
+            await read_model.materialize(session, workflow_id)
+            before = await read_model.get(session, workflow_id, "summary")
+
+            gap.overall_score = 80.0
+            await session.commit()
+            assert await read_model.get(session, workflow_id, "summary") is None
+
+            after = await read_model.get_or_build(session, workflow_id, "summary")
+
+        assert after.payload["overall_score"] == 80.0
+        assert after.etag != before.etag
+        assert after.version > before.version
+        assert not after.matches(before.etag)
+
+    @pytest.mark.asyncio
+    async def test_bulk_workflow_update_invalidates_workflow_sections_only(self, session_factory, read_model):
+        workflow_id = uuid4()
+        other_workflow_id = uuid4()
+
+        async with session_factory() as session:
+            await self._persist_gap_analysis(session, workflow_id)
+            await read_model.materialize(session, workflow_id)
+            await read_model.store(workflow_id, {"answers": {"correct_count": 1}})
+            await read_model.store(other_workflow_id, {"answers": {"correct_count": 2}})
+
+            await session.execute(
+                update(WorkflowExecution)
+                .where(WorkflowExecution.id == workflow_id)
+                .values(progress=100)
+            )
+            await session.commit()
+
+            assert await read_model.get(session, workflow_id, "answers") is None
+            assert await read_model.get(session, workflow_id, "summary") is not None
+            assert await read_model.get(session, other_workflow_id, "answers") is not None
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_rebuild_is_not_overwritten(self, session_factory, read_model):
+        workflow_id = uuid4()
+
+        async def builder(db, built_workflow_id):
+            # The workflow changes after the rebuild read its source rows
+            async with session_factory() as writer:
+                await writer.execute(
+                    update(WorkflowExecution)
+                    .where(WorkflowExecution.id == built_workflow_id)
+                    .values(progress=50)
+                )
+                await writer.commit()
+            return {"report": {"progress": 0}}
+
+        async with session_factory() as session:
+            served = await read_model.get_or_build(session, workflow_id, "report", builder=builder)
+
+            assert served.payload == {"progress": 0}
+            assert await read_model.get(session, workflow_id, "report") is None
+
+    @pytest.mark.asyncio
+    async def test_rebuild_never_commits_request_session(self, session_factory, read_model, monkeypatch):
+        workflow_id = uuid4()
+
+        async with session_factory() as session:
+            await self._persist_gap_analysis(session, workflow_id)
+            commit, rollback = AsyncMock(), AsyncMock()
+            monkeypatch.setattr(session, "commit", commit)
+            monkeypatch.setattr(session, "rollback", rollback)
+
+            summary = await read_model.get_or_build(session, workflow_id, "summary")
+
+        assert summary.version == 1
+        commit.assert_not_awaited()
+        rollback.assert_not_awaited()
@@ -0,0 +1,191 @@
+"""Tests for the shared Google API executor."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from googleapiclient.errors import HttpError
+
+from src.services.google_api_executor import (
+    BatchResponseMissingError,
+    GoogleAPIErrorHandler,
+    GoogleAPIExecutor,
+)
+
+
+def http_error(status):
+    return HttpError(resp=Mock(status=status), content=b'{"error": {"message": "boom"}}')
+
+
+class FakeRequest:
+    """Stands in for a googleapiclient HttpRequest with a blocking execute()."""
+
+    def __init__(self, *outcomes, delay=0.0):
+        self.outcomes = list(outcomes)
+        self.delay = delay
+        self.threads = []
+
+    def execute(self):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class FakeBatch:
+    def __init__(self, callback, log, failure=None, dropped=()):
+        self.callback = callback
+        self.log = log
+        self.failure = failure
+        self.dropped = dropped
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.log.append(len(self.requests))
+        if self.failure is not None:
+            raise self.failure
+        for request_id, request in self.requests:
+            if request in self.dropped:
+                continue  # no part for this call in the batch response
+            try:
+                self.callback(request_id, request.execute(), None)
+            except HttpError as exc:
+                self.callback(request_id, None, exc)
+
+
+class FakeService:
+    def __init__(self, batch_failures=(), dropped=()):
+        self.batches = []
+        self.batch_failures = list(batch_failures)
+        self.dropped = dropped
+
+    def new_batch_http_request(self, callback):
+        failure = self.batch_failures.pop(0) if self.batch_failures else None
+        return FakeBatch(callback, self.batches, failure, self.dropped)
+
+
+class TestGoogleAPIExecutor:
+    """Blocking requests run on the bounded pool with retries and metrics."""
+
+    @pytest.fixture
+    def executor(self):
+        executor = GoogleAPIExecutor(
+            max_workers=2, error_handler=GoogleAPIErrorHandler(base_delay=0.0)
+        )
+        yield executor
+        executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_requests_run_off_the_event_loop_on_bounded_workers(self, executor):
+        requests = [FakeRequest({"formId": str(i)}, delay=0.2) for i in range(4)]
+
+        started = time.perf_counter()
+        calls = asyncio.gather(*(
+            executor.execute(request, api="forms", operation="forms.get") for request in requests
+        ))
+        await asyncio.sleep(0.05)
+        loop_latency = time.perf_counter() - started
+        stats = executor.stats()
+        results = await calls
+
+        assert loop_latency < 0.15  # the loop kept running while requests blocked
+        assert stats["in_flight"] == 4 and stats["queued"] == 2
+        assert [result["formId"] for result in results] == ["0", "1", "2", "3"]
+        assert {thread for request in requests for thread in request.threads} <= {
+            "google-api_0", "google-api_1"
+        }
+        forms_get = executor.stats()["apis"]["forms"]["forms.get"]
+        assert forms_get["calls"] == 4 and forms_get["errors"] == 0
+        assert forms_get["p50_ms"] >= 200
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried_and_counted(self, executor):
+        request = FakeRequest(http_error(429), {"responses": []})
+
+        result = await executor.execute(request, api="forms", operation="forms.responses.list")
+
+        assert result == {"responses": []}
+        metrics = executor.stats()["apis"]["forms"]["forms.responses.list"]
+        assert metrics["calls"] == 2 and metrics["errors"] == 1
+        assert metrics["error_statuses"] == {"429": 1}
+
+        with pytest.raises(HttpError):
+            await executor.execute(FakeRequest(http_error(404)), api="forms", operation="forms.get")
+
+    @pytest.mark.asyncio
+    async def test_single_calls_retry_transport_errors_like_batches(self, executor):
+        request = FakeRequest(ConnectionResetError("reset"), {"formId": "f"})
+
+        result = await executor.execute(request, api="forms", operation="forms.get")
+
+        assert result == {"formId": "f"}
+        assert executor.stats()["apis"]["forms"]["forms.get"]["error_statuses"] == {"ConnectionResetError": 1}
+        with pytest.raises(ValueError):
+            await executor.execute(FakeRequest(ValueError("bad")), api="forms", operation="forms.get")
+
+    @pytest.mark.asyncio
+    async def test_batches_keep_order_and_resend_only_throttled_calls(self, executor):
+        service = FakeService()
+        requests = [
+            FakeRequest({"id": "a"}),
+            FakeRequest(http_error(429), {"id": "b"}),
+            FakeRequest(http_error(404)),
+        ]
+
+        results = await executor.execute_batch(
+            service, requests, api="drive", operation="files.create", return_exceptions=True
+        )
+
+        assert results[0] == {"id": "a"} and results[1] == {"id": "b"}
+        assert isinstance(results[2], HttpError)
+        assert service.batches == [3, 1]  # only the throttled call was resent
+        drive = executor.stats()["apis"]["drive"]
+        assert drive["files.create"]["calls"] == 4 and drive["files.create"]["errors"] == 2
+        assert drive["files.create"]["max_ms"] == 0.0  # no batch round-trips in per-call latency
+        assert drive["files.create[batch]"]["calls"] == 2
+        with pytest.raises(HttpError):
+            await executor.execute_batch(
+                service, [FakeRequest(http_error(404))], api="drive", operation="files.delete"
+            )
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_call_is_retried_with_backoff(self, executor):
+        service = FakeService(batch_failures=[ConnectionResetError("reset"), http_error(503)])
+        requests = [FakeRequest({"id": "a"}), FakeRequest({"id": "b"})]
+
+        results = await executor.execute_batch(service, requests, api="drive", operation="files.create")
+
+        assert results == [{"id": "a"}, {"id": "b"}]
+        assert service.batches == [2, 2, 2]
+        batch_metrics = executor.stats()["apis"]["drive"]["files.create[batch]"]
+        assert batch_metrics["calls"] == 3 and batch_metrics["errors"] == 2
+
+        failing = FakeService(batch_failures=[http_error(400)])
+        with pytest.raises(HttpError):
+            await executor.execute_batch(failing, requests, api="drive", operation="files.create")
+        assert failing.batches == [2]  # not retryable
+
+    @pytest.mark.asyncio
+    async def test_call_without_batch_response_is_an_error(self, executor):
+        dropped = FakeRequest({"id": "lost"})
+        service = FakeService(dropped=(dropped,))
+
+        results = await executor.execute_batch(
+            service, [FakeRequest({"id": "a"}), dropped], api="sheets", operation="values.get",
+            return_exceptions=True
+        )
+
+        assert results[0] == {"id": "a"}
+        assert isinstance(results[1], BatchResponseMissingError)
+        assert service.batches == [2]
+        assert executor.stats()["apis"]["sheets"]["values.get"]["errors"] == 1
@@ -0,0 +1,90 @@
+"""Tests for paginated, incremental Google Forms response fetching."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from src.services.google_api_executor import GoogleAPIExecutor
+from src.services.google_forms_service import GoogleFormsService
+
+
+def form_response(number):
+    return {
+        "responseId": f"resp_{number:03d}",
+        "lastSubmittedTime": f"2024-01-01T12:{number:02d}:00.123Z",
+        "answers": {"q1": {"textAnswers": {"answers": [{"value": f"answer {number}"}]}}},
+    }
+
+
+class FakeResponsesResource:
+    """responses().list() that pages through ``items`` and records each call's arguments."""
+
+    def __init__(self, items, page_size):
+        self.items = items
+        self.page_size = page_size
+        self.calls = []
+
+    def list(self, **kwargs):
+        self.calls.append(dict(kwargs))
+        start = int(kwargs.get("pageToken") or 0)
+        page = self.items[start:start + self.page_size]
+        payload = {"responses": page} if page else {}
+        if start + self.page_size < len(self.items):
+            payload["nextPageToken"] = str(start + self.page_size)
+        request = Mock()
+        request.execute.return_value = payload
+        return request
+
+
+class TestFormResponsePaging:
+    """Responses stream page by page and can be limited to new submissions."""
+
+    @pytest.fixture
+    def executor(self):
+        executor = GoogleAPIExecutor(max_workers=1)
+        yield executor
+        executor.shutdown(wait=True)
+
+    def make_service(self, executor, items, page_size=2):
+        resource = FakeResponsesResource(items, page_size)
+        forms_service = Mock()
+        forms_service.forms.return_value.responses.return_value = resource
+        service = GoogleFormsService(
+            forms_service=forms_service,
+            drive_service=Mock(),
+            auth_manager=Mock(),
+            api_executor=executor,
+        )
+        return service, resource
+
+    @pytest.mark.asyncio
+    async def test_all_pages_are_followed_and_yielded_lazily(self, executor):
+        items = [form_response(n) for n in range(1, 6)]
+        items.insert(2, {"responseId": "resp_empty", "lastSubmittedTime": "2024-01-01T12:02:30Z"})
+        service, resource = self.make_service(executor, items)
+
+        stream = service.iter_form_responses(form_id="form_1")
+        first = await stream.__anext__()
+        assert first["response_id"] == "resp_001" and len(resource.calls) == 1  # only page one fetched
+        rest = [item async for item in stream]
+
+        assert [item["response_id"] for item in [first] + rest] == [f"resp_{n:03d}" for n in range(1, 6)]
+        assert [call.get("pageToken") for call in resource.calls] == [None, "2", "4"]
+        assert all("filter" not in call for call in resource.calls)
+
+    @pytest.mark.asyncio
+    async def test_since_requests_only_newer_submissions(self, executor):
+        service, resource = self.make_service(executor, [form_response(n) for n in range(1, 4)])
+
+        result = await service.get_form_responses(form_id="form_1", since="2024-01-01T12:00:00.5Z")
+        await service.get_form_responses(
+            form_id="form_1", since=datetime(2024, 1, 1, 16, 0, tzinfo=timezone(timedelta(hours=2)))
+        )
+
+        assert resource.calls[0]["filter"] == "timestamp >= 2024-01-01T12:00:00.5Z"
+        assert resource.calls[-1]["filter"] == "timestamp >= 2024-01-01T14:00:00.000000Z"
+        assert result["latest_submitted_at"] == "2024-01-01T12:03:00.123Z"
+        assert len(result["responses"]) == 3
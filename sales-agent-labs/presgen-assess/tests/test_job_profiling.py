@@ -0,0 +1,76 @@
+"""Tests for the opt-in job sampling profiler."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.common.config import settings
+from src.common.profiling import PROFILE_NAME_RE, list_profiles, profile_job
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestProfileJob:
+    """Profiles are opt-in, written as collapsed stacks and merged per label."""
+
+    @pytest.fixture(autouse=True)
+    def profile_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "job_profile_dir", str(tmp_path))
+        monkeypatch.setattr(settings, "job_profile_interval_ms", 1)
+        return tmp_path
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.setattr(settings, "job_profiling_enabled", False)
+        with profile_job("wf-1", "generate_contextual_assessment") as path:
+            _spin(0.02)
+        assert path is None
+        assert list_profiles("wf-1") == []
+
+    @pytest.mark.asyncio
+    async def test_profiles_event_loop_work_in_collapsed_stack_format(self):
+        async def generate():
+            await asyncio.sleep(0)
+            _spin(0.1)
+
+        for _ in range(2):
+            with profile_job("wf-2", "generate_contextual_assessment", enabled=True) as path:
+                await generate()
+
+        assert list_profiles("wf-2") == ["profile-generate_contextual_assessment.folded"]
+        assert PROFILE_NAME_RE.match(path.name)
+        lines = path.read_text().splitlines()
+        stacks = {line.rpartition(" ")[0]: int(line.rpartition(" ")[2]) for line in lines}
+        # Repeated runs under one label merge into a single entry per stack
+        assert len(stacks) == len(lines)
+        assert sum(n for stack, n in stacks.items() if "_spin" in stack) > 10
+
+    @pytest.mark.asyncio
+    async def test_overlapping_jobs_only_sample_their_own_tasks(self):
+        def spin_first():
+            _spin(0.01)
+
+        def spin_second():
+            _spin(0.01)
+
+        async def step(spin):
+            spin()
+
+        async def generate(job_id, spin):
+            with profile_job(job_id, "generate_contextual_assessment", enabled=True) as path:
+                for _ in range(10):
+                    spin()
+                    # Work in a child task counts towards the job that created it
+                    await asyncio.create_task(step(spin))
+            return path
+
+        first, second = await asyncio.gather(generate("wf-3", spin_first), generate("wf-4", spin_second))
+
+        first_profile, second_profile = first.read_text(), second.read_text()
+        assert "spin_first" in first_profile and "spin_second" not in first_profile
+        assert "spin_second" in second_profile and "spin_first" not in second_profile
+        assert "step (" in first_profile
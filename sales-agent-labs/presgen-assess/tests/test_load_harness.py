@@ -0,0 +1,137 @@
+"""Tests for the load-test harness fakes and capacity estimation."""
+
+import random
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+pytest.importorskip("httpx")
+
+from loadtest.fakes import (
+    FakeGoogleBackend,
+    LatencyModel,
+    fake_questions,
+    make_fake_build,
+    parse_latency_overrides,
+)
+from loadtest.scenario import domain_distribution, estimate_capacity
+from src.services.google_api_executor import GoogleAPIExecutor
+from src.services.google_forms_service import GoogleFormsService
+
+
+def level(classes, *, failed=0, error_rate=0.0, read_p95=50.0, write_p95=500.0, timeouts=0):
+    return {
+        "classes": classes,
+        "classes_failed": failed,
+        "error_rate": error_rate,
+        "endpoints": {
+            "GET /workflows/{id}": {"p95_ms": read_p95},
+            "POST /workflows": {"p95_ms": write_p95},
+        },
+        "db_pool": {"timeouts": timeouts},
+    }
+
+
+class TestFakeGoogleBackend:
+    """The fake Forms API works through the real GoogleFormsService."""
+
+    @pytest.fixture
+    def executor(self):
+        executor = GoogleAPIExecutor(max_workers=2)
+        yield executor
+        executor.shutdown(wait=True)
+
+    def make_service(self, executor):
+        backend = FakeGoogleBackend(LatencyModel(scale=0))
+        build = make_fake_build(backend)
+        service = GoogleFormsService(
+            forms_service=build("forms", "v1"),
+            drive_service=build("drive", "v3"),
+            auth_manager=Mock(),
+            api_executor=executor,
+        )
+        return backend, service
+
+    @pytest.mark.asyncio
+    async def test_created_form_collects_paged_and_incremental_responses(self, executor):
+        backend, service = self.make_service(executor)
+        questions = [
+            {"id": f"q{n}", "question_text": f"Question {n}", "question_type": "multiple_choice",
+             "options": ["A) one", "B) two", "C) three", "D) four"], "correct_answer": "A"}
+            for n in range(3)
+        ]
+
+        form = await service.create_assessment_form(assessment_data={"questions": questions})
+        backend.submit_responses(form["form_id"], 5, random.Random(0))
+        first = [r async for r in service.iter_form_responses(form_id=form["form_id"], page_size=2)]
+        since = max(r["submitted_at"] for r in first)
+        backend.submit_responses(form["form_id"], 2, random.Random(1))
+        newer = await service.get_form_responses(form_id=form["form_id"], since=since)
+
+        assert form["success"] and form["form_url"].endswith("/viewform")
+        assert len(first) == 5 and len(first[0]["answers"]) == 3
+        assert set(first[0]["answers"].values()) <= set(questions[0]["options"])
+        assert len(newer["responses"]) == 3  # inclusive filter: last seen plus two new
+        assert backend.calls["forms.forms.responses.list"] == 4  # three pages, then one
+
+    def test_sheets_batch_update_assigns_new_sheet_ids(self):
+        backend = FakeGoogleBackend(LatencyModel(scale=0))
+        sheets = make_fake_build(backend)("sheets", "v4")
+
+        created = sheets.spreadsheets().create(body={"properties": {"title": "Export"}}).execute()
+        reply = sheets.spreadsheets().batchUpdate(
+            spreadsheetId=created["spreadsheetId"],
+            body={"requests": [{"addSheet": {"properties": {"title": "Gaps"}}}, {"repeatCell": {}}]},
+        ).execute()
+
+        assert reply["replies"][0]["addSheet"]["properties"] == {"title": "Gaps", "sheetId": 1}
+        assert reply["replies"][1] == {}
+
+
+class TestFakeQuestionsAndLatency:
+    """Fake LLM output passes the generator's checks; latencies are configurable."""
+
+    def test_fake_questions_are_valid_and_dissimilar(self):
+        questions = fake_questions(10, "Modeling", random.Random(3))
+
+        for question in questions:
+            assert len(question["options"]) == 4
+            assert question["correct_answer"] in "ABCD"
+            assert question["explanation"] and isinstance(question["references"], list)
+        word_sets = [set(q["question"].lower().split()) for q in questions]
+        overlaps = [len(a & b) / len(a | b) for i, a in enumerate(word_sets) for b in word_sets[i + 1:]]
+        assert max(overlaps) < 0.7  # generator drops near-duplicates above this
+
+    def test_latency_overrides_and_scale(self):
+        latency = LatencyModel(scale=0.5, overrides=parse_latency_overrides("forms=100,openai.chat=0"), jitter=0)
+
+        assert latency.seconds("forms") == pytest.approx(0.05)
+        assert latency.seconds("openai.chat") == 0.0
+        with pytest.raises(ValueError):
+            parse_latency_overrides("gemini=10")
+
+
+class TestCapacityEstimate:
+    """Capacity is the highest level whose lower levels all met the SLOs."""
+
+    def test_first_failing_level_limits_capacity(self):
+        levels = [level(1), level(2), level(4, read_p95=800.0, timeouts=2), level(8)]
+
+        result = estimate_capacity(levels, max_error_rate=0.01, read_slo_ms=500, write_slo_ms=5000)
+
+        assert result["concurrent_classes"] == 2
+        assert result["limited_at"] == 4
+        assert result["reasons"] == ["GET /workflows/{id} p95 800ms > 500ms", "2 DB pool checkout timeouts"]
+
+    def test_no_passing_level_and_all_passing(self):
+        failing = estimate_capacity([level(1, failed=1, error_rate=0.2)], 0.01, 500, 5000)
+        passing = estimate_capacity([level(1), level(2)], 0.01, 500, 5000)
+
+        assert failing["concurrent_classes"] is None
+        assert failing["reasons"] == ["1/1 classes failed", "error rate 20.00% > 1.00%"]
+        assert passing == {"concurrent_classes": 2, "limited_at": None, "reasons": []}
+
+    def test_domain_distribution_matches_question_count(self):
+        for count in (1, 7, 12, 24):
+            assert sum(domain_distribution(count).values()) == count
@@ -0,0 +1,77 @@
+"""Tests for concurrent, cached health checks in MonitoringService."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from src.services.monitoring_service import HealthCheckResult, MonitoringService
+
+CHECK_NAMES = ["system", "database", "google_forms", "presgen_integration", "workflow_system", "application"]
+
+
+class TestHealthCheckCaching:
+    """Checks run concurrently with timeouts; probes read a cached result."""
+
+    @pytest_asyncio.fixture
+    async def monitoring_setup(self):
+        with patch('src.services.monitoring_service.GoogleFormsService'), \
+                patch('src.services.monitoring_service.PresGenIntegrationService'):
+            service = MonitoringService(cache_ttl_seconds=0.3, check_timeout_seconds=0.5)
+        calls = []
+
+        def fake_check(name, delay):
+            async def check():
+                calls.append(name)
+                await asyncio.sleep(delay)
+                return HealthCheckResult(name, "healthy")
+            return check
+
+        delays = {name: 0.2 for name in CHECK_NAMES}
+        delays["google_forms"] = 60  # a hung Google API
+        service._health_checks = lambda: [
+            (name, fake_check(name, delays[name]), "degraded") for name in CHECK_NAMES
+        ]
+        yield service, calls
+        await service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently_and_slow_checks_time_out(self, monitoring_setup):
+        monitoring, _ = monitoring_setup
+        started = time.perf_counter()
+        result = await monitoring.comprehensive_health_check()
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.9  # bounded by the 0.5s timeout, not the sum of the checks
+        statuses = {check["service_name"]: check["status"] for check in result["checks"]}
+        assert statuses.pop("google_forms") == "degraded"
+        assert set(statuses.values()) == {"healthy"}
+        timed_out = next(check for check in result["checks"] if check["service_name"] == "google_forms")
+        assert timed_out["details"]["timed_out"] is True
+        assert result["overall_status"] == "degraded"
+
+    @pytest.mark.asyncio
+    async def test_cached_health_is_served_while_refreshing_in_background(self, monitoring_setup):
+        monitoring, calls = monitoring_setup
+        first = await monitoring.get_cached_health()
+        assert len(calls) == len(CHECK_NAMES)
+
+        started = time.perf_counter()
+        cached = await monitoring.get_cached_health()
+        assert time.perf_counter() - started < 0.05
+        assert cached["timestamp"] == first["timestamp"] and not cached["cache"]["stale"]
+        assert len(calls) == len(CHECK_NAMES)  # no checks re-run within the TTL
+
+        await asyncio.sleep(0.35)
+        started = time.perf_counter()
+        stale = [await monitoring.get_cached_health() for _ in range(3)]
+        assert time.perf_counter() - started < 0.05  # stale result returned without waiting
+        assert all(entry["cache"]["stale"] and entry["cache"]["refreshing"] for entry in stale)
+        assert stale[0]["timestamp"] == first["timestamp"]
+
+        await monitoring._refresh_task
+        refreshed = await monitoring.get_cached_health()
+        assert refreshed["timestamp"] != first["timestamp"] and not refreshed["cache"]["stale"]
+        assert len(calls) == 2 * len(CHECK_NAMES)  # exactly one background refresh
@@ -0,0 +1,67 @@
+"""Tests for concurrent remediation context retrieval."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.remediation_context import (
+    RemediationContextBuilder,
+    context_relevance,
+    domain_remediation_query,
+)
+
+
+class TestRemediationContextBuilder:
+    """Identical queries are retrieved once and distinct ones run in parallel."""
+
+    @pytest.fixture
+    def knowledge_base(self):
+        knowledge_base = AsyncMock()
+        state = {"in_flight": 0, "peak": 0}
+
+        async def retrieve(query, certification_id, k, balance_sources):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            if "Storage" in query:
+                raise RuntimeError("vector store unavailable")
+            return {"combined_context": f"Context for {query}", "citations": ["Shared Guide", query]}
+
+        knowledge_base.retrieve_context_for_assessment.side_effect = retrieve
+        knowledge_base.state = state
+        return knowledge_base
+
+    @pytest.mark.asyncio
+    async def test_retrieve_deduplicates_and_runs_concurrently(self, knowledge_base):
+        builder = RemediationContextBuilder(knowledge_base)
+        queries = [
+            domain_remediation_query(domain)
+            for domain in ["Security", "Networking", "security ", "Networking", "Storage"]
+        ]
+
+        contexts = await builder.retrieve(queries, "aws-saa")
+
+        assert knowledge_base.retrieve_context_for_assessment.await_count == 3
+        assert knowledge_base.state["peak"] == 3
+        assert builder.lookup(contexts, queries[2]) == builder.lookup(contexts, queries[0])
+        assert builder.lookup(contexts, queries[4]) == {}  # failure degrades to no context
+
+        citations = builder.merged_citations(builder.lookup(contexts, q) for q in queries)
+        assert citations.count("Shared Guide") == 1
+
+    @pytest.mark.asyncio
+    async def test_retrieve_without_certification_skips_lookup(self, knowledge_base):
+        contexts = await RemediationContextBuilder(knowledge_base).retrieve(["anything"], "")
+
+        assert contexts == {}
+        knowledge_base.retrieve_context_for_assessment.assert_not_awaited()
+
+    def test_query_and_relevance_helpers(self):
+        assert domain_remediation_query("Security", "IAM") == "study materials and learning resources for IAM in Security"
+        assert domain_remediation_query("Security", "Security") == "study materials and learning resources for Security"
+
+        context = {"sources": {"exam_guides": {"results": [{"distance": 0.2}, {"distance": 0.4}]}}}
+        assert context_relevance(context) == 0.7
+        assert context_relevance({}) is None
@@ -224,6 +224,55 @@ class TestWorkflowOrchestrator:
             assert result["current_step"] == "collect_responses"
             assert result["response_count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_continued_workflow_keeps_assessment_data(
+        self,
+        workflow_orchestrator,
+        sample_assessment_data
+    ):
+        """A workflow created through the API without questions gets them when continued."""
+        # Arrange
+        created_by_api = WorkflowExecution(
+            id=uuid4(),
+            user_id="test_user",
+            certification_profile_id=uuid4(),
+            current_step="initiated",
+            execution_status=WorkflowStatus.INITIATED,
+            assessment_data=None
+        )
+        existing_data = {"questions": [{"id": "earlier"}]}
+        already_generated = WorkflowExecution(
+            id=uuid4(),
+            user_id="test_user",
+            certification_profile_id=uuid4(),
+            current_step="create_form",
+            execution_status=WorkflowStatus.INITIATED,
+            assessment_data=existing_data
+        )
+
+        for workflow in (created_by_api, already_generated):
+            session = AsyncMock()
+            session.execute.return_value = MagicMock()
+            session.execute.return_value.scalars.return_value.all.return_value = [workflow]
+            with patch('src.services.workflow_orchestrator.get_async_session') as mock_session:
+                mock_session.return_value.__aenter__.return_value = session
+
+                # Act
+                result = await workflow_orchestrator._create_workflow_execution(
+                    certification_profile_id=workflow.certification_profile_id,
+                    user_id="test_user",
+                    assessment_data=sample_assessment_data
+                )
+
+            # Assert
+            assert result is workflow
+            if workflow is created_by_api:
+                assert result.assessment_data == sample_assessment_data
+                session.commit.assert_awaited_once()
+            else:
+                assert result.assessment_data == existing_data
+                session.commit.assert_not_awaited()
+
 
 class TestResponseIngestionService:
     """Test suite for response ingestion service."""
@@ -438,6 +487,48 @@ class TestResponseIngestionService:
             assert result["success"] is False
             assert "not found" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_polls_only_request_submissions_since_last_seen(
+        self,
+        response_ingestion_service,
+        mock_workflow_awaiting_completion
+    ):
+        """Each poll streams responses since the newest one already ingested."""
+        # Arrange - the workflow already holds resp_001 from before a restart
+        workflow = mock_workflow_awaiting_completion
+        workflow.collected_responses = [
+            {"response_id": "resp_001", "submitted_at": "2024-01-01T12:00:00+00:00"}
+        ]
+        polls = []
+
+        def iter_form_responses(*, form_id, include_empty, since):
+            polls.append(since)
+            batch = [
+                {"response_id": "resp_001", "submitted_at": "2024-01-01T12:00:00Z", "answers": {"q1": "B"}},
+                {"response_id": "resp_002", "submitted_at": "2024-01-01T12:30:00Z", "answers": {"q1": "A"}},
+            ]
+
+            async def stream():
+                for item in batch:
+                    yield item
+            return stream()
+
+        forms = response_ingestion_service.google_forms_service
+        forms.iter_form_responses = iter_form_responses
+        session = AsyncMock()
+
+        # Act
+        with patch.object(response_ingestion_service, '_evaluate_completion_criteria', AsyncMock()):
+            await response_ingestion_service._process_workflow_responses(session, workflow)
+            workflow.collected_responses = []  # the mocked update does not persist
+            await response_ingestion_service._process_workflow_responses(session, workflow)
+
+        # Assert
+        assert polls == ["2024-01-01T12:00:00+00:00", "2024-01-01T12:30:00Z"]
+        stored = session.execute.await_args_list
+        assert len(stored) == 1  # the second poll found nothing new
+        assert "resp_002" in response_ingestion_service._processed_responses
+
 
 class TestWorkflowOrchestrationAPI:
     """Test suite for workflow orchestration API endpoints."""
@@ -0,0 +1,164 @@
+# src/agent/google_clients.py
+from __future__ import annotations
+import datetime as dt
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import google_auth_httplib2
+import httplib2
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials as UserCredentials
+from googleapiclient.discovery import build
+
+from src.common.jsonlog import jlog
+
+log = logging.getLogger("agent.google_clients")
+
+# Refresh this long before the access token expires. Inside the margin the
+# current token is still handed out while a background thread refreshes it,
+# so API calls don't pay for a refresh (or a 401 + retry).
+REFRESH_MARGIN_SECS = int(os.getenv("GOOGLE_TOKEN_REFRESH_MARGIN_SECS", "300"))
+HTTP_TIMEOUT_SECS = float(os.getenv("GOOGLE_HTTP_TIMEOUT_SECS", "120"))
+
+
+class GoogleClientProvider:
+    """
+    Process-wide Google credentials and discovery clients.
+
+    - credentials are loaded once (service account or cached OAuth token)
+      and refreshed proactively on a background thread once they are within
+      the refresh margin; only a missing or expired token is refreshed in the
+      caller's thread. Refreshed OAuth tokens are written back through
+      on_refresh
+    - service objects are cached per thread: httplib2 connections are not
+      thread-safe, so each thread gets its own AuthorizedHttp whose
+      keep-alive connections are reused across calls
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        refresh_margin_secs: int = REFRESH_MARGIN_SECS,
+        http_timeout_secs: float = HTTP_TIMEOUT_SECS,
+        on_refresh: Optional[Callable[[Any], None]] = None,
+    ):
+        self._loader = loader
+        self.refresh_margin = dt.timedelta(seconds=refresh_margin_secs)
+        self.http_timeout_secs = http_timeout_secs
+        self._on_refresh = on_refresh
+        self._creds = None
+        self._refresher: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._tls = threading.local()
+
+    def credentials(self):
+        """Shared credentials; a refresh starts in the background once they expire within the margin."""
+        with self._lock:
+            if self._creds is None:
+                self._creds = self._loader()
+            creds = self._creds
+            if self._is_expired(creds):
+                # Nothing usable to hand out: wait for a running refresh, else refresh here
+                refresher = self._refresher
+                if refresher is not None:
+                    refresher.join()
+                if self._is_expired(creds):
+                    self._refresh(creds)
+            elif self._needs_refresh(creds) and self._refresher is None:
+                self._refresher = threading.Thread(
+                    target=self._refresh_in_background, args=(creds,),
+                    name="google-token-refresh", daemon=True,
+                )
+                self._refresher.start()
+            return creds
+
+    def service(self, api: str, version: str):
+        """This thread's discovery client for api/version, bound to the shared credentials."""
+        creds = self.credentials()
+        cache: Dict[Tuple[str, str], Any] = getattr(self._tls, "services", None)
+        if cache is None or getattr(self._tls, "creds", None) is not creds:
+            # First use on this thread, or credentials were reloaded (invalidate())
+            cache = self._tls.services = {}
+            self._tls.creds = creds
+            self._tls.http = google_auth_httplib2.AuthorizedHttp(
+                creds, http=httplib2.Http(timeout=self.http_timeout_secs)
+            )
+        svc = cache.get((api, version))
+        if svc is None:
+            start = time.time()
+            svc = build(api, version, http=self._tls.http, cache_discovery=False)
+            cache[(api, version)] = svc
+            jlog(log, logging.DEBUG, event="google_service_built", api=api, version=version,
+                 thread=threading.current_thread().name, build_secs=round(time.time() - start, 4))
+        return svc
+
+    def invalidate(self) -> None:
+        """Drop the cached credentials (e.g. after the token file changed); clients rebuild lazily."""
+        with self._lock:
+            self._creds = None
+
+    def _needs_refresh(self, creds) -> bool:
+        return self._expires_within(creds, self.refresh_margin)
+
+    def _is_expired(self, creds) -> bool:
+        return self._expires_within(creds, dt.timedelta(0))
+
+    @staticmethod
+    def _expires_within(creds, margin: dt.timedelta) -> bool:
+        if not getattr(creds, "token", None):
+            return True  # service accounts start without an access token
+        expiry = getattr(creds, "expiry", None)
+        if expiry is None:
+            return False
+        # google-auth keeps expiry as naive UTC
+        return expiry - margin <= dt.datetime.utcnow()
+
+    def _refresh_in_background(self, creds) -> None:
+        try:
+            self._refresh(creds)
+        except Exception as e:
+            # The current token stays valid until expiry; the next call retries
+            log.warning("Background Google token refresh failed: %s", e)
+        finally:
+            # Not under self._lock: credentials() may hold it while joining this thread
+            self._refresher = None
+
+    def _refresh(self, creds) -> None:
+        start = time.time()
+        creds.refresh(Request())
+        jlog(log, logging.INFO, event="google_token_refreshed",
+             creds_type=type(creds).__name__, expiry=str(getattr(creds, "expiry", None)),
+             refresh_secs=round(time.time() - start, 3))
+        if self._on_refresh is not None:
+            try:
+                self._on_refresh(creds)
+            except Exception as e:
+                log.warning("Could not persist refreshed Google token: %s", e)
+
+
+def save_user_token(path) -> Callable[[Any], None]:
+    """on_refresh hook that writes refreshed OAuth user tokens back to path."""
+    def _save(creds) -> None:
+        if isinstance(creds, UserCredentials):
+            path.write_text(creds.to_json(), encoding="utf-8")
+    return _save
+
+
+_PROVIDER: Optional[GoogleClientProvider] = None
+_PROVIDER_LOCK = threading.Lock()
+
+
+def get_google_clients() -> GoogleClientProvider:
+    """Provider for the Slides/Drive/Apps Script credentials; created on first use."""
+    global _PROVIDER
+    if _PROVIDER is None:
+        with _PROVIDER_LOCK:
+            if _PROVIDER is None:
+                # Imported here: slides_google imports the notes modules, which use this provider
+                from src.agent.slides_google import TOKEN_PATH, _load_credentials
+
+                _PROVIDER = GoogleClientProvider(_load_credentials, on_refresh=save_user_token(TOKEN_PATH))
+    return _PROVIDER
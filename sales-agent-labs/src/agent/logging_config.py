@@ -32,6 +32,12 @@ def setup_logging() -> None:
     )
     
     print(f"📝 Main App Logs: ENABLED → {app_log_file}")
+
+    # Handlers above run on a background listener thread from here on
+    from src.common.jsonlog import start_background_logging
+
+    start_background_logging()
+
     # Quiet noise libs by default
     logging.getLogger("google").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
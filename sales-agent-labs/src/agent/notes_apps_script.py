@@ -4,6 +4,8 @@ import logging
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from .google_clients import get_google_clients
+
 log = logging.getLogger("agent.notes_script")
 
 
@@ -19,7 +21,12 @@ def set_speaker_notes_via_script(
     Returns True on success, False on failure (error already logged).
     """
     try:
-        service = build("script", "v1", credentials=creds, cache_discovery=False)
+        clients = get_google_clients()
+        if creds is None or creds is clients.credentials():
+            # Shared, per-thread client (no per-call auth or discovery setup)
+            service = clients.service("script", "v1")
+        else:
+            service = build("script", "v1", credentials=creds, cache_discovery=False)
         body = {
             "function": "setSpeakerNotes",
             "parameters": [presentation_id, slide_object_id, text or ""],
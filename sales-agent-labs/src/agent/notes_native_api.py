@@ -352,10 +352,9 @@ def _add_visible_script_box(
 def test_notes_implementation(presentation_id: str, slide_id: str) -> dict:
     """Test function to verify notes implementation works."""
     try:
-        from .slides_google import _load_credentials, _slides_service
-        
-        creds = _load_credentials()
-        slides = _slides_service(creds)
+        from .slides_google import _slides_service
+
+        slides = _slides_service()
         
         test_text = f"Test speaker notes - {time.time()}"
         
@@ -4,10 +4,12 @@ import pathlib
 from typing import Dict, Any, List, Optional
 import uuid, time, os, inspect, sys
 from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from .google_clients import get_google_clients
 from .notes_apps_script import set_speaker_notes_via_script
 
 log = logging.getLogger("agent.slides")
@@ -75,6 +77,14 @@ def _load_credentials() -> Credentials:
     creds = None
     if TOKEN_PATH.exists() and not force_consent:
         creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
+        # An expired access token with a refresh token is renewed, not re-consented
+        if creds and creds.expired and creds.refresh_token and creds.has_scopes(SCOPES):
+            try:
+                creds.refresh(Request())
+                TOKEN_PATH.write_text(creds.to_json(), encoding="utf-8")
+                log.info("Refreshed cached OAuth token from %s", TOKEN_PATH)
+            except Exception as e:
+                log.warning("OAuth token refresh failed: %s", e)
         # If token is valid *and* includes all scopes, reuse it
         if creds and creds.valid and creds.has_scopes(SCOPES):
             log.debug("Using cached OAuth token from %s", TOKEN_PATH)
@@ -104,10 +114,16 @@ def _load_credentials() -> Credentials:
     return creds
 
 
-def _slides_service(creds: Credentials):
-    if creds is None:
-        log.error("❌ Cannot create slides service: credentials are None")
-        raise ValueError("Credentials cannot be None")
+def _credentials() -> Credentials:
+    """Shared credentials: loaded once per process, refreshed before they expire."""
+    return get_google_clients().credentials()
+
+
+def _slides_service(creds: Optional[Credentials] = None):
+    clients = get_google_clients()
+    if creds is None or creds is clients.credentials():
+        # Cached per thread on a keep-alive AuthorizedHttp
+        return clients.service("slides", "v1")
     try:
         service = build("slides", "v1", credentials=creds, cache_discovery=False)
         if service is None:
@@ -120,14 +136,16 @@ def _slides_service(creds: Credentials):
         raise
 
 
-def _drive_service(creds: Credentials):
+def _drive_service(creds: Optional[Credentials] = None):
+    clients = get_google_clients()
+    if creds is None or creds is clients.credentials():
+        return clients.service("drive", "v3")
     return build("drive", "v3", credentials=creds, cache_discovery=False)
 
 
 # -------- Slides Operations ----------
 def set_speaker_notes_via_script(pres_id, slide_id, text):
-    creds = _load_credentials()  # Your existing OAuth load
-    service = build("script", "v1", credentials=creds, cache_discovery=False)
+    service = get_google_clients().service("script", "v1")
 
     body = {
         "function": "setSpeakerNotes",
@@ -147,8 +165,7 @@ def set_speaker_notes_via_script(pres_id, slide_id, text):
 
 
 def create_presentation(title: str) -> Dict[str, Any]:
-    creds = _load_credentials()
-    slides = _slides_service(creds)
+    slides = _slides_service()
     try:
         pres = slides.presentations().create(body={"title": title}).execute()
         log.info(
@@ -167,8 +184,7 @@ def add_title_and_subtitle(presentation_id: str, title: str, subtitle: str) -> s
     Create a BLANK slide, add two text boxes, and fill them with title/subtitle.
     Returns the created slide's objectId.
     """
-    creds = _load_credentials()
-    slides = _slides_service(creds)
+    slides = _slides_service()
 
     # Unique IDs so multiple runs don’t collide
     slide_id = _gen_id("title_slide")
@@ -490,8 +506,7 @@ def add_bullets_and_script(
     """
     Create a BLANK slide, add a text box with bullet points, then set speaker notes.
     """
-    creds = _load_credentials()
-    slides = _slides_service(creds)
+    slides = _slides_service()
 
     body_slide_id = _gen_id("body_slide")
     body_box_id = _gen_id("body_box")
@@ -628,8 +643,7 @@ def delete_default_slide(presentation_id: str) -> str:
     """
     Delete the first (default) slide the API creates and return its objectId.
     """
-    creds = _load_credentials()
-    slides = _slides_service(creds)
+    slides = _slides_service()
 
     pres = slides.presentations().get(presentationId=presentation_id).execute()
     first = pres.get("slides", [])[0]
@@ -724,7 +738,7 @@ def create_main_slide_with_content(
         slide_id (str): the objectId of the created slide.
     """
     # Acquire creds + Slides service (uses your existing helpers in this module)
-    creds = _load_credentials()
+    creds = _credentials()
     slides = _slides_service(creds)
 
     # Generate stable IDs for this slide and its elements
@@ -1025,8 +1039,7 @@ def upload_image_to_drive(
     start_time = time.time()
     
     image_path = pathlib.Path(image_path)
-    creds = _load_credentials()
-    drive = _drive_service(creds)
+    drive = _drive_service()
 
     from googleapiclient.http import MediaFileUpload
 
@@ -1080,8 +1093,7 @@ def upload_image_to_drive(
 def insert_image_from_url(
     presentation_id: str, image_url: str, page_object_id: str = "body_slide"
 ) -> None:
-    creds = _load_credentials()
-    slides = _slides_service(creds)
+    slides = _slides_service()
     requests = [
         {
             "createImage": {
@@ -4,6 +4,8 @@ import hashlib, json, os, time, tempfile
 from pathlib import Path
 from typing import Any, Optional
 
+from src.common.metrics import record_cache_lookup
+
 DEFAULT_STATE_DIR = Path("out/state")
 
 
@@ -39,14 +41,15 @@ def get(
 ) -> Optional[dict]:
     """Return JSON object from cache if fresh, else None."""
     path = _ns_dir(namespace, root) / f"{key}.json"
-    if not path.exists():
-        return None
-    if not _is_fresh(path, ttl_secs):
+    if not path.exists() or not _is_fresh(path, ttl_secs):
+        record_cache_lookup(namespace, hit=False)
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        obj = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
-        return None  # defensive: corrupt cache shouldn't crash pipeline
+        obj = None  # defensive: corrupt cache shouldn't crash pipeline
+    record_cache_lookup(namespace, hit=obj is not None)
+    return obj
 
 
 def set(namespace: str, key: str, obj: dict, *, root: Path = DEFAULT_STATE_DIR) -> None:
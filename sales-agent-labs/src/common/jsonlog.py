@@ -1,17 +1,29 @@
 from __future__ import annotations
-import json, logging, time, uuid, os, sys
-from typing import Any
+import atexit, json, logging, logging.handlers, queue, time, uuid, os, sys
+from typing import Any, Optional
+
+from src.common.tracing import current_span
+
+try:  # optional fast encoder; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
 # GCP debug logging setup - controlled by environment variable
 _GCP_DEBUG_SETUP = False
+# Read once by _setup_gcp_debug_logging, not per record
+_GCP_DEBUG_ENABLED = False
+_GCP_TRACE_PREFIX = ""
 
 def _setup_gcp_debug_logging():
     """Setup GCP client-level debug logging if enabled"""
-    global _GCP_DEBUG_SETUP
+    global _GCP_DEBUG_SETUP, _GCP_DEBUG_ENABLED, _GCP_TRACE_PREFIX
     if _GCP_DEBUG_SETUP:
         return
     
     enable_gcp_debug = os.getenv("ENABLE_GCP_DEBUG_LOGGING", "false").lower() == "true"
+    _GCP_DEBUG_ENABLED = enable_gcp_debug
+    _GCP_TRACE_PREFIX = f"projects/{os.getenv('GOOGLE_CLOUD_PROJECT', 'unknown')}/traces/"
     enable_cloud_logging = os.getenv("ENABLE_CLOUD_LOGGING", "false").lower() == "true"
     enable_local_debug_file = os.getenv("ENABLE_LOCAL_DEBUG_FILE", "false").lower() == "true"
     
@@ -137,27 +149,97 @@ def _json_serializable(obj):
     else:
         return str(obj)
 
+def _dumps(kv: dict) -> str:
+    """Serialize once; non-serializable values go through _json_serializable"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(kv, default=_json_serializable, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except (TypeError, ValueError):
+            pass  # e.g. ints > 64 bit; let stdlib json have a go
+    try:
+        return json.dumps(kv, ensure_ascii=False, default=_json_serializable)
+    except (TypeError, ValueError):
+        # Circular references etc.: stringify the offending values individually
+        for key, value in kv.items():
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                kv[key] = _json_serializable(value)
+        return json.dumps(kv, ensure_ascii=False)
+
+
 def jlog(logger: logging.Logger, level: int, **kv: Any) -> None:
     # Setup GCP logging on first call
-    _setup_gcp_debug_logging()
+    if not _GCP_DEBUG_SETUP:
+        _setup_gcp_debug_logging()
+
+    # Dropped records cost a level check, nothing more
+    if not logger.isEnabledFor(level):
+        return
 
     kv.setdefault("ts_ms", int(time.time() * 1000))
     kv.setdefault("level", logging.getLevelName(level))
+    span = current_span()
+    if span is not None:
+        # Correlate log lines with the active trace (see src/common/tracing.py)
+        kv.setdefault("trace_id", span.trace_id)
+        kv.setdefault("span_id", span.span_id)
     if "req_id" not in kv:
-        kv["req_id"] = str(uuid.uuid4())  # caller can override; useful for tracing
+        kv["req_id"] = span.trace_id if span is not None else str(uuid.uuid4())
 
     # Add GCP correlation ID for debugging
-    if os.getenv("ENABLE_GCP_DEBUG_LOGGING") == "true":
+    if _GCP_DEBUG_ENABLED:
         # Use proper GCP trace format for correlation
-        import socket
-        trace_id = f"projects/{os.getenv('GOOGLE_CLOUD_PROJECT', 'unknown')}/traces/{uuid.uuid4().hex}"
-        kv.setdefault("gcp_trace_id", trace_id)
+        kv.setdefault("gcp_trace_id", _GCP_TRACE_PREFIX + uuid.uuid4().hex)
 
-    # Convert non-serializable objects to strings
-    for key, value in kv.items():
-        try:
-            json.dumps(value)
-        except (TypeError, ValueError):
-            kv[key] = _json_serializable(value)
+    logger.log(level, _dumps(kv))
+
+
+# --- Background log I/O -------------------------------------------------------
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+_QUEUED_LOGGER: Optional[logging.Logger] = None
+_QUEUE_HANDLER: Optional[logging.handlers.QueueHandler] = None
 
-    logger.log(level, json.dumps(kv, ensure_ascii=False))
+
+def start_background_logging(logger: Optional[logging.Logger] = None) -> None:
+    """
+    Move the logger's handlers (root by default) behind a QueueHandler.
+
+    Callers only enqueue the record; a QueueListener thread runs the original
+    handlers (console, files, cloud), so request threads never wait on log I/O.
+    Idempotent. Set JSONLOG_BACKGROUND=false to keep synchronous handlers.
+    """
+    global _LISTENER, _QUEUED_LOGGER, _QUEUE_HANDLER
+    if _LISTENER is not None or os.getenv("JSONLOG_BACKGROUND", "true").lower() != "true":
+        return
+
+    # Pull in GCP/debug-file handlers now so they end up behind the queue too
+    if not _GCP_DEBUG_SETUP:
+        _setup_gcp_debug_logging()
+
+    target = logger or logging.getLogger()
+    handlers = [h for h in target.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+    if not handlers:
+        return
+
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    for h in handlers:
+        target.removeHandler(h)
+    _QUEUED_LOGGER, _QUEUE_HANDLER = target, logging.handlers.QueueHandler(q)
+    target.addHandler(_QUEUE_HANDLER)
+
+    _LISTENER = logging.handlers.QueueListener(q, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(stop_background_logging)
+
+
+def stop_background_logging() -> None:
+    """Flush queued records, stop the listener thread and restore the handlers."""
+    global _LISTENER, _QUEUED_LOGGER, _QUEUE_HANDLER
+    if _LISTENER is None:
+        return
+    _LISTENER.stop()
+    _QUEUED_LOGGER.removeHandler(_QUEUE_HANDLER)
+    for h in _LISTENER.handlers:
+        _QUEUED_LOGGER.addHandler(h)
+    _LISTENER = _QUEUED_LOGGER = _QUEUE_HANDLER = None
@@ -0,0 +1,303 @@
+# src/common/metrics.py
+"""
+In-process metrics registry exposed in the Prometheus text format (/metrics).
+
+Recording is a dict update under a per-metric lock, so instrumenting hot paths
+costs well under a microsecond. Gauges that mirror existing state (queue depth,
+active jobs) take a callback that is only evaluated when /metrics is scraped.
+
+Tools served by the MCP stdio subprocess (data.query, chart rendering) record
+into that process's registry. With forwarding enabled there, counter and
+histogram updates are also journaled, shipped back on each JSON-RPC response
+and merged into the HTTP process's registry by MCPClient.
+"""
+from __future__ import annotations
+import bisect, math, threading, time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Seconds; spans sub-10ms cache reads up to multi-minute Whisper / ffmpeg runs
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._registry: Optional[MetricsRegistry] = None
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _forward(self, key: LabelValues, value: float) -> None:
+        registry = self._registry
+        if registry is not None and registry._journal is not None:
+            registry._journal.append((self.name, key, value))
+
+    def _apply(self, key: LabelValues, value: float) -> None:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        self._apply(key, amount)
+        self._forward(key, amount)
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _apply(self, key: LabelValues, value: float) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+        # per label set: [count per bucket (+Inf last), sum, count]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        self._apply(key, value)
+        self._forward(key, value)
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: Any) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def _apply(self, key: LabelValues, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(s[0]), s[1], s[2])) for k, s in self._values.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                cumulative += n
+                le = f'le="{_fmt(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_fmt(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback: Optional[Callable[[], Any]] = None
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, fn: Callable[[], Any]) -> None:
+        """Compute the value at scrape time.
+
+        fn returns a number (unlabelled gauge) or a mapping from label-value
+        tuples to numbers, e.g. {("running",): 2, ("queued",): 0} for
+        labelnames ("state",).
+        """
+        self._callback = fn
+
+    def _render_samples(self) -> List[str]:
+        if self._callback is not None:
+            try:
+                result = self._callback()
+            except Exception:
+                return []  # a failing callback must not break the whole scrape
+            if isinstance(result, dict):
+                items = sorted((tuple(str(x) for x in k), float(v)) for k, v in result.items())
+            else:
+                items = [((), float(result))]
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._journal: Optional[List[Tuple[str, LabelValues, float]]] = None
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        metric._registry = self
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))  # type: ignore[return-value]
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))  # type: ignore[return-value]
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Every registered metric in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    # --- cross-process forwarding (MCP subprocess -> HTTP process) ---
+
+    def start_forwarding(self) -> None:
+        """Journal counter/histogram updates so they can be drained and shipped."""
+        self._journal = []
+
+    def drain_forwarded(self) -> List[List[Any]]:
+        """Updates recorded since the last drain, as JSON-serializable triples."""
+        journal = self._journal
+        if not journal:
+            return []
+        self._journal = []  # list swap is atomic; appends racing the swap land in the next drain
+        return [[name, list(key), value] for name, key, value in journal]
+
+    def merge(self, entries: Optional[Sequence[Sequence[Any]]]) -> None:
+        """Apply updates drained from another process's registry."""
+        for name, key, value in entries or ():
+            metric = self._metrics.get(name)
+            if metric is None or isinstance(metric, Gauge) or len(key) != len(metric.labelnames):
+                continue
+            metric._apply(tuple(str(k) for k in key), float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+PHASE_SECONDS = REGISTRY.histogram(
+    "presgen_phase_duration_seconds",
+    "Latency of pipeline phases (LLM, Imagen, Slides API, DuckDB query, chart render, Whisper, face detection, ffmpeg compose).",
+    ("pipeline", "phase", "status"),
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "presgen_cache_requests_total",
+    "Cache lookups by namespace and result (hit or miss).",
+    ("namespace", "result"),
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "presgen_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+)
+
+
+def observe_phase(pipeline: str, phase: str, seconds: float, status: str = "ok") -> None:
+    PHASE_SECONDS.observe(seconds, pipeline=pipeline, phase=phase, status=status)
+
+
+@contextmanager
+def time_phase(pipeline: str, phase: str) -> Iterator[None]:
+    """Observe the block's duration; status is "error" if it raised."""
+    start = time.perf_counter()
+    status = "error"
+    try:
+        yield
+        status = "ok"
+    finally:
+        observe_phase(pipeline, phase, time.perf_counter() - start, status)
+
+
+def record_cache_lookup(namespace: str, hit: bool) -> None:
+    # Namespaces like "data_plan/<dataset_id>" are collapsed to keep label cardinality bounded
+    CACHE_REQUESTS.inc(namespace=namespace.split("/", 1)[0], result="hit" if hit else "miss")
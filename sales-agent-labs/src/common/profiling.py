@@ -0,0 +1,200 @@
+# src/common/profiling.py
+"""
+Opt-in sampling profiler for long-running jobs.
+
+A daemon thread snapshots the job's thread stack every
+PRESGEN_PROFILE_INTERVAL_MS (default 10ms) with sys._current_frames() and
+counts identical stacks. Nothing is installed in the profiled thread (no
+sys.setprofile hook), so overhead is one stack walk per interval.
+
+Profiles are written next to the job's artifacts as
+/tmp/jobs/<job_id>/profile-<label>.folded in the collapsed-stack format
+("outer;inner;leaf <samples>" per line) read by flamegraph.pl, speedscope and
+inferno. Repeated runs under the same label (e.g. several data.query calls in
+one deck) are merged into one file.
+
+Enable per request with the endpoint's `profile` flag, or for every job of a
+kind with PRESGEN_PROFILE_JOBS=all or a comma list (e.g. "render,data_query").
+
+SamplingProfiler is the same class as in presgen-assess/src/common/profiling.py;
+the two services are deployed separately with their own `src` packages, so
+keep the copies identical (tests/test_profiling_unit.py checks it).
+"""
+from __future__ import annotations
+import contextvars, logging, os, re, sys, threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.common.jsonlog import jlog
+
+log = logging.getLogger("common.profiling")
+
+JOBS_ROOT = Path("/tmp/jobs")
+PROFILE_NAME_RE = re.compile(r"^profile-[\w.-]+\.folded$")
+_MAX_DEPTH = 200
+
+# (job_id, profiling enabled) for the job this code runs under; MCPClient
+# forwards it so tool calls made by a profiled job are profiled in the server
+_JOB: contextvars.ContextVar[Optional[Tuple[str, bool]]] = contextvars.ContextVar(
+    "presgen_profiled_job", default=None
+)
+
+
+def profiling_enabled(kind: str, requested: Optional[bool] = None) -> bool:
+    """An explicit request flag wins; otherwise PRESGEN_PROFILE_JOBS decides."""
+    if requested is not None:
+        return requested
+    setting = os.getenv("PRESGEN_PROFILE_JOBS", "").strip().lower()
+    if setting in ("", "0", "false", "off", "none"):
+        return False
+    if setting in ("1", "true", "on", "all"):
+        return True
+    return kind.lower() in {k.strip() for k in setting.split(",")}
+
+
+def current_job() -> Optional[Tuple[str, bool]]:
+    return _JOB.get()
+
+
+def profile_path(job_id: str, label: str) -> Path:
+    safe_label = re.sub(r"[^\w.-]", "_", label)
+    return JOBS_ROOT / job_id / f"profile-{safe_label}.folded"
+
+
+def list_profiles(job_id: str) -> List[str]:
+    """Profile file names written for a job (served by GET /jobs/{job_id}/profiles/{name})."""
+    job_dir = JOBS_ROOT / job_id
+    if not job_dir.is_dir():
+        return []
+    return sorted(p.name for p in job_dir.glob("profile-*.folded"))
+
+
+class SamplingProfiler:
+    """Samples thread stacks on a background thread and aggregates collapsed stacks.
+
+    thread_ids=None samples every thread except the sampler, with each stack
+    rooted at its thread name. ``include`` is checked before and after each
+    stack snapshot; if either check is False the sample is counted as skipped.
+    """
+
+    def __init__(
+        self,
+        thread_ids: Optional[Iterable[int]] = None,
+        interval: Optional[float] = None,
+        include: Optional[Callable[[], bool]] = None,
+    ):
+        self.thread_ids = set(thread_ids) if thread_ids is not None else None
+        self.interval = interval or _default_interval()
+        self.include = include
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.skipped = 0
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="job-profiler", daemon=True)
+
+    def start(self) -> "SamplingProfiler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def sample(self) -> None:
+        if self.include is not None and not self.include():
+            self.skipped += 1
+            return
+        frames = sys._current_frames()
+        if self.include is not None and not self.include():
+            self.skipped += 1  # switched away while the stacks were captured
+            return
+        me = threading.get_ident()
+        if self.thread_ids is None:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            targets = [(tid, names.get(tid, str(tid))) for tid in frames if tid != me]
+        else:
+            targets = [(tid, None) for tid in self.thread_ids if tid in frames]
+        for tid, thread_name in targets:
+            stack = self._collapse(frames[tid])
+            if thread_name is not None:
+                stack = f"{thread_name};{stack}"
+            self.samples[stack] += 1
+        self.sample_count += 1
+
+    def write_folded(self, path: Path) -> None:
+        """Write (merging with any existing profile at path) in collapsed-stack format."""
+        merged = Counter(self.samples)
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                stack, _, count = line.rpartition(" ")
+                if stack and count.isdigit():
+                    merged[stack] += int(count)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text("".join(f"{s} {n}\n" for s, n in sorted(merged.items())), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def _collapse(self, frame) -> str:
+        parts: List[str] = []
+        while frame is not None and len(parts) < _MAX_DEPTH:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = (
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                ).replace(";", ":")
+            parts.append(label)
+            frame = frame.f_back
+        return ";".join(reversed(parts))
+
+
+def _default_interval() -> float:
+    return int(os.getenv("PRESGEN_PROFILE_INTERVAL_MS", "10")) / 1000
+
+
+@contextmanager
+def profile_job(
+    job_id: Optional[str],
+    label: str,
+    *,
+    kind: Optional[str] = None,
+    enabled: Optional[bool] = None,
+    all_threads: bool = False,
+) -> Iterator[Optional[Path]]:
+    """Profile the enclosed block if requested; yields the profile path or None.
+
+    Samples the calling thread. Use all_threads=True for async phases whose
+    work is spread over the event loop and its executor threads.
+    """
+    active = bool(job_id) and profiling_enabled(kind or label, enabled)
+    token = _JOB.set((job_id, active)) if job_id else None
+    if not active:
+        try:
+            yield None
+        finally:
+            if token is not None:
+                _JOB.reset(token)
+        return
+
+    path = profile_path(job_id, label)
+    profiler = SamplingProfiler(None if all_threads else [threading.get_ident()]).start()
+    try:
+        yield path
+    finally:
+        profiler.stop()
+        _JOB.reset(token)
+        try:
+            profiler.write_folded(path)
+            jlog(log, logging.INFO, event="job_profile_written", job_id=job_id, label=label,
+                 path=str(path), samples=profiler.sample_count,
+                 interval_ms=round(profiler.interval * 1000, 1))
+        except OSError as e:
+            jlog(log, logging.WARNING, event="job_profile_write_failed", job_id=job_id,
+                 label=label, error=str(e))
@@ -0,0 +1,317 @@
+# src/common/tracing.py
+"""
+Lightweight span tracing across HTTP -> orchestrator -> MCP subprocess -> tool.
+
+Spans carry W3C trace-context ids, so a trace can be followed end to end:
+  - the current span lives in a contextvar (copied into pipeline worker threads)
+  - MCPClient sends it to the server as params["_meta"]["traceparent"]
+  - the MCP server parents each tool span on it and ships finished spans back
+    on the JSON-RPC response (the subprocess is terminated right after each
+    client session, so it never exports on its own)
+
+Export is off by default. Set PRESGEN_TRACE_EXPORTER=file to append spans as
+JSON lines to PRESGEN_TRACE_FILE, or =otlp to POST OTLP/HTTP JSON to
+OTEL_EXPORTER_OTLP_TRACES_ENDPOINT (or OTEL_EXPORTER_OTLP_ENDPOINT + /v1/traces).
+Spans are handed to a background thread; request paths never wait on export.
+"""
+from __future__ import annotations
+import atexit, contextvars, functools, json, logging, os, queue, random, re, threading, time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+log = logging.getLogger("common.tracing")
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+_OTLP_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    kind: str = "internal"  # internal | server | client
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    status: str = "ok"  # ok | error
+    error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "service": _SERVICE_NAME,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+_CURRENT: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("presgen_span", default=None)
+_SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "presgen")
+_FORWARD: Optional[List[Dict[str, Any]]] = None
+
+
+def _new_id(nbytes: int) -> str:
+    return f"{random.getrandbits(nbytes * 8):0{nbytes * 2}x}"
+
+
+def current_span() -> Optional[Span]:
+    return _CURRENT.get()
+
+
+def current_trace_id() -> Optional[str]:
+    span = _CURRENT.get()
+    return span.trace_id if span is not None else None
+
+
+def extract(traceparent: Optional[str]) -> Optional[Span]:
+    """Parent for spans continuing a remote trace, from a W3C traceparent value."""
+    m = _TRACEPARENT_RE.match((traceparent or "").strip().lower())
+    if not m:
+        return None
+    return Span(name="remote", trace_id=m.group(1), span_id=m.group(2))
+
+
+@contextmanager
+def start_span(
+    name: str, *, kind: str = "internal", parent: Optional[Span] = None, **attributes: Any
+) -> Iterator[Span]:
+    """Run the block inside a new span, a child of parent or of the current span."""
+    parent = parent if parent is not None else _CURRENT.get()
+    span = Span(
+        name=name,
+        trace_id=parent.trace_id if parent is not None else _new_id(16),
+        span_id=_new_id(8),
+        parent_id=parent.span_id if parent is not None else None,
+        kind=kind,
+        attributes={k: v for k, v in attributes.items() if v is not None},
+    )
+    token = _CURRENT.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.status = "error"
+        span.error = f"{type(e).__name__}: {e}"[:500]
+        raise
+    finally:
+        _CURRENT.reset(token)
+        span.end_ns = time.time_ns()
+        _finish(span)
+
+
+def traced(name: str) -> Callable:
+    """Decorator form of start_span for whole functions."""
+
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with start_span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def inject(carrier: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the current span's traceparent to carrier (headers, JSON-RPC _meta)."""
+    span = _CURRENT.get()
+    if span is not None:
+        carrier["traceparent"] = span.traceparent
+    return carrier
+
+
+# --- cross-process forwarding (MCP subprocess -> HTTP process) ---
+
+
+def start_forwarding(service_name: str) -> None:
+    """Collect finished spans for drain_forwarded() instead of exporting them here."""
+    global _FORWARD, _SERVICE_NAME
+    _SERVICE_NAME = service_name
+    _FORWARD = []
+
+
+def drain_forwarded() -> List[Dict[str, Any]]:
+    global _FORWARD
+    spans = _FORWARD
+    if not spans:
+        return []
+    _FORWARD = []
+    return spans
+
+
+def ingest(spans: Optional[Sequence[Dict[str, Any]]]) -> None:
+    """Export spans finished in another process (see drain_forwarded)."""
+    if not spans:
+        return
+    exporter = _get_exporter()
+    if exporter is not None:
+        for record in spans:
+            exporter.submit(record)
+
+
+def _finish(span: Span) -> None:
+    if _FORWARD is not None:
+        _FORWARD.append(span.to_dict())
+        return
+    exporter = _get_exporter()
+    if exporter is not None:
+        exporter.submit(span.to_dict())
+
+
+# --- export -------------------------------------------------------------------
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(records: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """OTLP/HTTP JSON payload (ExportTraceServiceRequest) for span records."""
+    by_service: Dict[str, List[Dict[str, Any]]] = {}
+    for r in records:
+        span: Dict[str, Any] = {
+            "traceId": r["trace_id"],
+            "spanId": r["span_id"],
+            "name": r["name"],
+            "kind": _OTLP_KINDS.get(r.get("kind"), 1),
+            "startTimeUnixNano": str(r["start_ns"]),
+            "endTimeUnixNano": str(r["end_ns"]),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in (r.get("attributes") or {}).items()],
+            "status": {"code": 2, "message": r.get("error") or ""} if r.get("status") == "error" else {"code": 1},
+        }
+        if r.get("parent_id"):
+            span["parentSpanId"] = r["parent_id"]
+        by_service.setdefault(r.get("service") or _SERVICE_NAME, []).append(span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+                "scopeSpans": [{"scope": {"name": "presgen.tracing"}, "spans": spans}],
+            }
+            for service, spans in by_service.items()
+        ]
+    }
+
+
+class SpanExporter:
+    """Batches finished spans on a daemon thread and writes them to a file or an OTLP endpoint."""
+
+    def __init__(
+        self,
+        kind: str,
+        *,
+        path: Optional[Path] = None,
+        endpoint: Optional[str] = None,
+        flush_secs: float = 1.0,
+        max_batch: int = 512,
+    ):
+        self.kind = kind
+        self.path = path
+        self.endpoint = endpoint
+        self.flush_secs = flush_secs
+        self.max_batch = max_batch
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: Dict[str, Any]) -> None:
+        self._q.put(record)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Export everything queued so far, then stop the thread."""
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Dict[str, Any]] = []
+            deadline = time.monotonic() + self.flush_secs
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._q.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if batch:
+                self._export(batch)
+            if self._stop.is_set() and self._q.empty():
+                return
+
+    def _export(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            if self.kind == "file":
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(r, default=str) + "\n" for r in batch))
+            else:
+                import httpx
+
+                r = httpx.post(self.endpoint, json=to_otlp(batch), timeout=5.0)
+                r.raise_for_status()
+        except Exception as e:  # tracing must never take the pipeline down
+            log.warning("Span export (%s) failed for %d spans: %s", self.kind, len(batch), e)
+
+
+_EXPORTER: Optional[SpanExporter] = None
+_EXPORTER_READY = False
+_EXPORTER_LOCK = threading.Lock()
+
+
+def _get_exporter() -> Optional[SpanExporter]:
+    """Exporter configured from the environment on first use (after .env is loaded)."""
+    global _EXPORTER, _EXPORTER_READY
+    if _EXPORTER_READY:
+        return _EXPORTER
+    with _EXPORTER_LOCK:
+        if not _EXPORTER_READY:
+            kind = os.getenv("PRESGEN_TRACE_EXPORTER", "none").lower()
+            flush_secs = float(os.getenv("PRESGEN_TRACE_FLUSH_SECS", "1.0"))
+            if kind == "file":
+                path = Path(os.getenv("PRESGEN_TRACE_FILE", "out/state/traces/spans.jsonl"))
+                _EXPORTER = SpanExporter("file", path=path, flush_secs=flush_secs)
+            elif kind == "otlp":
+                endpoint = os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT") or (
+                    os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318").rstrip("/") + "/v1/traces"
+                )
+                _EXPORTER = SpanExporter("otlp", endpoint=endpoint, flush_secs=flush_secs)
+            elif kind not in ("", "none", "off"):
+                log.warning("Unknown PRESGEN_TRACE_EXPORTER=%r; tracing export disabled", kind)
+            _EXPORTER_READY = True
+    return _EXPORTER
+
+
+def shutdown_tracing() -> None:
+    """Flush queued spans and stop the exporter; the next span re-reads the config."""
+    global _EXPORTER, _EXPORTER_READY
+    with _EXPORTER_LOCK:
+        exporter, _EXPORTER, _EXPORTER_READY = _EXPORTER, None, False
+    if exporter is not None:
+        exporter.shutdown()
+
+
+atexit.register(shutdown_tracing)
@@ -59,6 +59,12 @@ def resolve_dataset(hint: Optional[str]) -> Optional[str]:
     return None
 
 
+def dataset_version(ds_id: str) -> str:
+    """Changes whenever the dataset is (re-)ingested; used to key derived caches."""
+    meta = _load().get(ds_id) or {}
+    return f"{meta.get('hash', ds_id)}:{meta.get('created_at', 0)}"
+
+
 def parquet_path_for(ds_id: str, sheet: Optional[str]) -> pathlib.Path:
     cat = _load()
     meta = cat.get(ds_id) or {}
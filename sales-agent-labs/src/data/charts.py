@@ -0,0 +1,363 @@
+from __future__ import annotations
+import hashlib, json, logging, os, pathlib, threading, time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import matplotlib
+
+matplotlib.use("Agg")  # headless; must run before anything imports pyplot
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
+import pandas as pd
+
+from src.common.jsonlog import jlog
+from src.common.metrics import time_phase
+
+log = logging.getLogger("chart_render")
+
+CHART_CACHE_DIR = pathlib.Path("out/images/charts/_cache")
+
+# Everything that changes the pixels goes in here; bump "version" when the
+# drawing code changes so stale PNGs are not served from the cache.
+CHART_STYLE: Dict[str, Any] = {"version": 1, "figsize": (8, 4.5), "dpi": 150}
+
+_WORKERS = int(os.getenv("CHART_RENDER_WORKERS", "2"))
+
+# Cache bounds: PNGs older than the max age are removed, then the oldest
+# beyond the max count. Pruning runs at most once per interval.
+CACHE_MAX_FILES = int(os.getenv("CHART_CACHE_MAX_FILES", "500"))
+CACHE_MAX_AGE_SECS = float(os.getenv("CHART_CACHE_MAX_AGE_SECS", str(7 * 24 * 3600)))
+_PRUNE_INTERVAL_SECS = 60.0
+
+# One reusable Figure per chart type, per worker thread. Figures from the OO
+# API (no pyplot) are independent, so threads never share drawing state.
+_tls = threading.local()
+
+
+def chart_key(
+    df: pd.DataFrame, chart_type: str, style: Optional[Dict[str, Any]] = None
+) -> str:
+    """Content hash of result data + chart type + style."""
+    style = style or CHART_STYLE
+    h = hashlib.sha256()
+    h.update(f"chart|{chart_type}|{json.dumps(style, sort_keys=True)}|".encode("utf-8"))
+    h.update(json.dumps([[str(c), str(df[c].dtype)] for c in df.columns]).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _figure_for(kind: str, style: Dict[str, Any]) -> Figure:
+    figs = getattr(_tls, "figures", None)
+    if figs is None:
+        figs = _tls.figures = {}
+    fig = figs.get(kind)
+    if fig is None:
+        fig = figs[kind] = Figure(figsize=style["figsize"])
+    else:
+        fig.clear()
+    return fig
+
+
+def _title(col: Any) -> str:
+    return str(col).replace("_", " ").title()
+
+
+def _draw(
+    fig: Figure,
+    df: pd.DataFrame,
+    kind: str,
+    numeric_cols: List[str],
+    correlation: Optional[float],
+    req_id: Optional[str],
+) -> str:
+    """Draw the chart onto fig; returns the kind actually drawn (after fallbacks)."""
+    ax = fig.add_subplot(1, 1, 1)
+
+    if kind == "single_value_bar":
+        # Single aggregate value - create a simple bar chart
+        col = df.columns[0]
+        value = df.iloc[0, 0]
+        ax.bar([_title(col)], [value])
+        ax.set_ylabel("Value")
+        ax.set_title(f"{_title(col)}: {value:,.0f}")
+
+    elif kind == "single_col_bar":
+        # Multiple values in one column - use index as x-axis
+        col = df.columns[0]
+        ax.bar(range(len(df)), df[col])
+        ax.set_ylabel(_title(col))
+        ax.set_xlabel("Item")
+
+    elif kind == "line":
+        # Time series or date-based data
+        x = df.columns[0]
+        y = numeric_cols[0] if numeric_cols else df.columns[1]
+        ax.plot(df[x], df[y])
+        ax.set_xlabel(_title(x))
+        ax.set_ylabel(_title(y))
+
+    elif kind == "scatter":
+        # Scatter plot for relationship analysis (MVP)
+        if len(numeric_cols) >= 2:
+            x_col, y_col = numeric_cols[0], numeric_cols[1]
+            ax.scatter(df[x_col], df[y_col], alpha=0.6, s=50)
+            ax.set_xlabel(_title(x_col))
+            ax.set_ylabel(_title(y_col))
+
+            # Add trend line if correlation exists
+            if correlation is not None and abs(correlation) > 0.5:
+                z = np.polyfit(df[x_col], df[y_col], 1)
+                p = np.poly1d(z)
+                ax.plot(df[x_col], p(df[x_col]), "r--", alpha=0.8)
+        else:
+            # Fallback to bar chart if insufficient numeric columns
+            kind = "bar"
+
+    elif kind == "grouped_bar":
+        # Grouped bar chart for multi-dimensional analysis (MVP)
+        if len(df.columns) >= 3:
+            try:
+                cat_col = df.columns[0]  # Category (e.g., company)
+                group_col = df.columns[1]  # Group (e.g., day of week)
+                value_col = df.columns[2]  # Value (e.g., frequency)
+
+                df_pivot = df.pivot_table(
+                    values=value_col,
+                    index=cat_col,
+                    columns=group_col,
+                    aggfunc="sum",
+                    fill_value=0,
+                )
+                df_pivot.plot(kind="bar", ax=ax)
+                ax.set_xlabel(_title(cat_col))
+                ax.set_ylabel(_title(value_col))
+                ax.legend(title=_title(group_col))
+                ax.tick_params(axis="x", labelrotation=45)
+            except Exception as e:
+                jlog(
+                    log,
+                    logging.WARNING,
+                    event="grouped_bar_fallback",
+                    error=str(e),
+                    req_id=req_id,
+                )
+                fig.clear()
+                ax = fig.add_subplot(1, 1, 1)
+                kind = "bar"
+        else:
+            kind = "bar"
+
+    if kind == "bar":  # Default case and fallback
+        # Two columns: category and value
+        x = df.columns[0]
+        if numeric_cols:
+            y = numeric_cols[0]  # Use first numeric column
+        else:
+            y = df.columns[1] if len(df.columns) > 1 else df.columns[0]
+
+        ax.bar(df[x].astype(str), df[y])
+        ax.set_xlabel(_title(x))
+        ax.set_ylabel(_title(y))
+        for label in ax.get_xticklabels():
+            label.set_rotation(30)
+            label.set_horizontalalignment("right")
+
+    fig.tight_layout()
+    return kind
+
+
+def _render_job(
+    df: pd.DataFrame,
+    kind: str,
+    numeric_cols: List[str],
+    correlation: Optional[float],
+    path: pathlib.Path,
+    style: Dict[str, Any],
+    req_id: Optional[str],
+) -> pathlib.Path:
+    fig = _figure_for(kind, style)
+    drawn = _draw(fig, df, kind, numeric_cols, correlation, req_id)
+    # Write to a temp name and rename so readers never see a partial PNG
+    tmp = path.with_name(f".{path.stem}.{threading.get_ident()}.tmp.png")
+    try:
+        fig.savefig(tmp, dpi=style["dpi"], bbox_inches="tight")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)  # only still there if the write failed
+    if drawn != kind:
+        jlog(log, logging.INFO, event="chart_kind_fallback", requested=kind, drawn=drawn, req_id=req_id)
+    return path
+
+
+def _warm_worker(style: Dict[str, Any]) -> None:
+    """Initialize font caches and the Agg text path on this worker thread."""
+    fig = _figure_for("bar", style)
+    ax = fig.add_subplot(1, 1, 1)
+    ax.bar(["warm"], [1])
+    ax.set_title("warm")
+    FigureCanvasAgg(fig).draw()  # a bare Figure's base canvas draws nothing
+    fig.clear()
+
+
+class ChartRenderer:
+    """
+    Off-thread PNG renderer for data-question charts.
+
+    - Agg backend, OO Figure API (no shared pyplot state)
+    - a pre-warmed worker pool with one reusable figure per chart type per worker
+    - content-addressed PNG cache: identical data + chart type + style returns
+      the existing file without rendering; bounded by file count and age
+    """
+
+    def __init__(
+        self,
+        max_workers: int = _WORKERS,
+        cache_dir: pathlib.Path = CHART_CACHE_DIR,
+        style: Optional[Dict[str, Any]] = None,
+        max_files: int = CACHE_MAX_FILES,
+        max_age_secs: float = CACHE_MAX_AGE_SECS,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.cache_dir = cache_dir
+        self.style = dict(style or CHART_STYLE)
+        self.max_files = max(1, max_files)
+        self.max_age_secs = max_age_secs
+        self._last_prune = 0.0
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="chart-render"
+        )
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def warm(self) -> None:
+        """Spin up every worker and render a throwaway figure on each."""
+        for _ in range(self.max_workers):
+            self._pool.submit(_warm_worker, self.style)
+
+    def path_for(self, key: str) -> pathlib.Path:
+        return self.cache_dir / f"{key}.png"
+
+    def prune(self, force: bool = False) -> int:
+        """Evict cached PNGs past the age or count limit; returns files removed."""
+        now = time.time()
+        with self._lock:
+            if not force and now - self._last_prune < _PRUNE_INTERVAL_SECS:
+                return 0
+            self._last_prune = now
+            inflight = {self.path_for(key) for key in self._inflight}
+
+        entries = []
+        for path in self.cache_dir.glob("*.png"):
+            if path.name.startswith(".") or path in inflight:
+                continue  # temp files and renders being written
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+        expired = [e for e in entries if now - e[0] > self.max_age_secs]
+        kept = len(entries) - len(expired)
+        overflow = entries[len(expired):len(expired) + max(0, kept - self.max_files)]
+
+        removed = 0
+        for mtime, path in expired + overflow:
+            try:
+                if path.stat().st_mtime != mtime:
+                    continue  # served from the cache since we listed it
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+        if removed:
+            jlog(log, logging.INFO, event="chart_cache_pruned", removed=removed, remaining=len(entries) - removed)
+        return removed
+
+    def submit(
+        self,
+        df: pd.DataFrame,
+        kind: str,
+        *,
+        numeric_cols: List[str],
+        correlation: Optional[float] = None,
+        req_id: Optional[str] = None,
+    ) -> Future:
+        """Queue a render; cached PNGs and identical in-flight renders are shared."""
+        key = chart_key(df, kind, self.style)
+        path = self.path_for(key)
+        try:
+            os.utime(path)  # a hit makes the entry the newest, so prune() keeps it
+        except FileNotFoundError:
+            pass
+        else:
+            jlog(log, logging.INFO, event="chart_cache_hit", chart_type=kind, path=str(path), req_id=req_id)
+            done: Future = Future()
+            done.set_result(path)
+            return done
+
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is not None:
+                return fut
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fut = self._pool.submit(
+                _render_job, df, kind, numeric_cols, correlation, path, self.style, req_id
+            )
+            self._inflight[key] = fut
+
+        def _done(_f: Future, key: str = key) -> None:
+            with self._lock:
+                self._inflight.pop(key, None)
+            try:
+                self.prune()
+            except OSError as e:
+                jlog(log, logging.WARNING, event="chart_cache_prune_failed", error=str(e))
+
+        fut.add_done_callback(_done)
+        return fut
+
+    def render(
+        self,
+        df: pd.DataFrame,
+        kind: str,
+        *,
+        numeric_cols: List[str],
+        correlation: Optional[float] = None,
+        req_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> pathlib.Path:
+        """Blocking convenience wrapper around submit()."""
+        start = time.time()
+        with time_phase("data", "chart_render"):
+            path = self.submit(
+                df, kind, numeric_cols=numeric_cols, correlation=correlation, req_id=req_id
+            ).result(timeout=timeout)
+        jlog(
+            log,
+            logging.INFO,
+            event="chart_rendered",
+            chart_type=kind,
+            path=str(path),
+            chart_time_secs=time.time() - start,
+            req_id=req_id,
+        )
+        return path
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+_RENDERER: Optional[ChartRenderer] = None
+_RENDERER_LOCK = threading.Lock()
+
+
+def get_chart_renderer() -> ChartRenderer:
+    """Process-wide renderer; created and warmed on first use."""
+    global _RENDERER
+    if _RENDERER is None:
+        with _RENDERER_LOCK:
+            if _RENDERER is None:
+                r = ChartRenderer()
+                r.warm()
+                _RENDERER = r
+    return _RENDERER
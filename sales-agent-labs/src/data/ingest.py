@@ -4,6 +4,7 @@ from typing import Dict, Any, List, Tuple
 import pandas as pd
 
 from .catalog import sha256_of_file, register_dataset
+from .query_cache import invalidate_dataset
 
 
 def _coerce_types(df: pd.DataFrame) -> pd.DataFrame:
@@ -71,6 +72,7 @@ def ingest_file(raw_path: pathlib.Path, *, original_name: str) -> Dict[str, Any]
         preview_csv = _preview_csv(df)
 
     ds_id = register_dataset(file_name=original_name, sha256=sha, sheets=sheets)
+    invalidate_dataset(ds_id)  # cached plans/results refer to the old parquet
     return {
         "dataset_id": ds_id,
         "file_name": original_name,
@@ -0,0 +1,131 @@
+"""Two-level cache for natural-language data questions.
+
+  plan:   (dataset version, sheet, normalized question) -> {sql, intent, insights}
+  result: (dataset version, sheet, sql, row limit)      -> result frame (parquet)
+
+Entries live under out/state/cache/data_plan/<dataset_id>/ and
+out/state/cache/data_result/<dataset_id>/. The dataset version changes on every
+ingest, and ingest also drops both directories for the dataset. Callers handling one
+question should resolve the version once with dataset_version() and pass it
+as ``version=``; otherwise every key computation re-reads the catalog.
+"""
+
+from __future__ import annotations
+import hashlib, os, re, shutil, tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from src.common.cache import DEFAULT_STATE_DIR, get as cache_get, set as cache_set
+from src.common.metrics import record_cache_lookup
+from .catalog import dataset_version
+
+
+PLAN_NS = "data_plan"
+RESULT_NS = "data_result"
+
+
+def _sha256_hex(s: str) -> str:
+    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+
+
+def normalize_question(question: str) -> str:
+    q = re.sub(r"\s+", " ", question.strip().lower())
+    return q.rstrip("?.! ")
+
+
+def plan_key(
+    dataset_id: str, sheet: Optional[str], question: str, version: Optional[str] = None
+) -> str:
+    ver = version or dataset_version(dataset_id)
+    return _sha256_hex(f"plan|{ver}|{sheet or ''}|{normalize_question(question)}")
+
+
+def result_key(
+    dataset_id: str, sheet: Optional[str], sql: str, limit_rows: int, version: Optional[str] = None
+) -> str:
+    ver = version or dataset_version(dataset_id)
+    sql_norm = re.sub(r"\s+", " ", sql.strip().rstrip(";"))
+    return _sha256_hex(f"result|{ver}|{sheet or ''}|{limit_rows}|{sql_norm}")
+
+
+def get_plan(
+    dataset_id: str,
+    sheet: Optional[str],
+    question: str,
+    *,
+    root: Path = DEFAULT_STATE_DIR,
+    version: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    return cache_get(
+        f"{PLAN_NS}/{dataset_id}", plan_key(dataset_id, sheet, question, version), root=root
+    )
+
+
+def set_plan(
+    dataset_id: str,
+    sheet: Optional[str],
+    question: str,
+    plan: Dict[str, Any],
+    *,
+    root: Path = DEFAULT_STATE_DIR,
+    version: Optional[str] = None,
+) -> None:
+    cache_set(
+        f"{PLAN_NS}/{dataset_id}", plan_key(dataset_id, sheet, question, version), plan, root=root
+    )
+
+
+def _result_path(dataset_id: str, key: str, root: Path) -> Path:
+    return root / "cache" / RESULT_NS / dataset_id / f"{key}.parquet"
+
+
+def get_result(
+    dataset_id: str,
+    sheet: Optional[str],
+    sql: str,
+    limit_rows: int,
+    *,
+    root: Path = DEFAULT_STATE_DIR,
+    version: Optional[str] = None,
+) -> Optional[pd.DataFrame]:
+    path = _result_path(dataset_id, result_key(dataset_id, sheet, sql, limit_rows, version), root)
+    if not path.exists():
+        record_cache_lookup(RESULT_NS, hit=False)
+        return None
+    try:
+        df = pd.read_parquet(path)
+    except Exception:
+        df = None  # defensive: corrupt cache shouldn't crash pipeline
+    record_cache_lookup(RESULT_NS, hit=df is not None)
+    return df
+
+
+def set_result(
+    dataset_id: str,
+    sheet: Optional[str],
+    sql: str,
+    limit_rows: int,
+    df: pd.DataFrame,
+    *,
+    root: Path = DEFAULT_STATE_DIR,
+    version: Optional[str] = None,
+) -> None:
+    """Atomically write the result frame as parquet."""
+    final = _result_path(dataset_id, result_key(dataset_id, sheet, sql, limit_rows, version), root)
+    final.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmpname = tempfile.mkstemp(dir=str(final.parent), suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmpname, index=False)
+        os.replace(tmpname, final)  # atomic on POSIX
+    except Exception:
+        Path(tmpname).unlink(missing_ok=True)
+        raise
+
+
+def invalidate_dataset(dataset_id: str, *, root: Path = DEFAULT_STATE_DIR) -> None:
+    """Drop every cached plan and result for a dataset (called on ingest)."""
+    for ns in (PLAN_NS, RESULT_NS):
+        shutil.rmtree(root / "cache" / ns / dataset_id, ignore_errors=True)
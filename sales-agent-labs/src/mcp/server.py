@@ -6,6 +6,8 @@ import sys
 import logging
 from typing import Any, Dict
 from src.mcp.tools.data import data_query_tool
+from src.common import tracing
+from src.common.profiling import profile_job
 import base64
 from pathlib import Path
 
@@ -112,6 +114,26 @@ def _handle_request(req: Dict[str, Any]) -> Dict[str, Any]:
     if not method or method not in TOOLS:
         return _error(id_, -32601, f"Method not found: {method}")
 
+    # Continue the caller's trace (MCPClient sends it in params._meta)
+    meta = params.pop("_meta", None) or {}
+    with tracing.start_span(
+        f"tool {method}",
+        kind="server",
+        parent=tracing.extract(meta.get("traceparent")),
+        **{"rpc.method": method},
+    ) as span, profile_job(
+        meta.get("job_id"),
+        method.replace(".", "_"),
+        enabled=True if meta.get("profile") else None,
+    ):
+        resp = _run_tool(id_, method, params)
+        if "error" in resp:
+            span.status = "error"
+            span.error = resp["error"].get("message")
+        return resp
+
+
+def _run_tool(id_: Any, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
     tool_fn = TOOLS[method]
     try:
         result = tool_fn(params)
@@ -142,6 +164,27 @@ def serve_stdio() -> int:
     os.environ["MCP_SERVER_MODE"] = "true"
     
     log.info("MCP server starting, listening on stdin...")
+
+    # Log handlers run on a background thread so tool calls don't block on file I/O
+    from src.common.jsonlog import start_background_logging
+
+    start_background_logging()
+
+    # Tool timings and cache lookups recorded here ride back on each response
+    # and are merged into the HTTP process's /metrics by MCPClient.
+    from src.common.metrics import REGISTRY
+
+    REGISTRY.start_forwarding()
+    tracing.start_forwarding("presgen-mcp")
+
+    # Warm the chart render workers now so the first data question isn't
+    # paying for font cache and Agg initialization.
+    try:
+        from src.data.charts import get_chart_renderer
+
+        get_chart_renderer()
+    except Exception as e:
+        log.warning("Chart renderer warm-up failed: %s", e)
     
     try:
         while True:
@@ -163,6 +206,12 @@ def serve_stdio() -> int:
                 continue
 
             resp = _handle_request(req)
+            forwarded = REGISTRY.drain_forwarded()
+            if forwarded:
+                resp["metrics"] = forwarded
+            spans = tracing.drain_forwarded()
+            if spans:
+                resp["spans"] = spans
             try:
                 # Check for problematic objects before serialization
                 bytes_path = _contains_bytes(resp)
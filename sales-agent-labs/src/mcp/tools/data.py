@@ -1,12 +1,16 @@
 from __future__ import annotations
-import os, re, json, hashlib, pathlib, io, time, logging
+import os, re, json, pathlib, io, time, logging
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 import duckdb, pandas as pd
-import matplotlib.pyplot as plt
 
 from src.common.jsonlog import jlog
 from src.common.config import cfg
-from src.data.catalog import parquet_path_for
+from src.common.metrics import observe_phase
+from src.common.tracing import start_span
+from src.data.catalog import dataset_version, parquet_path_for
+from src.data.charts import get_chart_renderer
+from src.data import query_cache
 
 # --- LLM helpers (Gemini 2.0 Flash) ---
 _USE_LLM = True
@@ -308,26 +312,119 @@ def _sanitize_sql(sql: str) -> str:
     return s
 
 
-def _chart_png_path(dataset_id: str, question: str) -> pathlib.Path:
-    h = hashlib.sha256(question.encode("utf-8")).hexdigest()[:8]
-    p = pathlib.Path("out/images/charts") / dataset_id
-    p.mkdir(parents=True, exist_ok=True)
-    return p / f"{h}.png"
-
-
 def _to_table_md(df: pd.DataFrame, max_rows: int = 12, max_cols: int = 6) -> str:
     df = df.iloc[:max_rows, :max_cols]
     cols = list(df.columns)
     header = "| " + " | ".join(str(c) for c in cols) + " |"
     sep = "| " + " | ".join("---" for _ in cols) + " |"
     rows = []
-    for _, r in df.iterrows():
-        rows.append("| " + " | ".join(str(r[c]) for c in cols) + " |")
+    # itertuples keeps per-column dtypes and avoids building a Series per row
+    for r in df.itertuples(index=False, name=None):
+        rows.append("| " + " | ".join(str(v) for v in r) + " |")
     return "\n".join([header, sep] + rows)
 
 
+# Above this many distinct categories a bar or grouped-bar chart is unreadable
+MAX_CHART_CATEGORIES = 30
+
+
+@dataclass
+class ResultProfile:
+    """Column profile of a query result, computed once per question"""
+    rows: int
+    cols: List[str]
+    dtypes: Dict[str, str]
+    numeric_cols: List[str]
+    datetime_cols: List[str]
+    # Distinct non-null values per non-numeric column (the possible category axes)
+    cardinality: Dict[str, int] = field(default_factory=dict)
+    # Per numeric column: min, max, mean, first, last
+    numeric_stats: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    # Pearson correlation of the first two numeric columns, if any
+    correlation: Optional[float] = None
+    intent: str = "general"
+    chart_type: str = "table"
+
+
+def _profile_result(
+    df: pd.DataFrame,
+    question: str = "",
+    req_id: Optional[str] = None,
+    intent: Optional[str] = None,
+) -> ResultProfile:
+    """
+    Analyze a query result once and decide the chart type.
+
+    Chart selection, rendering, bullet generation and insights all read from
+    the returned profile instead of rescanning the frame.
+    """
+    log = logging.getLogger("result_profile")
+    profile_start = time.time()
+
+    cols = df.columns.tolist()
+    dtypes = {c: str(df[c].dtype) for c in cols}
+    numeric_cols = [c for c in cols if pd.api.types.is_numeric_dtype(df[c])]
+    datetime_cols = [
+        c
+        for c in cols
+        if pd.api.types.is_datetime64_any_dtype(df[c]) or "date" in dtypes[c].lower()
+    ]
+
+    cardinality: Dict[str, int] = {}
+    category_cols = [c for c in cols if c not in numeric_cols]
+    if category_cols and len(df):
+        cardinality = {c: int(n) for c, n in df[category_cols].nunique(dropna=True).items()}
+
+    numeric_stats: Dict[str, Dict[str, float]] = {}
+    correlation = None
+    if numeric_cols and len(df):
+        agg = df[numeric_cols].agg(["min", "max", "mean"])
+        first = df[numeric_cols].iloc[0]
+        last = df[numeric_cols].iloc[-1]
+        for c in numeric_cols:
+            numeric_stats[c] = {
+                "min": agg.at["min", c],
+                "max": agg.at["max", c],
+                "mean": agg.at["mean", c],
+                "first": first[c],
+                "last": last[c],
+            }
+        if len(numeric_cols) >= 2:
+            correlation = df[numeric_cols[0]].corr(df[numeric_cols[1]])
+
+    profile = ResultProfile(
+        rows=len(df),
+        cols=cols,
+        dtypes=dtypes,
+        numeric_cols=numeric_cols,
+        datetime_cols=datetime_cols,
+        cardinality=cardinality,
+        numeric_stats=numeric_stats,
+        correlation=correlation,
+        intent=intent
+        or (_classify_mvp_intent(question, req_id) if question else "general"),
+    )
+    profile.chart_type = _select_chart_type(profile, req_id)
+
+    jlog(
+        log,
+        logging.INFO,
+        event="result_profiled",
+        data_shape=f"{profile.rows}x{len(cols)}",
+        numeric_cols=len(numeric_cols),
+        datetime_cols=len(datetime_cols),
+        chart_type=profile.chart_type,
+        profile_time_secs=time.time() - profile_start,
+        req_id=req_id,
+    )
+    return profile
+
+
 def _choose_chart(
-    df: pd.DataFrame, question: str = "", req_id: Optional[str] = None
+    df: pd.DataFrame,
+    question: str = "",
+    req_id: Optional[str] = None,
+    profile: Optional[ResultProfile] = None,
 ) -> str:
     """
     Enhanced chart selection with intent-aware logic for MVP.
@@ -339,24 +436,25 @@ def _choose_chart(
         df: The DataFrame to visualize
         question: The original user question for intent classification
         req_id: Optional request ID for logging correlation
+        profile: Precomputed result profile; reused instead of rescanning df
 
     Returns:
         str: Chart type - single_value_bar, single_col_bar, line, bar, scatter, grouped_bar, or table
     """
-    log = logging.getLogger("chart_selection")
+    if profile is None:
+        profile = _profile_result(df, question, req_id)
+    return profile.chart_type
 
-    # Get intent classification for chart selection
-    intent = _classify_mvp_intent(question, req_id) if question else "general"
 
-    cols = df.columns.tolist()
-    rows = len(df)
-    numeric_cols = [c for c in cols if pd.api.types.is_numeric_dtype(df[c])]
-    datetime_cols = [
-        c
-        for c in cols
-        if pd.api.types.is_datetime64_any_dtype(df[c])
-        or "date" in str(df[c].dtype).lower()
-    ]
+def _select_chart_type(profile: ResultProfile, req_id: Optional[str] = None) -> str:
+    """Pick the chart type from a result profile (no access to the frame)."""
+    log = logging.getLogger("chart_selection")
+
+    intent = profile.intent
+    cols = profile.cols
+    rows = profile.rows
+    numeric_cols = profile.numeric_cols
+    datetime_cols = profile.datetime_cols
 
     chart_type = None
 
@@ -381,7 +479,11 @@ def _choose_chart(
             chart_type=chart_type,
             req_id=req_id,
         )
-    elif intent == "grouped" and len(cols) >= 3:
+    elif (
+        intent == "grouped"
+        and len(cols) >= 3
+        and max(profile.cardinality.get(c, 0) for c in cols[:2]) <= MAX_CHART_CATEGORIES
+    ):
         chart_type = "grouped_bar"  # For frequency by company and day
         jlog(
             log,
@@ -402,23 +504,15 @@ def _choose_chart(
             chart_type = "single_col_bar"
         # Two or more columns with multiple rows
         elif len(cols) >= 2 and rows > 1:
-            x = cols[0]
-            y = cols[1]
-
             # Check if we have a numeric column for Y-axis
             if len(numeric_cols) >= 1:
-                # Use first numeric column as Y if current Y isn't numeric
-                if not pd.api.types.is_numeric_dtype(df[y]) and numeric_cols:
-                    y = numeric_cols[0]
-
                 # line if datetime-like X, else bar
-                if (
-                    pd.api.types.is_datetime64_any_dtype(df[x])
-                    or "date" in str(df[x].dtype).lower()
-                ):
+                if cols[0] in datetime_cols:
                     chart_type = "line"
-                else:
+                elif profile.cardinality.get(cols[0], 0) <= MAX_CHART_CATEGORIES:
                     chart_type = "bar"
+                else:
+                    chart_type = "table"  # too many bars to read
         # Two columns with few rows (<=10) - still worth charting
         elif len(cols) == 2 and rows <= 10 and rows > 0:
             if len(numeric_cols) >= 1:
@@ -446,21 +540,22 @@ def _choose_chart(
 
 def _render_chart(
     df: pd.DataFrame,
-    path: pathlib.Path,
     question: str = "",
     req_id: Optional[str] = None,
+    profile: Optional[ResultProfile] = None,
 ) -> Optional[pathlib.Path]:
     """
     Render chart with enhanced chart types for MVP visualization.
 
-    Creates PNG chart file based on data structure and question intent.
-    Supports scatter plots and grouped bar charts for MVP requirements.
+    Hands the drawing to the shared chart renderer (pre-warmed Agg worker
+    pool with content-hash PNG caching), so identical results on the same
+    data return the existing PNG without re-rendering.
 
     Args:
         df: DataFrame to visualize
-        path: Output path for PNG file
         question: Original user question for chart type selection
         req_id: Optional request ID for logging correlation
+        profile: Precomputed result profile; reused instead of rescanning df
 
     Returns:
         pathlib.Path: Path to generated PNG file, or None if table fallback
@@ -468,7 +563,9 @@ def _render_chart(
     log = logging.getLogger("chart_render")
 
     chart_start = time.time()
-    kind = _choose_chart(df, question, req_id)
+    if profile is None:
+        profile = _profile_result(df, question, req_id)
+    kind = profile.chart_type
 
     if kind == "table":
         jlog(
@@ -480,129 +577,15 @@ def _render_chart(
         )
         return None
 
-    plt.figure(figsize=(8, 4.5))  # 16:9
-
     try:
-        if kind == "single_value_bar":
-            # Single aggregate value - create a simple bar chart
-            col = df.columns[0]
-            value = df.iloc[0, 0]
-            plt.bar([col.replace("_", " ").title()], [value])
-            plt.ylabel("Value")
-            plt.title(f'{col.replace("_", " ").title()}: {value:,.0f}')
-
-        elif kind == "single_col_bar":
-            # Multiple values in one column - use index as x-axis
-            col = df.columns[0]
-            plt.bar(range(len(df)), df[col])
-            plt.ylabel(col.replace("_", " ").title())
-            plt.xlabel("Item")
-
-        elif kind == "line":
-            # Time series or date-based data
-            x = df.columns[0]
-            numeric_cols = [
-                c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])
-            ]
-            y = numeric_cols[0] if numeric_cols else df.columns[1]
-            plt.plot(df[x], df[y])
-            plt.xlabel(x.replace("_", " ").title())
-            plt.ylabel(y.replace("_", " ").title())
-
-        elif kind == "scatter":
-            # Scatter plot for relationship analysis (MVP)
-            numeric_cols = [
-                c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])
-            ]
-            if len(numeric_cols) >= 2:
-                x_col, y_col = numeric_cols[0], numeric_cols[1]
-                plt.scatter(df[x_col], df[y_col], alpha=0.6, s=50)
-                plt.xlabel(x_col.replace("_", " ").title())
-                plt.ylabel(y_col.replace("_", " ").title())
-
-                # Add trend line if correlation exists
-                correlation = df[x_col].corr(df[y_col])
-                if abs(correlation) > 0.5:
-                    import numpy as np
-
-                    z = np.polyfit(df[x_col], df[y_col], 1)
-                    p = np.poly1d(z)
-                    plt.plot(df[x_col], p(df[x_col]), "r--", alpha=0.8)
-            else:
-                # Fallback to bar chart if insufficient numeric columns
-                kind = "bar"
-
-        elif kind == "grouped_bar":
-            # Grouped bar chart for multi-dimensional analysis (MVP)
-            if len(df.columns) >= 3:
-                try:
-                    # Attempt pivot table for grouped visualization
-                    cat_col = df.columns[0]  # Category (e.g., company)
-                    group_col = df.columns[1]  # Group (e.g., day of week)
-                    value_col = df.columns[2]  # Value (e.g., frequency)
-
-                    df_pivot = df.pivot_table(
-                        values=value_col,
-                        index=cat_col,
-                        columns=group_col,
-                        aggfunc="sum",
-                        fill_value=0,
-                    )
-                    df_pivot.plot(kind="bar", ax=plt.gca())
-                    plt.xlabel(cat_col.replace("_", " ").title())
-                    plt.ylabel(value_col.replace("_", " ").title())
-                    plt.legend(title=group_col.replace("_", " ").title())
-                    plt.xticks(rotation=45)
-                except Exception as e:
-                    jlog(
-                        log,
-                        logging.WARNING,
-                        event="grouped_bar_fallback",
-                        error=str(e),
-                        req_id=req_id,
-                    )
-                    # Fallback to regular bar chart
-                    kind = "bar"
-            else:
-                # Fallback to bar chart if insufficient columns
-                kind = "bar"
-
-        if kind == "bar":  # Default case and fallback
-            # Two columns: category and value
-            x = df.columns[0]
-            # Find the numeric column for Y-axis
-            numeric_cols = [
-                c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])
-            ]
-            if numeric_cols:
-                y = numeric_cols[0]  # Use first numeric column
-            else:
-                y = df.columns[1] if len(df.columns) > 1 else df.columns[0]
-
-            plt.bar(df[x].astype(str), df[y])
-            plt.xlabel(x.replace("_", " ").title())
-            plt.ylabel(y.replace("_", " ").title())
-            plt.xticks(rotation=30, ha="right")
-
-        plt.tight_layout()
-        plt.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close()
-
-        chart_time = time.time() - chart_start
-        jlog(
-            log,
-            logging.INFO,
-            event="chart_rendered",
-            chart_type=kind,
-            path=str(path),
-            chart_time_secs=chart_time,
+        return get_chart_renderer().render(
+            df,
+            kind,
+            numeric_cols=profile.numeric_cols,
+            correlation=profile.correlation,
             req_id=req_id,
         )
-
-        return path
-
     except Exception as e:
-        plt.close()  # Ensure we clean up the figure
         chart_time = time.time() - chart_start
         jlog(
             log,
@@ -616,10 +599,14 @@ def _render_chart(
         raise e
 
 
-def _insights(df: pd.DataFrame, question: str) -> List[str]:
+def _insights(
+    df: pd.DataFrame, question: str, profile: Optional[ResultProfile] = None
+) -> List[str]:
     # Minimal heuristic; if LLM available, summarize top rows concisely
+    rows = profile.rows if profile else len(df)
+    ncols = len(profile.cols) if profile else len(df.columns)
     if not _USE_LLM:
-        return [f"Answered: {question}", f"Rows: {len(df)}; Columns: {len(df.columns)}"]
+        return [f"Answered: {question}", f"Rows: {rows}; Columns: {ncols}"]
 
     try:
         llm_start_time = time.time()
@@ -649,7 +636,7 @@ CSV:
             re.sub(r"^[\-\*\d\.\s]+", "", ln).strip() for ln in text if ln.strip()
         ]
         bullets = [b for b in bullets if b][:4]
-        return bullets or [f"Result has {len(df)} rows."]
+        return bullets or [f"Result has {rows} rows."]
 
     except Exception as e:
         # Fallback to simple insights if LLM fails
@@ -659,12 +646,16 @@ CSV:
         log.warning(f"LLM insights fallback, error: {str(e)}")
         return [
             f"Answered: {question}",
-            f"Found {len(df)} results with {len(df.columns)} columns",
+            f"Found {rows} results with {ncols} columns",
         ]
 
 
 def _generate_mvp_bullets(
-    df: pd.DataFrame, question: str, chart_type: str, req_id: Optional[str] = None
+    df: pd.DataFrame,
+    question: str,
+    chart_type: str,
+    req_id: Optional[str] = None,
+    profile: Optional[ResultProfile] = None,
 ) -> List[str]:
     """
     Generate bullet point summaries for charts in MVP implementation.
@@ -677,6 +668,7 @@ def _generate_mvp_bullets(
         question: Original user question
         chart_type: Type of chart being rendered
         req_id: Optional request ID for logging correlation
+        profile: Precomputed result profile; reused instead of rescanning df
 
     Returns:
         List[str]: List of 2-3 bullet point summaries (without bullet symbols)
@@ -686,14 +678,18 @@ def _generate_mvp_bullets(
 
     try:
         bullet_start = time.time()
-        numeric_cols = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+        if profile is None:
+            profile = _profile_result(df, question, req_id)
+        numeric_cols = profile.numeric_cols
+        stats = profile.numeric_stats
+        rows = profile.rows
 
         if chart_type == "line" and len(numeric_cols) >= 1:
             # Trend analysis for time series
             col = numeric_cols[0]
-            if len(df) >= 2:
-                first_val = df[col].iloc[0] if len(df) > 0 else 0
-                last_val = df[col].iloc[-1] if len(df) > 0 else 0
+            if rows >= 2:
+                first_val = stats[col]["first"]
+                last_val = stats[col]["last"]
                 if first_val > 0:
                     change_pct = ((last_val - first_val) / first_val) * 100
                     if change_pct > 10:
@@ -711,8 +707,8 @@ def _generate_mvp_bullets(
                 else:
                     bullets.append("Trend analysis shows period-over-period changes")
 
-            peak_val = df[col].max()
-            min_val = df[col].min()
+            peak_val = stats[col]["max"]
+            min_val = stats[col]["min"]
             bullets.append(
                 f"Peak value reached {peak_val:,.0f}, minimum was {min_val:,.0f}"
             )
@@ -720,7 +716,7 @@ def _generate_mvp_bullets(
         elif chart_type == "scatter" and len(numeric_cols) >= 2:
             # Relationship analysis for correlation
             x_col, y_col = numeric_cols[0], numeric_cols[1]
-            correlation = df[x_col].corr(df[y_col])
+            correlation = profile.correlation
 
             if abs(correlation) > 0.7:
                 strength = "strong"
@@ -743,15 +739,15 @@ def _generate_mvp_bullets(
             # Ranking and comparison analysis
             if len(numeric_cols) >= 1:
                 col = numeric_cols[0]
-                top_val = df[col].max()
+                top_val = stats[col]["max"]
                 bullets.append(f"Highest value shown: {top_val:,.0f}")
 
-                if len(df) > 1:
-                    avg_val = df[col].mean()
+                if rows > 1:
+                    avg_val = stats[col]["mean"]
                     bullets.append(f"Average across all categories: {avg_val:,.0f}")
 
                     # Calculate spread for comparison context
-                    min_val = df[col].min()
+                    min_val = stats[col]["min"]
                     if min_val > 0:
                         spread_ratio = top_val / min_val
                         if spread_ratio > 5:
@@ -761,13 +757,13 @@ def _generate_mvp_bullets(
 
         elif chart_type == "single_value_bar":
             # Single metric results
-            if len(df) > 0 and len(numeric_cols) >= 1:
-                value = df[numeric_cols[0]].iloc[0]
+            if rows > 0 and len(numeric_cols) >= 1:
+                value = stats[numeric_cols[0]]["first"]
                 bullets.append(f"Single metric result: {value:,.0f}")
 
         # Always add data scope context
         bullets.append(
-            f"Analysis based on {len(df)} data point{'s' if len(df) != 1 else ''}"
+            f"Analysis based on {rows} data point{'s' if rows != 1 else ''}"
         )
 
         bullet_time = time.time() - bullet_start
@@ -804,7 +800,7 @@ def _generate_mvp_bullets(
 
 def data_query_tool(params: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Params: {dataset_id, question, sheet?, limit_rows?, req_id?}
+    Params: {dataset_id, question, sheet?, limit_rows?, req_id?, use_cache?}
     """
     from src.common.jsonlog import jlog
     import logging
@@ -816,6 +812,7 @@ def data_query_tool(params: Dict[str, Any]) -> Dict[str, Any]:
     sheet = params.get("sheet")
     limit_rows = int(params.get("limit_rows") or 100_000)
     req_id = params.get("req_id")  # Accept req_id from orchestrator
+    use_cache = params.get("use_cache", True) is not False
 
     if not dataset_id or not question:
         raise ValueError("dataset_id and question are required")
@@ -832,60 +829,93 @@ def data_query_tool(params: Dict[str, Any]) -> Dict[str, Any]:
             req_id=req_id,
         )
 
-        # Phase 1: Load data
-        load_start = time.time()
-        pq = parquet_path_for(dataset_id, sheet)
-        df = pd.read_parquet(pq)
-        cols = [{"name": c, "dtype": str(df[c].dtype)} for c in df.columns]
-        load_time = time.time() - load_start
+        # Phase 0: Query-plan cache (dataset version + normalized question).
+        # The version is read from the catalog once and reused for every key.
+        version = dataset_version(dataset_id) if use_cache else None
+        plan = query_cache.get_plan(dataset_id, sheet, question, version=version) if use_cache else None
+        if plan:
+            jlog(log, logging.INFO, event="cache_hit", layer="data.plan", req_id=req_id)
 
-        jlog(
-            log,
-            logging.INFO,
-            event="data_loaded",
-            rows=len(df),
-            columns=len(df.columns),
-            load_time_secs=load_time,
-            req_id=req_id,
-        )
+        df: Optional[pd.DataFrame] = None
 
-        # Phase 2: Generate SQL
-        sql_start = time.time()
-        sql = _nl2sql(question, cols)
-        sql = _sanitize_sql(sql)
-        sql_gen_time = time.time() - sql_start
+        def _load_df() -> pd.DataFrame:
+            load_start = time.time()
+            with start_span("data.load_parquet", dataset_id=dataset_id):
+                frame = pd.read_parquet(parquet_path_for(dataset_id, sheet))
+            jlog(
+                log,
+                logging.INFO,
+                event="data_loaded",
+                rows=len(frame),
+                columns=len(frame.columns),
+                load_time_secs=time.time() - load_start,
+                req_id=req_id,
+            )
+            return frame
 
-        jlog(
-            log,
-            logging.INFO,
-            event="sql_generated",
-            sql=sql[:200],
-            sql_gen_time_secs=sql_gen_time,
-            req_id=req_id,
-        )
+        # Phase 1-2: Load data and generate SQL (skipped on plan hit)
+        if plan:
+            sql = plan["sql"]
+        else:
+            df = _load_df()
+            cols = [{"name": c, "dtype": str(df[c].dtype)} for c in df.columns]
+
+            sql_start = time.time()
+            with start_span("data.nl2sql"):
+                sql = _nl2sql(question, cols)
+                sql = _sanitize_sql(sql)
+            sql_gen_time = time.time() - sql_start
+            observe_phase("data", "llm_sql", sql_gen_time)
 
-        # Phase 3: Execute query
-        query_start = time.time()
-        con = duckdb.connect()
-        con.register("t", df)
-        try:
-            con.execute("EXPLAIN " + sql)
-        except Exception as e:
             jlog(
                 log,
-                logging.WARNING,
-                event="sql_validation_failed",
-                sql=sql,
-                error=str(e),
+                logging.INFO,
+                event="sql_generated",
+                sql=sql[:200],
+                sql_gen_time_secs=sql_gen_time,
                 req_id=req_id,
             )
-            # Try a safer fallback query
-            sql = f"SELECT * FROM t LIMIT {min(50, limit_rows)}"
-            jlog(log, logging.INFO, event="sql_fallback", sql=sql, req_id=req_id)
 
-        out_df = con.execute(sql).fetch_df()
-        if len(out_df) > limit_rows:
-            out_df = out_df.head(limit_rows)
+        # Phase 3: Execute query (result cache keyed by dataset version + SQL)
+        query_start = time.time()
+        out_df = (
+            query_cache.get_result(dataset_id, sheet, sql, limit_rows, version=version)
+            if use_cache else None
+        )
+        if out_df is not None:
+            jlog(log, logging.INFO, event="cache_hit", layer="data.result", req_id=req_id)
+        else:
+            if df is None:
+                df = _load_df()
+            duckdb_start = time.time()
+            con = duckdb.connect()
+            con.register("t", df)
+            try:
+                con.execute("EXPLAIN " + sql)
+            except Exception as e:
+                jlog(
+                    log,
+                    logging.WARNING,
+                    event="sql_validation_failed",
+                    sql=sql,
+                    error=str(e),
+                    req_id=req_id,
+                )
+                # Try a safer fallback query
+                sql = f"SELECT * FROM t LIMIT {min(50, limit_rows)}"
+                jlog(log, logging.INFO, event="sql_fallback", sql=sql, req_id=req_id)
+
+            with start_span("data.duckdb_query"):
+                out_df = con.execute(sql).fetch_df()
+            observe_phase("data", "duckdb_query", time.time() - duckdb_start)
+            if len(out_df) > limit_rows:
+                out_df = out_df.head(limit_rows)
+            if use_cache:
+                try:
+                    query_cache.set_result(dataset_id, sheet, sql, limit_rows, out_df, version=version)
+                    jlog(log, logging.INFO, event="cache_miss_store", layer="data.result", req_id=req_id)
+                except Exception as e:
+                    jlog(log, logging.WARNING, event="cache_store_failed", layer="data.result", error=str(e), req_id=req_id)
         query_time = time.time() - query_start
 
         jlog(
@@ -906,11 +936,16 @@ def data_query_tool(params: Dict[str, Any]) -> Dict[str, Any]:
             req_id=req_id,
         )
 
+        # Phase 3.5: Profile the result once; every later phase reads from it
+        profile = _profile_result(
+            out_df, question, req_id, intent=plan.get("intent") if plan else None
+        )
+
         # Phase 4: Generate chart
         chart_start = time.time()
-        png_path = _chart_png_path(dataset_id, question)
         try:
-            rendered = _render_chart(out_df, png_path, question, req_id)
+            with start_span("data.chart_render"):
+                rendered = _render_chart(out_df, question, req_id, profile)
             chart_time = time.time() - chart_start
             jlog(
                 log,
@@ -937,10 +972,10 @@ def data_query_tool(params: Dict[str, Any]) -> Dict[str, Any]:
         if rendered:  # Only generate bullets if chart was successfully created
             try:
                 bullet_start = time.time()
-                chart_type = _choose_chart(
-                    out_df, question, req_id
-                )  # Get chart type for bullet generation
-                bullets = _generate_mvp_bullets(out_df, question, chart_type, req_id)
+                with start_span("data.bullets"):
+                    bullets = _generate_mvp_bullets(
+                        out_df, question, profile.chart_type, req_id, profile
+                    )
                 bullet_time = time.time() - bullet_start
                 jlog(
                     log,
@@ -966,8 +1001,12 @@ def data_query_tool(params: Dict[str, Any]) -> Dict[str, Any]:
         table_start = time.time()
         table_md = _to_table_md(out_df)
 
+        insights_ok = True
         try:
-            insights = _insights(out_df, question)
+            if plan and plan.get("insights"):
+                insights = plan["insights"]
+            else:
+                insights = _insights(out_df, question, profile)
             insights_time = time.time() - table_start
         except Exception as e:
             insights_time = time.time() - table_start
@@ -980,11 +1019,26 @@ def data_query_tool(params: Dict[str, Any]) -> Dict[str, Any]:
                 req_id=req_id,
             )
             insights = [f"Analysis of {question}", f"Found {len(out_df)} results"]
+            insights_ok = False
+
+        if use_cache and not plan:
+            query_cache.set_plan(
+                dataset_id,
+                sheet,
+                question,
+                {
+                    "sql": sql,
+                    "intent": profile.intent,
+                    "insights": insights if insights_ok else None,
+                },
+                version=version,
+            )
+            jlog(log, logging.INFO, event="cache_miss_store", layer="data.plan", req_id=req_id)
 
         total_time = time.time() - start_time
 
-        # Get chart type for result metadata
-        chart_type = _choose_chart(out_df, question, req_id) if rendered else None
+        # Chart type for result metadata (already decided by the profile)
+        chart_type = profile.chart_type if rendered else None
 
         result = {
             "chart_png_path": str(rendered) if rendered else None,
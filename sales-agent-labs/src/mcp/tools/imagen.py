@@ -125,6 +125,7 @@ from vertexai.preview.vision_models import ImageGenerationModel
 from ..schemas import GenerateImageParams, GenerateImageResult  # repo schemas
 from src.agent.slides_google import upload_image_to_drive
 from src.common.config import cfg
+from src.common.tracing import start_span
 from google.api_core import exceptions as gexc  # we'll use this in Fix 2 as well
 
 
@@ -396,7 +397,8 @@ def image_generate_tool(params: dict) -> dict:
         )
         return _call_generate_images_resilient(model, base)
 
-    result = _backoff_retry(_gen)
+    with start_span("imagen.generate", model=model_name, width=width, height=height):
+        result = _backoff_retry(_gen)
 
     # Persist locally
     out_dir = pathlib.Path("out/images")
@@ -411,7 +413,8 @@ def image_generate_tool(params: dict) -> dict:
     # Optional: upload to Drive (non-fatal if it fails)
     if getattr(p, "return_drive_link", False):
         try:
-            file_id, public_url = upload_image_to_drive(str(path), make_public=True)
+            with start_span("drive.upload_image"):
+                file_id, public_url = upload_image_to_drive(str(path), make_public=True)
             out.drive_file_id = file_id
             out.url = public_url
         except HttpError as e:
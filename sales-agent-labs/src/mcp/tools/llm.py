@@ -14,6 +14,7 @@ from googleapiclient.errors import HttpError
 from ..schemas import SummarizeParams, SummarizeResult
 from src.common.config import cfg
 from src.common.jsonlog import jlog
+from src.common.tracing import start_span
 from src.agent.prompts import MULTI_SLIDE_SYSTEM_PROMPT
 
 log = logging.getLogger("mcp.tools.llm")
@@ -85,7 +86,8 @@ def _retry_json_validate(
     last_err: Exception | None = None
     for i in range(attempts):
         try:
-            raw = _call_gemini_once(p)
+            with start_span("llm.gemini_generate", attempt=i + 1):
+                raw = _call_gemini_once(p)
             res = SummarizeResult.model_validate(raw)
             # Optional: Trim script length if it exceeds the max
             for section in res.sections:
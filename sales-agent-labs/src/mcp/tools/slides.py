@@ -12,11 +12,12 @@ from src.agent.slides_google import (
     create_presentation,
     create_main_slide_with_content,
     delete_default_slide,
-    _load_credentials,
+    _credentials,
     _drive_public_download_url,
 )
 from src.common.idempotency import load_cache, save_cache
 from src.common.jsonlog import jlog
+from src.common.tracing import start_span
 
 log = logging.getLogger("mcp.tools.slides")
 
@@ -172,7 +173,7 @@ def slides_create_tool(params: dict) -> dict:
         ).model_dump(mode="json")
 
     # 2) Ensure credentials/scopes (no-op if using ADC for everything)
-    _ = _load_credentials()
+    _ = _credentials()
 
     # 3) Deck: append or create
     pres_id: str
@@ -192,7 +193,8 @@ def slides_create_tool(params: dict) -> dict:
         )
     else:
         # Create new deck
-        ret = _backoff(lambda: create_presentation(_clamp_title(p.title, p.subtitle)))
+        with start_span("slides.create_presentation"):
+            ret = _backoff(lambda: create_presentation(_clamp_title(p.title, p.subtitle)))
         pres_id, url = _normalize_create_presentation_ret(ret)
         jlog(
             log,
@@ -241,7 +243,8 @@ def slides_create_tool(params: dict) -> dict:
         try:
             # Import here to avoid circular import after removing from top
             from src.agent.slides_google import upload_image_to_drive
-            file_id, public_url = _backoff(lambda: upload_image_to_drive(val, make_public=p.share_image_public))  # type: ignore[arg-type]
+            with start_span("drive.upload_image"):
+                file_id, public_url = _backoff(lambda: upload_image_to_drive(val, make_public=p.share_image_public))  # type: ignore[arg-type]
             upload_duration = time.time() - start_time
             jlog(log, logging.INFO, tool="slides.create", event="drive_upload_complete", 
                  file_id=file_id, duration_secs=upload_duration, req_id=p.client_request_id)
@@ -290,16 +293,17 @@ def slides_create_tool(params: dict) -> dict:
     slide_start_time = time.time()
     
     try:
-        slide_id = _backoff(
-            lambda: create_main_slide_with_content(
-                presentation_id=pres_id,
-                title=p.title,
-                subtitle=p.subtitle,
-                bullets=bullets,
-                image_url=image_url,
-                script=script_text,
+        with start_span("slides.create_slide", presentation_id=pres_id, has_image=bool(image_url)):
+            slide_id = _backoff(
+                lambda: create_main_slide_with_content(
+                    presentation_id=pres_id,
+                    title=p.title,
+                    subtitle=p.subtitle,
+                    bullets=bullets,
+                    image_url=image_url,
+                    script=script_text,
+                )
             )
-        )
         slide_duration = time.time() - slide_start_time
         jlog(log, logging.INFO, tool="slides.create", event="slides_api_complete", 
              slide_id=slide_id, duration_secs=slide_duration, req_id=p.client_request_id)
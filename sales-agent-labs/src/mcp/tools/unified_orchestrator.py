@@ -13,6 +13,7 @@ from dataclasses import dataclass
 
 from src.presgen_training.avatar_generator import AvatarGenerator
 from src.common.jsonlog import jlog
+from src.common.metrics import observe_phase
 
 log = logging.getLogger("unified_orchestrator")
 
@@ -537,12 +538,15 @@ class UnifiedOrchestrator:
                  video_duration=video_duration)
             
             # Execute FFmpeg with enhanced composition
+            ffmpeg_start = time.time()
             result = subprocess.run(
                 ffmpeg_cmd, 
                 capture_output=True, 
                 text=True, 
                 timeout=120
             )
+            observe_phase("training", "ffmpeg_compose", time.time() - ffmpeg_start,
+                          status="ok" if result.returncode == 0 else "error")
             
             if result.returncode == 0:
                 jlog(log, logging.INFO,
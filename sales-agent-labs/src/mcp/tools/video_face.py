@@ -14,6 +14,7 @@ from dataclasses import dataclass
 
 from src.mcp.tools.context7 import context7_client
 from src.common.jsonlog import jlog
+from src.common.metrics import observe_phase
 
 log = logging.getLogger("video_face")
 
@@ -95,6 +96,7 @@ class VideoAgent:
             confidence = self._calculate_confidence(detections)
             
             detection_time = time.time() - start_time
+            observe_phase("video", "face_detection", detection_time)
             
             result = FaceDetectionResult(
                 success=True,
@@ -117,6 +119,7 @@ class VideoAgent:
             
         except Exception as e:
             detection_time = time.time() - start_time
+            observe_phase("video", "face_detection", detection_time, status="error")
             error_msg = f"Video processing failed: {str(e)}"
             
             jlog(log, logging.ERROR,
@@ -12,11 +12,51 @@ import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 from src.common.jsonlog import jlog
+from src.common.metrics import observe_phase
 
 log = logging.getLogger("video_phase3")
 
+# "overlay" (pre-rendered transparent PNG states) or "drawtext" (legacy)
+COMPOSITION_MODE = os.getenv("VIDEO_COMPOSITION_MODE", "overlay").lower()
+
+# x264 settings per speed profile; overridable per job via config["speed_profile"]
+SPEED_PROFILE = os.getenv("VIDEO_SPEED_PROFILE", "balanced").lower()
+_CPUS = os.cpu_count() or 2
+SPEED_PROFILES: Dict[str, Dict[str, Any]] = {
+    "fast": {"preset": "veryfast", "crf": 24, "threads": 0},               # all cores
+    "balanced": {"preset": "faster", "crf": 23, "threads": max(1, _CPUS - 1)},  # leave a core for the API
+    "quality": {"preset": "medium", "crf": 23, "threads": max(1, _CPUS - 1)},
+}
+
+# Audio codecs that are stream-copied into the MP4 output; anything else
+# (pcm_*, vorbis, flac from .mov/.avi/.mkv uploads) is re-encoded to AAC
+MP4_AUDIO_CODECS = {"aac", "mp3"}
+
+OVERLAY_FONT_FILE = "/System/Library/Fonts/Helvetica.ttc"
+_OVERLAY_FONT_CANDIDATES = [
+    OVERLAY_FONT_FILE,
+    "/Library/Fonts/Arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+]
+
+
+@lru_cache(maxsize=8)
+def _overlay_font(size: int):
+    """Pillow font matching the drawtext fontfile, with portable fallbacks"""
+    from PIL import ImageFont
+    
+    for candidate in _OVERLAY_FONT_CANDIDATES:
+        if os.path.exists(candidate):
+            try:
+                return ImageFont.truetype(candidate, size)
+            except OSError:
+                continue
+    return ImageFont.load_default(size=size)
+
 
 @dataclass
 class CompositionResult:
@@ -37,6 +77,7 @@ class Phase3Orchestrator:
         self.output_dir = self.job_dir / "output"
         self.output_dir.mkdir(exist_ok=True)
         self._provided_job_data = job_data  # Store provided job data
+        self._source_metadata: Optional[Dict[str, Any]] = None  # raw video probe, once per job
         
     def compose_final_video(self) -> Dict[str, Any]:
         """
@@ -304,19 +345,19 @@ class Phase3Orchestrator:
             return None
     
     def _get_actual_video_duration(self, job_data: Dict[str, Any]) -> float:
-        """Get actual video duration using ffprobe (most reliable method)"""
-        # ALWAYS use ffprobe for accurate duration - job metadata can be wrong
+        """Get actual video duration from the raw video (phase 1 probe or ffprobe)"""
+        # Measured from the file itself - the mock job metadata can be wrong
         try:
             raw_video_path = self.job_dir / "raw_video.mp4"
             if raw_video_path.exists():
-                metadata = self._get_video_metadata(raw_video_path)
-                if metadata and "duration" in metadata:
+                metadata = self._get_source_metadata(raw_video_path)
+                if metadata and metadata.get("duration"):
                     duration = metadata["duration"]
                     jlog(log, logging.INFO,
                          event="video_duration_from_ffprobe",
                          job_id=self.job_id,
                          duration=duration,
-                         source="ffprobe_direct")
+                         source="source_metadata")
                     return float(duration)
         except Exception as e:
             jlog(log, logging.WARNING,
@@ -361,12 +402,15 @@ class Phase3Orchestrator:
                  input_video=raw_video)
             
             # Execute ffmpeg command
+            ffmpeg_start = time.time()
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
                 timeout=300  # 5 minute timeout
             )
+            observe_phase("video", "ffmpeg_compose", time.time() - ffmpeg_start,
+                          status="ok" if result.returncode == 0 else "error")
             
             if result.returncode != 0:
                 jlog(log, logging.ERROR,
@@ -396,6 +440,7 @@ class Phase3Orchestrator:
             return output_path
             
         except subprocess.TimeoutExpired:
+            observe_phase("video", "ffmpeg_compose", time.time() - ffmpeg_start, status="timeout")
             jlog(log, logging.ERROR,
                  event="ffmpeg_timeout",
                  job_id=self.job_id)
@@ -411,35 +456,138 @@ class Phase3Orchestrator:
                                         raw_video: str, 
                                         slide_timeline: List[Dict[str, Any]],
                                         output_path: Path) -> List[str]:
-        """Build simplified ffmpeg command for full-screen video with right-side highlights rectangle"""
+        """Build ffmpeg command for full-screen video with right-side highlights rectangle.
+
+        Default mode renders the overlay layer once as a handful of transparent
+        PNGs (one per distinct on-screen state) and composites them with timed
+        ``overlay`` filters; AAC/MP3 audio is stream-copied. Set
+        VIDEO_COMPOSITION_MODE=drawtext for the legacy per-frame drawtext chain.
+        """
         
-        # Get video dimensions for fixed coordinate calculation
-        video_metadata = self._get_video_metadata(Path(raw_video))
-        video_width = video_metadata.get("width", 1280)  # Default fallback
-        video_height = video_metadata.get("height", 720)  # Default fallback
+        # Dimensions come from the phase 1 probe when available (probed at most once)
+        video_metadata = self._get_source_metadata(Path(raw_video))
+        video_width = video_metadata.get("width") or 1280  # Default fallback
+        video_height = video_metadata.get("height") or 720  # Default fallback
+        
+        layout = self._build_overlay_layout(slide_timeline, video_width, video_height)
+        if not layout:
+            raise Exception("Failed to generate overlay layout")
+        
+        encode = self._encode_settings()
+        audio_args = self._audio_args(video_metadata)
+        
+        if COMPOSITION_MODE != "drawtext":
+            try:
+                states = self._render_overlay_states(layout, video_width, video_height)
+                cmd = ["ffmpeg", "-y", "-i", raw_video]
+                filter_parts = []
+                current = "0:v"
+                for i, state in enumerate(states, 1):
+                    cmd += ["-i", state["path"]]
+                    label = "vout" if i == len(states) else f"v{i}"
+                    filter_parts.append(
+                        f"[{current}][{i}:v]overlay=0:0:enable='{state['enable']}'[{label}]"
+                    )
+                    current = label
+                cmd += [
+                    "-filter_complex", ";".join(filter_parts),
+                    "-map", "[vout]", "-map", "0:a?",
+                    # Output option: before an -i it would only set decoder threads
+                    "-threads", str(encode["threads"]),
+                    "-c:v", "libx264",
+                    "-preset", encode["preset"],
+                    "-crf", str(encode["crf"]),
+                    *audio_args,
+                    "-movflags", "+faststart",
+                    str(output_path)
+                ]
+                
+                jlog(log, logging.INFO,
+                     event="overlay_composition_planned",
+                     job_id=self.job_id,
+                     overlay_states=len(states),
+                     speed_profile=encode["profile"],
+                     preset=encode["preset"],
+                     audio=audio_args[1])
+                return cmd
+            except Exception as e:
+                jlog(log, logging.WARNING,
+                     event="overlay_render_fallback_to_drawtext",
+                     job_id=self.job_id,
+                     error=str(e))
         
-        # Build drawtext filters with calculated fixed coordinates
-        drawtext_filters = self._build_drawtext_filters(slide_timeline, video_width, video_height, video_metadata)
-        if not drawtext_filters:
+        # Legacy: drawtext filters using presgen-video's proven approach
+        filter_chain = self._build_drawtext_filters(slide_timeline, video_width, video_height, video_metadata)
+        if not filter_chain:
             raise Exception("Failed to generate drawtext filters")
         
-        # Use proven presgen-video approach: simple fixed coordinates with drawtext
-        filter_chain = drawtext_filters
-        
-        # Command with drawtext filters using presgen-video's proven approach
         cmd = [
             "ffmpeg", "-y",  # Overwrite output
             "-i", raw_video,
             "-vf", filter_chain,
+            "-threads", str(encode["threads"]),  # Encoder threads (output option)
             "-c:v", "libx264",  # Video codec
-            "-c:a", "aac",      # Audio codec  
-            "-preset", "medium", # Balance between quality and speed
-            "-crf", "23",       # Quality setting (lower = better quality)
+            "-preset", encode["preset"],
+            "-crf", str(encode["crf"]),  # Quality setting (lower = better quality)
+            *audio_args,
             str(output_path)
         ]
         
         return cmd
     
+    def _encode_settings(self) -> Dict[str, Any]:
+        """x264 preset/crf/threads for the configured speed profile"""
+        config = (self._provided_job_data or {}).get("config") or {}
+        profile = config.get("speed_profile") or SPEED_PROFILE
+        if profile not in SPEED_PROFILES:
+            profile = "balanced"
+        settings = dict(SPEED_PROFILES[profile])
+        settings["profile"] = profile
+        return settings
+    
+    def _audio_args(self, video_metadata: Dict[str, Any]) -> List[str]:
+        """Stream-copy AAC/MP3 audio; re-encode anything else (or unknown) to AAC"""
+        if video_metadata.get("audio_codec") in MP4_AUDIO_CODECS:
+            return ["-c:a", "copy"]
+        return ["-c:a", "aac"]
+    
+    def _get_source_metadata(self, raw_video: Path) -> Dict[str, Any]:
+        """Source video metadata: phase 1 probe result if recorded, else one ffprobe per job"""
+        if self._source_metadata is not None:
+            return self._source_metadata
+        
+        phase1 = (self._provided_job_data or {}).get("source_metadata") or {}
+        if phase1.get("width") and phase1.get("height") and phase1.get("duration"):
+            jlog(log, logging.INFO,
+                 event="source_metadata_reused",
+                 job_id=self.job_id,
+                 source="phase1")
+            self._source_metadata = dict(phase1)
+            if "audio_codec" not in phase1:
+                # Phase 1 reads frames with OpenCV, which doesn't see audio
+                self._source_metadata["audio_codec"] = self._probe_audio_codec(raw_video)
+        else:
+            self._source_metadata = self._get_video_metadata(raw_video)
+        return self._source_metadata
+    
+    def _probe_audio_codec(self, raw_video: Path) -> Optional[str]:
+        """Codec name of the first audio stream, or None if absent or the probe fails"""
+        try:
+            result = subprocess.run(
+                ["ffprobe", "-v", "quiet", "-select_streams", "a:0",
+                 "-show_entries", "stream=codec_name", "-of", "csv=p=0", str(raw_video)],
+                capture_output=True, text=True, timeout=30
+            )
+            if result.returncode != 0:
+                return None
+            return result.stdout.strip() or None
+        except Exception as e:
+            jlog(log, logging.WARNING,
+                 event="audio_codec_probe_failed",
+                 job_id=self.job_id,
+                 error=str(e))
+            return None
+    
     def _create_srt_subtitle_file(self, slide_timeline: List[Dict[str, Any]], output_path: Path) -> str:
         """Create SRT subtitle file for text overlays"""
         srt_path = str(output_path).replace('.mp4', '.srt')
@@ -480,12 +628,10 @@ class Phase3Orchestrator:
         
         return srt_path
     
-    def _build_drawtext_filters(self, slide_timeline: List[Dict[str, Any]], video_width: int, video_height: int, video_metadata: Dict[str, Any]) -> str:
-        """Build drawtext filters using presgen-video's proven simple approach"""
+    def _build_overlay_layout(self, slide_timeline: List[Dict[str, Any]], video_width: int, video_height: int) -> Optional[Dict[str, Any]]:
+        """Compute rectangle, title and timed bullet-line positions (presgen-video's proven layout)"""
         if not slide_timeline:
-            return ""
-            
-        filter_parts = []
+            return None
         
         # Use presgen-video's proven approach: simple fixed coordinates
         # Scale basic coordinates for video resolution (presgen-video used 512px width)
@@ -497,38 +643,22 @@ class Phase3Orchestrator:
         rect_x = video_width - rect_width       # Position at right edge minus width
         rect_height = video_height              # Full height
         
-        # 1. Add black semi-transparent rectangle with 5% top and bottom margins
+        # 1. Black semi-transparent rectangle with 5% top and bottom margins
         margin_y = int(video_height * 0.05)  # 5% of video height
-        rect_filter = (
-            f"drawbox="
-            f"x={rect_x}:y={margin_y}:"                           # 5% top margin
-            f"w={rect_width}:h={rect_height - 2*margin_y}:"       # Reduce height by margins
-            f"color=black@0.7:t=fill"                             # Black semi-transparent
-        )
-        filter_parts.append(rect_filter)
+        box = {"x": rect_x, "y": margin_y, "w": rect_width, "h": rect_height - 2*margin_y}
         
-        # 2. Add "Key Points" title (top-center, 5% from top of rectangle)
+        # 2. "Key Points" title (top-center, 5% from top of rectangle)
         title_font_size = int(10 * scale_factor)  # Base 10px scales to ~28px final size
         title_x = rect_x + (rect_width // 2) - int(len("Key Points") * title_font_size * 0.3)  # Center within rectangle
         effective_rect_height = rect_height - 2*margin_y  # Height of actual rectangle
         title_y = margin_y + int(effective_rect_height * 0.05)  # 5% from top of rectangle
+        title = {"text": "Key Points", "font_size": title_font_size, "x": title_x, "y": title_y}
         
-        title_filter = (
-            "drawtext=text='Key Points':"
-            f"fontsize={title_font_size}:"
-            "fontcolor=white:"
-            "fontfile=/System/Library/Fonts/Helvetica.ttc:"  # Arial/Helvetica font
-            f"x={title_x}:y={title_y}"
-        )
-        filter_parts.append(title_filter)
-        
-        # 3. Add bullet points with proper word wrapping
+        # 3. Bullet points with proper word wrapping
         bullet_font_size = int(8 * scale_factor)  # Base 8px scales to ~24px final size
         bullet_start_x = rect_x + int(rect_width * 0.08)  # Increased margin from rectangle left edge
         bullet_start_y = title_y + title_font_size + int(effective_rect_height * 0.05)  # 5% margin below title (same as between bullets)
         
-        current_y = bullet_start_y
-        
         # Use all bullets from the saved job data (no artificial limits)
         # This ensures user-added bullets are included in final video
         full_timeline = slide_timeline  # Process all bullets, not just original config limit
@@ -540,29 +670,16 @@ class Phase3Orchestrator:
         bullet_groups = self._create_bullet_groups(full_timeline, bullets_per_group)
         group_timings = self._calculate_group_timings(bullet_groups)
         
-        # Generate display filters for each group with individual bullet timing but group boundaries
+        lines = []
         for group_timing in group_timings:
-            group_start_time = group_timing['start_time']
             group_end_time = group_timing['end_time']
-            group_bullets = group_timing['bullets']
             
             # Reset Y position for each group (all groups start at same Y)
             group_current_y = bullet_start_y
             
-            # Add bullets in this group - each appears at its individual time
-            for bullet_idx, entry in enumerate(group_bullets):
-                # Calculate original bullet number for numbering
+            # Each bullet appears at its individual time and disappears when its group ends
+            for entry in group_timing['bullets']:
                 original_bullet_num = full_timeline.index(entry) + 1
-                bullet_start_time = entry['start_time']
-                
-                # Build individual bullet enable condition:
-                # Show from bullet's time AND within group boundaries
-                if group_end_time is not None:
-                    # Bullet appears at its time, disappears when group ends
-                    bullet_enable_condition = f"'gte(t,{bullet_start_time})*lt(t,{group_end_time})'"
-                else:
-                    # Last group - bullet appears at its time, stays visible
-                    bullet_enable_condition = f"'gte(t,{bullet_start_time})'"
                 
                 text = entry['text'].replace("'", "\\'").replace(":", "\\:")  # Escape special chars
                 numbered_text = f"#{original_bullet_num} {text}"
@@ -571,26 +688,113 @@ class Phase3Orchestrator:
                 max_chars_per_line = int(rect_width / (bullet_font_size * 0.6))  # Estimate chars per line
                 wrapped_lines = self._wrap_text_for_rectangle(numbered_text, max_chars_per_line)
                 
-                # Add each line of wrapped text with individual bullet timing
                 for line_idx, line in enumerate(wrapped_lines):
-                    line_y = group_current_y + (line_idx * int(bullet_font_size * 1.3))  # Line spacing
-                    
-                    bullet_filter = (
-                        f"drawtext=text='{line}':"
-                        f"fontsize={bullet_font_size}:"
-                        "fontcolor=white:"
-                        "fontfile=/System/Library/Fonts/Helvetica.ttc:"  # Arial/Helvetica font
-                        f"x={bullet_start_x}:y={line_y}:"
-                        f"enable={bullet_enable_condition}"
-                    )
-                    filter_parts.append(bullet_filter)
+                    lines.append({
+                        "text": line,  # drawtext-escaped
+                        "font_size": bullet_font_size,
+                        "x": bullet_start_x,
+                        "y": group_current_y + (line_idx * int(bullet_font_size * 1.3)),  # Line spacing
+                        "start": entry['start_time'],
+                        "end": group_end_time,
+                    })
                 
                 # Move Y position for next bullet in this group
                 group_current_y += len(wrapped_lines) * int(bullet_font_size * 1.3) + int(effective_rect_height * 0.05)  # 5% margin between bullets
         
+        return {"box": box, "title": title, "lines": lines}
+    
+    def _build_drawtext_filters(self, slide_timeline: List[Dict[str, Any]], video_width: int, video_height: int, video_metadata: Dict[str, Any]) -> str:
+        """Build drawtext filters using presgen-video's proven simple approach"""
+        layout = self._build_overlay_layout(slide_timeline, video_width, video_height)
+        if not layout:
+            return ""
+        
+        box, title = layout["box"], layout["title"]
+        filter_parts = [
+            f"drawbox="
+            f"x={box['x']}:y={box['y']}:"
+            f"w={box['w']}:h={box['h']}:"
+            f"color=black@0.7:t=fill",                            # Black semi-transparent
+            "drawtext=text='Key Points':"
+            f"fontsize={title['font_size']}:"
+            "fontcolor=white:"
+            f"fontfile={OVERLAY_FONT_FILE}:"  # Arial/Helvetica font
+            f"x={title['x']}:y={title['y']}",
+        ]
+        
+        for line in layout["lines"]:
+            if line["end"] is not None:
+                # Bullet appears at its time, disappears when group ends
+                enable = f"'gte(t,{line['start']})*lt(t,{line['end']})'"
+            else:
+                # Last group - bullet appears at its time, stays visible
+                enable = f"'gte(t,{line['start']})'"
+            filter_parts.append(
+                f"drawtext=text='{line['text']}':"
+                f"fontsize={line['font_size']}:"
+                "fontcolor=white:"
+                f"fontfile={OVERLAY_FONT_FILE}:"  # Arial/Helvetica font
+                f"x={line['x']}:y={line['y']}:"
+                f"enable={enable}"
+            )
+        
         # Chain all filters together
         return ",".join(filter_parts)
     
+    def _render_overlay_states(self, layout: Dict[str, Any], video_width: int, video_height: int) -> List[Dict[str, Any]]:
+        """Render one transparent PNG per distinct overlay state.
+
+        Visibility only changes when a bullet appears or a group ends, so the
+        whole overlay track is a few still frames instead of per-frame text
+        rendering inside ffmpeg.
+        """
+        from PIL import Image, ImageDraw
+        
+        overlay_dir = self.job_dir / "overlay"
+        overlay_dir.mkdir(parents=True, exist_ok=True)
+        
+        lines = layout["lines"]
+        boundaries = sorted({0.0} | {float(l["start"]) for l in lines}
+                            | {float(l["end"]) for l in lines if l["end"] is not None})
+        
+        states: List[Dict[str, Any]] = []
+        for i, t in enumerate(boundaries):
+            t_next = boundaries[i + 1] if i + 1 < len(boundaries) else None
+            visible = tuple(
+                idx for idx, l in enumerate(lines)
+                if l["start"] <= t and (l["end"] is None or t < l["end"])
+            )
+            if states and states[-1]["visible"] == visible:
+                states[-1]["end"] = t_next  # same picture, extend previous state
+                continue
+            states.append({"start": t, "end": t_next, "visible": visible})
+        
+        box, title = layout["box"], layout["title"]
+        for n, state in enumerate(states):
+            img = Image.new("RGBA", (video_width, video_height), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            draw.rectangle(
+                [box["x"], box["y"], box["x"] + box["w"] - 1, box["y"] + box["h"] - 1],
+                fill=(0, 0, 0, int(255 * 0.7)),
+            )
+            draw.text((title["x"], title["y"]), title["text"],
+                      font=_overlay_font(title["font_size"]), fill=(255, 255, 255, 255))
+            for idx in state["visible"]:
+                line = lines[idx]
+                text = line["text"].replace("\\'", "'").replace("\\:", ":")
+                draw.text((line["x"], line["y"]), text,
+                          font=_overlay_font(line["font_size"]), fill=(255, 255, 255, 255))
+            path = overlay_dir / f"overlay_{n:03d}.png"
+            img.save(path)
+            
+            if state["end"] is None:
+                state["enable"] = f"gte(t,{state['start']})"
+            else:
+                state["enable"] = f"gte(t,{state['start']})*lt(t,{state['end']})"
+            state["path"] = str(path)
+        
+        return states
+    
     def _calculate_bullets_per_group(self, rect_height: int, font_size: int, slide_timeline: List[Dict[str, Any]]) -> int:
         """Calculate maximum bullets that can fit in the overlay rectangle"""
         # Calculate available space
@@ -757,6 +961,10 @@ class Phase3Orchestrator:
                 (s for s in metadata.get("streams", []) if s.get("codec_type") == "video"), 
                 {}
             )
+            audio_stream = next(
+                (s for s in metadata.get("streams", []) if s.get("codec_type") == "audio"), 
+                {}
+            )
             
             # Calculate pixel aspect ratio
             sar = video_stream.get("sample_aspect_ratio", "1:1")
@@ -775,6 +983,7 @@ class Phase3Orchestrator:
                 "pixel_aspect_ratio": pixel_aspect_ratio,
                 "fps": eval(video_stream.get("r_frame_rate", "30/1")),  # Convert fraction to float
                 "codec": video_stream.get("codec_name"),
+                "audio_codec": audio_stream.get("codec_name"),
                 "file_size": int(metadata.get("format", {}).get("size", 0))
             }
             
@@ -1124,12 +1333,15 @@ def _create_overlay_video(
                  drawtext_filter=drawtext_filter[:500] + "..." if len(drawtext_filter) > 500 else drawtext_filter)
         
         # Execute FFmpeg
+        ffmpeg_start = time.time()
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
             timeout=120  # 2 minute timeout
         )
+        observe_phase("training", "ffmpeg_compose", time.time() - ffmpeg_start,
+                      status="ok" if result.returncode == 0 else "error")
         
         if result.returncode != 0:
             if logger:
@@ -4,15 +4,20 @@ PlaywrightAgent for professional slide generation with Context7 integration
 """
 
 import asyncio
+import base64
 import logging
+import os
+import re
 import time
 import hashlib
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from pydantic import BaseModel, Field
 
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from src.mcp.tools.context7 import context7_client
 from src.mcp.tools.video_content import BulletPoint, VideoSummary
 from src.common.jsonlog import jlog
@@ -53,6 +58,177 @@ class SlidesGenerationResult:
     error: Optional[str] = None
 
 
+# Shared browser pool settings
+POOL_PAGES = int(os.getenv("SLIDES_BROWSER_PAGES", "4"))
+# Optional local font files (e.g. Inter-Regular.woff2, Inter-Bold.woff2) inlined
+# into slide HTML so rendering never waits on fonts.googleapis.com; without
+# them slides load Inter from the Google Fonts stylesheet as before
+FONT_DIR = Path(os.getenv("SLIDES_FONT_DIR", "presgen-video/fonts"))
+GOOGLE_FONTS_CSS = "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap"
+# Everything else on the network is blocked while rendering
+_ALLOWED_REMOTE = re.compile(r"^https?://fonts\.(googleapis|gstatic)\.com/")
+
+_FONT_WEIGHTS = [("extrabold", 800), ("semibold", 600), ("bold", 700), ("medium", 500)]
+_FONT_MIME = {".woff2": "font/woff2", ".woff": "font/woff", ".ttf": "font/ttf", ".otf": "font/otf"}
+
+
+@lru_cache(maxsize=1)
+def _font_face_css() -> str:
+    """@font-face rules with base64-inlined local Inter files (empty if none found)."""
+    rules = []
+    if FONT_DIR.is_dir():
+        for font in sorted(FONT_DIR.iterdir()):
+            mime = _FONT_MIME.get(font.suffix.lower())
+            if not mime or not font.stem.lower().startswith("inter"):
+                continue
+            stem = font.stem.lower()
+            weight = next((w for key, w in _FONT_WEIGHTS if key in stem), 400)
+            data = base64.b64encode(font.read_bytes()).decode("ascii")
+            rules.append(
+                "@font-face { font-family: 'Inter'; font-weight: %d; "
+                "src: url(data:%s;base64,%s); }" % (weight, mime, data)
+            )
+    return "\n".join(rules)
+
+
+@lru_cache(maxsize=1)
+def _font_head_html() -> str:
+    """Inline local Inter when available, else link the Google Fonts stylesheet (warned once)."""
+    css = _font_face_css()
+    if css:
+        return f"<style>{css}</style>"
+    jlog(log, logging.WARNING,
+         event="slide_fonts_not_found",
+         font_dir=str(FONT_DIR),
+         fallback="google_fonts")
+    return f'<link href="{GOOGLE_FONTS_CSS}" rel="stylesheet">'
+
+
+async def _block_remote(route) -> None:
+    if _ALLOWED_REMOTE.match(route.request.url):
+        await route.continue_()
+    else:
+        await route.abort()
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium shared by every slide job in the process.
+
+    One browser and one context, with a fixed set of pages handed out through
+    a queue so a job can render several slides in parallel and pages are
+    reused across jobs. External requests other than Google Fonts (the
+    fallback when no local Inter files exist) are aborted, so nothing else
+    can stall on the network.
+    """
+
+    def __init__(self, size: int = POOL_PAGES, browser_options: Optional[Dict[str, Any]] = None):
+        self.size = max(1, size)
+        self.browser_options = browser_options or {"headless": True, "args": ["--no-sandbox"]}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._pages: Optional[asyncio.Queue] = None
+
+    async def start(self, viewport: Dict[str, int]) -> None:
+        start_time = time.time()
+        self.loop = asyncio.get_running_loop()
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(**self.browser_options)
+        self._context = await self._browser.new_context(viewport=viewport)
+        await self._context.route(re.compile(r"^https?://"), _block_remote)
+        self._pages = asyncio.Queue()
+        for _ in range(self.size):
+            self._pages.put_nowait(await self._context.new_page())
+
+        jlog(log, logging.INFO,
+             event="browser_pool_started",
+             pages=self.size,
+             startup_time=round(time.time() - start_time, 3))
+
+    def usable(self) -> bool:
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return (
+            self._browser is not None
+            and self._browser.is_connected()
+            and self.loop is current
+        )
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a page; a page that broke while in use is replaced."""
+        page = await self._pages.get()
+        try:
+            yield page
+        finally:
+            if page.is_closed() and self._browser and self._browser.is_connected():
+                try:
+                    page = await self._context.new_page()
+                except Exception:
+                    pass
+            self._pages.put_nowait(page)
+
+    async def close(self) -> None:
+        try:
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        finally:
+            self._browser = None
+            self._context = None
+            self._playwright = None
+            jlog(log, logging.INFO, event="browser_pool_closed")
+
+
+_POOL: Optional[BrowserPool] = None
+_POOL_LOCK: Optional[asyncio.Lock] = None
+_POOL_LOCK_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_browser_pool(
+    viewport: Dict[str, int], browser_options: Optional[Dict[str, Any]] = None
+) -> BrowserPool:
+    """Return the process-wide pool, starting (or restarting) it if needed."""
+    global _POOL, _POOL_LOCK, _POOL_LOCK_LOOP
+
+    if _POOL is not None and _POOL.usable():
+        return _POOL
+
+    loop = asyncio.get_running_loop()
+    if _POOL_LOCK is None or _POOL_LOCK_LOOP is not loop:
+        _POOL_LOCK = asyncio.Lock()
+        _POOL_LOCK_LOOP = loop
+
+    async with _POOL_LOCK:
+        if _POOL is not None and _POOL.usable():
+            return _POOL
+        if _POOL is not None:
+            # Browser crashed, or the pool belongs to an event loop that is gone
+            jlog(log, logging.WARNING, event="browser_pool_restart")
+            if _POOL.loop is loop:
+                try:
+                    await _POOL.close()
+                except Exception:
+                    pass
+        pool = BrowserPool(POOL_PAGES, browser_options)
+        await pool.start(viewport)
+        _POOL = pool
+        return _POOL
+
+
+async def shutdown_browser_pool() -> None:
+    """Close the shared browser (call on service shutdown)."""
+    global _POOL
+    if _POOL is not None:
+        pool, _POOL = _POOL, None
+        await pool.close()
+
+
 class PlaywrightAgent:
     """Agent for professional slide generation using Playwright with Context7 optimization"""
     
@@ -61,8 +237,7 @@ class PlaywrightAgent:
         self.job_dir = Path(f"/tmp/jobs/{job_id}")
         self.slides_dir = self.job_dir / "slides"
         self.slides_dir.mkdir(parents=True, exist_ok=True)
-        self.browser = None
-        self.page = None
+        self.pool: Optional[BrowserPool] = None
         self.design = SlideDesign()
     
     async def generate_slides(self, summary: VideoSummary) -> SlidesGenerationResult:
@@ -90,15 +265,15 @@ class PlaywrightAgent:
             # Initialize Playwright with Context7 settings
             await self._initialize_playwright(context)
             
-            # Generate slides for each bullet point
-            slide_results = []
-            for i, bullet in enumerate(summary.bullet_points):
-                slide_result = await self._generate_single_slide(
-                    bullet, i + 1, len(summary.bullet_points), summary.main_themes
-                )
-                slide_results.append(slide_result)
+            # Render all bullets concurrently; the pool bounds parallelism
+            total = len(summary.bullet_points)
+            slide_results = await asyncio.gather(*[
+                self._generate_single_slide(bullet, i + 1, total, summary.main_themes)
+                for i, bullet in enumerate(summary.bullet_points)
+            ])
+            slide_results = list(slide_results)
             
-            # Clean up browser
+            # Release the shared browser (it stays up for the next job)
             await self._cleanup_playwright()
             
             processing_time = time.time() - start_time
@@ -146,63 +321,41 @@ class PlaywrightAgent:
             )
     
     async def _initialize_playwright(self, context: Dict[str, Any]):
-        """Initialize Playwright with Context7 optimization"""
+        """Attach to the shared browser pool with Context7 optimization"""
         
-        try:
-            # Get Context7 recommended settings
-            playwright_settings = context.get("performance_settings", {})
-            
-            # Update design from Context7 if available
-            design_settings = context.get("design_settings", {})
-            if design_settings:
-                for key, value in design_settings.items():
-                    if hasattr(self.design, key):
-                        setattr(self.design, key, value)
-            
-            jlog(log, logging.INFO,
-                 event="playwright_initializing",
-                 job_id=self.job_id,
-                 design_settings=design_settings,
-                 context7_guided=bool(design_settings))
-            
-            # Launch browser with optimized settings
-            playwright = await async_playwright().start()
-            
-            # Use Context7 browser settings or defaults
-            browser_options = {
-                "headless": playwright_settings.get("headless", True),
-                "args": playwright_settings.get("browser_args", ["--no-sandbox"])
-            }
-            
-            self.browser = await playwright.chromium.launch(**browser_options)
-            self.page = await self.browser.new_page()
-            
-            # Set viewport for consistent slide generation
-            await self.page.set_viewport_size({
-                "width": self.design.slide_width,
-                "height": self.design.slide_height
-            })
-            
-            jlog(log, logging.INFO,
-                 event="playwright_initialized",
-                 job_id=self.job_id,
-                 viewport_width=self.design.slide_width,
-                 viewport_height=self.design.slide_height)
-            
-        except Exception as e:
-            jlog(log, logging.WARNING,
-                 event="playwright_initialization_fallback",
-                 job_id=self.job_id,
-                 error=str(e))
-            
-            # Fallback initialization
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(headless=True)
-            self.page = await self.browser.new_page()
-            await self.page.set_viewport_size({
-                "width": self.design.slide_width,
-                "height": self.design.slide_height
-            })
+        # Get Context7 recommended settings
+        playwright_settings = context.get("performance_settings", {})
+        
+        # Update design from Context7 if available
+        design_settings = context.get("design_settings", {})
+        if design_settings:
+            for key, value in design_settings.items():
+                if hasattr(self.design, key):
+                    setattr(self.design, key, value)
+        
+        jlog(log, logging.INFO,
+             event="playwright_initializing",
+             job_id=self.job_id,
+             design_settings=design_settings,
+             context7_guided=bool(design_settings))
+        
+        # Use Context7 browser settings or defaults (only applied on pool start)
+        browser_options = {
+            "headless": playwright_settings.get("headless", True),
+            "args": playwright_settings.get("browser_args", ["--no-sandbox"])
+        }
+        
+        self.pool = await get_browser_pool(self._viewport(), browser_options)
+        
+        jlog(log, logging.INFO,
+             event="playwright_initialized",
+             job_id=self.job_id,
+             pool_pages=self.pool.size,
+             viewport_width=self.design.slide_width,
+             viewport_height=self.design.slide_height)
+    
+    def _viewport(self) -> Dict[str, int]:
+        return {"width": self.design.slide_width, "height": self.design.slide_height}
     
     async def _generate_single_slide(self, bullet: BulletPoint, slide_num: int, 
                                    total_slides: int, themes: List[str]) -> SlideResult:
@@ -214,23 +367,26 @@ class PlaywrightAgent:
             # Create slide HTML
             html_content = self._create_slide_html(bullet, slide_num, total_slides, themes)
             
-            # Set HTML content
-            await self.page.set_content(html_content)
-            
-            # Wait for fonts to load
-            await self.page.wait_for_load_state("networkidle")
-            
             # Generate filename
             safe_timestamp = bullet.timestamp.replace(":", "-")
             slide_filename = f"slide_{slide_num:02d}_{safe_timestamp}.png"
             slide_path = self.slides_dir / slide_filename
             
-            # Take screenshot
-            await self.page.screenshot(
-                path=str(slide_path),
-                full_page=True,
-                type="png"
-            )
+            async with self.pool.page() as page:
+                viewport = self._viewport()
+                if page.viewport_size != viewport:
+                    await page.set_viewport_size(viewport)
+                
+                # HTML is self-contained (fonts inlined/local), so "load" is enough
+                await page.set_content(html_content, wait_until="load")
+                await page.evaluate("document.fonts.ready.then(() => true)")
+                
+                # Take screenshot
+                await page.screenshot(
+                    path=str(slide_path),
+                    full_page=True,
+                    type="png"
+                )
             
             processing_time = time.time() - slide_start_time
             
@@ -284,7 +440,7 @@ class PlaywrightAgent:
         <head>
             <meta charset="utf-8">
             <title>Slide {slide_num}</title>
-            <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
+            {_font_head_html()}
             <style>
                 * {{
                     margin: 0;
@@ -350,22 +506,11 @@ class PlaywrightAgent:
         return html_content.strip()
     
     async def _cleanup_playwright(self):
-        """Clean up Playwright resources"""
-        try:
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-                self.page = None
-                
-            jlog(log, logging.INFO,
-                 event="playwright_cleanup_complete",
-                 job_id=self.job_id)
-                
-        except Exception as e:
-            jlog(log, logging.WARNING,
-                 event="playwright_cleanup_error",
-                 job_id=self.job_id,
-                 error=str(e))
+        """Release this job's hold on the shared browser pool (the browser stays up)"""
+        self.pool = None
+        jlog(log, logging.INFO,
+             event="playwright_cleanup_complete",
+             job_id=self.job_id)
 
 
 if __name__ == "__main__":
@@ -398,6 +543,8 @@ if __name__ == "__main__":
         print(f"Slides generated: {result.slides_generated}")
         print(f"Design: {result.design_used.slide_width}x{result.design_used.slide_height}")
         
+        await shutdown_browser_pool()
+        
         if result.slides:
             print(f"\nGenerated slides:")
             for i, slide in enumerate(result.slides):
@@ -49,6 +49,7 @@ from dataclasses import dataclass
 from src.mcp.tools.context7 import context7_client
 from src.mcp.tools.video_audio import AudioSegment
 from src.common.jsonlog import jlog
+from src.common.metrics import observe_phase
 
 log = logging.getLogger("video_transcription")
 
@@ -117,6 +118,7 @@ class TranscriptionAgent:
             segments = self._process_transcript_segments(result)
             
             processing_time = time.time() - start_time
+            observe_phase("video", "whisper", processing_time)
             
             transcription_result = TranscriptionResult(
                 success=True,
@@ -141,6 +143,7 @@ class TranscriptionAgent:
             
         except Exception as e:
             processing_time = time.time() - start_time
+            observe_phase("video", "whisper", processing_time, status="error")
             error_msg = f"Transcription failed: {str(e)}"
             
             jlog(log, logging.ERROR,
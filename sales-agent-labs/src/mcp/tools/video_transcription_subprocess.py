@@ -17,6 +17,7 @@ from dataclasses import dataclass
 from src.mcp.tools.context7 import context7_client
 from src.mcp.tools.video_audio import AudioSegment
 from src.common.jsonlog import jlog
+from src.common.metrics import observe_phase
 
 log = logging.getLogger("video_transcription_subprocess")
 
@@ -100,6 +101,7 @@ class SubprocessTranscriptionAgent:
             ]
             
             processing_time = time.time() - start_time
+            observe_phase("video", "whisper", processing_time)
             
             transcription_result = TranscriptionResult(
                 success=True,
@@ -124,6 +126,7 @@ class SubprocessTranscriptionAgent:
             
         except Exception as e:
             processing_time = time.time() - start_time
+            observe_phase("video", "whisper", processing_time, status="error")
             error_msg = f"Subprocess transcription failed: {str(e)}"
             
             jlog(log, logging.ERROR,
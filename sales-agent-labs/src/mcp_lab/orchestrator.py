@@ -28,6 +28,7 @@ PRESGEN_USE_CACHE = _get_cache_setting()
 from .rpc_client import MCPClient, ToolError
 from src.common.cache import get as cache_get, set as cache_set, llm_key, imagen_key
 from src.common.jsonlog import jlog
+from src.common.tracing import traced
 
 log = logging.getLogger("orchestrator")
 
@@ -57,6 +58,7 @@ def _truncate_script(script: str, max_len: int) -> str:
         return script[:max_len - 3] + "..."
 
 
+@traced("orchestrator.orchestrate")
 def orchestrate(
     report_text: str,
     *,
@@ -524,6 +526,7 @@ def _stable_request_id(report_text: str) -> str:
     return f"req-{h}"
 
 
+@traced("orchestrator.orchestrate_many")
 def orchestrate_many(
     items: Iterable[Tuple[str, str]],
     *,
@@ -602,6 +605,7 @@ def orchestrate_many(
     return results
 
 
+@traced("orchestrator.orchestrate_mixed")
 def orchestrate_mixed(
     report_text: str,
     *,
@@ -710,6 +714,7 @@ def orchestrate_mixed(
                             "question": q,
                             "sheet": sheet,
                             "req_id": per_slide_id,  # Pass through the request ID
+                            "use_cache": use_cache,  # plan/result cache in data.query
                         },
                         req_id=per_slide_id,
                         timeout=90.0,  # Explicit timeout for data queries
@@ -2,6 +2,9 @@ from __future__ import annotations
 import json, logging, subprocess, sys, threading, queue, time, uuid
 from typing import Any, Dict, Optional
 
+from src.common import profiling, tracing
+from src.common.metrics import REGISTRY, time_phase
+
 log = logging.getLogger("mcp_lab.rpc_client")
 
 
@@ -18,6 +21,13 @@ METHOD_TIMEOUTS = {
     "slides.create": 300,  # Reduced from 600s (10min) to 300s (5min)
     "data.query": 180,  # Reduced from 300s (5min) to 180s (3min)
 }
+# presgen_phase_duration_seconds{phase=...} for each tool call
+METHOD_PHASES = {
+    "llm.summarize": "llm",
+    "image.generate": "imagen",
+    "slides.create": "slides_api",
+    "data.query": "data_query",
+}
 
 
 class ToolError(RuntimeError):
@@ -179,6 +189,24 @@ class MCPClient:
             self._start()
 
     def call(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        *,
+        req_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        with tracing.start_span(f"mcp.call {method}", kind="client", **{"rpc.method": method, "req_id": req_id}), \
+                time_phase("presentation", METHOD_PHASES.get(method, method)):
+            # Trace context travels in the JSON-RPC params, as MCP's params._meta
+            meta = tracing.inject(dict(params.get("_meta") or {}))
+            job = profiling.current_job()
+            if job is not None:
+                # Lets the server profile this tool call into the calling job's directory
+                meta["job_id"], meta["profile"] = job
+            return self._call(method, {**params, "_meta": meta}, req_id=req_id, timeout=timeout)
+
+    def _call(
         self,
         method: str,
         params: Dict[str, Any],
@@ -258,7 +286,11 @@ class MCPClient:
                 log.debug("Ignoring response for different request ID: %s (expected: %s)", 
                          resp.get("id"), rid)
                 continue
-                
+
+            # Phase timings, cache lookups and spans recorded inside the server process
+            REGISTRY.merge(resp.get("metrics"))
+            tracing.ingest(resp.get("spans"))
+
             if "error" in resp:
                 error_info = resp["error"]
                 # Enhanced error logging for tool errors
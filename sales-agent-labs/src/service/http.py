@@ -22,16 +22,21 @@ import httpx
 from fastapi import FastAPI, Request, HTTPException, UploadFile, File, Form, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from pydantic import BaseModel
 from pathlib import Path
 import re, json, time
+from dataclasses import asdict
 import subprocess
 from starlette.status import HTTP_206_PARTIAL_CONTENT
 from src.mcp_lab.orchestrator import orchestrate, orchestrate_mixed
 from src.common.jsonlog import jlog
+from src.common.metrics import HTTP_REQUEST_SECONDS, REGISTRY
+from src.common.profiling import PROFILE_NAME_RE, list_profiles, profile_job, profile_path
+from src.common.tracing import extract, shutdown_tracing, start_span
+from src.service.jobs import PipelineBusy, get_pipeline_executor, shutdown_pipeline_executor
 from dotenv import load_dotenv
 from src.data.ingest import ingest_file
 from src.data.catalog import resolve_dataset
@@ -59,6 +64,33 @@ if not SLACK_SIGNING_SECRET and not DEBUG_BYPASS_SLACK_SIG:
 
 app = FastAPI()
 
+
+@app.on_event("startup")
+async def _start_background_logging():
+    # Console/file handlers run on a listener thread; request paths only enqueue
+    from src.common.jsonlog import start_background_logging
+
+    start_background_logging()
+
+
+@app.on_event("shutdown")
+async def _close_slide_browser_pool():
+    # Shared Chromium used by PlaywrightAgent (started lazily on first slide job)
+    from src.mcp.tools.video_slides import shutdown_browser_pool
+
+    await shutdown_browser_pool()
+
+
+@app.on_event("shutdown")
+async def _shutdown_pipeline_executor():
+    shutdown_pipeline_executor()
+
+
+@app.on_event("shutdown")
+async def _flush_traces():
+    shutdown_tracing()
+
+
 # Add CORS middleware to allow frontend requests
 app.add_middleware(
     CORSMiddleware,
@@ -113,8 +145,35 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+def _observe_request(request: Request, status_code: int, seconds: float) -> None:
+    # Label by route template (/video/status/{job_id}), not the raw path, to bound cardinality
+    route = request.scope.get("route")
+    HTTP_REQUEST_SECONDS.observe(
+        seconds,
+        method=request.method,
+        route=getattr(route, "path", "unmatched"),
+        status=status_code,
+    )
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
+        # Root span for the request; a caller's traceparent header continues its trace
+        with start_span(
+            f"{request.method} {request.url.path}",
+            kind="server",
+            parent=extract(request.headers.get("traceparent")),
+            **{"http.method": request.method, "http.target": request.url.path},
+        ) as span:
+            response = await self._dispatch(request, call_next)
+            route = request.scope.get("route")
+            if route is not None:
+                span.name = f"{request.method} {route.path}"
+            span.set_attribute("http.status_code", response.status_code)
+            response.headers["traceparent"] = span.traceparent
+            return response
+
+    async def _dispatch(self, request: Request, call_next):
         start_time = time.time()
         
         # Log incoming request
@@ -132,6 +191,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         try:
             response = await call_next(request)
             
+            _observe_request(request, response.status_code, time.time() - start_time)
+
             # Log successful response
             duration = round(time.time() - start_time, 3)
             jlog(
@@ -147,6 +208,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             return response
             
         except Exception as e:
+            _observe_request(request, 500, time.time() - start_time)
+
             # Log failed response
             duration = round(time.time() - start_time, 3)
             jlog(
@@ -268,6 +331,7 @@ class RenderRequest(BaseModel):
     slides: int = 1
     use_cache: bool = PRESGEN_USE_CACHE
     channel_id: Optional[str] = None  # not used by /render, but kept for compatibility
+    profile: Optional[bool] = None  # /render/jobs: sample the run; linked from /jobs/{id}
 
 
 # ---------- Routes ----------
@@ -276,6 +340,12 @@ async def healthz():
     return {"ok": True}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint: phase latencies, cache hit rates, queue depth, active jobs."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.post("/render")
 async def render(req: RenderRequest):
     start_time = time.time()
@@ -312,7 +382,10 @@ async def render(req: RenderRequest):
             request_id=req.request_id,
         )
 
-        res = orchestrate(
+        # Runs on the bounded pipeline executor so the event loop stays free
+        res = await get_pipeline_executor().run(
+            "render",
+            orchestrate,
             req.report_text,
             client_request_id=req.request_id,
             use_cache=req.use_cache,
@@ -357,6 +430,9 @@ async def render(req: RenderRequest):
         
         return response_payload
         
+    except PipelineBusy as e:
+        jlog(log, logging.WARNING, event="render_busy", error=str(e), **request_info)
+        raise _busy_exception(e)
     except HTTPException as e:
         error_time = time.time()
         jlog(
@@ -402,6 +478,99 @@ async def render(req: RenderRequest):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+def _busy_exception(e: PipelineBusy) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+
+
+def _job_links(job_id: str) -> Dict[str, str]:
+    return {"status_url": f"/jobs/{job_id}", "events_url": f"/jobs/{job_id}/events"}
+
+
+def _profile_links(job_id: str) -> List[str]:
+    return [f"/jobs/{job_id}/profiles/{name}" for name in list_profiles(job_id)]
+
+
+def _render_job(req: RenderRequest) -> Dict[str, Any]:
+    """Pipeline-thread body for POST /render/jobs; returns the /render payload."""
+    res = orchestrate(
+        req.report_text,
+        client_request_id=req.request_id,
+        use_cache=req.use_cache,
+        slide_count=req.slides,
+    )
+    if not res.get("url"):
+        raise RuntimeError("Presentation was created but no URL returned")
+    return {
+        "ok": True,
+        "url": res.get("url"),
+        "presentation_id": res.get("presentation_id"),
+        "created_slides": res.get("created_slides"),
+        "first_slide_id": res.get("first_slide_id"),
+    }
+
+
+@app.post("/render/jobs", status_code=202)
+async def submit_render_job(req: RenderRequest):
+    """Queue a deck render and return a job id to poll (/jobs/{id}) or stream (/jobs/{id}/events)."""
+    if not req.report_text or not req.report_text.strip():
+        raise HTTPException(status_code=400, detail="report_text cannot be empty")
+    try:
+        job = get_pipeline_executor().submit("render", _render_job, req, profile=req.profile)
+    except PipelineBusy as e:
+        raise _busy_exception(e)
+    jlog(log, logging.INFO, event="render_job_submitted", job_id=job.job_id,
+         request_id=req.request_id, slides=req.slides)
+    return {"ok": True, "job_id": job.job_id, "status": job.status, **_job_links(job.job_id)}
+
+
+@app.get("/jobs/{job_id}")
+async def pipeline_job_status(job_id: str):
+    job = get_pipeline_executor().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {**job.to_dict(), "profiles": _profile_links(job_id)}
+
+
+@app.get("/jobs/{job_id}/profiles/{name}")
+async def job_profile(job_id: str, name: str):
+    """Collapsed-stack CPU profile of a job (flamegraph.pl / speedscope input)."""
+    if not PROFILE_NAME_RE.match(name) or "/" in job_id or job_id in (".", ".."):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    path = profile_path(job_id, name[len("profile-"):-len(".folded")])
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain", filename=name)
+
+
+@app.get("/jobs/{job_id}/events")
+async def pipeline_job_events(job_id: str):
+    """Server-sent events: a status event now, keep-alives while running, then the final job."""
+    executor = get_pipeline_executor()
+    job = executor.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    def _event(name: str) -> str:
+        return f"event: {name}\ndata: {json.dumps(job.to_dict(), default=str)}\n\n"
+
+    async def _stream():
+        yield _event("status")
+        last_status = job.status
+        while not await executor.wait(job_id, timeout=15):
+            if job.status != last_status:
+                last_status = job.status
+                yield _event("status")
+            else:
+                yield ": keep-alive\n\n"
+        yield _event(job.status)
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/slack/command")
 async def slack_command(request: Request):
     """
@@ -486,7 +655,13 @@ async def slack_command(request: Request):
             msg = f"❌ Failed to generate deck for <@{user_id}>: {e}"
         _post_followup(channel_id, response_url, msg)
 
-    threading.Thread(target=_run, daemon=True).start()
+    try:
+        get_pipeline_executor().submit("slack_command", _run)
+    except PipelineBusy:
+        return {
+            "response_type": "ephemeral",
+            "text": "PresGen is busy with other decks right now. Please try again in a minute.",
+        }
 
     # EPHEMERAL ACK (does NOT replace the original slash command message)
     return {
@@ -538,6 +713,7 @@ class VideoJobStatus(BaseModel):
     error: Optional[str] = None
     created_at: float
     updated_at: float
+    profiles: List[str] = []
 
 
 class VideoProcessingResult(BaseModel):
@@ -553,6 +729,30 @@ class VideoProcessingResult(BaseModel):
 # Global job storage (in production, use Redis or database)
 video_jobs: Dict[str, Dict[str, Any]] = {}
 
+def _pipeline_job_counts() -> Dict[tuple, int]:
+    stats = get_pipeline_executor().stats()
+    return {("running",): stats["running"], ("queued",): stats["queued"]}
+
+
+def _video_job_counts() -> Dict[tuple, int]:
+    counts: Dict[tuple, int] = {}
+    for job in list(video_jobs.values()):
+        key = (job.get("status", "unknown"),)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+REGISTRY.gauge(
+    "presgen_pipeline_jobs", "Deck pipeline jobs on the pipeline executor by state.", ("state",)
+).set_function(_pipeline_job_counts)
+REGISTRY.gauge(
+    "presgen_pipeline_workers", "Deck pipeline executor worker threads."
+).set_function(lambda: get_pipeline_executor().max_workers)
+REGISTRY.gauge(
+    "presgen_video_jobs", "Tracked video jobs by status (processing, phase3_processing, completed, ...).", ("status",)
+).set_function(_video_job_counts)
+
+
 def create_video_job(job_id: str, video_path: str, config: Dict[str, Any] = None) -> Dict[str, Any]:
     """Create a new video processing job"""
     job = {
@@ -684,6 +884,7 @@ async def video_upload(file: UploadFile = File(...), config: str = Form(None)):
 class PresentationRequest(BaseModel):
     script: str
     options: Optional[dict] = None
+    profile: Optional[bool] = None  # /presentation/jobs: sample the run; linked from /jobs/{id}
 
 class PresentationResponse(BaseModel):
     job_id: str
@@ -703,6 +904,7 @@ class TrainingVideoRequest(BaseModel):
     reference_video_path: Optional[str] = None
     quality_level: str = "standard"
     use_cache: bool = PRESGEN_USE_CACHE
+    profile: Optional[bool] = None  # sample generate_video; linked from the response
 
 class TrainingVideoResponse(BaseModel):
     job_id: str
@@ -715,6 +917,7 @@ class TrainingVideoResponse(BaseModel):
     avatar_duration: Optional[float] = None
     presentation_duration: Optional[float] = None
     error: Optional[str] = None
+    profiles: List[str] = []
 
 # VoiceCloneRequest removed - now using file upload directly
 
@@ -726,45 +929,41 @@ class VoiceCloneResponse(BaseModel):
 class VoiceProfilesResponse(BaseModel):
     profiles: List[Dict[str, Any]]
 
-@app.post("/presentation/generate", response_model=PresentationResponse)
-async def generate_presentation(req: PresentationRequest):
-    """Generate complete presentation from text script using PresGen-Training + PresGen-Video"""
+def _generate_presentation_job(job_id: str, script: str, options: Optional[dict]) -> Dict[str, Any]:
+    """
+    Pipeline-thread body for presentation generation.
+
+    UnifiedOrchestrator is async but shells out to ffmpeg/ffprobe and calls
+    blocking SDKs, so it gets its own event loop on a pipeline worker.
+    """
+    # Import here to avoid circular dependencies
+    from src.mcp.tools.unified_orchestrator import UnifiedOrchestrator, PresentationOptions
+
     start_time = time.time()
-    job_id = str(uuid.uuid4())
-    
-    jlog(log, logging.INFO,
-         event="presentation_generation_start",
-         job_id=job_id,
-         script_length=len(req.script),
-         options=req.options or {})
-    
     try:
-        # Import here to avoid circular dependencies
-        from src.mcp.tools.unified_orchestrator import UnifiedOrchestrator, PresentationOptions
-        
         # Create orchestrator
-        orchestrator = UnifiedOrchestrator(job_id, req.options or {})
-        
+        orchestrator = UnifiedOrchestrator(job_id, options or {})
+
         # Convert options
-        options = PresentationOptions()
-        if req.options:
-            if "avatar_quality" in req.options:
-                options.avatar_quality = req.options["avatar_quality"]
-            if "bullet_style" in req.options:
-                options.bullet_style = req.options["bullet_style"]
-        
+        presentation_options = PresentationOptions()
+        if options:
+            if "avatar_quality" in options:
+                presentation_options.avatar_quality = options["avatar_quality"]
+            if "bullet_style" in options:
+                presentation_options.bullet_style = options["bullet_style"]
+
         # Generate presentation
-        result = await orchestrator.generate_presentation(req.script, options)
-        
+        result = asyncio.run(orchestrator.generate_presentation(script, presentation_options))
+
         total_time = time.time() - start_time
-        
+
         jlog(log, logging.INFO,
              event="presentation_generation_complete",
              job_id=job_id,
              success=result.success,
              total_time=round(total_time, 2),
              phase_times=result.phase_times)
-        
+
         return PresentationResponse(
             job_id=job_id,
             success=result.success,
@@ -772,25 +971,65 @@ async def generate_presentation(req: PresentationRequest):
             phase_times=result.phase_times,
             output_path=result.output_path,
             error=result.error
-        )
-        
+        ).dict()
+
     except Exception as e:
         total_time = time.time() - start_time
         error_msg = f"Presentation generation failed: {str(e)}"
-        
+
         jlog(log, logging.ERROR,
              event="presentation_generation_exception",
              job_id=job_id,
              error=error_msg,
              total_time=round(total_time, 2))
-        
+
         return PresentationResponse(
             job_id=job_id,
             success=False,
             total_processing_time=total_time,
             phase_times={},
             error=error_msg
+        ).dict()
+
+
+@app.post("/presentation/generate", response_model=PresentationResponse)
+async def generate_presentation(req: PresentationRequest):
+    """Generate complete presentation from text script using PresGen-Training + PresGen-Video"""
+    job_id = str(uuid.uuid4())
+    
+    jlog(log, logging.INFO,
+         event="presentation_generation_start",
+         job_id=job_id,
+         script_length=len(req.script),
+         options=req.options or {})
+    
+    try:
+        return await get_pipeline_executor().run(
+            "presentation", _generate_presentation_job, job_id, req.script, req.options
         )
+    except PipelineBusy as e:
+        raise _busy_exception(e)
+
+
+@app.post("/presentation/jobs", status_code=202)
+async def submit_presentation_job(req: PresentationRequest):
+    """Queue presentation generation; poll /jobs/{id} or stream /jobs/{id}/events for the result."""
+    job_id = str(uuid.uuid4())
+    try:
+        job = get_pipeline_executor().submit(
+            "presentation", _generate_presentation_job, job_id, req.script, req.options,
+            job_id=job_id, profile=req.profile,
+        )
+    except PipelineBusy as e:
+        raise _busy_exception(e)
+
+    jlog(log, logging.INFO,
+         event="presentation_generation_start",
+         job_id=job_id,
+         script_length=len(req.script),
+         options=req.options or {})
+    return {"ok": True, "job_id": job.job_id, "status": job.status, **_job_links(job.job_id)}
+
 
 @app.get("/video/status/{job_id}", response_model=VideoJobStatus)
 async def video_status(job_id: str):
@@ -806,12 +1045,13 @@ async def video_status(job_id: str):
         progress=job.get("progress"),
         error=job.get("error"),
         created_at=job["created_at"],
-        updated_at=job["updated_at"]
+        updated_at=job["updated_at"],
+        profiles=_profile_links(job_id),
     )
 
 @app.post("/video/process/{job_id}")
-async def video_process(job_id: str):
-    """Start video processing with Phase 1 parallel agents"""
+async def video_process(job_id: str, profile: Optional[bool] = None):
+    """Start video processing with Phase 1 parallel agents (profile=true samples the phase)"""
     if job_id not in video_jobs:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
     
@@ -837,7 +1077,9 @@ async def video_process(job_id: str):
         jlog(log, logging.INFO, event="phase1_starting", job_id=job_id)
         update_video_job(job_id, progress={"phase": "phase1", "status": "processing"})
         
-        result = await orchestrator.phase1_parallel_processing(job["video_path"])
+        # Phase 1 fans out to executor threads, so every thread is sampled
+        with profile_job(job_id, "phase1", kind="video", enabled=profile, all_threads=True):
+            result = await orchestrator.phase1_parallel_processing(job["video_path"])
         
         if result.success:
             # Update job with Phase 1 results
@@ -852,7 +1094,9 @@ async def video_process(job_id: str):
                     "audio_duration": result.audio_result.duration,
                     "video_confidence": result.video_result.confidence_score
                 },
-                phases={"phase1": result.processing_time}
+                phases={"phase1": result.processing_time},
+                # Reused by Phase 3 so the raw video isn't probed again
+                source_metadata=asdict(result.video_result.video_metadata)
             )
             
             jlog(log, logging.INFO, 
@@ -909,8 +1153,8 @@ async def video_process(job_id: str):
 
 
 @app.post("/video/process-phase2/{job_id}")
-async def video_process_phase2(job_id: str):
-    """Execute Phase 2: transcription → summarization → slide generation"""
+async def video_process_phase2(job_id: str, profile: Optional[bool] = None):
+    """Execute Phase 2: transcription → summarization → slide generation (profile=true samples the phase)"""
     if job_id not in video_jobs:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
     
@@ -939,7 +1183,8 @@ async def video_process_phase2(job_id: str):
         jlog(log, logging.INFO, event="phase2_starting", job_id=job_id)
         update_video_job(job_id, progress={"phase": "phase2", "status": "processing"})
         
-        result = await orchestrator.process_content_pipeline()
+        with profile_job(job_id, "phase2", kind="video", enabled=profile, all_threads=True):
+            result = await orchestrator.process_content_pipeline()
         
         if result.success:
             # Update job with Phase 2 results
@@ -1246,7 +1491,8 @@ async def training_video_only(
     content_text: str = Form(None),
     content_file_path: str = Form(None),
     reference_video: UploadFile = File(None),
-    use_cache: bool = Form(PRESGEN_USE_CACHE)
+    use_cache: bool = Form(PRESGEN_USE_CACHE),
+    profile: Optional[bool] = Form(None)
 ):
     """Generate video-only content with avatar narration"""
     start_time = time.time()
@@ -1312,7 +1558,8 @@ async def training_video_only(
         )
 
         # Generate video
-        result = orchestrator.generate_video(generation_request)
+        with profile_job(job_id, "generate_video", kind="training", enabled=profile):
+            result = orchestrator.generate_video(generation_request)
 
         # Clean up temporary video file if uploaded
         if reference_video_path and Path(reference_video_path).exists():
@@ -1337,7 +1584,8 @@ async def training_video_only(
             total_duration=result.total_duration,
             avatar_duration=result.avatar_duration,
             presentation_duration=result.presentation_duration,
-            error=result.error
+            error=result.error,
+            profiles=_profile_links(job_id)
         )
 
     except Exception as e:
@@ -1359,7 +1607,8 @@ async def training_video_only(
             success=False,
             download_url=None,
             mode="video_only",
-            error=error_msg
+            error=error_msg,
+            profiles=_profile_links(job_id)
         )
 
 
@@ -1400,7 +1649,8 @@ async def training_presentation_only(req: TrainingVideoRequest):
         )
 
         # Generate video
-        result = orchestrator.generate_video(generation_request)
+        with profile_job(job_id, "generate_video", kind="training", enabled=req.profile):
+            result = orchestrator.generate_video(generation_request)
 
         total_time = time.time() - start_time
 
@@ -1421,7 +1671,8 @@ async def training_presentation_only(req: TrainingVideoRequest):
             total_duration=result.total_duration,
             avatar_duration=result.avatar_duration,
             presentation_duration=result.presentation_duration,
-            error=result.error
+            error=result.error,
+            profiles=_profile_links(job_id)
         )
 
     except Exception as e:
@@ -1439,7 +1690,8 @@ async def training_presentation_only(req: TrainingVideoRequest):
             success=False,
             download_url=None,
             mode="presentation_only",
-            error=error_msg
+            error=error_msg,
+            profiles=_profile_links(job_id)
         )
 
 
@@ -1482,7 +1734,8 @@ async def training_video_presentation(req: TrainingVideoRequest):
         )
 
         # Generate video
-        result = orchestrator.generate_video(generation_request)
+        with profile_job(job_id, "generate_video", kind="training", enabled=req.profile):
+            result = orchestrator.generate_video(generation_request)
 
         total_time = time.time() - start_time
 
@@ -1503,7 +1756,8 @@ async def training_video_presentation(req: TrainingVideoRequest):
             total_duration=result.total_duration,
             avatar_duration=result.avatar_duration,
             presentation_duration=result.presentation_duration,
-            error=result.error
+            error=result.error,
+            profiles=_profile_links(job_id)
         )
 
     except Exception as e:
@@ -1521,7 +1775,8 @@ async def training_video_presentation(req: TrainingVideoRequest):
             success=False,
             download_url=None,
             mode="video_presentation",
-            error=error_msg
+            error=error_msg,
+            profiles=_profile_links(job_id)
         )
 
 
@@ -1705,8 +1960,8 @@ async def update_crop(job_id: str, crop_region: dict):
 
 
 @app.post("/video/generate/{job_id}")
-async def generate_final_video(job_id: str):
-    """Start Phase 3: Final video composition with full-screen SRT subtitle overlay"""
+async def generate_final_video(job_id: str, profile: Optional[bool] = None):
+    """Start Phase 3: Final video composition with full-screen SRT subtitle overlay (profile=true samples it)"""
     if job_id not in video_jobs:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
     
@@ -1742,7 +1997,7 @@ async def generate_final_video(job_id: str):
         # Create background task for composition
         background_thread = threading.Thread(
             target=_run_phase3_composition,
-            args=(job_id, orchestrator)
+            args=(job_id, orchestrator, profile)
         )
         background_thread.daemon = True
         background_thread.start()
@@ -1763,7 +2018,7 @@ async def generate_final_video(job_id: str):
         raise HTTPException(status_code=500, detail=error_msg)
 
 
-def _run_phase3_composition(job_id: str, orchestrator):
+def _run_phase3_composition(job_id: str, orchestrator, profile: Optional[bool] = None):
     """Background task for Phase 3 video composition"""
     try:
         jlog(log, logging.INFO,
@@ -1771,7 +2026,8 @@ def _run_phase3_composition(job_id: str, orchestrator):
              job_id=job_id)
         
         # Run the composition process
-        result = orchestrator.compose_final_video()
+        with profile_job(job_id, "phase3", kind="video", enabled=profile):
+            result = orchestrator.compose_final_video()
         
         if result.get("success"):
             update_video_job(job_id, 
@@ -2239,7 +2495,9 @@ async def data_ask(req: DataAsk):
         )
 
         # Call orchestrate_mixed with enhanced error context
-        res = orchestrate_mixed(
+        res = await get_pipeline_executor().run(
+            "data_ask",
+            orchestrate_mixed,
             req.report_text,
             slide_count=req.slides,
             dataset_id=ds,
@@ -2267,6 +2525,9 @@ async def data_ask(req: DataAsk):
             "created_slides": res.get("created_slides"),
         }
         
+    except PipelineBusy as e:
+        jlog(log, logging.WARNING, event="data_ask_busy", error=str(e), **request_info)
+        raise _busy_exception(e)
     except HTTPException:
         raise  # Re-raise HTTP exceptions as-is
     except Exception as e:
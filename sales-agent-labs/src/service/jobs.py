@@ -0,0 +1,233 @@
+from __future__ import annotations
+import asyncio, contextvars, logging, os, threading, time, uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from src.common.jsonlog import jlog
+from src.common.profiling import profile_job
+from src.common.tracing import start_span
+
+log = logging.getLogger("service.jobs")
+
+_WORKERS = int(os.getenv("PRESGEN_PIPELINE_WORKERS", "3"))
+_MAX_QUEUED = int(os.getenv("PRESGEN_PIPELINE_MAX_QUEUED", "20"))
+_JOB_TTL_SECS = int(os.getenv("PRESGEN_PIPELINE_JOB_TTL_SECS", "3600"))
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class PipelineBusy(RuntimeError):
+    """Every worker is busy and the queue is full; the caller should retry later."""
+
+
+@dataclass
+class PipelineJob:
+    job_id: str
+    kind: str
+    status: str = "queued"  # queued -> running -> completed | failed
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    profile: Optional[bool] = None  # None defers to PRESGEN_PROFILE_JOBS
+    exception: Optional[Exception] = field(default=None, repr=False)
+    future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_secs": (
+                round(self.finished_at - self.started_at, 2)
+                if self.started_at and self.finished_at else None
+            ),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class PipelineExecutor:
+    """
+    Dedicated, bounded executor for the synchronous deck pipelines.
+
+    orchestrate()/orchestrate_mixed() block for the whole LLM + Imagen + Slides
+    run, so they must never execute on the uvicorn event loop. Work is either
+    awaited (run: synchronous HTTP mode) or registered as a job (submit: job id,
+    then poll or stream its status). At most max_workers pipelines run at once
+    and at most max_queued wait; beyond that submissions raise PipelineBusy.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = _WORKERS,
+        max_queued: int = _MAX_QUEUED,
+        job_ttl_secs: int = _JOB_TTL_SECS,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_queued = max(0, max_queued)
+        self.job_ttl_secs = job_ttl_secs
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pipeline"
+        )
+        self._jobs: Dict[str, PipelineJob] = {}
+        self._lock = threading.Lock()
+        self._active = 0  # queued + running
+        self._running = 0
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        job_id: Optional[str] = None,
+        profile: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> PipelineJob:
+        """Queue fn(*args, **kwargs) as a job and return it immediately.
+
+        profile=True samples the worker thread while the job runs (see
+        src.common.profiling); None leaves it to PRESGEN_PROFILE_JOBS.
+        """
+        self._prune()
+        job = PipelineJob(job_id=job_id or str(uuid.uuid4()), kind=kind, profile=profile)
+        with self._lock:
+            if self._active >= self.max_workers + self.max_queued:
+                jlog(log, logging.WARNING, event="pipeline_busy", kind=kind,
+                     active=self._active, running=self._running)
+                raise PipelineBusy(
+                    f"{self._active} pipeline jobs in progress; try again shortly"
+                )
+            self._active += 1
+            self._jobs[job.job_id] = job
+            # Run in the submitter's context so the job's spans join the request's trace
+            ctx = contextvars.copy_context()
+            job.future = self._pool.submit(ctx.run, self._run_job, job, fn, args, kwargs)
+        # Outside the lock: the callback runs inline if the future is already done
+        job.future.add_done_callback(lambda future: self._release_if_cancelled(job, future))
+        jlog(log, logging.INFO, event="pipeline_job_queued", job_id=job.job_id, kind=kind)
+        return job
+
+    async def run(self, kind: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run fn on the executor and await its result without blocking the event loop.
+
+        Cancelling the caller (client disconnect, shutdown, timeout) does not
+        cancel the job; it still runs and can be polled by id.
+        """
+        job = self.submit(kind, fn, *args, **kwargs)
+        await asyncio.shield(asyncio.wrap_future(job.future))
+        if job.exception is not None:
+            raise job.exception
+        return job.result
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> bool:
+        """Wait up to timeout seconds for a job to finish; True if it has."""
+        job = self._jobs.get(job_id)
+        if job is None or job.future is None:
+            return bool(job and job.done)
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(job.future)), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def get(self, job_id: str) -> Optional[PipelineJob]:
+        return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "running": self._running,
+                "queued": self._active - self._running,
+                "capacity": self.max_workers + self.max_queued,
+                "jobs_tracked": len(self._jobs),
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work; jobs still queued are cancelled and marked failed."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        for job in list(self._jobs.values()):
+            if job.future is not None and job.future.cancelled():
+                job.status = "failed"
+                job.error = "cancelled: pipeline executor shut down"
+                job.finished_at = time.time()
+
+    def _run_job(self, job: PipelineJob, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        with self._lock:
+            self._running += 1
+        job.status = "running"
+        job.started_at = time.time()
+        jlog(log, logging.INFO, event="pipeline_job_start", job_id=job.job_id, kind=job.kind,
+             queue_wait_secs=round(job.started_at - job.created_at, 3))
+        try:
+            with start_span(f"pipeline.{job.kind}", job_id=job.job_id,
+                            queue_wait_secs=round(job.started_at - job.created_at, 3)), \
+                    profile_job(job.job_id, job.kind, enabled=job.profile):
+                job.result = fn(*args, **kwargs)
+            job.status = "completed"
+        except Exception as e:  # surfaced to the waiter / poller, never raised here
+            job.exception = e
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._running -= 1
+                self._active -= 1
+            jlog(log, logging.INFO if job.status == "completed" else logging.ERROR,
+                 event="pipeline_job_finished", job_id=job.job_id, kind=job.kind,
+                 status=job.status, error=job.error,
+                 duration_secs=round(job.finished_at - job.started_at, 2))
+
+    def _release_if_cancelled(self, job: PipelineJob, future: Future) -> None:
+        """A job cancelled while queued never reaches _run_job; free its slot here."""
+        if not future.cancelled():
+            return
+        with self._lock:
+            self._active -= 1
+        job.status = "failed"
+        job.error = job.error or "cancelled before it started"
+        job.finished_at = time.time()
+        jlog(log, logging.WARNING, event="pipeline_job_cancelled", job_id=job.job_id, kind=job.kind)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.job_ttl_secs
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.done and job.finished_at and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+_EXECUTOR: Optional[PipelineExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_pipeline_executor() -> PipelineExecutor:
+    """Process-wide pipeline executor; created on first use."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = PipelineExecutor()
+    return _EXECUTOR
+
+
+def shutdown_pipeline_executor() -> None:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown()
+            _EXECUTOR = None
@@ -0,0 +1,82 @@
+# tests/test_benchmarks_unit.py
+import json
+
+from benchmarks import run, stubs
+from benchmarks.run import compare, percentile, run_scenario, summarize
+from src.mcp.tools import data
+
+_PARAMS = {
+    "iterations": 4, "concurrency": 2, "warmup": 0, "latency_scale": 0.0,
+    "latency_overrides": "", "slides": 2, "clip_secs": 5.0, "use_cache": False,
+}
+
+
+def test_summary_percentiles_and_throughput():
+    stats = summarize([0.1, 0.2, 0.3, 0.4, 1.0], errors=1, wall_secs=2.0)
+
+    assert percentile([], 95) == 0.0
+    assert stats["p50_ms"] == 300.0
+    assert stats["p95_ms"] == 880.0  # interpolated between 400 and 1000
+    assert stats["throughput_per_min"] == 150.0
+    assert (stats["ok"], stats["errors"]) == (5, 1)
+
+
+def test_compare_flags_regressions_beyond_tolerance_only():
+    base = {"p95_ms": 100.0, "peak_rss_mb": 200.0, "throughput_per_min": 60.0, "errors": 0, "params": _PARAMS}
+    baseline = {"scenarios": {"a": base, "b": base, "c": {**base, "params": {**_PARAMS, "iterations": 9}}}}
+    results = {
+        "a": {**base, "p95_ms": 115.0, "throughput_per_min": 55.0},  # within 20%
+        "b": {**base, "p95_ms": 130.0, "errors": 2},
+        "c": base,
+        "d": base,
+        "e": {"skipped": "ffmpeg not found on PATH"},
+    }
+
+    verdicts = compare(results, baseline, tolerance=0.2)
+
+    assert verdicts["a"] == {"regressions": [], "notes": []}
+    assert verdicts["b"]["regressions"] == ["errors 0 -> 2", "p95_ms 100.0 -> 130.0 (+30%)"]
+    assert verdicts["c"]["notes"] == ["not comparable: iterations differ"]
+    assert verdicts["d"]["notes"] == ["no baseline"]
+    assert "e" not in verdicts
+
+
+def test_stubbed_data_llm_serves_recorded_sql_and_latency_overrides(monkeypatch):
+    monkeypatch.setenv("PRESGEN_BENCH_LATENCY_MS", "data_llm=0")
+    fixture = stubs.load_fixture("data_llm")
+    question = "Show me something interesting"
+
+    sql = stubs.FakeGemini().generate_content(f"You are a SQL generator\nQ: {question}\n").text
+    assert sql == fixture["sql"][question]
+    assert stubs.latency_secs("data_llm", 1200) == 0.0
+    monkeypatch.setenv("PRESGEN_BENCH_LATENCY_MS", "")
+    monkeypatch.setenv("PRESGEN_BENCH_LATENCY_SCALE", "0.5")
+    assert stubs.latency_secs("imagen", 9000) == 4.5
+
+
+def test_data_query_scenario_runs_offline(tmp_path, monkeypatch):
+    monkeypatch.chdir(run.prepare_workdir(tmp_path))
+    monkeypatch.setenv("PRESGEN_BENCH_LATENCY_SCALE", "0")
+    # install_data_stubs patches the data tool module; restore it afterwards
+    monkeypatch.setattr(data, "_USE_LLM", data._USE_LLM)
+    monkeypatch.setattr(data, "_gemini", data._gemini)
+
+    result = run_scenario("data_query", _PARAMS)
+
+    assert result["errors"] == 0, result["failures"]
+    assert result["ok"] == 4 and result["p95_ms"] >= result["p50_ms"] > 0
+    assert result["peak_rss_mb"] > 0
+    assert (tmp_path / "out" / "state" / "datasets.json").exists()  # state stays in the workdir
+
+
+def test_orchestrate_runs_through_the_stub_mcp_server(tmp_path):
+    json_out = tmp_path / "results.json"
+    code = run.main([
+        "orchestrate", "--iterations", "1", "--warmup", "0", "--slides", "1", "--latency-scale", "0",
+        "--workdir", str(tmp_path), "--baseline", str(tmp_path / "none.json"), "--json", str(json_out),
+    ])
+
+    result = json.loads(json_out.read_text())["scenarios"]["orchestrate"]
+    assert code == 0
+    assert result["errors"] == 0 and result["ok"] == 1, result
+    assert result["peak_child_rss_mb"] > 0  # the MCP stub server ran as a subprocess
@@ -0,0 +1,78 @@
+# tests/test_chart_render_unit.py
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.data.charts import ChartRenderer, chart_key
+
+
+def _df(v: int = 3) -> pd.DataFrame:
+    return pd.DataFrame({"company": ["a", "b", "c"], "total": [1, 2, v]})
+
+
+def test_chart_key_stability():
+    assert chart_key(_df(), "bar") == chart_key(_df(), "bar")
+    assert chart_key(_df(), "bar") != chart_key(_df(4), "bar")
+    assert chart_key(_df(), "bar") != chart_key(_df(), "line")
+
+
+def test_render_is_cached_by_content(tmp_path: Path):
+    r = ChartRenderer(max_workers=1, cache_dir=tmp_path)
+    try:
+        p1 = r.render(_df(), "bar", numeric_cols=["total"])
+        assert p1.exists() and p1.parent == tmp_path
+        p1.write_bytes(b"cached")
+        os.utime(p1, (time.time() - 600, time.time() - 600))
+        p2 = r.render(_df(), "bar", numeric_cols=["total"])
+        assert p2 == p1
+        assert p2.read_bytes() == b"cached"  # served from cache, not re-rendered
+        assert time.time() - p2.stat().st_mtime < 60  # touched, so prune() keeps it
+    finally:
+        r.shutdown()
+
+
+def test_cache_evicts_expired_then_oldest(tmp_path: Path):
+    r = ChartRenderer(max_workers=1, cache_dir=tmp_path, max_files=2, max_age_secs=3600)
+    try:
+        now = time.time()
+        pngs = []
+        for i, age in enumerate([7200, 300, 200, 100]):
+            png = tmp_path / f"{i}.png"
+            png.write_bytes(b"png")
+            os.utime(png, (now - age, now - age))
+            pngs.append(png)
+        (tmp_path / ".3.123.tmp.png").write_bytes(b"partial")
+
+        assert r.prune(force=True) == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".3.123.tmp.png", "2.png", "3.png"]
+    finally:
+        r.shutdown()
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path: Path, monkeypatch):
+    from matplotlib.figure import Figure
+
+    def fail(self, fname, **kwargs):
+        Path(fname).write_bytes(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Figure, "savefig", fail)
+    r = ChartRenderer(max_workers=1, cache_dir=tmp_path)
+    try:
+        with pytest.raises(OSError):
+            r.render(_df(), "bar", numeric_cols=["total"])
+        assert list(tmp_path.iterdir()) == []
+    finally:
+        r.shutdown()
+
+
+def test_warm_worker_draws_on_agg_canvas():
+    from src.data.charts import _figure_for, _warm_worker, CHART_STYLE
+
+    _warm_worker(CHART_STYLE)
+
+    fig = _figure_for("bar", CHART_STYLE)
+    assert fig.canvas.get_renderer().width > 0  # Agg renderer was created by the draw
@@ -0,0 +1,93 @@
+# tests/test_google_clients_unit.py
+import datetime as dt
+import threading
+
+from src.agent import google_clients
+from src.agent.google_clients import GoogleClientProvider
+
+
+class _FakeCreds:
+    def __init__(self, token="t0", expires_in=3600):
+        self.token = token
+        self.expiry = dt.datetime.utcnow() + dt.timedelta(seconds=expires_in)
+        self.refreshes = 0
+
+    def refresh(self, request):
+        self.refreshes += 1
+        self.token = f"t{self.refreshes}"
+        self.expiry = dt.datetime.utcnow() + dt.timedelta(seconds=3600)
+
+
+def _provider(monkeypatch, creds, **kwargs):
+    loads, builds = [], []
+
+    def loader():
+        loads.append(1)
+        return creds() if callable(creds) else creds
+
+    def fake_build(api, version, http=None, cache_discovery=True):
+        builds.append((api, version, threading.current_thread().name))
+        return {"api": api, "http": http}
+
+    monkeypatch.setattr(google_clients, "build", fake_build)
+    return GoogleClientProvider(loader, **kwargs), loads, builds
+
+
+def test_credentials_load_once_and_services_are_cached_per_thread(monkeypatch):
+    provider, loads, builds = _provider(monkeypatch, _FakeCreds())
+
+    main = [provider.service("slides", "v1") for _ in range(5)]
+    drive = provider.service("drive", "v3")
+    other = []
+    t = threading.Thread(target=lambda: other.append(provider.service("slides", "v1")), name="worker")
+    t.start()
+    t.join()
+
+    assert len(loads) == 1
+    assert all(svc is main[0] for svc in main)
+    assert drive["http"] is main[0]["http"]  # one keep-alive transport per thread
+    assert other[0] is not main[0] and other[0]["http"] is not main[0]["http"]
+    assert sorted(api for api, _, _ in builds) == ["drive", "slides", "slides"]
+
+
+def test_tokens_refresh_in_background_before_expiry_and_are_persisted(monkeypatch):
+    creds = _FakeCreds(expires_in=120)  # inside the 300s margin
+    release = threading.Event()
+    refresh = creds.refresh
+    creds.refresh = lambda request: (release.wait(5), refresh(request))
+    saved = []
+    provider, _, _ = _provider(monkeypatch, creds, refresh_margin_secs=300, on_refresh=saved.append)
+
+    first = provider.credentials()
+    token_during_refresh = creds.token
+    refresher = provider._refresher
+    release.set()
+    refresher.join(5)
+    again = provider.credentials()
+
+    assert first is again is creds
+    assert token_during_refresh == "t0"  # the caller did not wait for the refresh
+    assert creds.refreshes == 1 and creds.token == "t1"
+    assert saved == [creds]
+    assert provider._refresher is None
+
+
+def test_expired_tokens_refresh_in_the_callers_thread(monkeypatch):
+    creds = _FakeCreds(expires_in=-10)
+    provider, _, _ = _provider(monkeypatch, creds, refresh_margin_secs=300)
+
+    provider.credentials()
+
+    assert creds.refreshes == 1 and creds.token == "t1"
+    assert provider._refresher is None
+
+
+def test_invalidate_rebinds_thread_clients_to_new_credentials(monkeypatch):
+    provider, loads, builds = _provider(monkeypatch, _FakeCreds)  # a new token each load
+    before = provider.service("slides", "v1")
+
+    provider.invalidate()
+    after = provider.service("slides", "v1")
+
+    assert len(loads) == 2
+    assert after is not before and after["http"] is not before["http"]
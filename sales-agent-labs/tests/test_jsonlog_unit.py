@@ -0,0 +1,80 @@
+# tests/test_jsonlog_unit.py
+import json
+import logging
+
+from src.common import jsonlog
+from src.common.jsonlog import jlog
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def _logger(name: str, level: int):
+    lg = logging.getLogger(name)
+    lg.handlers[:] = []
+    lg.propagate = False
+    lg.setLevel(level)
+    cap = _Capture()
+    lg.addHandler(cap)
+    return lg, cap
+
+
+def test_disabled_level_skips_serialization(monkeypatch):
+    lg, cap = _logger("test.jsonlog.disabled", logging.WARNING)
+
+    def boom(_kv):
+        raise AssertionError("serialized a dropped record")
+
+    monkeypatch.setattr(jsonlog, "_dumps", boom)
+    jlog(lg, logging.INFO, event="noisy")
+    assert cap.messages == []
+
+
+def test_single_pass_handles_non_serializable_values():
+    lg, cap = _logger("test.jsonlog.values", logging.INFO)
+    jlog(lg, logging.INFO, event="e", blob=b"abc", path=object(), req_id="r1")
+
+    rec = json.loads(cap.messages[0])
+    assert rec["event"] == "e" and rec["req_id"] == "r1"
+    assert rec["blob"] == "abc"
+    assert rec["path"].startswith("<object object")
+    assert rec["level"] == "INFO" and "ts_ms" in rec
+
+
+def test_background_logging_runs_handlers_off_thread():
+    lg, cap = _logger("test.jsonlog.background", logging.INFO)
+    try:
+        jsonlog.start_background_logging(lg)
+        assert isinstance(lg.handlers[0], logging.handlers.QueueHandler)
+        jlog(lg, logging.INFO, event="queued")
+    finally:
+        jsonlog.stop_background_logging()  # flushes the queue
+    assert json.loads(cap.messages[0])["event"] == "queued"
+
+
+def test_stop_background_logging_restores_handlers():
+    lg, cap = _logger("test.jsonlog.restore", logging.INFO)
+    jsonlog.start_background_logging(lg)
+    jsonlog.stop_background_logging()
+
+    assert lg.handlers == [cap]
+    jlog(lg, logging.INFO, event="after_stop")
+    assert json.loads(cap.messages[-1])["event"] == "after_stop"
+
+
+def test_gcp_debug_flag_is_read_once_not_per_record(monkeypatch):
+    lg, cap = _logger("test.jsonlog.gcp", logging.INFO)
+    monkeypatch.setattr(jsonlog, "_GCP_DEBUG_SETUP", True)
+    monkeypatch.setattr(jsonlog, "_GCP_DEBUG_ENABLED", True)
+    monkeypatch.setattr(jsonlog, "_GCP_TRACE_PREFIX", "projects/p/traces/")
+    monkeypatch.setenv("ENABLE_GCP_DEBUG_LOGGING", "false")
+
+    jlog(lg, logging.INFO, event="traced")
+
+    assert json.loads(cap.messages[0])["gcp_trace_id"].startswith("projects/p/traces/")
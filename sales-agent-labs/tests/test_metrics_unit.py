@@ -0,0 +1,93 @@
+# tests/test_metrics_unit.py
+import asyncio
+
+import httpx
+
+from src.common import cache, metrics
+from src.common.metrics import MetricsRegistry
+from src.service import http as service_http
+from src.service import jobs
+from src.service.jobs import PipelineExecutor
+
+
+def test_histogram_and_counter_render_in_prometheus_format():
+    reg = MetricsRegistry()
+    hist = reg.histogram("t_phase_seconds", "Phase latency.", ("phase",), buckets=(0.1, 1.0))
+    hits = reg.counter("t_cache_total", "Cache lookups.", ("result",))
+
+    for secs in (0.05, 0.5, 0.5, 3.0):
+        hist.observe(secs, phase="llm")
+    with hist.time(phase="imagen"):
+        pass
+    hits.inc(result="hit")
+    hits.inc(2, result="miss")
+
+    text = reg.render()
+    assert "# TYPE t_phase_seconds histogram" in text
+    assert 't_phase_seconds_bucket{phase="llm",le="0.1"} 1' in text
+    assert 't_phase_seconds_bucket{phase="llm",le="1"} 3' in text  # buckets are cumulative
+    assert 't_phase_seconds_bucket{phase="llm",le="+Inf"} 4' in text
+    assert 't_phase_seconds_sum{phase="llm"} 4.05' in text
+    assert 't_phase_seconds_count{phase="imagen"} 1' in text
+    assert 't_cache_total{result="miss"} 2' in text
+
+
+def test_forwarded_updates_merge_into_another_registry():
+    # Stands in for the MCP subprocess (server) and the HTTP process (client)
+    server, client = MetricsRegistry(), MetricsRegistry()
+    for reg in (server, client):
+        reg.histogram("t_query_seconds", "DuckDB query latency.", ("phase",))
+        reg.counter("t_lookups_total", "Lookups.", ("result",))
+    server.start_forwarding()
+
+    server.get("t_query_seconds").observe(0.2, phase="duckdb_query")
+    server.get("t_lookups_total").inc(result="hit")
+    entries = server.drain_forwarded()
+    client.merge(entries)
+    client.merge(None)
+
+    assert server.drain_forwarded() == []
+    assert client.get("t_query_seconds").count(phase="duckdb_query") == 1
+    assert client.get("t_lookups_total").value(result="hit") == 1
+
+
+def test_cache_get_counts_hits_and_misses(tmp_path):
+    before_hit = metrics.CACHE_REQUESTS.value(namespace="data_plan", result="hit")
+    before_miss = metrics.CACHE_REQUESTS.value(namespace="data_plan", result="miss")
+
+    assert cache.get("data_plan/ds1", "k", root=tmp_path) is None
+    cache.set("data_plan/ds1", "k", {"sql": "select 1"}, root=tmp_path)
+    assert cache.get("data_plan/ds1", "k", root=tmp_path) == {"sql": "select 1"}
+
+    # dataset ids are folded into the namespace label
+    assert metrics.CACHE_REQUESTS.value(namespace="data_plan", result="hit") == before_hit + 1
+    assert metrics.CACHE_REQUESTS.value(namespace="data_plan", result="miss") == before_miss + 1
+
+
+def test_metrics_endpoint_exposes_phases_gauges_and_request_latency(monkeypatch):
+    ex = PipelineExecutor(max_workers=2, max_queued=1)
+    monkeypatch.setattr(jobs, "_EXECUTOR", ex)
+    monkeypatch.setattr(service_http, "video_jobs", {
+        "a": {"status": "processing"}, "b": {"status": "processing"}, "c": {"status": "completed"},
+    })
+    metrics.observe_phase("presentation", "slides_api", 1.5)
+
+    async def scrape():
+        transport = httpx.ASGITransport(app=service_http.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/healthz")
+            return await client.get("/metrics")
+
+    try:
+        resp = asyncio.run(scrape())
+    finally:
+        ex.shutdown(wait=True)
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = resp.text
+    assert 'presgen_pipeline_jobs{state="queued"} 0' in body
+    assert "presgen_pipeline_workers 2" in body
+    assert 'presgen_video_jobs{status="processing"} 2' in body
+    assert 'presgen_phase_duration_seconds_count{pipeline="presentation",phase="slides_api",status="ok"}' in body
+    assert 'presgen_http_request_duration_seconds_count{method="GET",route="/healthz",status="200"}' in body
@@ -0,0 +1,145 @@
+# tests/test_pipeline_jobs_unit.py
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from src.service import http as service_http
+from src.service import jobs
+from src.service.jobs import PipelineBusy, PipelineExecutor
+
+
+def _slow_orchestrate(report_text, client_request_id=None, use_cache=True, slide_count=1):
+    time.sleep(0.3)  # stands in for the blocking LLM + Imagen + Slides run
+    if report_text == "fail":
+        raise RuntimeError("slides quota exceeded")
+    return {"url": f"https://slides/{report_text}", "presentation_id": report_text, "created_slides": slide_count}
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    ex = PipelineExecutor(max_workers=2, max_queued=1)
+    monkeypatch.setattr(jobs, "_EXECUTOR", ex)
+    monkeypatch.setattr(service_http, "orchestrate", _slow_orchestrate)
+    yield ex
+    ex.shutdown(wait=True)
+
+
+def _client():
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=service_http.app), base_url="http://test")
+
+
+def test_executor_bounds_concurrency_and_rejects_when_full():
+    ex = PipelineExecutor(max_workers=2, max_queued=1)
+    release = threading.Event()
+    running = []
+
+    def work(i):
+        running.append(i)
+        release.wait(5)
+        return i
+
+    submitted = [ex.submit("render", work, i) for i in range(3)]
+    time.sleep(0.1)
+    assert sorted(running) == [0, 1]  # the third job waits for a worker
+    assert ex.stats()["queued"] == 1
+    with pytest.raises(PipelineBusy):
+        ex.submit("render", work, 3)
+
+    release.set()
+    for job in submitted:
+        job.future.result(timeout=5)
+    ex.shutdown(wait=True)
+    assert [job.status for job in submitted] == ["completed"] * 3
+    assert [job.result for job in submitted] == [0, 1, 2]
+
+
+def test_cancelled_waiter_does_not_leak_a_queue_slot():
+    ex = PipelineExecutor(max_workers=1, max_queued=1)
+    release = threading.Event()
+    blocker = ex.submit("render", release.wait, 5)
+
+    async def cancel_queued_run():
+        waiter = asyncio.create_task(ex.run("render", lambda: "done"))
+        await asyncio.sleep(0.05)
+        assert ex.stats()["queued"] == 1
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(cancel_queued_run())
+    queued = next(job for job in ex._jobs.values() if job is not blocker)
+    release.set()
+    queued.future.result(timeout=5)
+    assert queued.status == "completed" and queued.result == "done"  # the job still ran
+    assert ex.stats()["queued"] == 0 and ex.stats()["running"] == 0
+
+    # A future cancelled before it starts releases its slot too
+    release.clear()
+    blocker = ex.submit("render", release.wait, 5)
+    time.sleep(0.05)
+    pending = ex.submit("render", lambda: "never")
+    assert pending.future.cancel()
+    assert pending.status == "failed" and ex.stats()["queued"] == 0
+    ex.submit("render", lambda: "fits")  # not rejected with PipelineBusy
+    release.set()
+    ex.shutdown(wait=True)
+
+def test_render_keeps_event_loop_responsive(executor):
+    async def scenario():
+        async with _client() as client:
+            renders = [
+                asyncio.create_task(client.post("/render", json={"report_text": f"deck{i}"}))
+                for i in range(2)
+            ]
+            await asyncio.sleep(0.05)
+            started = time.perf_counter()
+            health = await client.get("/healthz")
+            health_latency = time.perf_counter() - started
+            return health, health_latency, await asyncio.gather(*renders)
+
+    health, health_latency, renders = asyncio.run(scenario())
+
+    assert health.status_code == 200
+    assert health_latency < 0.2  # not stuck behind the 0.3s renders
+    assert [r.json()["url"] for r in renders] == ["https://slides/deck0", "https://slides/deck1"]
+
+
+def test_render_job_api_submit_poll_and_stream(executor):
+    async def scenario():
+        async with _client() as client:
+            ok = await client.post("/render/jobs", json={"report_text": "deck", "slides": 2})
+            failed = await client.post("/render/jobs", json={"report_text": "fail"})
+            assert ok.status_code == 202 and failed.status_code == 202
+
+            queued = await client.get(ok.json()["status_url"])
+            events = await client.get(ok.json()["events_url"])
+            await executor.wait(failed.json()["job_id"], timeout=5)
+            final_failed = await client.get(failed.json()["status_url"])
+            return queued.json(), events.text, final_failed.json()
+
+    queued, events, final_failed = asyncio.run(scenario())
+
+    assert queued["status"] in ("queued", "running")
+    assert events.startswith("event: status")
+    assert "event: completed" in events and "https://slides/deck" in events
+    assert final_failed["status"] == "failed"
+    assert "slides quota exceeded" in final_failed["error"]
+
+
+def test_render_returns_503_when_pipeline_is_saturated(executor):
+    async def scenario():
+        async with _client() as client:
+            accepted = [
+                await client.post("/render/jobs", json={"report_text": f"deck{i}"}) for i in range(3)
+            ]
+            rejected = await client.post("/render", json={"report_text": "one more"})
+            return accepted, rejected
+
+    accepted, rejected = asyncio.run(scenario())
+
+    assert [r.status_code for r in accepted] == [202, 202, 202]
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "30"
@@ -0,0 +1,105 @@
+# tests/test_profiling_unit.py
+import ast
+import asyncio
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from src.common import profiling
+from src.common.profiling import profile_job, profiling_enabled
+from src.service import http as service_http
+from src.service import jobs
+from src.service.jobs import PipelineExecutor
+
+
+def _spin(seconds: float) -> str:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+    return "done"
+
+
+@pytest.fixture
+def jobs_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "JOBS_ROOT", tmp_path)
+    monkeypatch.setenv("PRESGEN_PROFILE_INTERVAL_MS", "1")
+    monkeypatch.delenv("PRESGEN_PROFILE_JOBS", raising=False)
+    return tmp_path
+
+
+def test_request_flag_wins_over_env(monkeypatch):
+    monkeypatch.setenv("PRESGEN_PROFILE_JOBS", "render, data_query")
+    assert profiling_enabled("render") and profiling_enabled("data_query")
+    assert not profiling_enabled("presentation")
+    assert profiling_enabled("presentation", requested=True)
+    assert not profiling_enabled("render", requested=False)
+    monkeypatch.setenv("PRESGEN_PROFILE_JOBS", "all")
+    assert profiling_enabled("video")
+
+
+def test_profile_job_writes_and_merges_collapsed_stacks(jobs_root):
+    with profile_job("job-1", "data_query", enabled=False) as path:
+        _spin(0.01)
+    assert path is None and profiling.list_profiles("job-1") == []
+
+    for _ in range(2):
+        with profile_job("job-1", "data_query", enabled=True) as path:
+            assert profiling.current_job() == ("job-1", True)
+            _spin(0.1)
+    assert profiling.current_job() is None
+
+    assert path == jobs_root / "job-1" / "profile-data_query.folded"
+    assert profiling.list_profiles("job-1") == ["profile-data_query.folded"]
+    lines = path.read_text().splitlines()
+    counts = {line.rpartition(" ")[0]: int(line.rpartition(" ")[2]) for line in lines}
+    assert len(counts) == len(lines)  # the second run merged into the first
+    spin = [stack for stack in counts if "_spin (test_profiling_unit.py" in stack]
+    assert spin and all(stack.split(";")[-1].startswith("_spin") for stack in spin)
+    assert sum(counts[s] for s in spin) > 20
+
+
+def test_pipeline_job_profile_is_linked_from_job_status(jobs_root, monkeypatch):
+    ex = PipelineExecutor(max_workers=1, max_queued=1)
+    monkeypatch.setattr(jobs, "_EXECUTOR", ex)
+    job = ex.submit("render", _spin, 0.1, profile=True)
+    plain = ex.submit("render", _spin, 0.01)
+
+    async def fetch():
+        transport = httpx.ASGITransport(app=service_http.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await ex.wait(job.job_id, timeout=10)
+            await ex.wait(plain.job_id, timeout=10)
+            status = (await client.get(f"/jobs/{job.job_id}")).json()
+            profile = await client.get(status["profiles"][0])
+            missing = await client.get(f"/jobs/{job.job_id}/profiles/spans.jsonl")
+            return status, profile, missing, (await client.get(f"/jobs/{plain.job_id}")).json()
+
+    try:
+        status, profile, missing, plain_status = asyncio.run(fetch())
+    finally:
+        ex.shutdown(wait=True)
+
+    assert status["result"] == "done"
+    assert status["profiles"] == [f"/jobs/{job.job_id}/profiles/profile-render.folded"]
+    assert profile.status_code == 200 and "_spin" in profile.text
+    assert missing.status_code == 404
+    assert plain_status["profiles"] == []
+
+
+def _class_source(path: Path, name: str) -> str:
+    source = path.read_text()
+    node = next(n for n in ast.parse(source).body if isinstance(n, ast.ClassDef) and n.name == name)
+    return ast.get_source_segment(source, node)
+
+
+def test_sampling_profiler_matches_presgen_assess_copy():
+    # The two services ship separate src packages, so the sampler is copied
+    assess = Path(__file__).resolve().parents[1] / "presgen-assess" / "src" / "common" / "profiling.py"
+    if not assess.exists():
+        pytest.skip("presgen-assess is not checked out next to this package")
+
+    assert _class_source(Path(profiling.__file__), "SamplingProfiler") == _class_source(
+        assess, "SamplingProfiler"
+    )
@@ -0,0 +1,42 @@
+# tests/test_query_cache_unit.py
+from pathlib import Path
+
+import pandas as pd
+
+from src.data import catalog, query_cache
+
+
+def test_plan_and_result_roundtrip_and_invalidation(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(catalog, "CATALOG_PATH", tmp_path / "datasets.json")
+    ds = catalog.register_dataset(file_name="x.csv", sha256="ab" * 32, sheets=["main"])
+
+    plan = {"sql": "SELECT 1", "intent": "general", "insights": ["a"]}
+    query_cache.set_plan(ds, None, "Total Sales?", plan, root=tmp_path)
+    # question normalization: case, whitespace and trailing punctuation
+    assert query_cache.get_plan(ds, None, "  total   sales ", root=tmp_path) == plan
+
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    query_cache.set_result(ds, None, "SELECT 1", 100, df, root=tmp_path)
+    got = query_cache.get_result(ds, None, "SELECT 1;", 100, root=tmp_path)
+    pd.testing.assert_frame_equal(got, df)
+    assert query_cache.get_result(ds, None, "SELECT 1", 50, root=tmp_path) is None
+
+    query_cache.invalidate_dataset(ds, root=tmp_path)
+    assert query_cache.get_plan(ds, None, "total sales", root=tmp_path) is None
+    assert query_cache.get_result(ds, None, "SELECT 1", 100, root=tmp_path) is None
+
+
+def test_explicit_version_skips_catalog_reads(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(catalog, "CATALOG_PATH", tmp_path / "datasets.json")
+    ds = catalog.register_dataset(file_name="x.csv", sha256="cd" * 32, sheets=["main"])
+    ver = catalog.dataset_version(ds)
+    expected = (query_cache.plan_key(ds, None, "q"), query_cache.result_key(ds, None, "SELECT 1", 10))
+
+    def no_catalog(_ds):
+        raise AssertionError("catalog read despite an explicit version")
+
+    monkeypatch.setattr(query_cache, "dataset_version", no_catalog)
+    assert query_cache.plan_key(ds, None, "q", ver) == expected[0]
+    assert query_cache.result_key(ds, None, "SELECT 1", 10, ver) == expected[1]
+    query_cache.set_plan(ds, None, "q", {"sql": "SELECT 1"}, root=tmp_path, version=ver)
+    assert query_cache.get_plan(ds, None, "q", root=tmp_path, version=ver) == {"sql": "SELECT 1"}
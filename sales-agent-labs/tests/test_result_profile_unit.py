@@ -0,0 +1,29 @@
+# tests/test_result_profile_unit.py
+import pandas as pd
+
+from src.mcp.tools.data import MAX_CHART_CATEGORIES, _profile_result
+
+
+def test_cardinality_covers_category_columns_only():
+    df = pd.DataFrame({"company": ["a", "b", "a", None], "total": [1, 2, 3, 4]})
+
+    profile = _profile_result(df)
+
+    assert profile.cardinality == {"company": 2}
+    assert profile.chart_type == "bar"
+
+
+def test_high_cardinality_category_falls_back_to_table():
+    n = MAX_CHART_CATEGORIES + 1
+    df = pd.DataFrame({"company": [f"c{i}" for i in range(n)], "total": range(n)})
+
+    assert _profile_result(df).chart_type == "table"
+
+
+def test_grouped_intent_needs_low_cardinality_axes():
+    few = pd.DataFrame({"company": ["a", "b"] * 3, "day": ["mon", "tue", "wed"] * 2, "n": range(6)})
+    n = MAX_CHART_CATEGORIES + 1
+    many = pd.DataFrame({"company": ["a"] * n, "day": [f"d{i}" for i in range(n)], "n": range(n)})
+
+    assert _profile_result(few, intent="grouped").chart_type == "grouped_bar"
+    assert _profile_result(many, intent="grouped").chart_type != "grouped_bar"
@@ -0,0 +1,86 @@
+# tests/test_tracing_unit.py
+import json
+import sys
+
+import pytest
+
+from src.common import tracing
+from src.common.tracing import start_span
+from src.mcp_lab.rpc_client import MCPClient
+
+
+class _Collector:
+    def __init__(self):
+        self.records = []
+
+    def submit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def exported(monkeypatch):
+    collector = _Collector()
+    monkeypatch.setattr(tracing, "_EXPORTER", collector)
+    monkeypatch.setattr(tracing, "_EXPORTER_READY", True)
+    return collector.records
+
+
+def test_spans_nest_and_continue_a_remote_traceparent(exported):
+    remote = tracing.extract("00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01")
+
+    with start_span("POST /render", kind="server", parent=remote) as root:
+        with start_span("orchestrator.orchestrate", slides=3) as child:
+            carrier = tracing.inject({})
+        with pytest.raises(RuntimeError):
+            with start_span("slides.create_slide"):
+                raise RuntimeError("quota")
+
+    by_name = {r["name"]: r for r in exported}
+    assert [r["name"] for r in exported] == ["orchestrator.orchestrate", "slides.create_slide", "POST /render"]
+    assert {r["trace_id"] for r in exported} == {"0af7651916cd43dd8448eb211c80319c"}
+    assert by_name["POST /render"]["parent_id"] == "b7ad6b7169203331"
+    assert by_name["orchestrator.orchestrate"]["parent_id"] == root.span_id
+    assert by_name["slides.create_slide"]["status"] == "error"
+    assert carrier["traceparent"] == child.traceparent
+    assert tracing.current_span() is None
+    assert tracing.extract("not-a-traceparent") is None
+
+
+def test_file_exporter_writes_json_lines_and_otlp_payload_shape(tmp_path, monkeypatch):
+    path = tmp_path / "spans.jsonl"
+    monkeypatch.setenv("PRESGEN_TRACE_EXPORTER", "file")
+    monkeypatch.setenv("PRESGEN_TRACE_FILE", str(path))
+    monkeypatch.setenv("PRESGEN_TRACE_FLUSH_SECS", "0.05")
+    tracing.shutdown_tracing()
+    try:
+        with start_span("data.duckdb_query", rows=10):
+            pass
+    finally:
+        tracing.shutdown_tracing()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["name"] for r in records] == ["data.duckdb_query"]
+    payload = tracing.to_otlp(records)
+    span = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+    assert span["traceId"] == records[0]["trace_id"] and span["kind"] == 1
+    assert span["attributes"] == [{"key": "rows", "value": {"intValue": "10"}}]
+
+
+_ECHO_SERVER = (
+    "from src.mcp import server\n"
+    "server.TOOLS['test.echo'] = lambda params: {'params': params}\n"
+    "raise SystemExit(server.serve_stdio())\n"
+)
+
+
+def test_trace_context_crosses_the_mcp_subprocess(exported):
+    with start_span("orchestrator.orchestrate") as root:
+        with MCPClient(cmd=[sys.executable, "-c", _ECHO_SERVER], start_timeout=30) as client:
+            result = client.call("test.echo", {"question": "q"}, timeout=60)
+
+    assert result == {"params": {"question": "q"}}  # _meta is stripped before the tool runs
+    by_name = {r["name"]: r for r in exported}
+    call, tool = by_name["mcp.call test.echo"], by_name["tool test.echo"]
+    assert call["parent_id"] == root.span_id and call["kind"] == "client"
+    assert tool["parent_id"] == call["span_id"] and tool["service"] == "presgen-mcp"
+    assert {r["trace_id"] for r in exported} == {root.trace_id}
@@ -0,0 +1,37 @@
+# tests/test_video_phase3_unit.py
+from pathlib import Path
+
+import pytest
+
+from src.mcp.tools import video_phase3
+from src.mcp.tools.video_phase3 import Phase3Orchestrator
+
+
+def _orchestrator(tmp_path: Path, monkeypatch, mode: str) -> Phase3Orchestrator:
+    monkeypatch.setattr(video_phase3, "COMPOSITION_MODE", mode)
+    orch = Phase3Orchestrator.__new__(Phase3Orchestrator)
+    orch.job_id = "job-1"
+    orch.job_dir = tmp_path
+    orch.output_dir = tmp_path
+    orch._provided_job_data = {"config": {"speed_profile": "balanced"}}
+    orch._source_metadata = {"width": 1280, "height": 720, "audio_codec": "aac"}
+    monkeypatch.setattr(orch, "_build_overlay_layout", lambda *a: [{"text": "x"}])
+    monkeypatch.setattr(orch, "_render_overlay_states", lambda *a: [
+        {"path": str(tmp_path / f"state{i}.png"), "enable": f"between(t,{i},{i + 1})"} for i in range(2)
+    ])
+    monkeypatch.setattr(orch, "_build_drawtext_filters", lambda *a: "drawtext=text=x")
+    return orch
+
+
+@pytest.mark.parametrize("mode", ["overlay", "drawtext"])
+def test_threads_is_an_encoder_option_after_the_inputs(tmp_path: Path, monkeypatch, mode):
+    orch = _orchestrator(tmp_path, monkeypatch, mode)
+
+    cmd = orch._build_fullscreen_ffmpeg_command("raw.mp4", [], tmp_path / "out.mp4")
+
+    last_input = max(i for i, arg in enumerate(cmd) if arg == "-i")
+    threads = cmd.index("-threads")
+    assert cmd.count("-threads") == 1
+    assert threads > last_input
+    assert cmd[threads + 1] == str(video_phase3.SPEED_PROFILES["balanced"]["threads"])
+    assert threads < cmd.index("-c:v")
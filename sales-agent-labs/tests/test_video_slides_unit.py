@@ -0,0 +1,40 @@
+# tests/test_video_slides_unit.py
+import logging
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from src.mcp.tools import video_slides
+
+
+@pytest.fixture
+def font_dir(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(video_slides, "FONT_DIR", tmp_path)
+    video_slides._font_face_css.cache_clear()
+    video_slides._font_head_html.cache_clear()
+    yield tmp_path
+    video_slides._font_face_css.cache_clear()
+    video_slides._font_head_html.cache_clear()
+
+
+def test_local_inter_files_are_inlined(font_dir: Path):
+    (font_dir / "Inter-Bold.woff2").write_bytes(b"wOF2")
+
+    head = video_slides._font_head_html()
+
+    assert head.startswith("<style>") and "font-weight: 700" in head
+    assert "fonts.googleapis.com" not in head
+
+
+def test_missing_fonts_fall_back_to_google_fonts_and_warn_once(font_dir: Path, caplog):
+    with caplog.at_level(logging.WARNING, logger="video_slides"):
+        first = video_slides._font_head_html()
+        second = video_slides._font_head_html()
+
+    assert first == second
+    assert video_slides.GOOGLE_FONTS_CSS in first
+    assert len([r for r in caplog.records if "slide_fonts_not_found" in r.getMessage()]) == 1
+    assert video_slides._ALLOWED_REMOTE.match("https://fonts.gstatic.com/s/inter/v13/a.woff2")
+    assert not video_slides._ALLOWED_REMOTE.match("https://example.com/fonts.googleapis.com/")